@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add the `DbNodeClosure` table that can materialize the transitive closure of the data provenance graph."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error,no-member
+from django.db import migrations, models
+import django.db.models.deletion
+
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.41'
+DOWN_REVISION = '1.0.40'
+
+
+class Migration(migrations.Migration):
+    """Add the `DbNodeClosure` table that can materialize the transitive closure of the data provenance graph."""
+
+    dependencies = [
+        ('db', '0040_data_migration_legacy_process_attributes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DbNodeClosure',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('depth', models.IntegerField()),
+                (
+                    'ancestor',
+                    models.ForeignKey(
+                        related_name='closure_descendants',
+                        to='db.DbNode',
+                        on_delete=django.db.models.deletion.CASCADE
+                    )
+                ),
+                (
+                    'descendant',
+                    models.ForeignKey(
+                        related_name='closure_ancestors',
+                        to='db.DbNode',
+                        on_delete=django.db.models.deletion.CASCADE
+                    )
+                ),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='dbnodeclosure',
+            unique_together=set([('ancestor', 'descendant')]),
+        ),
+        # The trigger that maintains the closure is only installed when the closure is enabled, but it has to go when
+        # the table is dropped, otherwise every subsequent link insertion would fail.
+        migrations.RunSQL(
+            migrations.RunSQL.noop,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS db_dblink_closure_trigger ON db_dblink;
+                DROP FUNCTION IF EXISTS db_dbnodeclosure_update();
+            """
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add the `DbNodeStatistics` table with the number of nodes per user, node type and day of creation."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from __future__ import absolute_import
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error,no-member
+from django.db import migrations, models
+import django.db.models.deletion
+
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.42'
+DOWN_REVISION = '1.0.41'
+
+# The trigger keeps the counts up to date when nodes are stored, deleted or change type, creator or creation time. It
+# only appends a row with the change of the count, instead of updating the row of the user, type and day, such that
+# transactions that store nodes concurrently never wait for each other on the same row. The rows are summed when the
+# statistics are read and are periodically merged into one row per user, type and day.
+SQL_INSTALL_TRIGGER = """
+    CREATE OR REPLACE FUNCTION db_dbnodestatistics_update() RETURNS trigger AS $body$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+            VALUES (OLD.user_id, OLD.node_type, (OLD.ctime AT TIME ZONE 'UTC')::date, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+            VALUES (NEW.user_id, NEW.node_type, (NEW.ctime AT TIME ZONE 'UTC')::date, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $body$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER db_dbnode_statistics_trigger AFTER INSERT OR DELETE ON db_dbnode
+    FOR EACH ROW EXECUTE PROCEDURE db_dbnodestatistics_update();
+
+    CREATE TRIGGER db_dbnode_statistics_update_trigger AFTER UPDATE OF user_id, node_type, ctime ON db_dbnode
+    FOR EACH ROW WHEN (
+        OLD.user_id IS DISTINCT FROM NEW.user_id OR OLD.node_type IS DISTINCT FROM NEW.node_type OR
+        OLD.ctime IS DISTINCT FROM NEW.ctime
+    ) EXECUTE PROCEDURE db_dbnodestatistics_update();
+
+    INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+    SELECT user_id, node_type, (ctime AT TIME ZONE 'UTC')::date, COUNT(*)
+    FROM db_dbnode GROUP BY user_id, node_type, (ctime AT TIME ZONE 'UTC')::date;
+"""
+
+SQL_UNINSTALL_TRIGGER = """
+    DROP TRIGGER IF EXISTS db_dbnode_statistics_update_trigger ON db_dbnode;
+    DROP TRIGGER IF EXISTS db_dbnode_statistics_trigger ON db_dbnode;
+    DROP FUNCTION IF EXISTS db_dbnodestatistics_update();
+"""
+
+
+class Migration(migrations.Migration):
+    """Add the `DbNodeStatistics` table with the number of nodes per user, node type and day of creation."""
+
+    dependencies = [
+        ('db', '0041_node_closure_table'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DbNodeStatistics',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('node_type', models.CharField(max_length=255)),
+                ('day', models.DateField()),
+                ('count', models.IntegerField()),
+                (
+                    'user',
+                    models.ForeignKey(
+                        related_name='+', to='db.DbUser', on_delete=django.db.models.deletion.CASCADE
+                    )
+                ),
+            ],
+        ),
+        migrations.RunSQL(SQL_INSTALL_TRIGGER, reverse_sql=SQL_UNINSTALL_TRIGGER),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
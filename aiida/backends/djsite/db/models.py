@@ -192,6 +192,44 @@ class DbLink(m.Model):
             self.output.pk, )
 
 
+@python_2_unicode_compatible
+class DbNodeClosure(m.Model):
+    """Materialized transitive closure of the data provenance graph.
+
+    Every row connects a node to one of its descendants along `create` and `input_calc` links, where `depth` is the
+    length of the shortest path minus one, i.e. zero for directly linked nodes. The table is empty unless it has been
+    enabled through `verdi database closure enable`, after which it is kept up to date by a database trigger on the
+    `DbLink` table.
+    """
+    ancestor = m.ForeignKey('DbNode', related_name='closure_descendants', on_delete=m.CASCADE)
+    descendant = m.ForeignKey('DbNode', related_name='closure_ancestors', on_delete=m.CASCADE)
+    depth = m.IntegerField()
+
+    class Meta:
+        unique_together = (('ancestor', 'descendant'),)
+
+    def __str__(self):
+        return '{} --> {} (depth {})'.format(self.ancestor_id, self.descendant_id, self.depth)
+
+
+@python_2_unicode_compatible
+class DbNodeStatistics(m.Model):
+    """Number of nodes per user, node type and day of creation.
+
+    The table is kept up to date by a database trigger on the `DbNode` table, such that the node creation statistics can
+    be computed from it without scanning all nodes. The day is the date of the creation time in UTC. The trigger appends
+    a row with the change of the count for every change of the node table, so the number of nodes is the sum of the
+    counts of all rows of a user, type and day, until the rows are merged by `compact_node_statistics`.
+    """
+    user = m.ForeignKey(DbUser, on_delete=m.CASCADE, related_name='+')
+    node_type = m.CharField(max_length=255)
+    day = m.DateField()
+    count = m.IntegerField()
+
+    def __str__(self):
+        return '{} nodes of type {} on {}'.format(self.count, self.node_type, self.day)
+
+
 @python_2_unicode_compatible
 class DbSetting(m.Model):
     """
@@ -20,6 +20,17 @@ class DjangoQueryManager(AbstractQueryManager):
     def __init__(self, backend):
         super(DjangoQueryManager, self).__init__(backend)
 
+    def execute_statement(self, statement):
+        """Execute a raw SQL statement that does not return any rows in its own transaction.
+
+        :param statement: a string containing one or more raw SQL statements
+        """
+        from django.db import transaction  # pylint: disable=import-error,no-name-in-module
+
+        with transaction.atomic():
+            with self._backend.cursor() as cursor:
+                cursor.execute(statement)
+
     def get_creation_statistics(
             self,
             user_pk=None
@@ -53,27 +64,28 @@ class DjangoQueryManager(AbstractQueryManager):
 
         retdict = {}
 
-        total_query = s.query(djmodels.DbNode.sa)
-        types_query = s.query(djmodels.DbNode.sa.node_type.label('typestring'),
-                              sa.func.count(djmodels.DbNode.sa.id))
-        stat_query = s.query(sa.func.date_trunc('day', djmodels.DbNode.sa.ctime).label('cday'),
-                             sa.func.count(djmodels.DbNode.sa.id))
+        # The counts are read from the statistics table, which is maintained by a trigger on the node table, such that
+        # the cost of the queries scales with the number of node types and days instead of with the number of nodes. The
+        # rows of the changes that were not yet merged by `compact_node_statistics` are summed, so this only reads.
+        statistics = djmodels.DbNodeStatistics.sa
+        types_query = s.query(statistics.node_type.label('typestring'), sa.func.sum(statistics.count))
+        stat_query = s.query(statistics.day.label('cday'), sa.func.sum(statistics.count))
 
         if user_pk is not None:
-            total_query = total_query.filter(djmodels.DbNode.sa.user_id == user_pk)
-            types_query = types_query.filter(djmodels.DbNode.sa.user_id == user_pk)
-            stat_query = stat_query.filter(djmodels.DbNode.sa.user_id == user_pk)
-
-        # Total number of nodes
-        retdict['total'] = total_query.count()
+            types_query = types_query.filter(statistics.user_id == user_pk)
+            stat_query = stat_query.filter(statistics.user_id == user_pk)
 
         # Nodes per type
-        retdict['types'] = dict(types_query.group_by('typestring').all())
+        types_query = types_query.group_by('typestring').having(sa.func.sum(statistics.count) != 0)
+        retdict['types'] = {typestring: int(count) for typestring, count in types_query.all()}
+
+        # Total number of nodes
+        retdict['total'] = sum(retdict['types'].values())
 
         # Nodes created per day
-        stat = stat_query.group_by('cday').order_by('cday').all()
+        stat = stat_query.group_by('cday').having(sa.func.sum(statistics.count) != 0).order_by('cday').all()
 
-        ctime_by_day = {_[0].strftime('%Y-%m-%d'): _[1] for _ in stat}
+        ctime_by_day = {_[0].strftime('%Y-%m-%d'): int(_[1]) for _ in stat}
         retdict['ctime_by_day'] = ctime_by_day
 
         return retdict
@@ -117,7 +129,7 @@ class DjangoQueryManager(AbstractQueryManager):
         from django.db.models import Q
         from aiida.backends.djsite.db import models
         from aiida.common.utils import grouper
-        from aiida.orm.nodes.data.structure import (get_formula, get_symbols_string)
+        from aiida.orm.nodes.data.structure import get_formula, get_site_symbols_from_attributes
         from aiida.orm import BandsData
         from aiida import orm
 
@@ -174,13 +186,12 @@ class DjangoQueryManager(AbstractQueryManager):
                         if not all([s in all_symbols for s in args.element_only]):
                             continue
 
-                    # build the formula
-                    symbol_dict = {k['name']: get_symbols_string(k['symbols'],
-                                                                 k['weights'])
-                                   for k in deser_data[struc_pk]['kinds']}
+                    # build the formula, the sites of structures in compact form are replaced by the number of sites
+                    # of each kind
+                    attributes = deser_data[struc_pk]
                     try:
-                        symbol_list = [symbol_dict[s['kind_name']]
-                                       for s in deser_data[struc_pk]['sites']]
+                        symbol_list = get_site_symbols_from_attributes(
+                            attributes['kinds'], attributes.get('sites'), attributes.get('kind_site_counts'))
                         formula = get_formula(symbol_list,
                                               mode=args.formulamode)
                     # If for some reason there is no kind with the name
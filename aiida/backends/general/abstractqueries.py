@@ -11,9 +11,112 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
-from abc import ABCMeta
+from abc import ABCMeta, abstractmethod
 import six
 
+# Names of the database trigger and function that maintain the `db_dbnodeclosure` table when it is enabled
+NODE_CLOSURE_TRIGGER = 'db_dblink_closure_trigger'
+NODE_CLOSURE_FUNCTION = 'db_dbnodeclosure_update'
+
+# The link types that are followed by the transitive closure, which should be the same as the ones that are followed by
+# the recursive joins of the `QueryBuilder` for the `with_ancestors` and `with_descendants` relationships.
+NODE_CLOSURE_LINK_TYPES = "('create', 'input_calc')"
+
+# For each new link `input -> output`, connect all ancestors of `input`, including itself, to all descendants of
+# `output`, including itself. Paths that were already known keep the smallest depth.
+NODE_CLOSURE_INSTALL_SQL = """
+    CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $body$
+    BEGIN
+        INSERT INTO db_dbnodeclosure (ancestor_id, descendant_id, depth)
+        SELECT ancestors.node_id, descendants.node_id, ancestors.depth + descendants.depth + 2
+        FROM (
+            SELECT NEW.input_id AS node_id, -1 AS depth
+            UNION ALL
+            SELECT ancestor_id, depth FROM db_dbnodeclosure WHERE descendant_id = NEW.input_id
+        ) AS ancestors
+        CROSS JOIN (
+            SELECT NEW.output_id AS node_id, -1 AS depth
+            UNION ALL
+            SELECT descendant_id, depth FROM db_dbnodeclosure WHERE ancestor_id = NEW.output_id
+        ) AS descendants
+        ON CONFLICT (ancestor_id, descendant_id)
+        DO UPDATE SET depth = LEAST(db_dbnodeclosure.depth, EXCLUDED.depth);
+        RETURN NULL;
+    END;
+    $body$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS {trigger} ON db_dblink;
+    CREATE TRIGGER {trigger} AFTER INSERT ON db_dblink
+    FOR EACH ROW WHEN (NEW.type IN {link_types}) EXECUTE PROCEDURE {function}();
+""".format(function=NODE_CLOSURE_FUNCTION, trigger=NODE_CLOSURE_TRIGGER, link_types=NODE_CLOSURE_LINK_TYPES)
+
+NODE_CLOSURE_UNINSTALL_SQL = """
+    DROP TRIGGER IF EXISTS {trigger} ON db_dblink;
+    DROP FUNCTION IF EXISTS {function}();
+    DELETE FROM db_dbnodeclosure;
+""".format(function=NODE_CLOSURE_FUNCTION, trigger=NODE_CLOSURE_TRIGGER)
+
+# The closure is built breadth first: the paths of depth `n + 1` are the paths of depth `n` extended by a single link.
+# Since all paths of a given depth are inserted before those of the next one, the first time a pair is inserted is with
+# its shortest depth, and any later duplicates can simply be ignored. The link table is locked for writing such that no
+# links can be added while the closure is being rebuilt.
+NODE_CLOSURE_REBUILD_SQL = """
+    LOCK TABLE db_dblink IN SHARE MODE;
+    DO $body$
+    DECLARE
+        current_depth INTEGER := 0;
+        inserted INTEGER := 1;
+    BEGIN
+        DELETE FROM db_dbnodeclosure;
+
+        INSERT INTO db_dbnodeclosure (ancestor_id, descendant_id, depth)
+        SELECT DISTINCT input_id, output_id, 0 FROM db_dblink WHERE type IN {link_types}
+        ON CONFLICT DO NOTHING;
+
+        WHILE inserted > 0 LOOP
+            INSERT INTO db_dbnodeclosure (ancestor_id, descendant_id, depth)
+            SELECT DISTINCT closure.ancestor_id, link.output_id, current_depth + 1
+            FROM db_dbnodeclosure AS closure
+            JOIN db_dblink AS link ON link.input_id = closure.descendant_id
+            WHERE closure.depth = current_depth AND link.type IN {link_types}
+            ON CONFLICT DO NOTHING;
+
+            GET DIAGNOSTICS inserted = ROW_COUNT;
+            current_depth := current_depth + 1;
+        END LOOP;
+    END;
+    $body$;
+""".format(link_types=NODE_CLOSURE_LINK_TYPES)
+
+
+# The node statistics are maintained by a trigger on the node table that is installed by the database migrations. The
+# node table is locked for writing while the statistics are recomputed, such that no counts are lost.
+NODE_STATISTICS_REFRESH_SQL = """
+    LOCK TABLE db_dbnode IN SHARE MODE;
+    DELETE FROM db_dbnodestatistics;
+    INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+    SELECT user_id, node_type, (ctime AT TIME ZONE 'UTC')::date, COUNT(*)
+    FROM db_dbnode GROUP BY user_id, node_type, (ctime AT TIME ZONE 'UTC')::date;
+"""
+
+# The rows with the changes of the counts that the trigger appended are replaced by one row per user, type and day. Rows
+# that are appended concurrently are not visible to the statement and are left for the next compaction. Only one
+# transaction compacts at a time, such that two compactions never wait for each other on the rows they delete.
+NODE_STATISTICS_COMPACT_SQL = """
+    DO $body$
+    BEGIN
+        IF pg_try_advisory_xact_lock(hashtext('db_dbnodestatistics')) THEN
+            WITH deleted AS (
+                DELETE FROM db_dbnodestatistics RETURNING user_id, node_type, day, count
+            )
+            INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+            SELECT user_id, node_type, day, SUM(count) FROM deleted
+            GROUP BY user_id, node_type, day HAVING SUM(count) <> 0;
+        END IF;
+    END;
+    $body$;
+"""
+
 
 @six.add_metaclass(ABCMeta)
 class AbstractQueryManager(object):
@@ -24,6 +127,77 @@ class AbstractQueryManager(object):
         :type backend: :class:`aiida.orm.implementation.sql.SqlBackend`
         """
         self._backend = backend
+        self._node_closure_enabled = None
+
+    @abstractmethod
+    def execute_statement(self, statement):
+        """Execute a raw SQL statement that does not return any rows in its own transaction.
+
+        :param statement: a string containing one or more raw SQL statements
+        """
+
+    def is_node_closure_enabled(self):
+        """Return whether the transitive closure table of the provenance graph is enabled and being maintained.
+
+        The result is cached on this query manager, so a closure that is enabled or disabled by another process will
+        only be noticed by this one once it is restarted, which is why `verdi database closure` requires the daemon to
+        be stopped.
+
+        :return: True if the `db_dbnodeclosure` table is maintained by its trigger, False otherwise
+        """
+        if self._node_closure_enabled is None:
+            query = "SELECT COUNT(*) FROM pg_trigger WHERE tgname = '{}'".format(NODE_CLOSURE_TRIGGER)
+            self._node_closure_enabled = self._backend.execute_raw(query)[0][0] > 0
+
+        return self._node_closure_enabled
+
+    def enable_node_closure(self):
+        """Install the trigger that maintains the transitive closure table and build it from the existing links.
+
+        Once enabled, the `QueryBuilder` will use the closure table instead of recursive queries over the link table
+        for the `with_ancestors` and `with_descendants` relationships.
+        """
+        self.execute_statement(NODE_CLOSURE_INSTALL_SQL)
+        self.execute_statement(NODE_CLOSURE_REBUILD_SQL)
+        self._node_closure_enabled = True
+
+    def disable_node_closure(self):
+        """Remove the trigger that maintains the transitive closure table and empty it."""
+        self.execute_statement(NODE_CLOSURE_UNINSTALL_SQL)
+        self._node_closure_enabled = False
+
+    def rebuild_node_closure(self):
+        """Recompute the transitive closure table from scratch from the current link table.
+
+        The trigger only accounts for links that are added, so this is necessary after links have been deleted
+        without deleting the nodes they connected.
+
+        :raises aiida.common.exceptions.InvalidOperation: if the closure table is not enabled
+        """
+        from aiida.common.exceptions import InvalidOperation
+
+        if not self.is_node_closure_enabled():
+            raise InvalidOperation('the node closure table is not enabled')
+
+        self.execute_statement(NODE_CLOSURE_REBUILD_SQL)
+
+    def refresh_node_statistics(self):
+        """Recompute the node statistics table, which contains the number of nodes per user, type and day, from scratch.
+
+        The table is kept up to date by a database trigger, so this is only necessary if nodes were modified while the
+        trigger was disabled, for example by a bulk operation that bypassed it.
+        """
+        self.execute_statement(NODE_STATISTICS_REFRESH_SQL)
+
+    def compact_node_statistics(self):
+        """Merge the rows of the node statistics table into a single row per user, node type and day.
+
+        The trigger that maintains the table appends a row for every node that is stored or deleted, so the table has
+        to be compacted regularly to keep its size proportional to the number of types and days. This is done
+        periodically by the daemon workers and by `verdi database refresh-statistics --compact`. Nothing is done if
+        another transaction is compacting the table at the same time.
+        """
+        self.execute_statement(NODE_STATISTICS_COMPACT_SQL)
 
     def get_duplicate_uuids(self, table):
         """
@@ -138,7 +312,7 @@ class AbstractQueryManager(object):
 
         import datetime
         from aiida.common import timezone
-        from aiida.orm.nodes.data.structure import (get_formula, get_symbols_string)
+        from aiida.orm.nodes.data.structure import get_formula, get_site_symbols_from_attributes
         from aiida import orm
 
         qb = orm.QueryBuilder()
@@ -170,7 +344,7 @@ class AbstractQueryManager(object):
 
         qb.append(orm.StructureData, tag='sdata', with_descendants='bdata',
                   # We don't care about the creator of StructureData
-                  project=['id', 'attributes.kinds', 'attributes.sites'])
+                  project=['id', 'attributes.kinds', 'attributes.sites', 'attributes.kind_site_counts'])
 
         qb.order_by({orm.StructureData: {'ctime': 'desc'}})
 
@@ -179,7 +353,7 @@ class AbstractQueryManager(object):
         entry_list = []
         already_visited_bdata = set()
 
-        for [bid, blabel, bdate, sid, akinds, asites] in list_data.all():
+        for [bid, blabel, bdate, sid, akinds, asites, acounts] in list_data.all():
 
             # We process only one StructureData per BandsData.
             # We want to process the closest StructureData to
@@ -205,21 +379,13 @@ class AbstractQueryManager(object):
                 ):
                     continue
 
-            # We want only the StructureData that have attributes
-            if akinds is None or asites is None:
+            # We want only the StructureData that have attributes, the sites of structures in compact form are
+            # replaced by the number of sites of each kind
+            if akinds is None or (asites is None and acounts is None):
                 continue
 
-            symbol_dict = {}
-            for k in akinds:
-                symbols = k['symbols']
-                weights = k['weights']
-                symbol_dict[k['name']] = get_symbols_string(symbols,
-                                                            weights)
-
             try:
-                symbol_list = []
-                for s in asites:
-                    symbol_list.append(symbol_dict[s['kind_name']])
+                symbol_list = get_site_symbols_from_attributes(akinds, asites, acounts)
                 formula = get_formula(symbol_list,
                                       mode=args.formulamode)
             # If for some reason there is no kind with the name
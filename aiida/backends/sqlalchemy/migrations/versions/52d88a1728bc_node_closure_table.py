@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add the `db_dbnodeclosure` table that can materialize the transitive closure of the data provenance graph.
+
+This migration corresponds to the 0041_node_closure_table Django migration.
+
+Revision ID: 52d88a1728bc
+Revises: e734dd5e50d7
+Create Date: 2019-10-21 10:12:38.417925
+
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '52d88a1728bc'
+down_revision = 'e734dd5e50d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the `db_dbnodeclosure` table."""
+    op.create_table(
+        'db_dbnodeclosure',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ancestor_id', sa.Integer(), nullable=False),
+        sa.Column('descendant_id', sa.Integer(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['db_dbnode.id'],
+                                ondelete='CASCADE',
+                                initially='DEFERRED',
+                                deferrable=True),
+        sa.ForeignKeyConstraint(['descendant_id'], ['db_dbnode.id'],
+                                ondelete='CASCADE',
+                                initially='DEFERRED',
+                                deferrable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('ancestor_id', 'descendant_id')
+    )
+    op.create_index('ix_db_dbnodeclosure_ancestor_id', 'db_dbnodeclosure', ['ancestor_id'], unique=False)
+    op.create_index('ix_db_dbnodeclosure_descendant_id', 'db_dbnodeclosure', ['descendant_id'], unique=False)
+
+
+def downgrade():
+    """Drop the `db_dbnodeclosure` table and the trigger that maintains it, if it was enabled."""
+    conn = op.get_bind()
+    conn.execute(text('DROP TRIGGER IF EXISTS db_dblink_closure_trigger ON db_dblink;'))
+    conn.execute(text('DROP FUNCTION IF EXISTS db_dbnodeclosure_update();'))
+    op.drop_index('ix_db_dbnodeclosure_descendant_id', table_name='db_dbnodeclosure')
+    op.drop_index('ix_db_dbnodeclosure_ancestor_id', table_name='db_dbnodeclosure')
+    op.drop_table('db_dbnodeclosure')
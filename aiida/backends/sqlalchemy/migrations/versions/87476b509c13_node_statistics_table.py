@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add the `db_dbnodestatistics` table with the number of nodes per user, node type and day of creation.
+
+This migration corresponds to the 0042_node_statistics_table Django migration.
+
+Revision ID: 87476b509c13
+Revises: 52d88a1728bc
+Create Date: 2019-10-24 09:31:12.503218
+
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '87476b509c13'
+down_revision = '52d88a1728bc'
+branch_labels = None
+depends_on = None
+
+# The trigger keeps the counts up to date when nodes are stored, deleted or change type, creator or creation time. It
+# only appends a row with the change of the count, instead of updating the row of the user, type and day, such that
+# transactions that store nodes concurrently never wait for each other on the same row. The rows are summed when the
+# statistics are read and are periodically merged into one row per user, type and day.
+SQL_INSTALL_TRIGGER = """
+    CREATE OR REPLACE FUNCTION db_dbnodestatistics_update() RETURNS trigger AS $body$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+            VALUES (OLD.user_id, OLD.node_type, (OLD.ctime AT TIME ZONE 'UTC')::date, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+            VALUES (NEW.user_id, NEW.node_type, (NEW.ctime AT TIME ZONE 'UTC')::date, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $body$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER db_dbnode_statistics_trigger AFTER INSERT OR DELETE ON db_dbnode
+    FOR EACH ROW EXECUTE PROCEDURE db_dbnodestatistics_update();
+
+    CREATE TRIGGER db_dbnode_statistics_update_trigger AFTER UPDATE OF user_id, node_type, ctime ON db_dbnode
+    FOR EACH ROW WHEN (
+        OLD.user_id IS DISTINCT FROM NEW.user_id OR OLD.node_type IS DISTINCT FROM NEW.node_type OR
+        OLD.ctime IS DISTINCT FROM NEW.ctime
+    ) EXECUTE PROCEDURE db_dbnodestatistics_update();
+
+    INSERT INTO db_dbnodestatistics (user_id, node_type, day, count)
+    SELECT user_id, node_type, (ctime AT TIME ZONE 'UTC')::date, COUNT(*)
+    FROM db_dbnode GROUP BY user_id, node_type, (ctime AT TIME ZONE 'UTC')::date;
+"""
+
+SQL_UNINSTALL_TRIGGER = """
+    DROP TRIGGER IF EXISTS db_dbnode_statistics_update_trigger ON db_dbnode;
+    DROP TRIGGER IF EXISTS db_dbnode_statistics_trigger ON db_dbnode;
+    DROP FUNCTION IF EXISTS db_dbnodestatistics_update();
+"""
+
+
+def upgrade():
+    """Create the `db_dbnodestatistics` table, the trigger that maintains it and fill it for the existing nodes."""
+    op.create_table(
+        'db_dbnodestatistics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('node_type', sa.String(length=255), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['db_dbuser.id'],
+                                ondelete='CASCADE',
+                                initially='DEFERRED',
+                                deferrable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    conn = op.get_bind()
+    conn.execute(text(SQL_INSTALL_TRIGGER))
+
+
+def downgrade():
+    """Drop the `db_dbnodestatistics` table and the trigger that maintains it."""
+    conn = op.get_bind()
+    conn.execute(text(SQL_UNINSTALL_TRIGGER))
+    op.drop_table('db_dbnodestatistics')
@@ -13,8 +13,8 @@ from __future__ import absolute_import
 
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import relationship, backref
-from sqlalchemy.schema import Column
-from sqlalchemy.types import Integer, String, DateTime, Text
+from sqlalchemy.schema import Column, UniqueConstraint
+from sqlalchemy.types import Integer, String, Date, DateTime, Text
 # Specific to PGSQL. If needed to be agnostic
 # http://docs.sqlalchemy.org/en/rel_0_9/core/custom_types.html?highlight=guid#backend-agnostic-guid-type
 # Or maybe rely on sqlalchemy-utils UUID type
@@ -189,3 +189,58 @@ class DbLink(Base):
             self.output.get_simple_name(invalid_result='Unknown node'),
             self.output.pk
         )
+
+
+class DbNodeClosure(Base):
+    """Materialized transitive closure of the data provenance graph.
+
+    Every row connects a node to one of its descendants along `create` and `input_calc` links, where `depth` is the
+    length of the shortest path minus one, i.e. zero for directly linked nodes. The table is empty unless it has been
+    enabled through `verdi database closure enable`, after which it is kept up to date by a database trigger on the
+    `DbLink` table.
+    """
+    __tablename__ = 'db_dbnodeclosure'
+
+    id = Column(Integer, primary_key=True)
+    ancestor_id = Column(
+        Integer,
+        ForeignKey('db_dbnode.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+        index=True,
+        nullable=False
+    )
+    descendant_id = Column(
+        Integer,
+        ForeignKey('db_dbnode.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+        index=True,
+        nullable=False
+    )
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (UniqueConstraint('ancestor_id', 'descendant_id'),)
+
+    def __str__(self):
+        return '{} --> {} (depth {})'.format(self.ancestor_id, self.descendant_id, self.depth)
+
+
+class DbNodeStatistics(Base):
+    """Number of nodes per user, node type and day of creation.
+
+    The table is kept up to date by a database trigger on the `DbNode` table, such that the node creation statistics can
+    be computed from it without scanning all nodes. The day is the date of the creation time in UTC. The trigger appends
+    a row with the change of the count for every change of the node table, so the number of nodes is the sum of the
+    counts of all rows of a user, type and day, until the rows are merged by `compact_node_statistics`.
+    """
+    __tablename__ = 'db_dbnodestatistics'
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer,
+        ForeignKey('db_dbuser.id', ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+        nullable=False
+    )
+    node_type = Column(String(255), nullable=False)
+    day = Column(Date, nullable=False)
+    count = Column(Integer, nullable=False)
+
+    def __str__(self):
+        return '{} nodes of type {} on {}'.format(self.count, self.node_type, self.day)
@@ -24,6 +24,23 @@ class SqlaQueryManager(AbstractQueryManager):
     def __init__(self, backend):
         super(SqlaQueryManager, self).__init__(backend)
 
+    def execute_statement(self, statement):
+        """Execute a raw SQL statement that does not return any rows in its own transaction.
+
+        :param statement: a string containing one or more raw SQL statements
+        """
+        from sqlalchemy.sql import text
+        from aiida.backends.sqlalchemy import get_scoped_session
+
+        session = get_scoped_session()
+
+        try:
+            session.execute(text(statement))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
     def get_creation_statistics(
             self,
             user_pk=None
@@ -57,27 +74,28 @@ class SqlaQueryManager(AbstractQueryManager):
 
         retdict = {}
 
-        total_query = s.query(m.node.DbNode)
-        types_query = s.query(m.node.DbNode.node_type.label('typestring'),
-                              sa.func.count(m.node.DbNode.id))
-        stat_query = s.query(sa.func.date_trunc('day', m.node.DbNode.ctime).label('cday'),
-                             sa.func.count(m.node.DbNode.id))
+        # The counts are read from the statistics table, which is maintained by a trigger on the node table, such that
+        # the cost of the queries scales with the number of node types and days instead of with the number of nodes. The
+        # rows of the changes that were not yet merged by `compact_node_statistics` are summed, so this only reads.
+        statistics = m.node.DbNodeStatistics
+        types_query = s.query(statistics.node_type.label('typestring'), sa.func.sum(statistics.count))
+        stat_query = s.query(statistics.day.label('cday'), sa.func.sum(statistics.count))
 
         if user_pk is not None:
-            total_query = total_query.filter(m.node.DbNode.user_id == user_pk)
-            types_query = types_query.filter(m.node.DbNode.user_id == user_pk)
-            stat_query = stat_query.filter(m.node.DbNode.user_id == user_pk)
-
-        # Total number of nodes
-        retdict['total'] = total_query.count()
+            types_query = types_query.filter(statistics.user_id == user_pk)
+            stat_query = stat_query.filter(statistics.user_id == user_pk)
 
         # Nodes per type
-        retdict['types'] = dict(types_query.group_by('typestring').all())
+        types_query = types_query.group_by('typestring').having(sa.func.sum(statistics.count) != 0)
+        retdict['types'] = {typestring: int(count) for typestring, count in types_query.all()}
+
+        # Total number of nodes
+        retdict['total'] = sum(retdict['types'].values())
 
         # Nodes created per day
-        stat = stat_query.group_by('cday').order_by('cday').all()
+        stat = stat_query.group_by('cday').having(sa.func.sum(statistics.count) != 0).order_by('cday').all()
 
-        ctime_by_day = {_[0].strftime('%Y-%m-%d'): _[1] for _ in stat}
+        ctime_by_day = {_[0].strftime('%Y-%m-%d'): int(_[1]) for _ in stat}
         retdict['ctime_by_day'] = ctime_by_day
 
         return retdict
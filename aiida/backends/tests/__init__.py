@@ -83,14 +83,18 @@ DB_TEST_LIST = {
         'common.utils': ['aiida.backends.tests.common.test_utils'],
         'dataclasses': ['aiida.backends.tests.test_dataclasses'],
         'dbimporters': ['aiida.backends.tests.test_dbimporters'],
+        'engine.daemon.autoscaler': ['aiida.backends.tests.engine.daemon.test_autoscaler'],
         'engine.daemon.client': ['aiida.backends.tests.engine.daemon.test_client'],
+        'engine.daemon.remotecache': ['aiida.backends.tests.engine.daemon.test_remotecache'],
         'engine.calc_job': ['aiida.backends.tests.engine.test_calc_job'],
         'engine.calcfunctions': ['aiida.backends.tests.engine.test_calcfunctions'],
         'engine.class_loader': ['aiida.backends.tests.engine.test_class_loader'],
         'engine.daemon': ['aiida.backends.tests.engine.test_daemon'],
+        'engine.executors': ['aiida.backends.tests.engine.test_executors'],
         'engine.futures': ['aiida.backends.tests.engine.test_futures'],
         'engine.launch': ['aiida.backends.tests.engine.test_launch'],
         'engine.manager': ['aiida.backends.tests.engine.test_manager'],
+        'engine.metrics': ['aiida.backends.tests.engine.test_metrics'],
         'engine.persistence': ['aiida.backends.tests.engine.test_persistence'],
         'engine.ports': ['aiida.backends.tests.engine.test_ports'],
         'engine.process': ['aiida.backends.tests.engine.test_process'],
@@ -100,6 +104,7 @@ DB_TEST_LIST = {
         'engine.rmq': ['aiida.backends.tests.engine.test_rmq'],
         'engine.run': ['aiida.backends.tests.engine.test_run'],
         'engine.runners': ['aiida.backends.tests.engine.test_runners'],
+        'engine.throttle': ['aiida.backends.tests.engine.test_throttle'],
         'engine.transport': ['aiida.backends.tests.engine.test_transport'],
         'engine.utils': ['aiida.backends.tests.engine.test_utils'],
         'engine.work_chain': ['aiida.backends.tests.engine.test_work_chain'],
@@ -108,6 +113,7 @@ DB_TEST_LIST = {
         'manage.backup.backup_script': ['aiida.backends.tests.manage.backup.test_backup_script'],
         'manage.backup.backup_setup_script': ['aiida.backends.tests.manage.backup.test_backup_setup_script'],
         'manage.caching.': ['aiida.backends.tests.manage.test_caching'],
+        'manage.object_store': ['aiida.backends.tests.manage.test_object_store'],
         'manage.configuration.config.': ['aiida.backends.tests.manage.configuration.test_config'],
         'manage.configuration.migrations.': ['aiida.backends.tests.manage.configuration.migrations.test_migrations'],
         'manage.configuration.options.': ['aiida.backends.tests.manage.configuration.test_options'],
@@ -729,6 +729,19 @@ PRIMVEC
     def test_list(self):
         self.data_listing_test(StructureData, 'BaO3Ti', self.ids)
 
+    def test_list_compact(self):
+        """Test that the formula of a structure with its sites in compact form is listed."""
+        struc = StructureData(cell=((4., 0., 0.), (0., 4., 0.), (0., 0., 4.)), compact_sites=True)
+        struc.append_atom(position=(0., 0., 0.), symbols='Sr')
+        struc.append_atom(position=(2., 2., 2.), symbols='Ti')
+        struc.append_atom(position=(2., 2., 0.), symbols='O')
+        struc.append_atom(position=(2., 0., 2.), symbols='O')
+        struc.append_atom(position=(0., 2., 2.), symbols='O')
+        struc.store()
+
+        res = self.cli_runner.invoke(cmd_structure.structure_list, ['--raw'], catch_exceptions=False)
+        self.assertIn('{} O3SrTi'.format(struc.pk).encode('utf-8'), b' '.join(res.stdout_bytes.split()))
+
     def test_export(self):
         from aiida.cmdline.commands.cmd_data.cmd_structure import EXPORT_FORMATS
         self.data_export_test(StructureData, self.ids, EXPORT_FORMATS)
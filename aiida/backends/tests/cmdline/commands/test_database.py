@@ -149,3 +149,25 @@ class TestVerdiDatabasaIntegrity(AiidaTestCase):
         result = self.cli_runner.invoke(cmd_database.detect_invalid_nodes, [])
         self.assertNotEqual(result.exit_code, 0)
         self.assertIsNotNone(result.exception)
+
+
+class TestVerdiDatabaseStatistics(AiidaTestCase):
+    """Tests for `verdi database refresh-statistics`."""
+
+    def setUp(self):
+        self.cli_runner = CliRunner()
+
+    def test_refresh_statistics_compact(self):
+        """Test that `verdi database refresh-statistics --compact` merges the rows of the statistics table."""
+        count_rows = 'SELECT COUNT(*) FROM db_dbnodestatistics'
+        count_groups = 'SELECT COUNT(DISTINCT (user_id, node_type, day)) FROM db_dbnodestatistics'
+
+        for _ in range(3):
+            Data().store()
+
+        statistics = self.backend.query_manager.get_creation_statistics()
+
+        result = self.cli_runner.invoke(cmd_database.database_refresh_statistics, ['--compact'])
+        self.assertClickResultNoException(result)
+        self.assertEqual(self.backend.execute_raw(count_rows), self.backend.execute_raw(count_groups))
+        self.assertEqual(self.backend.query_manager.get_creation_statistics(), statistics)
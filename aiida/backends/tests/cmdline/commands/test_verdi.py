@@ -11,6 +11,13 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+
+import os
+import subprocess
+import sys
+import time
+
+import click
 from click.testing import CliRunner
 
 from aiida import get_version
@@ -18,6 +25,35 @@ from aiida.backends.tests.utils.configuration import with_temporary_config_insta
 from aiida.backends.testbase import AiidaTestCase
 from aiida.cmdline.commands import cmd_verdi
 
+# Maximum number of seconds that a `verdi --help` call, including the start of the interpreter, is allowed to take. The
+# default is generous, such that only a regression that imports the ORM or all subcommands again makes the test fail,
+# but it can be tightened, or relaxed on slow machines, with the `AIIDA_VERDI_HELP_TIME_BUDGET` environment variable
+VERDI_HELP_TIME_BUDGET = float(os.environ.get('AIIDA_VERDI_HELP_TIME_BUDGET', 5.0))
+
+# Modules that neither printing the help of `verdi` nor completing its subcommands should import
+HEAVY_MODULES = ('aiida.orm', 'aiida.engine') + tuple(cmd_verdi.VERDI_SUBCOMMANDS.values())
+
+# Script that prints the help of `verdi` and writes the names of the heavy modules that were imported to stderr
+VERDI_HELP_SCRIPT = """
+import sys
+from aiida.cmdline.commands.cmd_verdi import verdi
+try:
+    verdi(['--help'], prog_name='verdi')
+except SystemExit:
+    pass
+sys.stderr.write(' '.join(name for name in sys.modules if name.startswith({modules!r})))
+"""
+
+# Script that completes the subcommands of `verdi` like the shell does, writing the completions to stdout and the names
+# of the heavy modules that were imported to stderr
+VERDI_COMPLETE_SCRIPT = """
+import sys
+from click_completion.core import get_choices
+from aiida.cmdline.commands.cmd_verdi import verdi
+sys.stdout.write(' '.join(name for name, _ in get_choices(verdi, 'verdi', [], '')))
+sys.stderr.write(' '.join(name for name in sys.modules if name.startswith({modules!r})))
+"""
+
 
 class TestVerdi(AiidaTestCase):
     """Tests for `verdi`."""
@@ -41,3 +77,50 @@ class TestVerdi(AiidaTestCase):
         CONFIG.dictionary[CONFIG.KEY_PROFILES] = {}
         result = self.cli_runner.invoke(cmd_verdi.verdi, [])
         self.assertIsNone(result.exception, result.output)
+
+    def test_verdi_subcommands(self):
+        """Verify that each lazily loaded subcommand is defined by the module that it is mapped onto."""
+        ctx = click.Context(cmd_verdi.verdi)
+
+        for name in cmd_verdi.VERDI_SUBCOMMANDS:
+            command = cmd_verdi.verdi.get_command(ctx, name)
+            self.assertIsNotNone(command, name)
+            self.assertEqual(command.name, name)
+
+    def test_verdi_help(self):
+        """Verify that `verdi --help` lists the subcommands with their short help."""
+        result = self.cli_runner.invoke(cmd_verdi.verdi, ['--help'])
+        self.assertIsNone(result.exception, result.output)
+
+        for name in cmd_verdi.VERDI_SUBCOMMANDS:
+            self.assertIn(name, result.output)
+
+    @staticmethod
+    def run_script(script):
+        """Run a script in a new interpreter and return its output and the heavy modules that it imported."""
+        script = script.format(modules=HEAVY_MODULES)
+        process = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        return stdout.decode('utf-8').split(), stderr.decode('utf-8').split()
+
+    def test_verdi_help_imports(self):
+        """Verify that `verdi --help` is fast and imports neither the ORM, the engine nor the subcommand modules."""
+        # The first call can build the cached command index, which imports all subcommands
+        self.run_script(VERDI_HELP_SCRIPT)
+
+        start = time.time()
+        _, modules = self.run_script(VERDI_HELP_SCRIPT)
+        elapsed = time.time() - start
+
+        self.assertEqual(modules, [])
+        self.assertLess(elapsed, VERDI_HELP_TIME_BUDGET)
+
+    def test_verdi_complete_imports(self):
+        """Verify that completing the subcommands of `verdi` does not import the modules of the subcommands."""
+        ctx = click.Context(cmd_verdi.verdi)
+        visible = [name for name in cmd_verdi.VERDI_SUBCOMMANDS if not cmd_verdi.verdi.get_command(ctx, name).hidden]
+
+        self.run_script(VERDI_HELP_SCRIPT)
+        choices, modules = self.run_script(VERDI_COMPLETE_SCRIPT)
+        self.assertEqual(modules, [])
+        self.assertEqual(sorted(choices), sorted(visible))
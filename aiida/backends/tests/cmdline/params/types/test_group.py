@@ -88,3 +88,16 @@ class TestGroupParamType(AiidaTestCase):
         identifier = '{}{}'.format(self.entity_03.label, OrmEntityLoader.label_ambiguity_breaker)
         result = self.param.convert(identifier, None, None)
         self.assertEqual(result.uuid, self.entity_03.uuid)
+
+    def test_create_if_not_exist_multiple(self):
+        """
+        Verify that an argument with multiple values still creates the groups that do not exist
+        """
+        from aiida.cmdline.params.arguments.overridable import IdentifierArgument
+
+        argument = IdentifierArgument(['groups'], nargs=-1, type=GroupParamType(create_if_not_exist=True))
+        result = argument.type_cast_value(None, (self.entity_01.label, 'non_existent_group'))
+
+        self.assertEqual(result[0].uuid, self.entity_01.uuid)
+        self.assertEqual(result[1].label, 'non_existent_group')
+        self.assertFalse(result[1].is_stored)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the autoscaler of the daemon and the worker status files it relies on."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import time
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon.autoscaler import AutoscalerPolicy
+from aiida.engine.daemon.monitor import get_worker_statuses, write_status_file
+
+
+def get_status(active_processes=0, loop_lag=0., max_processes=10):
+    """Return a worker status with the given load."""
+    return {
+        'pid': 1,
+        'active_processes': active_processes,
+        'max_processes': max_processes,
+        'loop_lag': loop_lag,
+        'timestamp': time.time()
+    }
+
+
+class TestAutoscalerPolicy(AiidaTestCase):
+    """Unit tests for the `AutoscalerPolicy` class."""
+
+    def setUp(self):
+        super(TestAutoscalerPolicy, self).setUp()
+        self.policy = AutoscalerPolicy(min_workers=1, max_workers=4, max_loop_lag=0.5, cooldown=60)
+
+    def test_bounds(self):
+        """Test that the number of workers is brought within the bounds."""
+        self.assertEqual(self.policy.decide(0, 0, [])[0], 1)
+        self.assertEqual(self.policy.decide(6, 0, [get_status()] * 6)[0], 4)
+
+        with self.assertRaises(ValueError):
+            AutoscalerPolicy(min_workers=2, max_workers=1, max_loop_lag=0.5, cooldown=60)
+
+    def test_scale_up(self):
+        """Test that workers are added for waiting tasks and lagging event loops, up to the maximum."""
+        full = get_status(active_processes=10)
+
+        self.assertEqual(self.policy.decide(1, 15, [full])[0], 3)
+        self.assertEqual(self.policy.decide(1, 100, [full])[0], 4)
+        self.assertEqual(self.policy.decide(2, 0, [full, get_status(loop_lag=2.)])[0], 3)
+        self.assertEqual(self.policy.decide(4, 100, [full] * 4), (4, None))
+
+    def test_scale_down(self):
+        """Test that a single worker is removed if the remaining workers can take the active processes easily."""
+        self.assertEqual(self.policy.decide(3, 0, [get_status(active_processes=2)] * 3)[0], 2)
+        self.assertEqual(self.policy.decide(2, 0, [get_status(active_processes=4)] * 2), (2, None))
+        self.assertEqual(self.policy.decide(3, 0, [get_status(loop_lag=0.4)] * 3), (3, None))
+        self.assertEqual(self.policy.decide(1, 0, [get_status()]), (1, None))
+
+    def test_cooldown(self):
+        """Test that the number of workers is not changed within the cooldown after the last change."""
+        now = time.time()
+        self.policy.last_scaled = now - 30
+        self.assertEqual(self.policy.decide(1, 100, [get_status(active_processes=10)], now=now), (1, None))
+        self.assertEqual(self.policy.decide(1, 100, [get_status(active_processes=10)], now=now + 31)[0], 4)
+
+
+class TestWorkerStatuses(AiidaTestCase):
+    """Unit tests for the status files of the daemon workers."""
+
+    def setUp(self):
+        super(TestWorkerStatuses, self).setUp()
+        self.dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(TestWorkerStatuses, self).tearDown()
+        shutil.rmtree(self.dirpath)
+
+    def test_get_worker_statuses(self):
+        """Test that the statuses of the workers are read and that stale statuses are ignored."""
+        stale = get_status()
+        stale['timestamp'] -= 3600
+
+        write_status_file(os.path.join(self.dirpath, '1.json'), get_status(active_processes=3))
+        write_status_file(os.path.join(self.dirpath, '2.json'), stale)
+
+        with open(os.path.join(self.dirpath, '3.json'), 'w') as handle:
+            handle.write('corrupt')
+
+        statuses = get_worker_statuses(self.dirpath)
+        self.assertEqual(len(statuses), 1)
+        self.assertEqual(statuses[0]['active_processes'], 3)
+        self.assertEqual(get_worker_statuses(os.path.join(self.dirpath, 'non-existent')), [])
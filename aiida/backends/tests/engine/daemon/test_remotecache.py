@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the cache of uploaded files on a computer."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+import tempfile
+import time
+
+import mock
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon import remotecache
+from aiida.engine.daemon.remotecache import MINIMUM_OBJECT_SIZE, RemoteObjectCache, get_object_key, get_objects_to_evict
+from aiida.transports.plugins.local import LocalTransport
+
+
+class TestGetObjectsToEvict(AiidaTestCase):
+    """Unit tests for the `get_objects_to_evict` function."""
+
+    def setUp(self):
+        super(TestGetObjectsToEvict, self).setUp()
+        self.objects = [('old', 100., 10), ('recent', 300., 10), ('middle', 200., 10)]
+
+    def test_unlimited(self):
+        """Test that no objects are evicted without limits."""
+        self.assertEqual(get_objects_to_evict(self.objects, now=400.), [])
+
+    def test_max_age(self):
+        """Test that the objects that were not used within the maximum age are evicted."""
+        self.assertEqual(get_objects_to_evict(self.objects, now=400., max_age=150.), ['old', 'middle'])
+
+    def test_max_size(self):
+        """Test that the least recently used objects are evicted until the others fit in the maximum size."""
+        self.assertEqual(get_objects_to_evict(self.objects, now=400., max_size=25), ['old'])
+
+
+class TestRemoteObjectCache(AiidaTestCase):
+    """Unit tests for the `RemoteObjectCache` class."""
+
+    def setUp(self):
+        super(TestRemoteObjectCache, self).setUp()
+        self.local = tempfile.mkdtemp()
+        self.remote = tempfile.mkdtemp()
+        self.content = os.urandom(MINIMUM_OBJECT_SIZE)
+        self.filepath = os.path.join(self.local, 'density')
+
+        with io.open(self.filepath, 'wb') as handle:
+            handle.write(self.content)
+
+        remotecache._LAST_EVICTION.pop(self.computer.uuid, None)  # pylint: disable=protected-access
+
+    def tearDown(self):
+        shutil.rmtree(self.local)
+        shutil.rmtree(self.remote)
+        remotecache._LAST_EVICTION.pop(self.computer.uuid, None)  # pylint: disable=protected-access
+        super(TestRemoteObjectCache, self).tearDown()
+
+    def test_put(self):
+        """Test that a file is copied from the cache once a file with the same content was uploaded."""
+        with LocalTransport() as transport:
+            transport.chdir(self.remote)
+            cache = RemoteObjectCache(transport, self.computer, self.remote)
+
+            self.assertFalse(cache.put(self.filepath, 'first'))
+            self.assertEqual(os.listdir(cache.path), [get_object_key(self.filepath)])
+
+            # The second upload is copied on the computer itself, without transferring the file
+            with mock.patch.object(LocalTransport, 'put') as put:
+                self.assertTrue(cache.put(self.filepath, 'second'))
+            self.assertFalse(put.called)
+            self.assertEqual(os.listdir(cache.path), [get_object_key(self.filepath)])
+
+        for filename in ['first', 'second']:
+            with io.open(os.path.join(self.remote, filename), 'rb') as handle:
+                self.assertEqual(handle.read(), self.content)
+
+    def test_put_small(self):
+        """Test that files below the minimum size are uploaded without being cached."""
+        with io.open(self.filepath, 'wb') as handle:
+            handle.write(b'small')
+
+        with LocalTransport() as transport:
+            transport.chdir(self.remote)
+            cache = RemoteObjectCache(transport, self.computer, self.remote)
+
+            self.assertFalse(cache.put(self.filepath, 'small'))
+            self.assertFalse(os.path.exists(cache.path))
+
+    def test_evict_temporary(self):
+        """Test that stale temporary files are removed by the eviction, even if the cache has no limits."""
+        with LocalTransport() as transport:
+            transport.chdir(self.remote)
+            cache = RemoteObjectCache(transport, self.computer, self.remote)
+            self.assertFalse(cache.put(self.filepath, 'first'))
+
+            now = time.time()
+            stale = 'stale{}'.format(remotecache.TEMPORARY_SUFFIX)
+            recent = 'recent{}'.format(remotecache.TEMPORARY_SUFFIX)
+
+            for filename, mtime in [(stale, now - 2 * remotecache.EVICTION_INTERVAL), (recent, now)]:
+                filepath = os.path.join(cache.path, filename)
+                with io.open(filepath, 'wb') as handle:
+                    handle.write(b'partial')
+                os.utime(filepath, (mtime, mtime))
+
+            self.assertEqual(cache.evict(now=now), [stale])
+
+        self.assertEqual(sorted(os.listdir(cache.path)), sorted([get_object_key(self.filepath), recent]))
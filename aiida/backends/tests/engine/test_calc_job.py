@@ -13,15 +13,24 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import copy
+import io
+import os
+import shutil
+import tempfile
+
+import mock
 
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
+from aiida.common.datastructures import CalcJobState
 from aiida.engine import launch, CalcJob, Process
+from aiida.engine.processes.calcjobs.tasks import Waiting, RETRIEVE_COMMAND
 from aiida.engine.processes.ports import PortNamespace
-from aiida.plugins import CalculationFactory
+from aiida.plugins import CalculationFactory, ParserFactory
 
 ArithmeticAddCalculation = CalculationFactory('arithmetic.add')  # pylint: disable=invalid-name
+ArithmeticAddParser = ParserFactory('arithmetic.add')  # pylint: disable=invalid-name
 
 
 class TestCalcJob(AiidaTestCase):
@@ -185,3 +194,88 @@ class TestCalcJob(AiidaTestCase):
 
         with self.assertRaises(exceptions.InputValidationError):
             ArithmeticAddCalculation(inputs=inputs)
+
+
+class TestCalcJobOffloaded(AiidaTestCase):
+    """Test the `Waiting` state of a `CalcJob` whose computer offloads the retrieval and parsing to the executor."""
+
+    @classmethod
+    def setUpClass(cls, *args, **kwargs):
+        super(TestCalcJobOffloaded, cls).setUpClass(*args, **kwargs)
+        computer = orm.Computer(
+            name='offloading', hostname='localhost', transport_type='local', scheduler_type='direct',
+            workdir='/tmp/aiida').store()
+        computer.configure()
+        computer.set_maximum_offloaded_tasks(1)
+        cls.code = orm.Code(remote_computer_exec=(computer, '/bin/true')).store()
+
+    def setUp(self):
+        super(TestCalcJobOffloaded, self).setUp()
+        self.assertIsNone(Process.current())
+        self.workdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir)
+        super(TestCalcJobOffloaded, self).tearDown()
+        self.assertIsNone(Process.current())
+
+    def get_retrieving_process(self, output):
+        """Return a process whose job finished, with the given content in its output file in the remote workdir."""
+        inputs = {
+            'code': self.code,
+            'x': orm.Int(1),
+            'y': orm.Int(2),
+            'metadata': {
+                'options': {
+                    'resources': {
+                        'num_machines': 1,
+                        'num_mpiprocs_per_machine': 1
+                    },
+                }
+            }
+        }
+        process = ArithmeticAddCalculation(inputs=inputs)
+
+        with io.open(os.path.join(self.workdir, 'aiida.out'), 'w') as handle:
+            handle.write(output)
+
+        process.node.set_remote_workdir(self.workdir)
+        process.node.set_retrieve_list(['aiida.out'])
+        process.node.set_state(CalcJobState.RETRIEVING)
+
+        return process
+
+    @staticmethod
+    def run_waiting(process):
+        """Run the `Waiting` state that retrieves the job of the process and return the state it transitions to."""
+        waiting = Waiting(process, None, data=RETRIEVE_COMMAND)
+        return process.runner.loop.run_sync(waiting.execute)
+
+    def test_retrieve_and_parse(self):
+        """Test that the outputs are retrieved and parsed in the executor and only attached by the process."""
+        process = self.get_retrieving_process(u'3')
+        node = process.node
+
+        state = self.run_waiting(process)
+        self.assertEqual(node.get_state(), CalcJobState.PARSING)
+        self.assertEqual(node.get_outgoing(link_label_filter='sum').one().node.value, 3)
+        self.assertIsNotNone(node.get_outgoing(link_label_filter=node.link_label_retrieved).first())
+
+        exit_code = process.parse(*state.args)
+        self.assertEqual(exit_code.status, 0)
+        self.assertEqual(process.outputs['sum'].value, 3)
+
+    def test_invalid_output(self):
+        """Test that outputs that do not match the output ports are not stored by the executor."""
+
+        def parse(parser, **kwargs):  # pylint: disable=unused-argument
+            parser.out('sum', orm.Str('3'))
+
+        process = self.get_retrieving_process(u'3')
+
+        with mock.patch.object(ArithmeticAddParser, 'parse', parse):
+            state = self.run_waiting(process)
+
+        exit_code = process.parse(*state.args)
+        self.assertEqual(exit_code.status, process.exit_codes.ERROR_INVALID_OUTPUT.status)
+        self.assertIsNone(process.node.get_outgoing(link_label_filter='sum').first())
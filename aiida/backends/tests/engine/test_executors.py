@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the executor to which runners offload blocking tasks."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import threading
+import time
+
+from tornado import gen, ioloop
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.executors import ThreadExecutor
+
+
+class TestThreadExecutor(AiidaTestCase):
+    """Tests for the `ThreadExecutor` class."""
+
+    def setUp(self):
+        super(TestThreadExecutor, self).setUp()
+        self.loop = ioloop.IOLoop()
+        self.executor = ThreadExecutor(max_workers=4, loop=self.loop)
+
+    def tearDown(self):
+        self.executor.close()
+        self.loop.close()
+        super(TestThreadExecutor, self).tearDown()
+
+    def test_result(self):
+        """Test that the function runs in another thread and that its result is returned on the event loop."""
+
+        @gen.coroutine
+        def task():
+            thread = yield self.executor.submit('key', 1, threading.current_thread)
+            raise gen.Return((thread, threading.current_thread()))
+
+        thread, loop_thread = self.loop.run_sync(task)
+        self.assertIsNot(thread, loop_thread)
+
+    def test_exception(self):
+        """Test that an exception raised by the function is raised by the coroutine that submitted it."""
+
+        def fail():
+            raise RuntimeError('failed')
+
+        @gen.coroutine
+        def task():
+            yield self.executor.submit('key', 1, fail)
+
+        with self.assertRaises(RuntimeError):
+            self.loop.run_sync(task)
+
+    def test_limit(self):
+        """Test that no more functions with the same key run at once than the limit."""
+        lock = threading.Lock()
+        running = {'current': 0, 'maximum': 0}
+
+        def work():
+            with lock:
+                running['current'] += 1
+                running['maximum'] = max(running['maximum'], running['current'])
+            time.sleep(0.05)
+            with lock:
+                running['current'] -= 1
+
+        @gen.coroutine
+        def task():
+            yield [self.executor.submit('key', 2, work) for _ in range(6)]
+
+        self.loop.run_sync(task)
+        self.assertEqual(running['maximum'], 2)
+
+    def test_submit_once(self):
+        """Test that a function is not submitted again while its outcome was not collected."""
+        calls = []
+
+        def work(cancelled):  # pylint: disable=unused-argument
+            calls.append(None)
+            time.sleep(0.05)
+            return len(calls)
+
+        @gen.coroutine
+        def task():
+            first = self.executor.submit_once('task', 'key', 2, work)
+            second = self.executor.submit_once('task', 'key', 2, work)
+            self.assertIs(first, second)
+            yield first
+
+            # The outcome was not collected yet, as if the process was paused while waiting for it
+            result = yield self.executor.submit_once('task', 'key', 2, work)
+            self.executor.release('task')
+
+            resubmitted = yield self.executor.submit_once('task', 'key', 2, work)
+            raise gen.Return((result, resubmitted))
+
+        self.assertEqual(self.loop.run_sync(task), (1, 2))
+
+    def test_submit_once_failed(self):
+        """Test that a function that failed is submitted again."""
+        calls = []
+
+        def fail(cancelled):  # pylint: disable=unused-argument
+            calls.append(None)
+            raise RuntimeError('failed')
+
+        @gen.coroutine
+        def task():
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    yield self.executor.submit_once('task', 'key', 1, fail)
+
+        self.loop.run_sync(task)
+        self.assertEqual(len(calls), 2)
+
+    def test_cancel(self):
+        """Test that cancelling a function sets its event and returns its future."""
+        started = threading.Event()
+
+        def work(cancelled):
+            started.set()
+            cancelled.wait(5)
+            return cancelled.is_set()
+
+        @gen.coroutine
+        def task():
+            future = self.executor.submit_once('task', 'key', 1, work)
+            while not started.is_set():
+                yield gen.sleep(0.01)
+            self.assertIs(self.executor.cancel('task'), future)
+            self.assertIsNone(self.executor.cancel('task'))
+            result = yield future
+            raise gen.Return(result)
+
+        self.assertTrue(self.loop.run_sync(task))
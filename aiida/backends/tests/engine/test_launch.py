@@ -105,6 +105,41 @@ class TestLaunchers(AiidaTestCase):
         with self.assertRaises(exceptions.InvalidOperation):
             launch.submit(AddWorkChain, a=self.a, b=self.b, metadata={'store_provenance': False})
 
+    def test_submit_many(self):
+        """Verify that `submit_many` returns the nodes in order and reports the processes that failed by index."""
+        import mock
+        from aiida.engine.exceptions import SubmissionError
+        from aiida.manage.manager import Manager
+
+        builders = []
+        for value in range(5):
+            builder = AddWorkChain.get_builder()
+            builder.a = orm.Int(value)
+            builder.b = self.b
+            builders.append(builder)
+
+        builders[3].metadata.store_provenance = False
+
+        controller = mock.Mock()
+        with mock.patch.object(Manager, 'get_process_controller', return_value=controller):
+            with self.assertRaises(SubmissionError) as context:
+                launch.submit_many(builders, batch_size=2)
+
+        nodes = context.exception.nodes
+        self.assertEqual(list(context.exception.failures.keys()), [3])
+        self.assertIsInstance(context.exception.failures[3], exceptions.InvalidOperation)
+        self.assertIsNone(nodes[3])
+
+        for value, node in enumerate(nodes):
+            if value != 3:
+                self.assertIsInstance(node, orm.WorkChainNode)
+                self.assertTrue(node.is_stored)
+                self.assertIsNotNone(node.checkpoint)
+                self.assertEqual(node.get_incoming().get_node_by_label('a').value, value)
+
+        pids = sorted(call[0][0] for call in controller.continue_process.call_args_list)
+        self.assertEqual(pids, sorted(node.pk for node in nodes if node is not None))
+
 
 class TestLaunchersDryRun(AiidaTestCase):
     """Test the launchers when performing a dry-run."""
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the metrics of the engine."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.metrics import MetricsRegistry, format_prometheus, merge_snapshots
+
+
+class TestMetrics(AiidaTestCase):
+    """Unit tests for the `MetricsRegistry` and the functions that operate on its snapshots."""
+
+    def setUp(self):
+        super(TestMetrics, self).setUp()
+        self.registry = MetricsRegistry()
+
+    def test_histogram(self):
+        """Test that a histogram counts its observations per labels and in cumulative buckets."""
+        histogram = self.registry.histogram('task_seconds', 'Time per task', buckets=(1., 10.))
+        histogram.observe(0.5, task='upload')
+        histogram.observe(5., task='upload')
+        histogram.observe(50., task='upload')
+        histogram.observe(2., task='retrieve')
+
+        snapshot = self.registry.snapshot()['task_seconds']
+        series = {entry['labels']['task']: entry['value'] for entry in snapshot['series']}
+
+        self.assertEqual(snapshot['type'], 'histogram')
+        self.assertEqual(snapshot['buckets'], [1., 10.])
+        self.assertEqual(series['upload'], {'buckets': [1, 2], 'count': 3, 'sum': 55.5, 'max': 50.})
+        self.assertEqual(series['retrieve'], {'buckets': [0, 1], 'count': 1, 'sum': 2., 'max': 2.})
+
+    def test_histogram_time(self):
+        """Test that timing a block records an observation, also if the block raises."""
+        histogram = self.registry.histogram('step_seconds', 'Time per step')
+
+        with self.assertRaises(RuntimeError):
+            with histogram.time(state='running'):
+                raise RuntimeError
+
+        series = self.registry.snapshot()['step_seconds']['series']
+        self.assertEqual(series[0]['labels'], {'state': 'running'})
+        self.assertEqual(series[0]['value']['count'], 1)
+
+    def test_registry(self):
+        """Test that the registry returns the existing metric for a name and refuses a metric of another type."""
+        histogram = self.registry.histogram('name', 'description')
+        self.assertIs(self.registry.histogram('name', 'description'), histogram)
+
+        with self.assertRaises(ValueError):
+            self.registry.gauge('name', 'description')
+
+        histogram.observe(1.)
+        self.registry.reset()
+        self.assertEqual(self.registry.snapshot()['name']['series'], [])
+
+    def test_merge_snapshots(self):
+        """Test that the snapshots of several workers are merged per metric and labels."""
+        first = MetricsRegistry()
+        first.histogram('lag', 'Lag', buckets=(1.,)).observe(0.5)
+        first.gauge('active', 'Active').set(2)
+
+        second = MetricsRegistry()
+        second.histogram('lag', 'Lag', buckets=(1.,)).observe(3.)
+        second.gauge('active', 'Active').set(3)
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])
+
+        self.assertEqual(merged['lag']['series'][0]['value'], {'buckets': [1], 'count': 2, 'sum': 3.5, 'max': 3.})
+        self.assertEqual(merged['active']['series'][0]['value'], 5)
+
+    def test_format_prometheus(self):
+        """Test the text format of Prometheus, including the extra labels of a snapshot."""
+        self.registry.histogram('lag_seconds', 'Lag', buckets=(1.,)).observe(0.5)
+        self.registry.gauge('active', 'Active "processes"').set(2, computer='local\\host')
+
+        text = format_prometheus([({'worker': 12}, self.registry.snapshot())])
+
+        self.assertEqual(
+            text.splitlines(), [
+                '# HELP aiida_active Active "processes"',
+                '# TYPE aiida_active gauge',
+                'aiida_active{computer="local\\\\host",worker="12"} 2',
+                '# HELP aiida_lag_seconds Lag',
+                '# TYPE aiida_lag_seconds histogram',
+                'aiida_lag_seconds_bucket{le="1.0",worker="12"} 1',
+                'aiida_lag_seconds_bucket{le="+Inf",worker="12"} 1',
+                'aiida_lag_seconds_sum{worker="12"} 0.5',
+                'aiida_lag_seconds_count{worker="12"} 1',
+            ])
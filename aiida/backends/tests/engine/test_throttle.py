@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the enforcement of the limits of computers on the transport tasks of calculation jobs."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.processes.calcjobs.throttle import FairQueue, RateLimiter
+
+
+class TestFairQueue(AiidaTestCase):
+    """Tests for the `FairQueue` class."""
+
+    def test_limit(self):
+        """Test that no more slots are granted than the limit and that a released slot goes to the next waiter."""
+        queue = FairQueue(limit=2)
+        managers = [queue.request_slot('group') for _ in range(3)]
+        requests = [manager.__enter__() for manager in managers]
+
+        self.assertEqual([request.done() for request in requests], [True, True, False])
+        self.assertEqual((queue.active, queue.waiting), (2, 1))
+
+        managers[0].__exit__(None, None, None)
+        self.assertTrue(requests[2].done())
+        self.assertEqual((queue.active, queue.waiting), (2, 0))
+
+        for manager in managers[1:]:
+            manager.__exit__(None, None, None)
+
+        self.assertEqual((queue.active, queue.waiting), (0, 0))
+
+    def test_unlimited(self):
+        """Test that a limit of zero grants all requests."""
+        queue = FairQueue(limit=0)
+
+        with queue.request_slot() as first, queue.request_slot() as second:
+            self.assertTrue(first.done() and second.done())
+
+    def test_round_robin(self):
+        """Test that the waiters of different groups are served in turn, regardless of the order of their requests."""
+        queue = FairQueue(limit=1)
+        managers = {}
+        granted = []
+
+        holder = queue.request_slot('holder')
+        holder.__enter__()
+
+        for key in [('a', 1), ('a', 2), ('a', 3), ('b', 1), ('b', 2)]:
+            managers[key] = queue.request_slot(key[0])
+            request = managers[key].__enter__()
+            request.add_done_callback(lambda _, key=key: granted.append(key))
+
+        holder.__exit__(None, None, None)
+
+        # Each waiter releases its slot as soon as it is granted, which grants the slot to the next one in turn
+        while len(granted) < len(managers):
+            managers[granted[-1]].__exit__(None, None, None)
+
+        managers[granted[-1]].__exit__(None, None, None)
+
+        self.assertEqual(granted, [('a', 1), ('b', 1), ('a', 2), ('b', 2), ('a', 3)])
+        self.assertEqual((queue.active, queue.waiting), (0, 0))
+
+    def test_abandoned(self):
+        """Test that a waiter that gives up before being granted a slot is removed from the queue."""
+        queue = FairQueue(limit=1)
+
+        with queue.request_slot('a'):
+            with queue.request_slot('b') as request:
+                self.assertFalse(request.done())
+            self.assertEqual((queue.active, queue.waiting), (1, 0))
+
+        self.assertEqual(queue.active, 0)
+
+
+class TestRateLimiter(AiidaTestCase):
+    """Tests for the `RateLimiter` class."""
+
+    def test_reserve(self):
+        """Test that the reserved moments are spaced out according to the rate."""
+        limiter = RateLimiter(rate=6)
+
+        self.assertEqual(limiter.reserve(now=100.), 0.)
+        self.assertEqual(limiter.reserve(now=100.), 10.)
+        self.assertEqual(limiter.reserve(now=105.), 15.)
+        self.assertEqual(limiter.reserve(now=200.), 0.)
+
+    def test_unlimited(self):
+        """Test that a rate of zero never delays."""
+        limiter = RateLimiter(rate=0)
+
+        for _ in range(3):
+            self.assertEqual(limiter.reserve(now=100.), 0.)
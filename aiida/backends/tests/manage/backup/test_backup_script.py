@@ -271,6 +271,43 @@ class TestBackupScriptUnit(AiidaTestCase):
             '_backup_setup_inst destination directory is not normalized as expected.'
         )
 
+    def test_backup_directory_incremental(self):
+        """Test that only changed files are copied and that deleted files are removed from the backup."""
+        import io
+        import os
+        from aiida.manage.backup.backup_base import BackupManifest, BandwidthLimiter
+
+        repository_path = tempfile.mkdtemp()
+        self._backup_setup_inst._backup_dir = tempfile.mkdtemp()
+
+        try:
+            os.makedirs(os.path.join(repository_path, 'node', 'sub'))
+            for filename, content in [('file_a', b'a'), (os.path.join('sub', 'file_b'), b'b')]:
+                with io.open(os.path.join(repository_path, 'node', filename), 'wb') as handle:
+                    handle.write(content)
+
+            manifest = BackupManifest(os.path.join(self._backup_setup_inst._backup_dir, 'manifest.sqlite'))
+            limiter = BandwidthLimiter()
+            backup_directory = self._backup_setup_inst._backup_directory
+
+            self.assertEqual(backup_directory(repository_path, 'node', manifest, limiter), 2)
+            self.assertEqual(backup_directory(repository_path, 'node', manifest, limiter), 0)
+
+            with io.open(os.path.join(repository_path, 'node', 'file_a'), 'wb') as handle:
+                handle.write(b'changed')
+            os.remove(os.path.join(repository_path, 'node', 'sub', 'file_b'))
+
+            self.assertEqual(backup_directory(repository_path, 'node', manifest, limiter), 1)
+            self.assertFalse(os.path.exists(os.path.join(self._backup_setup_inst._backup_dir, 'node', 'sub', 'file_b')))
+            with io.open(os.path.join(self._backup_setup_inst._backup_dir, 'node', 'file_a'), 'rb') as handle:
+                self.assertEqual(handle.read(), b'changed')
+
+            manifest.close()
+            self.assertEqual(list(BackupManifest(manifest._filepath).get('node').keys()), ['file_a'])
+        finally:
+            shutil.rmtree(repository_path)
+            shutil.rmtree(self._backup_setup_inst._backup_dir)
+
 
 class TestBackupScriptIntegration(AiidaTestCase):
     """Integration tests for the Backup classes."""
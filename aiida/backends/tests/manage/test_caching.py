@@ -12,12 +12,15 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import os
 import tempfile
+import time
 import unittest
 import yaml
 
 from aiida.common import exceptions
 from aiida.manage.caching import configure, get_use_cache, enable_caching, disable_caching
+from aiida.manage.caching import _CachingPolicy, CHECK_INTERVAL
 from aiida.manage.configuration import get_profile
 
 
@@ -90,6 +93,9 @@ class CacheConfigTest(unittest.TestCase):
         with self.assertRaises(exceptions.ConfigurationError):
             load_configuration('aiida.nonexistent_group:templatereplacer')  # invalid entry point group
 
+        with self.assertRaises(exceptions.ConfigurationError):
+            load_configuration('aiida.calculations:*.add')  # wildcard is only allowed at the end
+
     def test_invalid_config(self):
         """Test `get_use_cache` raises a `TypeError` if identifier is not a valid entry point string."""
         with self.assertRaises(TypeError):
@@ -121,3 +127,69 @@ class CacheConfigTest(unittest.TestCase):
         with disable_caching(identifier='aiida.calculations:arithmetic.add'):
             self.assertFalse(get_use_cache(identifier='aiida.calculations:arithmetic.add'))
         self.assertTrue(get_use_cache(identifier='aiida.calculations:arithmetic.add'))
+
+    def test_contextmanager_nested(self):
+        """Test that nested context managers with the same identifier are undone in the reverse order."""
+        identifier = 'aiida.calculations:templatereplacer'
+
+        with enable_caching(identifier=identifier):
+            with disable_caching(identifier=identifier):
+                with enable_caching(identifier=identifier):
+                    self.assertTrue(get_use_cache(identifier=identifier))
+                self.assertFalse(get_use_cache(identifier=identifier))
+            self.assertTrue(get_use_cache(identifier=identifier))
+        self.assertFalse(get_use_cache(identifier=identifier))
+
+        with enable_caching():
+            with disable_caching():
+                with enable_caching():
+                    self.assertTrue(get_use_cache())
+                self.assertFalse(get_use_cache())
+            self.assertTrue(get_use_cache())
+
+    def test_wildcard(self):
+        """Test that wildcards apply to all matching identifiers, unless a more specific identifier is configured."""
+        configuration = {
+            get_profile().name: {
+                'default': False,
+                'enabled': ['aiida.calculations:*'],
+                'disabled': ['aiida.calculations:arithmetic.*', 'aiida.calculations:templatereplacer'],
+            }
+        }
+        with tempfile.NamedTemporaryFile() as handle:
+            yaml.dump(configuration, handle, encoding='utf-8')
+            configure(config_file=handle.name)
+
+        self.assertTrue(get_use_cache(identifier='aiida.calculations:simpleplugins.templatereplacer'))
+        self.assertFalse(get_use_cache(identifier='aiida.calculations:arithmetic.add'))
+        self.assertFalse(get_use_cache(identifier='aiida.calculations:templatereplacer'))
+        self.assertFalse(get_use_cache(identifier='aiida.workflows:arithmetic.add_multiply'))
+
+    def test_policy_outdated(self):
+        """Test that a policy that watches its configuration file is outdated once the file is modified."""
+        config = {'default': True, 'enabled': [], 'disabled': []}
+
+        with tempfile.NamedTemporaryFile() as handle:
+            mtime = os.stat(handle.name).st_mtime
+            watching = _CachingPolicy(config, config_file=handle.name, mtime=mtime)
+            pinned = _CachingPolicy(config, mtime=mtime)
+            self.assertFalse(watching.is_outdated())
+
+            os.utime(handle.name, (mtime + 10, mtime + 10))
+            now = time.time() + CHECK_INTERVAL
+            self.assertTrue(watching.is_outdated(now=now))
+            self.assertFalse(pinned.is_outdated(now=now))
+
+    def test_policy_outdated_interval(self):
+        """Test that the configuration file is checked at most once every `CHECK_INTERVAL` seconds."""
+        config = {'default': True, 'enabled': [], 'disabled': []}
+
+        with tempfile.NamedTemporaryFile() as handle:
+            mtime = os.stat(handle.name).st_mtime
+            policy = _CachingPolicy(config, config_file=handle.name, mtime=mtime)
+            now = time.time() + CHECK_INTERVAL
+            self.assertFalse(policy.is_outdated(now=now))
+
+            os.utime(handle.name, (mtime + 10, mtime + 10))
+            self.assertFalse(policy.is_outdated(now=now + CHECK_INTERVAL / 2.))
+            self.assertTrue(policy.is_outdated(now=now + CHECK_INTERVAL))
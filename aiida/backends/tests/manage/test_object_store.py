@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the content-addressed object store of the node repositories."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from uuid import uuid4
+
+from aiida.common import exceptions
+from aiida.manage.repository.object_store import (
+    PackedObjectStore, migrate_folder_repository, OBJECT_TYPE_DIRECTORY, OBJECT_TYPE_FILE
+)
+
+
+class ObjectStoreTestCase(unittest.TestCase):
+    """Base class for tests that need an initialised object store in a temporary directory."""
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.store = PackedObjectStore(os.path.join(self.dirpath, 'packs'), pack_size=8)
+        self.store.initialise()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def create_folder(self, contents):
+        """Create a folder with the given contents, a dictionary of relative file paths onto their content."""
+        dirpath = tempfile.mkdtemp(dir=self.dirpath)
+
+        for relpath, content in contents.items():
+            filepath = os.path.join(dirpath, relpath)
+            if not os.path.isdir(os.path.dirname(filepath)):
+                os.makedirs(os.path.dirname(filepath))
+            with io.open(filepath, 'wb') as handle:
+                handle.write(content)
+
+        return dirpath
+
+
+class TestPackedObjectStore(ObjectStoreTestCase):
+    """Tests for the `PackedObjectStore`."""
+
+    def test_add_node(self):
+        """Test adding the contents of a node repository and reading them back."""
+        uuid = 'a0b1c2d3-0000-0000-0000-000000000000'
+        contents = {'file_a.txt': b'content a', os.path.join('sub', 'file_b.txt'): b'content b'}
+        self.store.add_node(uuid, self.create_folder(contents))
+
+        entries = self.store.get_node_entries(uuid)
+        self.assertEqual(entries[''][0], OBJECT_TYPE_DIRECTORY)
+        self.assertEqual(entries['sub'][0], OBJECT_TYPE_DIRECTORY)
+        self.assertEqual(entries['sub/file_b.txt'][0], OBJECT_TYPE_FILE)
+
+        with self.store.open_object(entries['file_a.txt'][1]) as handle:
+            self.assertEqual(handle.read(), b'content a')
+
+        with self.store.open_object(entries['sub/file_b.txt'][1]) as handle:
+            handle.seek(8)
+            self.assertEqual(handle.read(), b'b')
+
+        target = tempfile.mkdtemp(dir=self.dirpath)
+        self.store.materialize_node(uuid, target)
+        with io.open(os.path.join(target, 'sub', 'file_b.txt'), 'rb') as handle:
+            self.assertEqual(handle.read(), b'content b')
+
+        with self.assertRaises(exceptions.NotExistent):
+            self.store.get_node_entries('non-existent')
+
+    def test_deduplication(self):
+        """Test that identical content of different nodes is stored once and is removed by repacking when unused."""
+        self.store.add_node('node_a', self.create_folder({'a': b'shared', 'b': b'unique'}))
+        self.store.add_node('node_b', self.create_folder({'c': b'shared'}))
+
+        statistics = self.store.get_statistics()
+        self.assertEqual(statistics['nodes'], 2)
+        self.assertEqual(statistics['objects'], 2)
+        self.assertGreater(statistics['packs'], 1)
+
+        self.store.delete_node('node_a')
+        self.assertEqual(self.store.get_statistics()['unreferenced_objects'], 1)
+
+        removed, _ = self.store.repack()
+        self.assertEqual(removed, 1)
+        self.assertEqual(self.store.get_statistics()['unreferenced_objects'], 0)
+
+        with self.store.open_object(self.store.get_node_entries('node_b')['c'][1]) as handle:
+            self.assertEqual(handle.read(), b'shared')
+
+    def test_migrate_folder_repository(self):
+        """Test migrating the sharded node repository folders into the store."""
+        uuid = 'a0b1c2d3-0000-0000-0000-000000000000'
+        repository = tempfile.mkdtemp(dir=self.dirpath)
+        node_folder = os.path.join(repository, 'node', uuid[:2], uuid[2:4], uuid[4:])
+        shutil.copytree(self.create_folder({os.path.join('path', 'file'): b'content'}), node_folder)
+
+        self.assertEqual(migrate_folder_repository(self.store, repository), 1)
+        self.assertFalse(os.path.exists(node_folder))
+        self.assertEqual(self.store.get_node_entries(uuid)['path/file'][0], OBJECT_TYPE_FILE)
+
+
+class TestPackedRepository(ObjectStoreTestCase):
+    """Tests for the `Repository` of a node in a profile whose repository uses the object store."""
+
+    def get_repository(self, uuid):
+        """Return the repository of the stored node with the given UUID, using the object store of the test."""
+        from aiida.orm.utils.repository import Repository
+
+        store = self.store
+
+        class PackedRepository(Repository):
+
+            def _get_object_store(self):
+                return store
+
+        return PackedRepository(uuid, is_stored=True)
+
+    def test_folder_layout(self):
+        """Test that the repository of a node that is not in the object store is read from the folder layout."""
+        repository = self.get_repository(str(uuid4()))
+        self.assertFalse(repository._is_packed())  # pylint: disable=protected-access
+
+    def test_hash(self):
+        """Test that a packed repository hashes like the folder with the same contents, without materializing it."""
+        from aiida.common.folders import Folder
+        from aiida.common.hashing import make_hash
+
+        uuid = str(uuid4())
+        dirpath = self.create_folder({'file_a.txt': b'content a', os.path.join('sub', 'file_b.txt'): b'content b'})
+        self.store.add_node(uuid, dirpath)
+
+        repository = self.get_repository(uuid)
+        self.assertTrue(repository._is_packed())  # pylint: disable=protected-access
+        folder = repository._get_folder_to_hash()  # pylint: disable=protected-access
+        self.assertEqual(make_hash(folder), make_hash(Folder(dirpath)))
+        self.assertIsNone(repository._temp_folder)  # pylint: disable=protected-access
@@ -14,6 +14,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 import os
+import mock
+import six
 
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions, LinkType
@@ -122,6 +124,20 @@ class TestNodeAttributesExtras(AiidaTestCase):
         node_attribute['nested']['a'] = 3
         self.assertEqual(original_attribute['nested']['a'], 2)
 
+    def test_get_attribute_many_stored(self):
+        """Test that `Node.get_attribute_many` of a loaded node returns the selected values, including `None`."""
+        self.node.set_attribute_many({'one': 1, 'none': None, 'nested': {'a': [1, 2]}})
+        self.node.store()
+
+        node = load_node(self.node.pk)
+        self.assertEqual(node.get_attribute_many(['nested', 'none', 'one']), [{'a': [1, 2]}, None, 1])
+        self.assertEqual(node.get_attribute('none', 'default'), None)
+        self.assertEqual(node.get_attribute('missing', 'default'), 'default')
+        self.assertEqual(node.attributes, {'one': 1, 'none': None, 'nested': {'a': [1, 2]}})
+
+        with self.assertRaises(AttributeError):
+            node.get_attribute_many(['one', 'missing'])
+
     def test_set_attribute(self):
         """Test the `Node.set_attribute` method."""
         with self.assertRaises(exceptions.ValidationError):
@@ -365,6 +381,242 @@ class TestNodeAttributesExtras(AiidaTestCase):
         self.assertEqual(set(self.node.extras_keys()), set(extras))
 
 
+class TestNodeStoreMany(AiidaTestCase):
+    """Test for storing multiple nodes at once through `Node.objects.store_many`."""
+
+    def test_store_many(self):
+        """Test that nodes, their hashes and the links between them are stored."""
+        calculation = CalculationNode()
+        inputs = [Data() for _ in range(3)]
+        output = Data()
+
+        for index, node in enumerate(inputs):
+            node.set_attribute('index', index)
+            calculation.add_incoming(node, link_type=LinkType.INPUT_CALC, link_label='input_{}'.format(index))
+
+        output.put_object_from_filelike(six.StringIO(u'content'), 'file.txt')
+        output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+
+        nodes = Node.objects.store_many(inputs + [calculation, output])
+
+        self.assertEqual(len(nodes), 5)
+        for node in nodes:
+            self.assertTrue(node.is_stored)
+            self.assertFalse(node.has_cached_links())
+            self.assertEqual(node.get_extra('_aiida_hash'), node.get_hash())
+
+        self.assertEqual(len(calculation.get_incoming(link_type=LinkType.INPUT_CALC).all()), 3)
+        self.assertEqual(output.get_incoming().one().node.uuid, calculation.uuid)
+        self.assertEqual(load_node(output.pk).get_object_content('file.txt'), 'content')
+
+    def test_store_many_unstored_source(self):
+        """Test that the source nodes of cached links have to be stored or part of the nodes to store."""
+        source = Data()
+        target = CalculationNode()
+        target.add_incoming(source, link_type=LinkType.INPUT_CALC, link_label='input')
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            Node.objects.store_many([target])
+
+        self.assertFalse(target.is_stored)
+
+    def test_store_many_not_storable(self):
+        """Test that nothing is stored if one of the nodes cannot be stored."""
+        node = Data()
+
+        with self.assertRaises(exceptions.StoringNotAllowed):
+            Node.objects.store_many([node, Node()])
+
+        self.assertFalse(node.is_stored)
+
+    def test_store_many_links(self):
+        """Test that additional links between stored nodes are validated and stored together with the nodes."""
+        from aiida.orm import WorkflowNode
+
+        workflow = WorkflowNode().store()
+        calculation = CalculationNode().store()
+        stored = Data().store()
+        unstored = Data()
+        unstored.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+
+        with self.assertRaises(ValueError):
+            Node.objects.store_many([unstored], links=[(stored, workflow, LinkType.CREATE, 'invalid')])
+
+        self.assertFalse(unstored.is_stored)
+
+        links = [(workflow, stored, LinkType.RETURN, 'output_stored')]
+        Node.objects.store_many([unstored], links=links)
+
+        self.assertTrue(unstored.is_stored)
+        self.assertEqual(workflow.get_outgoing(link_type=LinkType.RETURN).one().node.uuid, stored.uuid)
+
+        Node.objects.store_many([], links=[(workflow, unstored, LinkType.RETURN, 'output_unstored')])
+        self.assertEqual(len(workflow.get_outgoing(link_type=LinkType.RETURN).all()), 2)
+
+    def test_store_many_links_conflicting(self):
+        """Test that links that are valid on their own but violate a uniqueness constraint together are rejected."""
+        calculation = CalculationNode().store()
+        other = CalculationNode().store()
+        source = Data().store()
+        output = Data()
+
+        # Two `CREATE` links into the same node
+        links = [(calculation, output, LinkType.CREATE, 'output'), (other, output, LinkType.CREATE, 'output')]
+
+        with self.assertRaises(ValueError):
+            Node.objects.store_many([output], links=links)
+
+        self.assertFalse(output.is_stored)
+
+        # A link with the same label as a link in the incoming link cache of another node of the batch
+        output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+        links = [(calculation, Data(), LinkType.CREATE, 'output')]
+
+        with self.assertRaises(ValueError):
+            Node.objects.store_many([output, links[0][1]], links=links)
+
+        self.assertFalse(output.is_stored)
+
+        # Two `INPUT_CALC` links with the same label into the same calculation
+        links = [(source, other, LinkType.INPUT_CALC, 'input'), (Data().store(), other, LinkType.INPUT_CALC, 'input')]
+
+        with self.assertRaises(ValueError):
+            Node.objects.store_many([], links=links)
+
+        self.assertEqual(other.get_incoming().all(), [])
+
+    def test_store_all(self):
+        """Test that `Node.store_all` stores the unstored source nodes of the cached links together with the node."""
+        calculation = CalculationNode()
+        inputs = [Data(), Data().store()]
+
+        for index, node in enumerate(inputs):
+            calculation.add_incoming(node, link_type=LinkType.INPUT_CALC, link_label='input_{}'.format(index))
+
+        calculation.store_all()
+
+        self.assertTrue(all(node.is_stored for node in inputs + [calculation]))
+        self.assertEqual(len(calculation.get_incoming(link_type=LinkType.INPUT_CALC).all()), 2)
+
+    def test_store_all_from_cache(self):
+        """Test that `Node.store_all` finds a node to cache from before storing the unstored source nodes."""
+        from aiida.engine import ProcessState
+        from aiida.manage.caching import enable_caching
+
+        process_type = 'aiida.calculations:arithmetic.add'
+
+        def create_calculation():
+            """Return an unstored calculation with an unstored input."""
+            calculation = CalculationNode()
+            calculation.set_process_type(process_type)
+            source = Data()
+            source.set_attribute('value', 1)
+            calculation.add_incoming(source, link_type=LinkType.INPUT_CALC, link_label='input')
+            return calculation, source
+
+        original, _ = create_calculation()
+        original.store_all()
+        original.set_process_state(ProcessState.FINISHED)
+        original.set_exit_status(0)
+        output = Data()
+        output.add_incoming(original, link_type=LinkType.CREATE, link_label='output')
+        output.store()
+
+        calculation, source = create_calculation()
+
+        with enable_caching(identifier=process_type):
+            calculation.store_all()
+
+        self.assertTrue(source.is_stored)
+        self.assertTrue(calculation.is_created_from_cache)
+        self.assertEqual(calculation.get_cache_source(), original.uuid)
+        self.assertEqual(calculation.get_incoming().one().node.uuid, source.uuid)
+        self.assertEqual(calculation.get_outgoing(link_type=LinkType.CREATE).one().link_label, 'output')
+
+    def test_store_all_from_cache_compact_structure(self):
+        """Test that a node with an unstored compact `StructureData` input is found by the lookup before storing.
+
+        The sites of a compact structure are only written to its repository by its validation, so the prospective hash
+        of the calculation matches the hash of the stored one only if the input is validated before it is hashed.
+        """
+        from aiida.engine import ProcessState
+        from aiida.manage.caching import enable_caching
+        from aiida.orm import StructureData
+
+        process_type = 'aiida.calculations:arithmetic.add'
+
+        def create_calculation():
+            """Return an unstored calculation with an unstored compact structure as input."""
+            calculation = CalculationNode()
+            calculation.set_process_type(process_type)
+            structure = StructureData(cell=[[2., 0., 0.], [0., 2., 0.], [0., 0., 2.]], compact_sites=True)
+            structure.append_atom(position=(0., 0., 0.), symbols='H')
+            structure.append_atom(position=(1., 1., 1.), symbols='He')
+            calculation.add_incoming(structure, link_type=LinkType.INPUT_CALC, link_label='structure')
+            return calculation, structure
+
+        original, _ = create_calculation()
+        original.store_all()
+        original.set_process_state(ProcessState.FINISHED)
+        original.set_exit_status(0)
+
+        calculation, structure = create_calculation()
+
+        with enable_caching(identifier=process_type):
+            calculation.store_all()
+
+        self.assertTrue(structure.is_stored)
+        self.assertEqual(structure.get_hash(), original.get_incoming().one().node.get_hash())
+        self.assertTrue(calculation.is_created_from_cache)
+        self.assertEqual(calculation.get_cache_source(), original.uuid)
+
+    def test_store_all_cache_miss(self):
+        """Test that `Node.store_all` looks for a node to cache from only once if there is none."""
+        from aiida.manage.caching import enable_caching
+
+        process_type = 'aiida.calculations:arithmetic.add'
+
+        calculation = CalculationNode()
+        calculation.set_process_type(process_type)
+        source = Data()
+        source.set_attribute('value', 1)
+        calculation.add_incoming(source, link_type=LinkType.INPUT_CALC, link_label='input')
+
+        with enable_caching(identifier=process_type):
+            with mock.patch.object(Node, '_get_same_node', autospec=True, return_value=None) as get_same_node:
+                calculation.store_all()
+
+        lookups = [args for args, _ in get_same_node.call_args_list if args[0] is calculation]
+        self.assertEqual(len(lookups), 1)
+        self.assertTrue(source.is_stored)
+        self.assertTrue(calculation.is_stored)
+        self.assertFalse(calculation.is_created_from_cache)
+        self.assertEqual(calculation.get_hash(), calculation.get_extra('_aiida_hash'))
+        self.assertEqual(calculation.get_incoming().one().node.uuid, source.uuid)
+
+    def test_store_all_overridden_store(self):
+        """Test that `Node.store_all` calls the `store` method of an input whose class overrides it."""
+        from aiida.manage.caching import enable_caching
+
+        process_type = 'aiida.calculations:arithmetic.add'
+
+        calculation = CalculationNode()
+        calculation.set_process_type(process_type)
+        source = Data()
+        calculation.add_incoming(source, link_type=LinkType.INPUT_CALC, link_label='input')
+
+        with enable_caching(identifier=process_type):
+            with mock.patch.object(Data, 'store', autospec=True, side_effect=Node.store) as store:
+                with mock.patch.object(Node, '_get_prospective_same_node', autospec=True) as get_prospective_same_node:
+                    calculation.store_all()
+
+        self.assertEqual([args[0] for args, _ in store.call_args_list], [source])
+        self.assertFalse(get_prospective_same_node.called)
+        self.assertTrue(source.is_stored)
+        self.assertTrue(calculation.is_stored)
+        self.assertEqual(calculation.get_incoming().one().node.uuid, source.uuid)
+
+
 class TestNodeLinks(AiidaTestCase):
     """Test for linking from and to Node."""
 
@@ -565,6 +817,37 @@ class TestNodeLinks(AiidaTestCase):
         incoming_uuids = sorted([neighbor.node.uuid for neighbor in incoming_nodes])
         self.assertEqual(incoming_uuids, sorted([source_one.uuid, source_two.uuid]))
 
+    def test_prefetch(self):
+        """Test that `get_incoming` and `get_outgoing` are answered from the links loaded by `prefetch`."""
+        from aiida.orm import prefetch
+
+        source_one = Data().store()
+        source_two = Data().store()
+        target = CalculationNode()
+
+        target.add_incoming(source_one, LinkType.INPUT_CALC, 'link_one')
+        target.add_incoming(source_two, LinkType.INPUT_CALC, 'link_two')
+        target.store()
+
+        nodes = [load_node(node.pk) for node in (source_one, source_two, target)]
+        prefetch(nodes)
+
+        source_one, source_two, target = nodes
+        incoming = target.get_incoming()
+        self.assertEqual(sorted(incoming.all_link_labels()), ['link_one', 'link_two'])
+        self.assertEqual(target.get_incoming(link_label_filter='link_o%').one().node.uuid, source_one.uuid)
+        self.assertEqual(target.get_incoming(node_class=CalculationNode).all(), [])
+        self.assertEqual(source_two.get_outgoing(only_uuid=True).one().node, target.uuid)
+
+        # Nodes linked to multiple nodes in the collection are represented by a single instance
+        self.assertIs(source_one.get_outgoing().one().node, source_two.get_outgoing().one().node)
+
+        # Adding a link invalidates the prefetched links of both nodes involved
+        output = Data()
+        output.add_incoming(target, LinkType.CREATE, 'output')
+        output.store()
+        self.assertEqual(target.get_outgoing().one().node.uuid, output.uuid)
+
     def test_node_indegree_unique_pair(self):
         """Test that the validation of links with indegree `unique_pair` works correctly
 
@@ -59,6 +59,72 @@ class TestComputer(AiidaTestCase):
         with self.assertRaises(exceptions.NotExistent):
             orm.Computer.objects.get(id=comp_pk)
 
+    def test_maximum_offloaded_tasks(self):
+        """Test the property that determines whether and how many calculation job tasks are offloaded."""
+        computer = orm.Computer(
+            name='ccc', hostname='localhost', transport_type='local', scheduler_type='direct', workdir='/tmp/aiida'
+        ).store()
+
+        self.assertEqual(computer.get_maximum_offloaded_tasks(), 0)
+
+        computer.set_maximum_offloaded_tasks(2)
+        self.assertEqual(computer.get_maximum_offloaded_tasks(), 2)
+
+        for invalid in [-1, 1.5, 'two']:
+            with self.assertRaises(ValueError):
+                computer.set_maximum_offloaded_tasks(invalid)
+
+    def test_transport_task_limits(self):
+        """Test the properties that limit the transfers, queued jobs and submission rate of calculation jobs."""
+        computer = orm.Computer(
+            name='ddd', hostname='localhost', transport_type='local', scheduler_type='direct', workdir='/tmp/aiida'
+        ).store()
+
+        self.assertEqual(computer.get_maximum_concurrent_transfers(), 0)
+        self.assertEqual(computer.get_maximum_queued_jobs(), 0)
+        self.assertEqual(computer.get_maximum_submission_rate(), 0)
+
+        computer.set_maximum_concurrent_transfers(4)
+        computer.set_maximum_queued_jobs(100)
+        computer.set_maximum_submission_rate(0.5)
+        self.assertEqual(computer.get_maximum_concurrent_transfers(), 4)
+        self.assertEqual(computer.get_maximum_queued_jobs(), 100)
+        self.assertEqual(computer.get_maximum_submission_rate(), 0.5)
+
+        for setter in [computer.set_maximum_concurrent_transfers, computer.set_maximum_queued_jobs]:
+            for invalid in [-1, 1.5, 'two']:
+                with self.assertRaises(ValueError):
+                    setter(invalid)
+
+        for invalid in [-1, True, 'two']:
+            with self.assertRaises(ValueError):
+                computer.set_maximum_submission_rate(invalid)
+
+    def test_remote_object_cache(self):
+        """Test the properties that configure the remote object cache and its eviction."""
+        computer = orm.Computer(
+            name='eee', hostname='localhost', transport_type='local', scheduler_type='direct', workdir='/tmp/aiida'
+        ).store()
+
+        self.assertFalse(computer.get_use_remote_object_cache())
+        self.assertEqual(computer.get_remote_object_cache_max_age(), 0)
+        self.assertEqual(computer.get_remote_object_cache_max_size(), 0)
+
+        computer.set_use_remote_object_cache(True)
+        computer.set_remote_object_cache_max_age(7)
+        computer.set_remote_object_cache_max_size(1024.)
+        self.assertTrue(computer.get_use_remote_object_cache())
+        self.assertEqual(computer.get_remote_object_cache_max_age(), 7)
+        self.assertEqual(computer.get_remote_object_cache_max_size(), 1024.)
+
+        with self.assertRaises(ValueError):
+            computer.set_use_remote_object_cache('yes')
+
+        for setter in [computer.set_remote_object_cache_max_age, computer.set_remote_object_cache_max_size]:
+            for invalid in [-1, True, 'two']:
+                with self.assertRaises(ValueError):
+                    setter(invalid)
+
 
 class TestComputerConfigure(AiidaTestCase):
     """Tests for the configuring of instance of the `Computer` ORM class."""
@@ -33,3 +33,20 @@ class TestQueryBuilder(AiidaTestCase):
         self.assertEqual(len(result), 2)
         self.assertIsInstance(result[0], six.string_types)
         self.assertIsInstance(result[1], orm.Data)
+
+    def test_defer_node_columns(self):
+        """Test that nodes are returned with the same attributes whether or not their JSONB columns are deferred."""
+        node = orm.Data()
+        node.set_attribute('key', 'value')
+        node.store()
+
+        for defer_node_columns in [True, False]:
+            builder = orm.QueryBuilder(defer_node_columns=defer_node_columns)
+            builder.append(orm.Data, filters={'id': node.pk})
+
+            with self.backend.transaction():
+                loaded = builder.one()[0]
+                self.assertEqual(loaded.get_attribute('key'), 'value')
+                self.assertEqual(loaded.get_attribute_many(['key']), ['value'])
+
+            self.assertEqual(loaded.get_attribute('key'), 'value')
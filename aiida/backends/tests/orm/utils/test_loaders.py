@@ -12,8 +12,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common.exceptions import NotExistent
-from aiida.orm import Node, Group, Data
-from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node
+from aiida.orm import Node, Group, Data, CalculationNode
+from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node, load_nodes
 from aiida.orm.utils.loaders import NodeEntityLoader
 
 
@@ -211,3 +211,43 @@ class TestOrmUtils(AiidaTestCase):
 
         with self.assertRaises(NotExistent):
             load_group('non-existent-uuid')
+
+    def test_load_nodes(self):
+        """Test the functionality of load_nodes."""
+        nodes = [Data().store() for _ in range(3)]
+        identifiers = [nodes[0].pk, nodes[1].uuid, nodes[2].uuid[:10]]
+
+        loaded_nodes = load_nodes(identifiers)
+        self.assertEqual([node.uuid for node in loaded_nodes], [node.uuid for node in nodes])
+
+        # Loading the same nodes again should return the instances of the identity map
+        reloaded_nodes = load_nodes([nodes[2].pk, nodes[0].uuid])
+        self.assertIs(reloaded_nodes[0], loaded_nodes[2])
+        self.assertIs(reloaded_nodes[1], loaded_nodes[0])
+
+        # Restricting the sub classes should not return nodes from the identity map of another type
+        with self.assertRaises(NotExistent):
+            load_nodes([nodes[0].pk], sub_classes=(CalculationNode,))
+
+        with self.assertRaises(NotExistent):
+            load_nodes([nodes[0].pk, -1])
+
+    def test_load_node_identity_map(self):
+        """Test that `load_node` shares the identity map with `load_nodes` and that deleted nodes are evicted."""
+        node = Data().store()
+
+        loaded_node = load_node(node.pk)
+        self.assertIs(load_node(node.pk), loaded_node)
+        self.assertIs(load_nodes([node.pk])[0], loaded_node)
+        self.assertIs(load_node(node.uuid), loaded_node)
+
+        with self.assertRaises(NotExistent):
+            load_node(node.pk, sub_classes=(CalculationNode,))
+
+        Node.objects.delete(node.pk)
+
+        with self.assertRaises(NotExistent):
+            load_node(node.pk)
+
+        with self.assertRaises(NotExistent):
+            load_nodes([node.pk])
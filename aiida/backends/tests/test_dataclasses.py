@@ -1958,6 +1958,75 @@ class TestStructureDataReload(AiidaTestCase):
             self.assertAlmostEqual(c.sites[1].position[i], 1.)
 
 
+class TestStructureDataCompactSites(AiidaTestCase):
+    """
+    Tests the StructureData that stores its sites in compact form.
+    """
+
+    def test_compact_sites(self):
+        """
+        Test that the sites stored as arrays are preserved by storing and reloading
+        """
+        import numpy
+
+        a = StructureData(cell=((2., 0., 0.), (0., 2., 0.), (0., 0., 2.)), compact_sites=True)
+        a.append_atom(position=(0., 0., 0.), symbols=['Ba'])
+        a.append_atom(position=(1., 1., 1.), symbols=['Ti'])
+        a.append_atom(position=(1., 1., 0.), symbols=['Ba'])
+
+        self.assertTrue(a.is_compact)
+        self.assertNotIn('sites', a.attributes)
+        self.assertEqual(a.get_kind_indices().tolist(), [0, 1, 0])
+        self.assertEqual(a.get_site_kindnames(), ['Ba', 'Ti', 'Ba'])
+        self.assertEqual(len(a.sites), 3)
+        self.assertEqual(a.sites[-1].kind_name, 'Ba')
+        self.assertEqual(a.get_formula(), 'Ba2Ti')
+
+        a.reset_sites_positions(a.get_positions() + 0.5)
+        self.assertEqual(a.sites[1].position, (1.5, 1.5, 1.5))
+
+        with self.assertRaises(ValueError):
+            a.reset_sites_positions([[0., 0.], [0., 0.], [0., 0.]])
+
+        a.store()
+
+        b = load_node(a.pk)
+        self.assertTrue(b.is_compact)
+        self.assertEqual(b.get_attribute('array|positions'), [3, 3])
+        self.assertEqual(b.get_attribute('kind_site_counts'), [2, 1])
+        self.assertEqual(sorted(b.list_object_names()), ['kind_indices.npy', 'positions.npy'])
+        numpy.testing.assert_allclose(b.get_positions(), [[0.5, 0.5, 0.5], [1.5, 1.5, 1.5], [1.5, 1.5, 0.5]])
+        self.assertEqual([site.kind_name for site in b.sites], ['Ba', 'Ti', 'Ba'])
+
+        c = b.clone()
+        self.assertEqual(c.get_kind_indices().tolist(), [0, 1, 0])
+        c.append_atom(position=(0., 0., 1.), symbols=['O'])
+        c.store()
+        self.assertEqual(load_node(c.pk).get_formula(), 'Ba2OTi')
+
+    def test_set_compact_sites(self):
+        """
+        Test the conversion of the sites between the attributes and the compact form
+        """
+        a = StructureData(cell=((2., 0., 0.), (0., 2., 0.), (0., 0., 2.)))
+        a.append_atom(position=(0., 0., 0.), symbols=['Ba'])
+        a.append_atom(position=(1., 1., 1.), symbols=['Ti'])
+
+        a.set_compact_sites()
+        self.assertTrue(a.is_compact)
+        self.assertEqual(a.get_positions().tolist(), [[0., 0., 0.], [1., 1., 1.]])
+
+        a.set_compact_sites(False)
+        self.assertFalse(a.is_compact)
+        self.assertNotIn('array|positions', a.attributes)
+        self.assertEqual(a.get_site_kindnames(), ['Ba', 'Ti'])
+        self.assertEqual(a.sites[1].position, (1., 1., 1.))
+
+        a.store()
+        with self.assertRaises(ModificationNotAllowed):
+            a.set_compact_sites()
+
+
 class TestStructureDataFromAse(AiidaTestCase):
     """
     Tests the creation of Sites from/to a ASE object.
@@ -2685,6 +2754,54 @@ class TestArrayData(AiidaTestCase):
             if name == 'third':
                 self.assertAlmostEquals(abs(third - array).max(), 0.)
 
+    def test_mmap(self):
+        """
+        Check that memory mapped arrays have the same content, both before and after storing
+        """
+        import numpy
+
+        n = ArrayData()
+        first = numpy.random.rand(5, 3, 2)
+        n.set_array('first', first)
+        n.set_array('empty', numpy.zeros((0, 3)))
+
+        self.assertAlmostEquals(abs(first - n.get_array('first', mmap=True)).max(), 0.)
+
+        n.store()
+
+        array = n.get_array('first', mmap=True)
+        self.assertIsInstance(array, numpy.memmap)
+        self.assertFalse(array.flags.writeable)
+        self.assertAlmostEquals(abs(first[2] - array[2]).max(), 0.)
+        self.assertEqual(n.get_array('empty', mmap=True).shape, (0, 3))
+        self.assertEqual(len(n._cached_arrays), 0)  # pylint: disable=protected-access
+
+        with self.assertRaises(KeyError):
+            n.get_array('nonexistent_array', mmap=True)
+
+    def test_cache_eviction(self):
+        """
+        Check that the internal cache of a stored node evicts the least recently used arrays
+        """
+        import numpy
+
+        n = ArrayData()
+        for name in ['first', 'second', 'third']:
+            n.set_array(name, numpy.zeros(100))
+        n.store()
+
+        n.array_cache_max_bytes = 2 * numpy.zeros(100).nbytes
+        n.get_array('first')
+        n.get_array('second')
+        n.get_array('first')
+        n.get_array('third')
+        self.assertEqual(list(n._cached_arrays), ['first', 'third'])  # pylint: disable=protected-access
+
+        n.array_cache_max_bytes = 10
+        n.clear_internal_cache()
+        n.get_array('first')
+        self.assertEqual(len(n._cached_arrays), 0)  # pylint: disable=protected-access
+
 
 class TestTrajectoryData(AiidaTestCase):
     """
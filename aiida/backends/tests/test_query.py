@@ -1201,6 +1201,76 @@ class QueryBuilderPath(AiidaTestCase):
         # self.assertTrue(set(next(zip(*qb.all()))), set([5]))
 
 
+class QueryBuilderNodeClosure(AiidaTestCase):
+    """Test the recursive joins of the `QueryBuilder` when the transitive closure table is enabled."""
+
+    def setUp(self):
+        super(QueryBuilderNodeClosure, self).setUp()
+        self.backend.query_manager.enable_node_closure()
+
+    def tearDown(self):
+        self.backend.query_manager.disable_node_closure()
+        super(QueryBuilderNodeClosure, self).tearDown()
+
+    @staticmethod
+    def count_descendants(ancestor, descendant, **kwargs):
+        builder = orm.QueryBuilder().append(orm.Node, filters={'id': ancestor.pk}, tag='anc')
+        builder.append(orm.Node, with_ancestors='anc', filters={'id': descendant.pk}, **kwargs)
+        return builder.count()
+
+    @staticmethod
+    def count_ancestors(descendant, ancestor, **kwargs):
+        builder = orm.QueryBuilder().append(orm.Node, filters={'id': descendant.pk}, tag='desc')
+        builder.append(orm.Node, with_descendants='desc', filters={'id': ancestor.pk}, **kwargs)
+        return builder.count()
+
+    def test_closure(self):
+        """The closure should be updated for links added in any order and contain each pair of nodes only once."""
+        n1 = orm.Data().store()
+        n2 = orm.CalculationNode().store()
+        n3 = orm.Data().store()
+        n4 = orm.Data().store()
+        n5 = orm.CalculationNode().store()
+        n6 = orm.Data().store()
+        n7 = orm.CalculationNode().store()
+        n8 = orm.Data().store()
+
+        # Add the links in an order that requires joining separate subgraphs of the closure
+        n3.add_incoming(n2, link_type=LinkType.CREATE, link_label='link1')
+        n2.add_incoming(n1, link_type=LinkType.INPUT_CALC, link_label='link2')
+        n5.add_incoming(n3, link_type=LinkType.INPUT_CALC, link_label='link3')
+        n5.add_incoming(n4, link_type=LinkType.INPUT_CALC, link_label='link4')
+        n4.add_incoming(n2, link_type=LinkType.CREATE, link_label='link5')
+        n7.add_incoming(n6, link_type=LinkType.INPUT_CALC, link_label='link6')
+        n8.add_incoming(n7, link_type=LinkType.CREATE, link_label='link7')
+
+        self.assertEqual(self.count_descendants(n1, n8), 0)
+        self.assertEqual(self.count_ancestors(n8, n1), 0)
+
+        n6.add_incoming(n5, link_type=LinkType.CREATE, link_label='link8')
+
+        # There are two paths from n1 to n8, but the closure only contains the pair once
+        self.assertEqual(self.count_descendants(n1, n8), 1)
+        self.assertEqual(self.count_ancestors(n8, n1), 1)
+        self.assertEqual(self.count_ancestors(n8, n1, edge_filters={'depth': 5}), 1)
+        self.assertEqual(self.count_ancestors(n8, n1, edge_filters={'depth': {'<': 5}}), 0)
+
+        builder = orm.QueryBuilder().append(orm.Node, filters={'id': n5.pk}, tag='desc')
+        builder.append(orm.Node, with_descendants='desc', project='id')
+        self.assertEqual({pk for pk, in builder.all()}, {n1.pk, n2.pk, n3.pk, n4.pk})
+
+        # Projecting the path still goes through the recursive query and returns one row per path
+        self.assertEqual(self.count_descendants(n1, n8, edge_project='path'), 2)
+
+        # Rebuilding from scratch should give the same closure as the one maintained incrementally
+        builder = orm.QueryBuilder().append(orm.Node, tag='anc', project='id')
+        builder.append(orm.Node, with_ancestors='anc', project='id', edge_project='depth')
+        closure = sorted(builder.all())
+
+        self.backend.query_manager.rebuild_node_closure()
+        self.assertEqual(sorted(builder.all()), closure)
+
+
 class TestConsistency(AiidaTestCase):
 
     def test_create_node_and_query(self):
@@ -1317,6 +1387,43 @@ class TestManager(AiidaTestCase):
 
         self.assertEqual(new_db_statistics, expected_db_statistics)
 
+    def test_statistics_maintained(self):
+        """Test that the node statistics are updated when nodes are deleted and are unchanged by a refresh."""
+        from aiida.manage.database.delete.nodes import delete_nodes
+
+        qmanager = self.backend.query_manager
+        node = orm.Dict().store()
+        node_type = node.node_type
+
+        statistics = qmanager.get_creation_statistics()
+        qmanager.refresh_node_statistics()
+        self.assertEqual(qmanager.get_creation_statistics(), statistics)
+
+        delete_nodes([node.pk], force=True)
+        new_statistics = qmanager.get_creation_statistics()
+        self.assertEqual(new_statistics['total'], statistics['total'] - 1)
+        self.assertEqual(new_statistics['types'].get(node_type, 0), statistics['types'][node_type] - 1)
+
+    def test_statistics_compacted(self):
+        """Test that the rows appended by the trigger are merged into one row per user, type and day."""
+        qmanager = self.backend.query_manager
+        count_rows = 'SELECT COUNT(*) FROM db_dbnodestatistics'
+        count_groups = 'SELECT COUNT(DISTINCT (user_id, node_type, day)) FROM db_dbnodestatistics'
+
+        for _ in range(3):
+            orm.Int(1).store()
+
+        self.assertGreater(self.backend.execute_raw(count_rows)[0][0], 1)
+
+        # Reading the statistics should not write to the table
+        rows = self.backend.execute_raw(count_rows)
+        statistics = qmanager.get_creation_statistics()
+        self.assertEqual(self.backend.execute_raw(count_rows), rows)
+
+        qmanager.compact_node_statistics()
+        self.assertEqual(self.backend.execute_raw(count_rows), self.backend.execute_raw(count_groups))
+        self.assertEqual(qmanager.get_creation_statistics(), statistics)
+
 
 class TestDoubleStar(AiidaTestCase):
     """
@@ -432,6 +432,52 @@ class RESTApiTestSuite(RESTApiTestCase):
             self, 'computers', '/computers/page/4?perpage=2&orderby=+id', expected_errormsg=expected_error
         )
 
+    def test_computers_list_page_count_modes(self):
+        """
+        Without counting, the total count header is omitted and the next page is only linked if it has results.
+        An estimated count falls back onto an exact count for small numbers of results.
+        """
+        url = self.get_url_prefix() + '/computers/page/{}?perpage=2&orderby=+id&count={}'
+        with self.app.test_client() as client:
+            rv_obj = client.get(url.format(1, 'none'))
+            self.assertEqual(rv_obj.status_code, 200)
+            self.assertNotIn('X-Total-Count', rv_obj.headers)
+            self.assertIn('rel=next', rv_obj.headers['Link'])
+
+            rv_obj = client.get(url.format(3, 'none'))
+            self.assertEqual(len(json.loads(rv_obj.data)['data']['computers']), 1)
+            self.assertNotIn('rel=next', rv_obj.headers['Link'])
+
+            rv_obj = client.get(url.format(1, 'estimated'))
+            self.assertEqual(rv_obj.headers['X-Total-Count'], '5')
+            self.assertNotIn('X-Total-Count-Approximate', rv_obj.headers)
+
+            rv_obj = client.get(url.format(1, 'invalid'))
+            self.assertEqual(rv_obj.status_code, 400)
+
+    def test_computers_list_streamed(self):
+        """
+        Large listings are streamed with the same content, or as newline delimited JSON if the client accepts it.
+        """
+        url = self.get_url_prefix() + '/computers?orderby=+id'
+        with self.app.test_client() as client:
+            rv_obj = client.get(url + '&limit=2')
+            expected = json.loads(rv_obj.data)['data']['computers']
+
+            rv_obj = client.get(url + '&limit=200')
+            self.assertNotIn('ETag', rv_obj.headers)
+            self.assertEqual(json.loads(rv_obj.data)['data']['computers'][:2], expected)
+
+            # Listings with the default limit are not streamed, such that they can be cached
+            rv_obj = client.get(url)
+            self.assertIn('ETag', rv_obj.headers)
+            self.assertEqual(json.loads(rv_obj.data)['data']['computers'][:2], expected)
+
+            rv_obj = client.get(url + '&limit=2', headers={'Accept': 'application/x-ndjson'})
+            self.assertEqual(rv_obj.mimetype, 'application/x-ndjson')
+            lines = rv_obj.data.decode('utf-8').splitlines()
+            self.assertEqual([json.loads(line) for line in lines], expected)
+
     ############### list filters ########################
     def test_computers_filter_id1(self):
         """
@@ -750,6 +796,37 @@ class RESTApiTestSuite(RESTApiTestCase):
             response = json.loads(response_value.data)
             self.assertEqual(response['data']['retrieved_outputs'], ['calcjob_outputs/aiida.out'])
 
+    def test_calculation_retrieved_inputs_download(self):
+        """
+        Download a retrieved input file of the given calculation, in full, as a range and compressed
+        """
+        import gzip
+        import io
+
+        node_uuid = self.get_dummy_data()['calculations'][1]['uuid']
+        url = self.get_url_prefix() + '/calculations/' + str(
+            node_uuid
+        ) + '/io/retrieved_inputs?filename="calcjob_inputs/aiida.in"'
+        content = b'The input file\nof the CalcJob node'
+
+        with self.app.test_client() as client:
+            response_value = client.get(url, headers={'Accept-Encoding': 'identity'})
+            self.assertEqual(response_value.status_code, 200)
+            self.assertEqual(response_value.headers['Content-Length'], str(len(content)))
+            self.assertEqual(response_value.data, content)
+
+            response_value = client.get(url, headers={'Range': 'bytes=4-8'})
+            self.assertEqual(response_value.status_code, 206)
+            self.assertEqual(response_value.headers['Content-Range'], 'bytes 4-8/{}'.format(len(content)))
+            self.assertEqual(response_value.data, content[4:9])
+
+            response_value = client.get(url, headers={'Range': 'bytes=1000-'})
+            self.assertEqual(response_value.status_code, 416)
+
+            response_value = client.get(url, headers={'Accept-Encoding': 'gzip'})
+            self.assertEqual(response_value.headers['Content-Encoding'], 'gzip')
+            self.assertEqual(gzip.GzipFile(fileobj=io.BytesIO(response_value.data)).read(), content)
+
     def test_calcfunction_retrieved_inputs(self):
         """
         Check that the given calcfunction does not have retrieved_inputs
@@ -1021,3 +1098,58 @@ class RESTApiTestSuite(RESTApiTestCase):
             ]
             self.assertEqual(response['data']['data'], expected_data_types)
             RESTApiTestCase.compare_extra_response_data(self, 'nodes', url, response)
+
+    def test_conditional_request(self):
+        """
+        Test that a request with the ETag of the current content is answered with 304 Not Modified
+        """
+        url = self.get_url_prefix() + '/nodes/types'
+        with self.app.test_client() as client:
+            rv_obj = client.get(url)
+            etag = rv_obj.headers['ETag']
+            self.assertIsNotNone(rv_obj.headers.get('Last-Modified'))
+
+            rv_obj = client.get(url, headers={'If-None-Match': etag})
+            self.assertEqual(rv_obj.status_code, 304)
+
+    def test_cached_response_accept(self):
+        """
+        Test that a cached JSON response is not returned to a client that accepts newline delimited JSON
+        """
+        from aiida.restapi.common.config import CACHE_CONFIG
+
+        kwargs = dict(
+            PREFIX=self._url_prefix,
+            PERPAGE_DEFAULT=self._PERPAGE_DEFAULT,
+            LIMIT_DEFAULT=self._LIMIT_DEFAULT,
+            CACHE_CONFIG=CACHE_CONFIG)
+        app = App(__name__)
+        app.config['TESTING'] = True
+        AiidaApi(app, **kwargs)
+
+        url = self.get_url_prefix() + '/nodes?orderby=+id'
+        with app.test_client() as client:
+            for _ in range(2):
+                rv_obj = client.get(url)
+                self.assertEqual(rv_obj.mimetype, 'application/json')
+                self.assertIn('Accept', rv_obj.headers['Vary'])
+
+            rv_obj = client.get(url, headers={'Accept': 'application/x-ndjson'})
+            self.assertEqual(rv_obj.mimetype, 'application/x-ndjson')
+
+    def test_lru_cache(self):
+        """
+        Test the eviction and expiration of the entries of the in-process cache of the REST API
+        """
+        from aiida.restapi.common.cache import LRUCache
+
+        cache = LRUCache(threshold=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+
+        cache.set('d', 4, timeout=-1)
+        self.assertIsNone(cache.get('d'))
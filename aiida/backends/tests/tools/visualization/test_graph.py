@@ -216,6 +216,19 @@ class TestVisGraph(AiidaTestCase):
             ])
         )
 
+    def test_graph_recurse_max_nodes(self):
+        """ test that the recursion stops adding nodes once the maximum number of nodes is reached"""
+        nodes = self.create_provenance()
+
+        graph = graph_mod.Graph()
+        graph.recurse_descendants(nodes.pd0, max_nodes=3)
+
+        self.assertEqual(len(graph.nodes), 3)
+        self.assertIn(nodes.pd0.pk, graph.nodes)
+        for in_pk, out_pk, _ in graph.edges:
+            self.assertIn(in_pk, graph.nodes)
+            self.assertIn(out_pk, graph.nodes)
+
     def test_graph_graphviz_source(self):
         """ test the output of graphviz source """
         nodes = self.create_provenance()
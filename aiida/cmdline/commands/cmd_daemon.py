@@ -22,8 +22,8 @@ from click_spinner import spinner
 from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.utils import decorators, echo
 from aiida.cmdline.utils.common import get_env_with_venv_bin
-from aiida.cmdline.utils.daemon import get_daemon_status, \
-    print_client_response_status, delete_stale_pid_file, _START_CIRCUS_COMMAND
+from aiida.cmdline.utils.daemon import get_daemon_status, get_daemon_metrics, get_daemon_metrics_prometheus, \
+    serve_daemon_metrics, print_client_response_status, delete_stale_pid_file, _START_CIRCUS_COMMAND
 from aiida.manage.configuration import get_config
 
 
@@ -122,6 +122,36 @@ def decr(number):
     print_client_response_status(response)
 
 
+@verdi_daemon.command()
+@click.option('--prometheus', is_flag=True, help='Print the metrics in the text format of Prometheus.')
+@click.option(
+    '--serve',
+    'port',
+    type=click.INT,
+    default=None,
+    metavar='PORT',
+    help='Serve the metrics in the text format of Prometheus over HTTP on PORT, press CTRL+C to quit.')
+@click.option('--host', default='127.0.0.1', show_default=True, help='The address to serve the metrics on.')
+@decorators.only_if_daemon_running()
+def metrics(prometheus, port, host):
+    """Show the metrics of the workers of the daemon.
+
+    The metrics include the lag of the event loops of the workers and the time spent in the steps of processes, the
+    tasks of calculation jobs, waiting for transports and polling the schedulers.
+    """
+    from aiida.engine.daemon.client import get_daemon_client
+
+    client = get_daemon_client()
+
+    if port is not None:
+        echo.echo_info('Serving the metrics on http://{}:{}/metrics, press CTRL+C to quit'.format(host, port))
+        serve_daemon_metrics(client, host, port)
+    elif prometheus:
+        echo.echo(get_daemon_metrics_prometheus(client), nl=False)
+    else:
+        echo.echo(get_daemon_metrics(client))
+
+
 @verdi_daemon.command()
 def logshow():
     """Show the log of the daemon, press CTRL+C to quit."""
@@ -234,6 +264,7 @@ def start_circus(foreground, number):
     from circus.util import check_future_exception_and_log, configure_logger
 
     from aiida.engine.daemon.client import get_daemon_client
+    from aiida.manage.configuration import get_config_option
 
     if foreground and number > 1:
         raise click.ClickException('can only run a single worker when running in the foreground')
@@ -273,6 +304,19 @@ def start_circus(foreground, number):
         }]
     }  # yapf: disable
 
+    if get_config_option('daemon.autoscale') and not foreground:
+        arbiter_config['plugins'] = [{
+            'use': 'aiida.engine.daemon.autoscaler.AutoscalerPlugin',
+            'name': '{}-autoscaler'.format(client.daemon_name),
+            'profile': client.profile.name,
+            'watcher': client.daemon_name,
+            'min_workers': get_config_option('daemon.autoscale_min_workers'),
+            'max_workers': get_config_option('daemon.autoscale_max_workers'),
+            'interval': get_config_option('daemon.autoscale_interval'),
+            'cooldown': get_config_option('daemon.autoscale_cooldown'),
+            'max_loop_lag': get_config_option('daemon.autoscale_max_loop_lag'),
+        }]
+
     if not foreground:
         daemonize()
 
@@ -64,16 +64,19 @@ def structure():
 @decorators.with_dbenv()
 def structure_list(elements, raw, formula_mode, past_days, groups, all_users):
     """List StructureData objects."""
-    from aiida.orm.nodes.data.structure import StructureData, get_formula, get_symbols_string
+    from aiida.orm.nodes.data.structure import StructureData, get_formula, get_site_symbols_from_attributes
     from tabulate import tabulate
 
     elements_only = False
+    # The sites of structures in compact form are not in the attributes, their formula is computed from the number of
+    # sites of each kind instead
     lst = data_list(
-        StructureData, LIST_PROJECT_HEADERS, elements, elements_only, formula_mode, past_days, groups, all_users
+        StructureData, LIST_PROJECT_HEADERS + ['KindSiteCounts'], elements, elements_only, formula_mode, past_days,
+        groups, all_users
     )
 
     entry_list = []
-    for [pid, label, akinds, asites] in lst:
+    for [pid, label, akinds, asites, acounts] in lst:
         # If symbols are defined there is a filtering of the structures
         # based on the element
         # When QueryBuilder will support this (attribute)s filtering,
@@ -87,19 +90,11 @@ def structure_list(elements, raw, formula_mode, past_days, groups, all_users):
                 echo.echo_critical('Not implemented elements-only search')
 
         # We want only the StructureData that have attributes
-        if akinds is None or asites is None:
+        if akinds is None or (asites is None and acounts is None):
             continue
 
-        symbol_dict = {}
-        for k in akinds:
-            symbols = k['symbols']
-            weights = k['weights']
-            symbol_dict[k['name']] = get_symbols_string(symbols, weights)
-
         try:
-            symbol_list = []
-            for site in asites:
-                symbol_list.append(symbol_dict[site['kind_name']])
+            symbol_list = get_site_symbols_from_attributes(akinds, asites, acounts)
             formula = get_formula(symbol_list, mode=formula_mode)
         # If for some reason there is no kind with the name
         # referenced by the site
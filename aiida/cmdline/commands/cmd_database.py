@@ -12,6 +12,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import os
+
 import click
 
 from aiida.cmdline.commands.cmd_verdi import verdi
@@ -71,6 +73,206 @@ def database_migrate(force):
         echo.echo_success('migration completed')
 
 
+@verdi_database.command('summary')
+@options.USER(help='Only count the nodes created by this user.')
+@decorators.with_dbenv()
+def database_summary(user):
+    """Summarize the number of nodes in the database per node type."""
+    from tabulate import tabulate
+    from aiida.manage.manager import get_manager
+
+    query_manager = get_manager().get_backend().query_manager
+    statistics = query_manager.get_creation_statistics(user_pk=None if user is None else user.pk)
+
+    rows = sorted(statistics['types'].items(), key=lambda item: item[1], reverse=True)
+    rows.append(['Total', statistics['total']])
+    echo.echo(tabulate(rows, headers=['Node type', 'Count']))
+
+
+@verdi_database.command('refresh-statistics')
+@click.option(
+    '--compact',
+    is_flag=True,
+    help='Only merge the changes of the counts that were recorded since the last compaction, which does not prevent '
+    'nodes from being stored.')
+@decorators.with_dbenv()
+def database_refresh_statistics(compact):
+    """Recompute the node statistics from scratch.
+
+    The number of nodes per user, node type and day, which is used by `verdi database summary` and the statistics
+    endpoint of the REST API, is kept up to date by the database. Recomputing it is only needed if the node table was
+    modified while bypassing the trigger that maintains it. Nodes cannot be stored while the statistics are recomputed.
+
+    The changes of the counts are recorded as separate rows, which are merged periodically by the daemon workers. If
+    the daemon is not running, merge them with `--compact` from time to time instead.
+    """
+    from aiida.manage.manager import get_manager
+
+    query_manager = get_manager().get_backend().query_manager
+
+    if compact:
+        query_manager.compact_node_statistics()
+        echo.echo_success('node statistics compacted')
+    else:
+        query_manager.refresh_node_statistics()
+        echo.echo_success('node statistics refreshed')
+
+
+@verdi_database.group('closure')
+def verdi_database_closure():
+    """Manage the transitive closure table of the provenance graph."""
+
+
+def _get_query_manager_with_stopped_daemon():
+    """Return the query manager of the current backend, aborting if the daemon is running.
+
+    The daemon workers cache whether the closure table is enabled, so it can only be changed while they are stopped.
+    """
+    from aiida.engine.daemon.client import get_daemon_client
+    from aiida.manage.manager import get_manager
+
+    if get_daemon_client().is_daemon_running:
+        echo.echo_critical('the daemon for the profile is still running, stop it first with `verdi daemon stop`')
+
+    return get_manager().get_backend().query_manager
+
+
+@verdi_database_closure.command('status')
+@decorators.with_dbenv()
+def closure_status():
+    """Show whether the transitive closure table is enabled."""
+    from aiida.manage.manager import get_manager
+
+    if get_manager().get_backend().query_manager.is_node_closure_enabled():
+        echo.echo_info('the transitive closure table is enabled')
+    else:
+        echo.echo_info('the transitive closure table is disabled')
+
+
+@verdi_database_closure.command('enable')
+@decorators.with_dbenv()
+def closure_enable():
+    """Build the transitive closure table and keep it up to date when links are added.
+
+    Once enabled, queries for ancestors and descendants of nodes will use the table instead of recursively walking the
+    links of the provenance graph. Building the table for an existing database can take a while.
+    """
+    query_manager = _get_query_manager_with_stopped_daemon()
+    query_manager.enable_node_closure()
+    echo.echo_success('transitive closure table enabled')
+
+
+@verdi_database_closure.command('disable')
+@decorators.with_dbenv()
+def closure_disable():
+    """Stop maintaining the transitive closure table and empty it."""
+    query_manager = _get_query_manager_with_stopped_daemon()
+    query_manager.disable_node_closure()
+    echo.echo_success('transitive closure table disabled')
+
+
+@verdi_database_closure.command('rebuild')
+@decorators.with_dbenv()
+def closure_rebuild():
+    """Rebuild the transitive closure table from scratch.
+
+    The table is kept up to date when links are added, but not when links are deleted without deleting the nodes they
+    connect, in which case the table should be rebuilt.
+    """
+    from aiida.common.exceptions import InvalidOperation
+
+    query_manager = _get_query_manager_with_stopped_daemon()
+
+    try:
+        query_manager.rebuild_node_closure()
+    except InvalidOperation:
+        echo.echo_critical('the transitive closure table is not enabled, use `verdi database closure enable`')
+
+    echo.echo_success('transitive closure table rebuilt')
+
+
+@verdi_database.group('repository')
+def verdi_database_repository():
+    """Manage the object store of the file repository."""
+
+
+def _get_object_store_with_stopped_daemon():
+    """Return the object store of the repository of the current profile, aborting if the daemon is running."""
+    from aiida.common.utils import get_repository_folder
+    from aiida.engine.daemon.client import get_daemon_client
+    from aiida.manage.repository.object_store import PackedObjectStore, OBJECT_STORE_DIRECTORY
+
+    if get_daemon_client().is_daemon_running:
+        echo.echo_critical('the daemon for the profile is still running, stop it first with `verdi daemon stop`')
+
+    return PackedObjectStore(os.path.join(get_repository_folder('repository'), OBJECT_STORE_DIRECTORY))
+
+
+@verdi_database_repository.command('status')
+@decorators.with_dbenv()
+def repository_status():
+    """Show whether the repository uses the object store and statistics of its contents."""
+    from tabulate import tabulate
+
+    from aiida.manage.repository.object_store import get_object_store
+
+    object_store = get_object_store()
+
+    if object_store is None:
+        echo.echo_info('the repository uses the folder layout, use `verdi database repository migrate` to pack it')
+        return
+
+    statistics = object_store.get_statistics()
+    rows = [
+        ['Node repositories', statistics['nodes']],
+        ['Objects', '{} ({} bytes)'.format(statistics['objects'], statistics['objects_size'])],
+        ['Unreferenced objects', '{} ({} bytes)'.format(statistics['unreferenced_objects'],
+                                                          statistics['unreferenced_size'])],
+        ['Pack files', '{} ({} bytes)'.format(statistics['packs'], statistics['packs_size'])],
+    ]
+    echo.echo(tabulate(rows))
+
+
+@verdi_database_repository.command('migrate')
+@options.FORCE()
+@decorators.with_dbenv()
+def repository_migrate(force):
+    """Move the node repository folders into the content-addressed object store.
+
+    Files with identical content are only stored once and all files are stored in a few large pack files instead of
+    one file per object on the file system. The migration can be interrupted and continued later by calling the
+    command again. Make a backup of the repository before migrating.
+    """
+    from aiida.common.utils import get_repository_folder
+    from aiida.manage.repository.object_store import migrate_folder_repository, reset_object_store
+
+    object_store = _get_object_store_with_stopped_daemon()
+
+    if not force:
+        click.confirm('Are you sure you want to migrate the repository, which is not reversible?', abort=True)
+
+    object_store.initialise()
+    reset_object_store()
+
+    echo.echo_info('migrating the node repositories, this can take a while...')
+    count = migrate_folder_repository(object_store, get_repository_folder('repository'))
+
+    echo.echo_success('migrated {} node repositories'.format(count))
+
+
+@verdi_database_repository.command('repack')
+@decorators.with_dbenv()
+def repository_repack():
+    """Rewrite the pack files of the object store, removing the content of deleted nodes."""
+    object_store = _get_object_store_with_stopped_daemon()
+
+    if not object_store.is_initialised:
+        echo.echo_critical('the repository uses the folder layout, use `verdi database repository migrate` to pack it')
+
+    objects, size = object_store.repack()
+    echo.echo_success('removed {} unreferenced objects, freeing {} bytes'.format(objects, size))
+
+
 @verdi_database.group('integrity')
 def verdi_database_integrity():
     """Check the integrity of the database and fix potential issues."""
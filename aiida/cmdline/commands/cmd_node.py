@@ -403,6 +403,11 @@ def verdi_graph():
     help='The maximum depth when recursing through the descendants. If not set it will recurse to the end.',
     type=click.IntRange(min=0)
 )
+@click.option(
+    '--max-nodes',
+    help='The maximum number of nodes in the graph, once reached the recursion stops and the graph is partial.',
+    type=click.IntRange(min=1)
+)
 @click.option('-o', '--process-out', is_flag=True, help='Show outgoing links for all processes.')
 @click.option('-i', '--process-in', is_flag=True, help='Show incoming links for all processes.')
 @options.VERBOSE(help='Print verbose information of the graph traversal.')
@@ -417,8 +422,8 @@ def verdi_graph():
 @click.option('-s', '--show', is_flag=True, help='Open the rendered result with the default application.')
 @decorators.with_dbenv()
 def graph_generate(
-    root_node, link_types, identifier, ancestor_depth, descendant_depth, process_out, process_in, engine, verbose,
-    output_format, show
+    root_node, link_types, identifier, ancestor_depth, descendant_depth, max_nodes, process_out, process_in, engine,
+    verbose, output_format, show
 ):
     """
     Generate a graph from a ROOT_NODE (specified by pk or uuid).
@@ -437,7 +442,8 @@ def graph_generate(
         link_types=link_types,
         annotate_links='both',
         include_process_outputs=process_out,
-        print_func=print_func
+        print_func=print_func,
+        max_nodes=max_nodes
     )
     echo.echo_info('Recursing descendants, max depth={}'.format(descendant_depth))
     graph.recurse_descendants(
@@ -446,7 +452,8 @@ def graph_generate(
         link_types=link_types,
         annotate_links='both',
         include_process_inputs=process_in,
-        print_func=print_func
+        print_func=print_func,
+        max_nodes=max_nodes
     )
     output_file_name = graph.graphviz.render(
         filename='{}.{}'.format(root_node.pk, engine), format=output_format, view=show, cleanup=True
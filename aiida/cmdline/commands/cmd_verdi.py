@@ -12,12 +12,62 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import os
+
 import click
 
 from aiida.cmdline.params import options, types
+from aiida.cmdline.utils.lazy import LazyGroup
+
+# The modules that define the `verdi` subcommands, which are only imported when the subcommand is invoked
+VERDI_SUBCOMMANDS = {
+    'calcjob': 'aiida.cmdline.commands.cmd_calcjob',
+    'code': 'aiida.cmdline.commands.cmd_code',
+    'comment': 'aiida.cmdline.commands.cmd_comment',
+    'completioncommand': 'aiida.cmdline.commands.cmd_completioncommand',
+    'computer': 'aiida.cmdline.commands.cmd_computer',
+    'config': 'aiida.cmdline.commands.cmd_config',
+    'daemon': 'aiida.cmdline.commands.cmd_daemon',
+    'data': 'aiida.cmdline.commands.cmd_data',
+    'database': 'aiida.cmdline.commands.cmd_database',
+    'devel': 'aiida.cmdline.commands.cmd_devel',
+    'export': 'aiida.cmdline.commands.cmd_export',
+    'graph': 'aiida.cmdline.commands.cmd_graph',
+    'group': 'aiida.cmdline.commands.cmd_group',
+    'import': 'aiida.cmdline.commands.cmd_import',
+    'node': 'aiida.cmdline.commands.cmd_node',
+    'plugin': 'aiida.cmdline.commands.cmd_plugin',
+    'process': 'aiida.cmdline.commands.cmd_process',
+    'profile': 'aiida.cmdline.commands.cmd_profile',
+    'quicksetup': 'aiida.cmdline.commands.cmd_setup',
+    'rehash': 'aiida.cmdline.commands.cmd_rehash',
+    'restapi': 'aiida.cmdline.commands.cmd_restapi',
+    'run': 'aiida.cmdline.commands.cmd_run',
+    'setup': 'aiida.cmdline.commands.cmd_setup',
+    'shell': 'aiida.cmdline.commands.cmd_shell',
+    'status': 'aiida.cmdline.commands.cmd_status',
+    'user': 'aiida.cmdline.commands.cmd_user',
+}
+
+
+class VerdiCommandGroup(LazyGroup):
+    """The `verdi` command group, which loads its subcommands lazily."""
+
+    def main(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Activate the completion of parameter types of the `click_completion` package if a completion is requested.
+
+        Since this requires to patch `click`, it is only done when the shell calls `verdi` to complete a command line.
+        """
+        if os.environ.get(kwargs.get('complete_var') or '_VERDI_COMPLETE'):
+            import click_completion
+            click_completion.init()
+
+        return super(VerdiCommandGroup, self).main(*args, **kwargs)
 
 
-@click.group(context_settings={'help_option_names': ['-h', '--help']})
+@click.group(
+    cls=VerdiCommandGroup, lazy_subcommands=VERDI_SUBCOMMANDS, context_settings={'help_option_names': ['-h', '--help']}
+)
 @options.PROFILE(type=types.ProfileParamType(load_profile=True))
 @click.version_option(None, '-v', '--version', message='AiiDA version %(version)s')
 @click.pass_context
@@ -18,6 +18,27 @@ from __future__ import absolute_import
 import click
 
 
+class IdentifierArgument(click.Argument):
+    """
+    Argument that, when it accepts multiple values of an `IdentifierParamType`, loads all corresponding entities with
+    a single query instead of converting each value separately.
+
+    Types that override `convert`, for example to validate the loaded entity or to create it if it does not exist,
+    still convert each value separately, such that their checks are not skipped.
+    """
+
+    def type_cast_value(self, ctx, value):
+        from six import get_unbound_function
+        from aiida.cmdline.params.types.identifier import IdentifierParamType
+
+        if self.nargs != 1 and not self.multiple and isinstance(self.type, IdentifierParamType):
+            convert = get_unbound_function(type(self.type).convert)
+            if convert is get_unbound_function(IdentifierParamType.convert):
+                return self.type.convert_many(tuple(value), self, ctx) if value else ()
+
+        return super(IdentifierArgument, self).type_cast_value(ctx, value)
+
+
 class OverridableArgument(object):
     """
     Wrapper around click.argument that increases reusability
@@ -59,6 +80,7 @@ class OverridableArgument(object):
         """
         kw_copy = self.kwargs.copy()
         kw_copy.update(kwargs)
+        kw_copy.setdefault('cls', IdentifierArgument)
 
         if args:
             return click.argument(*args, **kw_copy)
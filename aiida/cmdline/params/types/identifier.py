@@ -89,11 +89,52 @@ class IdentifierParamType(click.ParamType):
         :raises RuntimeError: if the defined orm class loader is not a subclass of the OrmEntityLoader class
         """
         from aiida.common import exceptions
-        from aiida.orm.utils.loaders import OrmEntityLoader
 
         if not value:
             raise click.BadParameter('the value for the identifier cannot be empty')
 
+        loader = self._get_loader()
+
+        try:
+            entity = loader.load_entity(value, sub_classes=self._sub_classes)
+        except (exceptions.MultipleObjectsError, exceptions.NotExistent, ValueError) as exception:
+            raise click.BadParameter(str(exception))
+
+        return entity
+
+    @with_dbenv()
+    def convert_many(self, values, param, ctx):  # pylint: disable=unused-argument
+        """
+        Attempt to convert the given values to instances of the orm class using a single query of the orm class loader.
+
+        :return: tuple of the loaded orm entities
+        :raises click.BadParameter: if any of the values is ambiguous and leads to multiple entities
+        :raises click.BadParameter: if any of the values cannot be mapped onto any existing instance
+        :raises RuntimeError: if the defined orm class loader is not a subclass of the OrmEntityLoader class
+        """
+        from aiida.common import exceptions
+
+        if not all(values):
+            raise click.BadParameter('the value for the identifier cannot be empty')
+
+        loader = self._get_loader()
+
+        try:
+            entities = loader.load_entities(values, sub_classes=self._sub_classes)
+        except (exceptions.MultipleObjectsError, exceptions.NotExistent, ValueError) as exception:
+            raise click.BadParameter(str(exception))
+
+        return tuple(entities)
+
+    def _get_loader(self):
+        """
+        Return the orm class loader, after having loaded the sub classes defined by the entry points if necessary.
+
+        :return: the orm entity loader class for this ParamType
+        :raises RuntimeError: if the defined orm class loader is not a subclass of the OrmEntityLoader class
+        """
+        from aiida.orm.utils.loaders import OrmEntityLoader
+
         loader = self.orm_class_loader
 
         if not issubclass(loader, OrmEntityLoader):
@@ -123,9 +164,4 @@ class IdentifierParamType(click.ParamType):
 
             self._sub_classes = tuple(sub_classes)
 
-        try:
-            entity = loader.load_entity(value, sub_classes=self._sub_classes)
-        except (exceptions.MultipleObjectsError, exceptions.NotExistent, ValueError) as exception:
-            raise click.BadParameter(str(exception))
-
-        return entity
+        return loader
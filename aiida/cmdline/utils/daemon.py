@@ -20,6 +20,18 @@ from aiida.cmdline.utils.common import format_local_time
 
 _START_CIRCUS_COMMAND = 'start-circus'
 
+# Content type of the text format of Prometheus
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Keys of the status of the autoscaler that are exposed as metrics, with their types and descriptions
+_AUTOSCALER_METRICS = (
+    ('workers', 'gauge', 'Number of workers of the daemon'),
+    ('queue_depth', 'gauge', 'Number of process tasks that are waiting for a worker'),
+    ('scale_up_total', 'counter', 'Number of times that workers were added'),
+    ('scale_down_total', 'counter', 'Number of times that workers were removed'),
+    ('errors_total', 'counter', 'Number of times that the autoscaler failed to determine the load or scale'),
+)
+
 
 def print_client_response_status(response):
     """
@@ -94,9 +106,118 @@ def get_daemon_status(client):
         'Use verdi daemon [incr | decr] [num] to increase / decrease the amount of workers'
     )
 
+    autoscaler = client.get_autoscaler_status()
+
+    if autoscaler is not None:
+        template += '\nThe daemon scales automatically between {min_workers} and {max_workers} workers'
+        info['min_workers'] = autoscaler['min_workers']
+        info['max_workers'] = autoscaler['max_workers']
+
+        if autoscaler['last_decision'] is not None:
+            decision = autoscaler['last_decision']
+            template += ', last from {scaled_from} to {scaled_to} at {scaled_time} because {scaled_reason}'
+            info['scaled_from'] = decision['from']
+            info['scaled_to'] = decision['to']
+            info['scaled_time'] = format_local_time(decision['time'])
+            info['scaled_reason'] = decision['reason']
+
     return template.format(**info)
 
 
+def get_daemon_metrics(client):
+    """
+    Return a table of the metrics of the daemon, merged over all of its workers
+
+    :param client: the DaemonClient
+    """
+    from aiida.engine.metrics import merge_snapshots, METRIC_TYPE_HISTOGRAM
+
+    merged = merge_snapshots(snapshot for _, snapshot in client.get_metrics())
+
+    if not merged:
+        return 'No metrics were published by the workers yet'
+
+    rows = [['Metric', 'Labels', 'Count', 'Mean [s]', 'Max [s]']]
+
+    for name in sorted(merged):
+        metric = merged[name]
+        for entry in sorted(metric['series'], key=lambda entry: sorted(entry['labels'].items())):
+            labels = ', '.join('{}={}'.format(key, value) for key, value in sorted(entry['labels'].items()))
+            value = entry['value']
+            if metric['type'] == METRIC_TYPE_HISTOGRAM:
+                mean = value['sum'] / value['count'] if value['count'] else 0.
+                rows.append([name, labels, value['count'], '{:.3f}'.format(mean), '{:.3f}'.format(value['max'])])
+            else:
+                rows.append([name, labels, value, '', ''])
+
+    return tabulate(rows, headers='firstrow', tablefmt='simple')
+
+
+def get_daemon_metrics_prometheus(client):
+    """
+    Return the metrics of the daemon in the text format of Prometheus
+
+    The series of the metrics of the workers are labeled with the pid of the worker. If the daemon scales automatically,
+    the metrics of the autoscaler are included as well.
+
+    :param client: the DaemonClient
+    """
+    from aiida.engine.metrics import format_prometheus
+
+    snapshots = [({'worker': pid}, snapshot) for pid, snapshot in client.get_metrics()]
+    autoscaler = client.get_autoscaler_status()
+
+    if autoscaler is not None:
+        snapshot = {}
+        for key, metric_type, description in _AUTOSCALER_METRICS:
+            series = [{'labels': {}, 'value': autoscaler[key]}]
+            snapshot['autoscaler_{}'.format(key)] = {'type': metric_type, 'description': description, 'series': series}
+        snapshots.append(({}, snapshot))
+
+    return format_prometheus(snapshots)
+
+
+def serve_daemon_metrics(client, host, port):
+    """
+    Serve the metrics of the daemon in the text format of Prometheus over HTTP, until interrupted
+
+    The metrics are collected from the status files of the workers for every request to `/metrics`.
+
+    :param client: the DaemonClient
+    :param host: the host name or address to listen on
+    :param port: the port to listen on
+    """
+    from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # pylint: disable=import-error
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Handler that responds to requests for the metrics."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Respond with the current metrics of the daemon."""
+            if self.path.split('?')[0] not in ['/', '/metrics']:
+                self.send_error(404)
+                return
+
+            content = get_daemon_metrics_prometheus(client).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', PROMETHEUS_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """Do not log the requests, which are typically periodic scrapes."""
+
+    server = HTTPServer((host, port), MetricsHandler)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 def delete_stale_pid_file(client):
     """Delete a potentially state daemon PID file.
 
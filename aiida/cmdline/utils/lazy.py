@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Click command group that imports the modules of its subcommands lazily."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import importlib
+import io
+import json
+import os
+
+import click
+
+# Name of the file in the configuration folder in which the command index is cached
+COMMAND_INDEX_FILENAME = 'verdi_command_index.json'
+
+
+class LazyGroup(click.Group):
+    """A click command group that imports the module that defines a subcommand only when that subcommand is needed.
+
+    The modules register their subcommands with the group when they are imported, for example with the
+    `@verdi.command()` decorator. The short help strings of the subcommands, which are needed to print the help of the
+    group and to complete the subcommand names in the shell, are read from a command index instead. The index is cached
+    in the configuration folder and is only rebuilt, by importing all modules once, if a module changed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize with the modules of the lazy subcommands.
+
+        :param lazy_subcommands: dictionary of subcommand names onto the fully qualified names of their modules
+        """
+        self._lazy_subcommands = kwargs.pop('lazy_subcommands', {})
+        self._command_index = None
+        super(LazyGroup, self).__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        """Return the names of the subcommands, including those whose modules have not been imported yet."""
+        return sorted(set(super(LazyGroup, self).list_commands(ctx)) | set(self._lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        """Return the subcommand with the given name, importing its module if necessary.
+
+        While the shell completes a command line, the context parses resiliently and `click_completion` requests every
+        subcommand, only to read its short help and whether it is hidden. In that case, a subcommand whose module has
+        not been imported yet is returned as an `IndexedCommand`, which only imports the module if the completion
+        descends into the subcommand.
+        """
+        if cmd_name not in self.commands and cmd_name in self._lazy_subcommands:
+            if ctx is not None and ctx.resilient_parsing:
+                entry = self.get_command_index(ctx).get(cmd_name)
+                if entry is not None:
+                    return IndexedCommand(self, cmd_name, entry)
+
+            return self.load_command(cmd_name)
+
+        return super(LazyGroup, self).get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name):
+        """Import the module of the subcommand with the given name and return the subcommand.
+
+        :return: the subcommand or None if the module does not define it
+        """
+        if cmd_name not in self.commands and cmd_name in self._lazy_subcommands:
+            importlib.import_module(self._lazy_subcommands[cmd_name])
+
+        return self.commands.get(cmd_name)
+
+    def load_commands(self):
+        """Import the modules of all lazy subcommands, such that the `commands` attribute contains all subcommands."""
+        for module_name in sorted(set(self._lazy_subcommands.values())):
+            importlib.import_module(module_name)
+
+    def format_commands(self, ctx, formatter):
+        """Write the names and short help strings of the subcommands, taken from the command index, to the formatter."""
+        index = self.get_command_index(ctx)
+        commands = [(name, index[name]) for name in self.list_commands(ctx) if name in index]
+        commands = [(name, entry) for name, entry in commands if not entry['hidden']]
+
+        if commands:
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [(name, click.utils.make_default_short_help(entry['short_help'], limit)) for name, entry in commands]
+
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+    def get_command_index(self, ctx):
+        """Return the command index, a dictionary of subcommand names onto their short help and whether they are hidden.
+
+        The index is read from the cache file if it is up to date, otherwise it is built by importing the modules of all
+        subcommands and written to the cache file.
+        """
+        if self._command_index is not None:
+            return self._command_index
+
+        filepath = get_command_index_filepath()
+        fingerprint = self._get_fingerprint()
+        index = None
+
+        if filepath is not None:
+            try:
+                with io.open(filepath, 'r', encoding='utf8') as handle:
+                    content = json.load(handle)
+                if content.get('fingerprint') == fingerprint:
+                    index = content['commands']
+            except (IOError, OSError, ValueError, KeyError, AttributeError):
+                pass
+
+        if index is None:
+            index = self._build_command_index(ctx)
+            if filepath is not None:
+                try:
+                    with io.open(filepath, 'w', encoding='utf8') as handle:
+                        handle.write(json.dumps({'fingerprint': fingerprint, 'commands': index}, ensure_ascii=False))
+                except (IOError, OSError):
+                    pass
+
+        self._command_index = index
+        return index
+
+    def _build_command_index(self, ctx):
+        """Build the command index by importing the modules of all subcommands."""
+        index = {}
+
+        self.load_commands()
+
+        for name in self.list_commands(ctx):
+            command = self.get_command(ctx, name)
+            if command is not None:
+                index[name] = {'short_help': command.get_short_help_str(limit=1000), 'hidden': command.hidden}
+
+        return index
+
+    def _get_fingerprint(self):
+        """Return a fingerprint of the modules of the subcommands, which changes if any of the modules changes."""
+        from aiida import __version__
+
+        modification_times = {}
+
+        for module_name in set(self._lazy_subcommands.values()):
+            try:
+                modification_times[module_name] = os.path.getmtime(_get_module_filepath(module_name))
+            except (ImportError, OSError, AttributeError):
+                modification_times[module_name] = None
+
+        return json.dumps([__version__, self._lazy_subcommands, modification_times], sort_keys=True)
+
+
+class IndexedCommand(click.Command):
+    """Placeholder of a subcommand of a `LazyGroup` whose module has not been imported, built from the command index.
+
+    It has the short help of the subcommand and whether it is hidden, which is all that is needed to complete its name.
+    Making a context for it imports the module of the subcommand and returns the context of the subcommand instead.
+    """
+
+    def __init__(self, group, name, entry):
+        """Construct a new instance.
+
+        :param group: the `LazyGroup` that the subcommand belongs to
+        :param name: the name of the subcommand
+        :param entry: the entry of the subcommand in the command index of the group
+        """
+        super(IndexedCommand, self).__init__(name, short_help=entry['short_help'], hidden=entry['hidden'])
+        self._group = group
+
+    def get_short_help_str(self, limit=45):
+        """Return the short help of the subcommand, shortened to the given length like that of the subcommand itself."""
+        return click.utils.make_default_short_help(self.short_help or '', limit)
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        """Import the module of the subcommand and make a context for the subcommand itself."""
+        return self._group.load_command(self.name).make_context(info_name, args, parent=parent, **extra)
+
+
+def get_command_index_filepath():
+    """Return the path of the file in which the command index is cached, or None if there is no configuration folder."""
+    from aiida.manage.configuration import settings
+
+    if settings.AIIDA_CONFIG_FOLDER is None:
+        return None
+
+    dirpath = os.path.expanduser(settings.AIIDA_CONFIG_FOLDER)
+
+    if not os.path.isdir(dirpath):
+        return None
+
+    return os.path.join(dirpath, COMMAND_INDEX_FILENAME)
+
+
+def _get_module_filepath(module_name):
+    """Return the path of the file of a module, or of the `__init__.py` of a package, without importing it.
+
+    The parent package of the module is imported, which is expected to be lightweight.
+    """
+    package_name, _, name = module_name.rpartition('.')
+    package = importlib.import_module(package_name)
+
+    for dirpath in package.__path__:
+        for filepath in (os.path.join(dirpath, name + '.py'), os.path.join(dirpath, name, '__init__.py')):
+            if os.path.isfile(filepath):
+                return filepath
+
+    raise ImportError('no module named {}'.format(module_name))
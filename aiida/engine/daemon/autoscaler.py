@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Circus plugin that scales the number of daemon workers with the load."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import math
+import os
+import time
+
+from circus import logger
+from circus.plugins import CircusPlugin
+
+from aiida.engine.daemon.monitor import get_worker_statuses, write_status_file
+
+# Fraction of the process slots of the remaining workers that may at most be in use to remove a worker
+SCALE_DOWN_UTILIZATION = 0.5
+
+
+class AutoscalerPolicy(object):
+    """The policy that decides on the number of daemon workers, given the load of the daemon.
+
+    A worker is added if there are tasks waiting in the process queue, which means that all workers have taken as many
+    processes as they can, or if the event loop of any worker lags more than `max_loop_lag`. As many workers are added
+    at once as are needed to take all waiting tasks. A worker is removed if no tasks are waiting, no event loop lags
+    more than half of `max_loop_lag` and the active processes would occupy at most `SCALE_DOWN_UTILIZATION` of the
+    process slots of the remaining workers. Since a removed worker hands its processes back to the queue, only one
+    worker is removed at a time. After each change, no further change is made for `cooldown` seconds, to give the load
+    time to redistribute over the workers.
+    """
+
+    def __init__(self, min_workers, max_workers, max_loop_lag, cooldown):
+        """Construct a new instance.
+
+        :param min_workers: the minimum number of workers
+        :param max_workers: the maximum number of workers
+        :param max_loop_lag: the event loop lag in seconds above which a worker is considered overloaded
+        :param cooldown: the minimum time in seconds between two changes of the number of workers
+        """
+        if min_workers < 1 or max_workers < min_workers:
+            raise ValueError('invalid bounds for the number of workers: {} to {}'.format(min_workers, max_workers))
+
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.max_loop_lag = max_loop_lag
+        self.cooldown = cooldown
+        self.last_scaled = None
+
+    def decide(self, num_workers, queue_depth, statuses, now=None):
+        """Return the number of workers that the daemon should have and the reason for the change, if any.
+
+        :param num_workers: the current number of workers
+        :param queue_depth: the number of process tasks that are waiting in the queue for a worker
+        :param statuses: the statuses of the workers, see :meth:`aiida.engine.daemon.monitor.WorkerMonitor.get_status`
+        :param now: the current time, by default `time.time()`
+        :return: tuple of the target number of workers and a string with the reason, which is None if the number of
+            workers should not change
+        """
+        now = time.time() if now is None else now
+
+        if num_workers < self.min_workers:
+            return self.min_workers, 'the number of workers is below the minimum'
+
+        if num_workers > self.max_workers:
+            return self.max_workers, 'the number of workers is above the maximum'
+
+        if self.last_scaled is not None and now - self.last_scaled < self.cooldown:
+            return num_workers, None
+
+        active = sum(status['active_processes'] for status in statuses)
+        slots = max([status['max_processes'] for status in statuses] or [1])
+        loop_lag = max([status['loop_lag'] for status in statuses] or [0.])
+
+        if num_workers < self.max_workers:
+            if queue_depth > 0:
+                needed = int(math.ceil(queue_depth / slots))
+                return min(num_workers + needed, self.max_workers), '{} tasks are waiting'.format(queue_depth)
+
+            if loop_lag > self.max_loop_lag:
+                return num_workers + 1, 'the event loop of a worker lags {:.3f} s'.format(loop_lag)
+
+        if num_workers > self.min_workers and queue_depth == 0 and loop_lag <= self.max_loop_lag / 2:
+            if active <= (num_workers - 1) * slots * SCALE_DOWN_UTILIZATION:
+                return num_workers - 1, 'only {} processes are active'.format(active)
+
+        return num_workers, None
+
+
+class AutoscalerPlugin(CircusPlugin):
+    """Circus plugin that periodically applies the `AutoscalerPolicy` to the workers of the daemon of a profile.
+
+    The load of the workers is read from the status files that they write, see `aiida.engine.daemon.monitor`, and the
+    number of waiting tasks from the process queue in RabbitMQ. The plugin logs every change of the number of workers
+    to the circus log and writes its own status, including its metrics and last decision, to the autoscaler file of the
+    profile, from where it can be read with :meth:`aiida.engine.daemon.client.DaemonClient.get_autoscaler_status`.
+
+    The plugin is configured by the following options, which circus passes as strings:
+
+        * `profile`: the name of the profile
+        * `watcher`: the name of the circus watcher of the workers
+        * `min_workers` and `max_workers`: the bounds of the number of workers
+        * `interval`: the interval in seconds between two decisions
+        * `cooldown`: the minimum time in seconds between two changes of the number of workers
+        * `max_loop_lag`: the event loop lag in milliseconds above which a worker is considered overloaded
+    """
+
+    name = 'aiida_autoscaler'
+
+    def __init__(self, *args, **config):
+        super(AutoscalerPlugin, self).__init__(*args, **config)
+        self.profile_name = config['profile']
+        self.watcher = config['watcher']
+        self.interval = int(config.get('interval', 30))
+        self.policy = AutoscalerPolicy(
+            min_workers=int(config.get('min_workers', 1)),
+            max_workers=int(config.get('max_workers', 4)),
+            max_loop_lag=int(config.get('max_loop_lag', 500)) / 1000.,
+            cooldown=int(config.get('cooldown', 120)),
+        )
+        self.metrics = {'scale_up_total': 0, 'scale_down_total': 0, 'errors_total': 0}
+        self.last_decision = None
+        self.period = None
+        self._profile = None
+        self._connection = None
+        self._channel = None
+
+    def handle_init(self):
+        """Load the profile and start the periodic decisions."""
+        from tornado.ioloop import PeriodicCallback
+        from aiida.manage.configuration import get_config
+
+        self._profile = get_config().get_profile(self.profile_name)
+        self.period = PeriodicCallback(self.look_after, self.interval * 1000, io_loop=self.loop)
+        self.period.start()
+
+    def handle_stop(self):
+        """Stop the periodic decisions and remove the status file."""
+        if self.period is not None:
+            self.period.stop()
+
+        self._close_connection()
+
+        try:
+            os.remove(self._profile.filepaths['daemon']['autoscaler'])
+        except (AttributeError, OSError):
+            pass
+
+    def handle_recv(self, data):
+        """The plugin does not react to the events published by circus."""
+
+    def look_after(self):
+        """Decide on the number of workers and apply the decision."""
+        try:
+            response = self.call('numprocesses', name=self.watcher)
+            num_workers = int(response['numprocesses'])
+            queue_depth = self.get_queue_depth()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('autoscaler failed to determine the load of the daemon')
+            self.metrics['errors_total'] += 1
+            return
+
+        statuses = get_worker_statuses(self._profile.filepaths['daemon']['workers'])
+        target, reason = self.policy.decide(num_workers, queue_depth, statuses)
+
+        if target != num_workers:
+            command = 'incr' if target > num_workers else 'decr'
+            logger.info('autoscaler changes the number of workers from %d to %d: %s', num_workers, target, reason)
+            response = self.call(command, name=self.watcher, nb=abs(target - num_workers))
+
+            if response.get('status') == 'ok':
+                self.policy.last_scaled = time.time()
+                self.metrics['scale_up_total' if target > num_workers else 'scale_down_total'] += 1
+                self.last_decision = {'time': time.time(), 'from': num_workers, 'to': target, 'reason': reason}
+                num_workers = target
+            else:
+                logger.error('autoscaler failed to change the number of workers: %s', response)
+                self.metrics['errors_total'] += 1
+
+        status = {
+            'timestamp': time.time(),
+            'workers': num_workers,
+            'min_workers': self.policy.min_workers,
+            'max_workers': self.policy.max_workers,
+            'queue_depth': queue_depth,
+            'active_processes': sum(entry['active_processes'] for entry in statuses),
+            'loop_lag': max([entry['loop_lag'] for entry in statuses] or [0.]),
+            'last_decision': self.last_decision,
+        }
+        status.update(self.metrics)
+
+        try:
+            write_status_file(self._profile.filepaths['daemon']['autoscaler'], status)
+        except (IOError, OSError):
+            logger.exception('autoscaler failed to write its status file')
+
+    def get_queue_depth(self):
+        """Return the number of process tasks that are waiting in the queue of the profile for a worker.
+
+        :return: the number of messages that are ready to be delivered from the process queue
+        """
+        import pika
+        import pika.exceptions
+        from aiida.manage.external import rmq
+
+        if self._channel is None or not self._channel.is_open:
+            self._close_connection()
+            self._connection = pika.BlockingConnection(pika.URLParameters(rmq.get_rmq_url()))
+            self._channel = self._connection.channel()
+
+        queue = rmq.get_launch_queue_name(self._profile.rmq_prefix)
+
+        try:
+            frame = self._channel.queue_declare(queue=queue, passive=True)
+        except pika.exceptions.ChannelClosedByBroker:
+            # The queue does not exist yet, because no worker declared it, so no tasks can be waiting either
+            self._channel = None
+            return 0
+
+        return frame.method.message_count
+
+    def _close_connection(self):
+        """Close the connection to RabbitMQ if it is open."""
+        if self._connection is not None and self._connection.is_open:
+            try:
+                self._connection.close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+        self._connection = None
+        self._channel = None
@@ -144,6 +144,14 @@ class DaemonClient(object):  # pylint: disable=too-many-public-methods
     def daemon_pid_file(self):
         return self.profile.filepaths['daemon']['pid']
 
+    @property
+    def daemon_workers_dir(self):
+        return self.profile.filepaths['daemon']['workers']
+
+    @property
+    def daemon_autoscaler_file(self):
+        return self.profile.filepaths['daemon']['autoscaler']
+
     def get_circus_port(self):
         """
         Retrieve the port for the circus controller, which should be written to the circus port file. If the
@@ -406,6 +414,37 @@ class DaemonClient(object):  # pylint: disable=too-many-public-methods
 
         return self.call_client(command)
 
+    def get_worker_statuses(self):
+        """
+        Get the load of the workers, as published by each worker in its status file
+
+        :return: list of status dictionaries, see :meth:`aiida.engine.daemon.monitor.WorkerMonitor.get_status`
+        """
+        from aiida.engine.daemon.monitor import get_worker_statuses
+        return get_worker_statuses(self.daemon_workers_dir)
+
+    def get_metrics(self):
+        """
+        Get the metrics of the workers, as published by each worker in its status file
+
+        :return: list of tuples of the pid of a worker and the snapshot of its metrics, see
+            :meth:`aiida.engine.metrics.MetricsRegistry.snapshot`
+        """
+        return [(status['pid'], status.get('metrics', {})) for status in self.get_worker_statuses()]
+
+    def get_autoscaler_status(self):
+        """
+        Get the status of the autoscaler of the daemon, including its metrics and the last scaling decision
+
+        :return: the status dictionary or None if the daemon does not scale automatically
+        """
+        from aiida.engine.daemon.monitor import read_status_file
+
+        if not self.is_daemon_running:
+            return None
+
+        return read_status_file(self.daemon_autoscaler_file)
+
     def increase_workers(self, number):
         """
         Increase the number of workers
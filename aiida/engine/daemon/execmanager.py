@@ -47,6 +47,7 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     from logging import LoggerAdapter
     from tempfile import NamedTemporaryFile
     from aiida.orm import load_node, Code, RemoteData
+    from aiida.engine.daemon.remotecache import RemoteObjectCache
 
     # If the calculation already has a `remote_folder`, simply return. The upload was apparently already completed
     # before, which can happen if the daemon is restarted and it shuts down after uploading but before getting the
@@ -70,6 +71,7 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
                          'submission, set `metadata.dry_run` to True in the inputs.'.format(node.pk))
 
     folder = node._raw_input_folder
+    object_cache = None
 
     # If we are performing a dry-run, the working directory should actually be a local folder that should already exist
     if dry_run:
@@ -138,6 +140,9 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
         workdir = transport.getcwd()
         node.set_remote_workdir(workdir)
 
+        if computer.get_use_remote_object_cache():
+            object_cache = RemoteObjectCache(transport, computer, remote_working_directory)
+
     # I first create the code files, so that the code can put
     # default files to be overwritten by the plugin itself.
     # Still, beware! The code file itself could be overwritten...
@@ -153,7 +158,10 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
     if not dry_run:
         for filename in folder.get_content_list():
             logger.debug('[submission of calculation {}] copying file/folder {}...'.format(node.pk, filename))
-            transport.put(folder.get_abs_path(filename), filename)
+            if object_cache is not None and folder.isfile(filename):
+                object_cache.put(folder.get_abs_path(filename), filename)
+            else:
+                transport.put(folder.get_abs_path(filename), filename)
 
     # local_copy_list is a list of tuples, each with (uuid, dest_rel_path)
     # NOTE: validation of these lists are done inside calculation.presubmit()
@@ -176,7 +184,10 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
             handle.write(data_node.get_object_content(filename, mode='rb'))
             handle.flush()
             handle.seek(0)
-            transport.put(handle.name, target)
+            if object_cache is not None:
+                object_cache.put(handle.name, target)
+            else:
+                transport.put(handle.name, target)
 
     if dry_run:
         if remote_copy_list:
@@ -232,6 +243,9 @@ def upload_calculation(node, transport, calc_info, script_filename, dry_run=Fals
         remotedata.add_incoming(node, link_type=LinkType.CREATE, link_label='remote_folder')
         remotedata.store()
 
+        if object_cache is not None:
+            object_cache.evict()
+
     return calc_info, script_filename
 
 
@@ -371,14 +385,108 @@ def parse_results(process, retrieved_temporary_folder=None):
 
     :returns: integer exit code, where 0 indicates success and non-zero failure
     """
-    from aiida.engine import ExitCode
-
     assert process.node.get_state() == CalcJobState.PARSING, \
         'job should be in the PARSING state when calling this function yet it is {}'.format(process.node.get_state())
 
-    parser_class = process.node.get_parser_class()
-    exit_code = ExitCode()
-    logger_extra = get_dblogger_extra(process.node)
+    parser, exit_code = _run_parser(process.node, retrieved_temporary_folder)
+
+    if parser is None:
+        return exit_code
+
+    for link_label, node in parser.outputs.items():
+        try:
+            process.out(link_label, node)
+        except ValueError as exception:
+            parser.logger.error('invalid value {} specified with label {}: {}'.format(node, link_label, exception))
+            exit_code = process.exit_codes.ERROR_INVALID_OUTPUT
+            break
+
+    return exit_code
+
+
+def parse_and_store_results(calculation, retrieved_temporary_folder=None, cancelled=None):
+    """
+    Parse the results of a job calculation and store the outputs of the parser, linked to the calculation.
+
+    Unlike `parse_results`, this does not need the process of the calculation, such that it can be called by a thread
+    other than the one that runs the process, with a node that was loaded by that thread. The outputs are first
+    validated against the output ports of the process class of the calculation, like `Process.out` does, and are then
+    stored together in a single transaction. If any output is invalid, none of them is stored.
+
+    :param calculation: the CalcJobNode to parse
+    :param retrieved_temporary_folder: the absolute path to the directory with the retrieved temporary files, if any
+    :param cancelled: an optional `threading.Event`, if it is set once the parser finished the outputs are not stored
+    :returns: the exit code returned by the parser, or `ERROR_INVALID_OUTPUT` if any of its outputs is invalid
+    """
+    from aiida.engine.processes.ports import PORT_NAMESPACE_SEPARATOR
+    from aiida.orm import Node
+
+    parser, exit_code = _run_parser(calculation, retrieved_temporary_folder)
+
+    if parser is None:
+        return exit_code
+
+    spec = calculation.process_class.spec()
+    outputs = []
+
+    for link_label, node in parser.outputs.items():
+        validation_error = _validate_output(spec, link_label, node)
+        if validation_error:
+            message = 'invalid value {} specified with label {}: {}'.format(node, link_label, validation_error)
+            parser.logger.error(message)
+            return spec.exit_codes.ERROR_INVALID_OUTPUT
+
+        node.add_incoming(calculation, LinkType.CREATE, link_label.replace('.', PORT_NAMESPACE_SEPARATOR))
+        outputs.append(node)
+
+    if cancelled is not None and cancelled.is_set():
+        parser.logger.warning('not storing the outputs of the parser, because the calculation was killed')
+        return exit_code
+
+    Node.objects(calculation.backend).store_many(outputs)
+
+    return exit_code
+
+
+def _validate_output(spec, link_label, node):
+    """
+    Validate an output of a parser against the output ports of a process spec, the same way as `Process.out` does.
+
+    :param spec: the spec of the process class of the calculation
+    :param link_label: the label with which the parser registered the output, with namespaces separated by dots
+    :param node: the output node
+    :returns: the validation error, or None if the output is valid
+    """
+    namespace = link_label.split(spec.namespace_separator)
+    port_name = namespace.pop()
+
+    try:
+        port_namespace = spec.outputs.get_port(spec.namespace_separator.join(namespace)) if namespace else spec.outputs
+    except (KeyError, ValueError):
+        return 'unexpected output namespace {}'.format(spec.namespace_separator.join(namespace))
+
+    try:
+        port = port_namespace[port_name]
+    except KeyError:
+        if not port_namespace.dynamic:
+            return 'unexpected output {}'.format(link_label)
+        return port_namespace.validate_dynamic_ports({port_name: node})
+
+    return port.validate(node)
+
+
+def _run_parser(calculation, retrieved_temporary_folder=None):
+    """
+    Run the parser of a job calculation, if it has one, on its retrieved files.
+
+    :param calculation: the CalcJobNode to parse
+    :param retrieved_temporary_folder: the absolute path to the directory with the retrieved temporary files, if any
+    :returns: tuple of the parser, or None if the calculation does not have a parser, and the exit code it returned
+    """
+    from aiida.engine import ExitCode
+
+    parser_class = calculation.get_parser_class()
+    logger_extra = get_dblogger_extra(calculation)
 
     if retrieved_temporary_folder:
         files = []
@@ -390,39 +498,32 @@ def parse_results(process, retrieved_temporary_folder=None):
 
         execlogger.debug('[parsing of calc {}] '
                          'Content of the retrieved_temporary_folder: \n'
-                         '{}'.format(process.node.pk, '\n'.join(files)), extra=logger_extra)
+                         '{}'.format(calculation.pk, '\n'.join(files)), extra=logger_extra)
     else:
         execlogger.debug('[parsing of calc {}] '
-                         'No retrieved_temporary_folder.'.format(process.node.pk), extra=logger_extra)
+                         'No retrieved_temporary_folder.'.format(calculation.pk), extra=logger_extra)
 
-    if parser_class is not None:
+    if parser_class is None:
+        return None, ExitCode()
 
-        parser = parser_class(process.node)
-        parse_kwargs = parser.get_outputs_for_parsing()
+    parser = parser_class(calculation)
+    parse_kwargs = parser.get_outputs_for_parsing()
 
-        if retrieved_temporary_folder:
-            parse_kwargs['retrieved_temporary_folder'] = retrieved_temporary_folder
+    if retrieved_temporary_folder:
+        parse_kwargs['retrieved_temporary_folder'] = retrieved_temporary_folder
 
-        exit_code = parser.parse(**parse_kwargs)
+    exit_code = parser.parse(**parse_kwargs)
 
-        if exit_code is None:
-            exit_code = ExitCode(0)
+    if exit_code is None:
+        exit_code = ExitCode(0)
 
-        if not isinstance(exit_code, ExitCode):
-            raise ValueError('parse should return an `ExitCode` or None, and not {}'.format(type(exit_code)))
+    if not isinstance(exit_code, ExitCode):
+        raise ValueError('parse should return an `ExitCode` or None, and not {}'.format(type(exit_code)))
 
-        if exit_code.status:
-            parser.logger.error('parser returned exit code<{}>: {}'.format(exit_code.status, exit_code.message))
+    if exit_code.status:
+        parser.logger.error('parser returned exit code<{}>: {}'.format(exit_code.status, exit_code.message))
 
-        for link_label, node in parser.outputs.items():
-            try:
-                process.out(link_label, node)
-            except ValueError as exception:
-                parser.logger.error('invalid value {} specified with label {}: {}'.format(node, link_label, exception))
-                exit_code = process.exit_codes.ERROR_INVALID_OUTPUT
-                break
-
-    return exit_code
+    return parser, exit_code
 
 
 def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_extra=None):
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Monitor that measures the load of a daemon worker and publishes it in a status file."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import json
+import logging
+import os
+import time
+
+from aiida.engine import metrics
+
+LOGGER = logging.getLogger(__name__)
+
+_LOOP_LAG_SECONDS = metrics.get_registry().histogram(
+    'worker_loop_lag_seconds', 'Time that a callback waits before the event loop of the worker runs it')
+
+_ACTIVE_PROCESSES = metrics.get_registry().gauge(
+    'worker_active_processes', 'Number of processes that the worker is running')
+
+# Interval in seconds at which the event loop lag of a worker is probed
+PROBE_INTERVAL = 1
+
+# Interval in seconds at which a worker writes its status file
+STATUS_INTERVAL = 5
+
+# Age in seconds after which the status file of a worker is considered stale, for example because the worker died
+STATUS_MAX_AGE = 3 * STATUS_INTERVAL
+
+
+class WorkerMonitor(object):
+    """Monitor of the load of a daemon worker, which periodically writes it to a status file in a shared directory.
+
+    The load consists of the number of processes that the worker is running and the lag of its event loop, which is the
+    time that a callback has to wait before the loop gets to run it. A large lag means that the loop is saturated, for
+    example by blocking calls, and that the worker will be slow to respond to anything, including heartbeats. The lag
+    is probed every `PROBE_INTERVAL` seconds and the maximum since the last write is reported. The status also contains
+    a snapshot of the metrics of the worker, see `aiida.engine.metrics`, in which every probe is recorded.
+    """
+
+    def __init__(self, runner, dirpath):
+        """Construct a new instance.
+
+        :param runner: the daemon runner of the worker
+        :param dirpath: the directory in which the status files of the workers of the daemon are written
+        """
+        self._runner = runner
+        self._dirpath = dirpath
+        self._filepath = os.path.join(dirpath, '{}.json'.format(os.getpid()))
+        self._callback = None
+        self._loop_lag = 0.
+        self._last_write = 0.
+
+    @property
+    def filepath(self):
+        """Return the path of the status file of this worker."""
+        return self._filepath
+
+    def start(self):
+        """Start probing the event loop of the runner."""
+        from tornado.ioloop import PeriodicCallback
+
+        if not os.path.isdir(self._dirpath):
+            try:
+                os.makedirs(self._dirpath)
+            except OSError:
+                # The directory may have been created concurrently by another worker
+                if not os.path.isdir(self._dirpath):
+                    raise
+
+        self._callback = PeriodicCallback(self._probe, PROBE_INTERVAL * 1000, io_loop=self._runner.loop)
+        self._callback.start()
+
+    def stop(self):
+        """Stop probing the event loop of the runner and remove the status file."""
+        if self._callback is not None:
+            self._callback.stop()
+            self._callback = None
+
+        try:
+            os.remove(self._filepath)
+        except OSError:
+            pass
+
+    def get_status(self):
+        """Return the current status of the worker.
+
+        :return: dictionary with the pid of the worker, the number of active processes, the number of processes it
+            takes at most, the maximum event loop lag in seconds since the last write, the snapshot of the metrics of
+            the worker and the time of the status
+        """
+        from aiida.manage.external import rmq
+
+        task_receiver = self._runner.task_receiver
+        active_processes = task_receiver.num_active if task_receiver is not None else 0
+        _ACTIVE_PROCESSES.set(active_processes)
+
+        return {
+            'pid': os.getpid(),
+            'active_processes': active_processes,
+            'max_processes': rmq._RMQ_TASK_PREFETCH_COUNT,  # pylint: disable=protected-access
+            'loop_lag': self._loop_lag,
+            'metrics': metrics.get_registry().snapshot(),
+            'timestamp': time.time(),
+        }
+
+    def _probe(self):
+        """Schedule a callback on the event loop that measures how long it had to wait before being run."""
+        scheduled = time.time()
+        self._runner.loop.add_callback(self._record, scheduled)
+
+    def _record(self, scheduled):
+        """Record the lag of a probe and write the status file if it is due."""
+        now = time.time()
+        self._loop_lag = max(self._loop_lag, now - scheduled)
+        _LOOP_LAG_SECONDS.observe(now - scheduled)
+
+        if now - self._last_write >= STATUS_INTERVAL:
+            try:
+                write_status_file(self._filepath, self.get_status())
+            except (IOError, OSError):
+                LOGGER.exception('failed to write the worker status file %s', self._filepath)
+            self._last_write = now
+            self._loop_lag = 0.
+
+
+def write_status_file(filepath, status):
+    """Write a status dictionary to a JSON file atomically, such that readers never see a partially written file.
+
+    :param filepath: the path of the status file
+    :param status: the status dictionary
+    """
+    temporary = '{}.tmp'.format(filepath)
+
+    with io.open(temporary, 'w', encoding='utf8') as handle:
+        handle.write(json.dumps(status, ensure_ascii=False))
+
+    os.rename(temporary, filepath)
+
+
+def read_status_file(filepath):
+    """Read a status dictionary from a JSON file.
+
+    :param filepath: the path of the status file
+    :return: the status dictionary or None if the file does not exist or cannot be read
+    """
+    try:
+        with io.open(filepath, 'r', encoding='utf8') as handle:
+            return json.load(handle)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def get_worker_statuses(dirpath, max_age=STATUS_MAX_AGE):
+    """Return the statuses of the workers of a daemon, ignoring those that are stale.
+
+    :param dirpath: the directory in which the status files of the workers are written
+    :param max_age: the age in seconds after which a status is considered stale
+    :return: list of status dictionaries, as returned by `WorkerMonitor.get_status`
+    """
+    statuses = []
+
+    try:
+        filenames = os.listdir(dirpath)
+    except OSError:
+        return statuses
+
+    now = time.time()
+
+    for filename in sorted(filenames):
+        if not filename.endswith('.json'):
+            continue
+
+        status = read_status_file(os.path.join(dirpath, filename))
+
+        if status is not None and now - status.get('timestamp', 0) <= max_age:
+            statuses.append(status)
+
+    return statuses
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Cache of uploaded files on a computer, from which later uploads of files with the same content are copied."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import hashlib
+import os
+import time
+import uuid
+
+from aiida.common import AIIDA_LOGGER
+from aiida.common.escaping import escape_for_bash
+
+__all__ = ('RemoteObjectCache',)
+
+# Name of the directory in the remote working directory of a computer in which the cached objects are stored
+REMOTE_OBJECT_CACHE = '_aiida_object_cache'
+
+# Files smaller than this number of bytes are uploaded directly, because the round trips to look them up cost more
+MINIMUM_OBJECT_SIZE = 1024 * 1024
+
+# Minimum number of seconds between two evictions of the cache of a computer by the same interpreter
+EVICTION_INTERVAL = 600
+
+# Suffix of the temporary files that cached objects are first copied to, before they are moved in place
+TEMPORARY_SUFFIX = '.tmp'
+
+LOGGER = AIIDA_LOGGER.getChild('remotecache')
+
+# Time of the last eviction of the cache of each computer, by the UUID of the computer
+_LAST_EVICTION = {}
+
+
+class RemoteObjectCache(object):
+    """
+    Files that were uploaded to a computer, stored on the computer itself under the hash of their content.
+
+    When a file is uploaded of which the cache already holds the content, for example a pseudopotential or a charge
+    density to restart from that was already uploaded for a previous calculation, it is copied from the cache on the
+    computer itself instead of being transferred over the network. The file is copied rather than linked, such that a
+    calculation that modifies its input files cannot corrupt the cache.
+
+    The cache is evicted according to the `remote_object_cache_max_age` and `remote_object_cache_max_size` properties
+    of the computer, removing the least recently used objects first. Temporary files that were left behind by objects
+    that failed to be added are removed regardless of these properties.
+    """
+
+    def __init__(self, transport, computer, remote_working_directory):
+        """
+        :param transport: an open transport to the computer
+        :param computer: the computer
+        :param remote_working_directory: the remote working directory of the computer, in which the cache is stored
+        """
+        self._transport = transport
+        self._computer = computer
+        self._path = os.path.join(remote_working_directory, REMOTE_OBJECT_CACHE)
+        self._created = False
+
+    @property
+    def path(self):
+        """Return the absolute path of the directory of the cache on the computer."""
+        return self._path
+
+    def put(self, localpath, remotepath):
+        """
+        Upload a local file, copying it from the cache if it holds a file with the same content.
+
+        A file that is not yet in the cache is uploaded normally and then added to the cache. Failing to add it to the
+        cache does not fail the upload.
+
+        :param localpath: the absolute path of the local file
+        :param remotepath: the path on the computer to upload the file to
+        :return: True if the file was copied from the cache, False if it was uploaded
+        """
+        if os.path.getsize(localpath) < MINIMUM_OBJECT_SIZE:
+            self._transport.put(localpath, remotepath)
+            return False
+
+        cached = os.path.join(self._path, get_object_key(localpath))
+
+        if self._transport.isfile(cached):
+            try:
+                self._transport.copyfile(cached, remotepath)
+            except (IOError, OSError):
+                # The object may have been evicted in the meantime
+                LOGGER.debug('failed to copy cached object {}, uploading instead'.format(cached))
+            else:
+                self._touch(cached)
+                return True
+
+        self._transport.put(localpath, remotepath)
+
+        try:
+            self._add(remotepath, cached)
+        except (IOError, OSError) as exception:
+            LOGGER.warning('failed to add {} to the remote object cache: {}'.format(remotepath, exception))
+
+        return False
+
+    def evict(self, now=None):
+        """
+        Remove the objects that are older than the maximum age and then the least recently used objects until the cache
+        fits in the maximum size. The cache of a computer is evicted at most once every `EVICTION_INTERVAL` seconds.
+
+        Temporary files that are older than `EVICTION_INTERVAL` seconds are removed as well, since the addition of the
+        object that they were copied for must have failed. Younger ones may still be copied to by another worker.
+
+        :param now: the current time, by default `time.time()`
+        :return: the names of the objects and temporary files that were removed
+        """
+        now = time.time() if now is None else now
+        max_age = self._computer.get_remote_object_cache_max_age() * 86400
+        max_size = self._computer.get_remote_object_cache_max_size() * 1024 * 1024
+
+        if now - _LAST_EVICTION.get(self._computer.uuid, 0) < EVICTION_INTERVAL:
+            return []
+
+        _LAST_EVICTION[self._computer.uuid] = now
+
+        try:
+            objects = [(name, self._transport.get_attribute(os.path.join(self._path, name)))
+                       for name in self._transport.listdir(self._path)]
+        except (IOError, OSError):
+            return []
+
+        objects = [(name, attributes.st_mtime, attributes.st_size) for name, attributes in objects]
+        temporaries = [name for name, last_used, _ in objects
+                       if name.endswith(TEMPORARY_SUFFIX) and now - last_used > EVICTION_INTERVAL]
+        objects = [entry for entry in objects if not entry[0].endswith(TEMPORARY_SUFFIX)]
+        evicted = temporaries + get_objects_to_evict(objects, now, max_age, max_size)
+
+        for name in evicted:
+            try:
+                self._transport.remove(os.path.join(self._path, name))
+            except (IOError, OSError):
+                LOGGER.debug('failed to evict {} from the remote object cache'.format(name))
+
+        return evicted
+
+    def _add(self, remotepath, cached):
+        """Copy an uploaded file into the cache, through a temporary file such that it only appears once complete."""
+        if not self._created:
+            self._transport.makedirs(self._path, ignore_existing=True)
+            self._created = True
+
+        temporary = '{}.{}{}'.format(cached, uuid.uuid4().hex, TEMPORARY_SUFFIX)
+        self._transport.copyfile(remotepath, temporary)
+
+        # The `rename` of the transports requires the destination to exist, whereas `mv` creates or replaces it
+        command = 'mv -f {} {}'.format(escape_for_bash(temporary), escape_for_bash(cached))
+        retval, _, stderr = self._transport.exec_command_wait(command)
+
+        if retval != 0:
+            try:
+                self._transport.remove(temporary)
+            except (IOError, OSError):
+                pass
+            raise IOError('failed to move {} into place: {}'.format(temporary, stderr.strip()))
+
+    def _touch(self, cached):
+        """Update the modification time of a cached object, which is the time it was last used for the eviction."""
+        self._transport.exec_command_wait('touch -c {}'.format(escape_for_bash(cached)))
+
+
+def get_object_key(localpath):
+    """Return the key of a local file in the cache, which is the SHA-256 hash of its content.
+
+    :param localpath: the absolute path of the file
+    :return: the hexadecimal digest of the content of the file
+    """
+    digest = hashlib.sha256()
+
+    with open(localpath, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def get_objects_to_evict(objects, now, max_age=0, max_size=0):
+    """Return the names of the cached objects that should be evicted.
+
+    :param objects: a list of tuples of the name, the time of last use and the size in bytes of each object
+    :param now: the current time
+    :param max_age: the maximum number of seconds since the last use of an object, 0 meaning unlimited
+    :param max_size: the maximum total size of the objects in bytes, 0 meaning unlimited
+    :return: the names of the objects to evict, the least recently used first
+    """
+    evicted = []
+    total = 0
+
+    for name, last_used, size in sorted(objects, key=lambda entry: entry[1], reverse=True):
+        if (max_age and now - last_used > max_age) or (max_size and total + size > max_size):
+            evicted.append(name)
+        else:
+            total += size
+
+    return list(reversed(evicted))
@@ -15,12 +15,26 @@ from __future__ import absolute_import
 import logging
 import signal
 
+from tornado.ioloop import PeriodicCallback
+
 from aiida.common.log import configure_logging
 from aiida.engine.daemon.client import get_daemon_client
+from aiida.engine.daemon.monitor import WorkerMonitor
 from aiida.manage.manager import get_manager
 
 LOGGER = logging.getLogger(__name__)
 
+# Interval in seconds at which a daemon worker merges the changes of the node statistics, see `compact_node_statistics`
+STATISTICS_COMPACT_INTERVAL = 3600
+
+
+def compact_node_statistics():
+    """Merge the changes of the node statistics that were recorded since the last compaction."""
+    try:
+        get_manager().get_backend().query_manager.compact_node_statistics()
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception('failed to compact the node statistics')
+
 
 def start_daemon():
     """Start a daemon runner for the currently configured profile."""
@@ -35,8 +49,18 @@ def start_daemon():
         LOGGER.exception('daemon runner failed to start')
         raise
 
+    # Publish the load of this worker, which is used by the autoscaler of the daemon
+    monitor = WorkerMonitor(runner, daemon_client.daemon_workers_dir)
+    monitor.start()
+
+    # The statistics are only compacted by one worker at a time, the others skip the compaction
+    compaction = PeriodicCallback(compact_node_statistics, STATISTICS_COMPACT_INTERVAL * 1000, io_loop=runner.loop)
+    compaction.start()
+
     def shutdown_daemon(_num, _frame):
         LOGGER.info('Received signal to shut down the daemon runner')
+        compaction.stop()
+        monitor.stop()
         runner.close()
 
     signal.signal(signal.SIGINT, shutdown_daemon)
@@ -48,6 +72,8 @@ def start_daemon():
         runner.start()
     except SystemError as exception:
         LOGGER.info('Received a SystemError: %s', exception)
+        compaction.stop()
+        monitor.stop()
         runner.close()
 
     LOGGER.info('Daemon runner stopped')
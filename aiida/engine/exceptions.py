@@ -14,8 +14,25 @@ from __future__ import absolute_import
 
 from aiida.common.exceptions import AiidaException
 
-__all__ = ('PastException',)
+__all__ = ('PastException', 'SubmissionError')
 
 
 class PastException(AiidaException):
     """Raised when an attempt is made to continue a Process that has already excepted before."""
+
+
+class SubmissionError(AiidaException):
+    """Raised by `submit_many` when one or more of the processes could not be submitted.
+
+    The exception carries the nodes of all processes, in the order in which they were passed, with `None` for those
+    that could not be created, and a dictionary of the index of each process that failed onto its exception.
+    """
+
+    def __init__(self, nodes, failures):
+        self.nodes = nodes
+        self.failures = failures
+        message = '{} of {} processes could not be submitted: {}'.format(
+            len(failures), len(nodes),
+            ', '.join('[{}] {}'.format(index, exception) for index, exception in sorted(failures.items()))
+        )
+        super(SubmissionError, self).__init__(message)
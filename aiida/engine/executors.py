@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""A bounded pool of threads to which a runner offloads blocking tasks, such that they do not stall its event loop."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import logging
+import sys
+import threading
+
+from tornado import concurrent, gen, ioloop, locks
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default number of threads of the executor of a runner
+DEFAULT_MAX_WORKERS = 4
+
+
+class ThreadExecutor(object):
+    """
+    A bounded pool of threads in which blocking functions are run on behalf of coroutines on an event loop.
+
+    The result of a function, or the exception it raised, is handed back to the event loop through its callback queue,
+    which is the only thread-safe way to resolve a future of the loop. Besides the number of threads, which bounds the
+    number of functions that run at once overall, the number of functions that run at once can be limited per key, for
+    example per computer.
+
+    Functions that run in a thread of the executor have to load the database entities they need themselves, because the
+    entities that are loaded by the thread of the event loop belong to its database session, which is not thread-safe.
+    After each function, the database session of the thread is closed, such that the next function that is run by the
+    same thread does not see entities that were cached by the previous one.
+
+    A thread cannot be interrupted, so a coroutine that stops waiting for a function, for example because its process
+    is paused, leaves the function running. Functions that should not run twice at once, such as the retrieval of a
+    calculation job, are therefore submitted with `submit_once`, which hands out the future of the function that is
+    still in flight, or that finished but whose outcome was not yet collected, instead of submitting it again.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, loop=None):
+        """
+        :param max_workers: the maximum number of threads
+        :param loop: The event loop to use, will use `tornado.ioloop.IOLoop.current()` if not supplied
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        """
+        self._max_workers = max_workers
+        self._loop = loop if loop is not None else ioloop.IOLoop.current()
+        self._pool = None
+        self._semaphores = {}
+        self._inflight = {}
+
+    @property
+    def max_workers(self):
+        """Return the maximum number of threads of the executor."""
+        return self._max_workers
+
+    @gen.coroutine
+    def submit(self, key, limit, func, *args, **kwargs):
+        """
+        Run a function in a thread of the executor and return its result, once it is the turn of the given key::
+
+            @tornado.gen.coroutine
+            def parse_task(executor, computer, node_pk):
+                result = yield executor.submit(computer.uuid, 2, parse_node, node_pk)
+
+        :param key: the key to which the limit applies, for example the UUID of a computer
+        :param limit: the maximum number of functions with the same key that may run at once
+        :param func: the function to run, which should not use any database entities loaded by the event loop
+        :param args: the positional arguments of the function
+        :param kwargs: the keyword arguments of the function
+        :return: the return value of the function
+        """
+        with (yield self._get_semaphore(key, limit).acquire()):
+            future = concurrent.Future()
+            self._get_pool().apply_async(self._run, (future, func, args, kwargs))
+            result = yield future
+
+        raise gen.Return(result)
+
+    def submit_once(self, task_key, key, limit, func, *args, **kwargs):
+        """
+        Run a function like `submit`, unless a function that was submitted with the same task key is still in flight.
+
+        The future of a function that succeeds remains available to later calls with the same task key, until the
+        caller that collected its result calls `release`. A caller that stopped waiting for the function, for example
+        because its process was paused, thus gets its result once it resumes, even if the function finished meanwhile.
+        A function that fails is forgotten, such that the caller can submit it again.
+
+        The function is called with the additional keyword argument `cancelled`, a `threading.Event` that is set by
+        `cancel` and that the function should check before it makes changes that should not outlive its caller.
+
+        :param task_key: the key that identifies the task, for example the command and the UUID of a node
+        :param key: the key to which the limit applies, for example the UUID of a computer
+        :param limit: the maximum number of functions with the same key that may run at once
+        :param func: the function to run, which should not use any database entities loaded by the event loop
+        :param args: the positional arguments of the function
+        :param kwargs: the keyword arguments of the function
+        :return: the future of the function, which is the one of the function in flight if there is one
+        """
+        if task_key in self._inflight:
+            return self._inflight[task_key][0]
+
+        def forget_failed(future):
+            if future.exception() is not None and self._inflight.get(task_key, (None,))[0] is future:
+                self._inflight.pop(task_key)
+
+        cancelled = threading.Event()
+        future = self.submit(key, limit, func, *args, cancelled=cancelled, **kwargs)
+        self._inflight[task_key] = (future, cancelled)
+        future.add_done_callback(forget_failed)
+
+        return future
+
+    def release(self, task_key):
+        """
+        Forget the function with the given task key, once its result was collected.
+
+        :param task_key: the key that identifies the task
+        """
+        self._inflight.pop(task_key, None)
+
+    def cancel(self, task_key):
+        """
+        Cancel and forget the function with the given task key, if any, by setting its `cancelled` event.
+
+        :param task_key: the key that identifies the task
+        :return: the future of the function, to wait for it to finish, or None if there is no such function
+        """
+        if task_key not in self._inflight:
+            return None
+
+        future, cancelled = self._inflight.pop(task_key)
+        cancelled.set()
+
+        return future
+
+    def close(self):
+        """Stop accepting functions and wait for the threads to finish the functions that they are running."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self):
+        """Return the pool of threads, creating it the first time that a function is submitted."""
+        from multiprocessing.pool import ThreadPool
+
+        if self._pool is None:
+            self._pool = ThreadPool(self._max_workers)
+
+        return self._pool
+
+    def _get_semaphore(self, key, limit):
+        """Return the semaphore that limits the number of functions with the given key that run at once."""
+        semaphore, semaphore_limit = self._semaphores.get(key, (None, None))
+
+        if semaphore is None or semaphore_limit != limit:
+            # The limit changed, the functions that hold the previous semaphore will release it without any effect
+            semaphore = locks.Semaphore(max(limit, 1))
+            self._semaphores[key] = (semaphore, limit)
+
+        return semaphore
+
+    def _run(self, future, func, args, kwargs):
+        """Run the function in the current thread and resolve the future with its outcome on the event loop."""
+        from aiida.manage.manager import get_manager
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            self._loop.add_callback(future.set_exc_info, sys.exc_info())
+        else:
+            self._loop.add_callback(future.set_result, result)
+        finally:
+            try:
+                get_manager().get_backend().close_session()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception('failed to close the database session of an executor thread')
@@ -18,7 +18,13 @@ from .processes.functions import FunctionProcess
 from .processes.process import Process
 from .utils import is_process_function, is_process_scoped, instantiate_process
 
-__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit')
+__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit', 'submit_many')
+
+# Default number of processes that are created and checkpointed in a single database transaction by `submit_many`
+SUBMIT_BATCH_SIZE = 100
+
+# Maximum number of continue tasks that `submit_many` publishes concurrently, each waiting for the broker confirmation
+SUBMIT_PUBLISH_WORKERS = 8
 
 
 def run(process, *args, **inputs):
@@ -129,6 +135,107 @@ def submit(process, **inputs):
     return process.node
 
 
+def submit_many(processes, batch_size=SUBMIT_BATCH_SIZE):
+    """Submit many processes to the daemon at once, immediately returning control to the interpreter.
+
+    This is equivalent to calling `submit` for each of the processes, but considerably faster for large numbers. The
+    processes are created and checkpointed in batches, each of which is committed to the database in a single
+    transaction. Once a batch is committed, the continue tasks of its processes are published concurrently, such that
+    the round trips for the confirmations of the broker overlap instead of being paid one after the other.
+
+    A process that fails to be created, checkpointed or published does not prevent the others from being submitted.
+    Processes that request a dry run are run, just as with `submit`.
+
+    .. warning: this should not be used within another process.
+
+    .. warning: submission of processes requires `store_provenance=True`
+
+    :param processes: a sequence of process builders or process classes
+    :param batch_size: the number of processes that are created in a single database transaction
+    :return: the nodes of the processes, in the order of the `processes`
+    :rtype: list of :class:`aiida.orm.ProcessNode`
+    :raises aiida.engine.exceptions.SubmissionError: if any of the processes could not be submitted, carrying the nodes
+        of all processes, with `None` for those that could not be created, and the exception of each failure by index
+    """
+    from multiprocessing.pool import ThreadPool
+    from aiida.common.utils import grouper
+    from .exceptions import SubmissionError
+
+    if is_process_scoped() and not isinstance(Process.current(), FunctionProcess):
+        raise InvalidOperation('Cannot use top-level `submit` from within another process, use `self.submit` instead')
+
+    runner = manager.get_manager().get_runner()
+    controller = manager.get_manager().get_process_controller()
+    backend = manager.get_manager().get_backend()
+
+    processes = list(processes)
+
+    for process in processes:
+        assert not is_process_function(process), 'Cannot submit a process function'
+
+    nodes = [None] * len(processes)
+    failures = {}
+
+    def publish(task):
+        """Publish the continue task of a process and return its index with the exception if that fails."""
+        index, pid = task
+        try:
+            # Do not wait for the future's result, because in the case of a single worker this would block itself
+            controller.continue_process(pid, nowait=False, no_reply=True)
+        except Exception as exception:  # pylint: disable=broad-except
+            return index, exception
+        return index, None
+
+    pool = ThreadPool(SUBMIT_PUBLISH_WORKERS)
+
+    try:
+        for batch in grouper(batch_size, enumerate(processes)):
+            created = []
+            dry_runs = []
+
+            with backend.transaction():
+                for index, process in batch:
+                    try:
+                        # Each process gets its own savepoint, such that a failure does not roll back the others
+                        with backend.transaction():
+                            instance = instantiate_process(runner, process)
+
+                            if instance.metadata.get('dry_run', False):
+                                dry_runs.append((index, instance))
+                                continue
+
+                            if not instance.metadata.store_provenance:
+                                raise InvalidOperation('cannot submit a process with `store_provenance=False`')
+
+                            runner.persister.save_checkpoint(instance)
+                            instance.close()
+                    except Exception as exception:  # pylint: disable=broad-except
+                        failures[index] = exception
+                    else:
+                        created.append((index, instance))
+
+            for index, instance in created:
+                nodes[index] = instance.node
+
+            for index, error in pool.map(publish, [(index, instance.pid) for index, instance in created]):
+                if error is not None:
+                    failures[index] = error
+
+            for index, instance in dry_runs:
+                try:
+                    _, nodes[index] = run_get_node(instance)
+                except Exception as exception:  # pylint: disable=broad-except
+                    failures[index] = exception
+    finally:
+        pool.close()
+        pool.join()
+
+    if failures:
+        raise SubmissionError(nodes, failures)
+
+    return nodes
+
+
 # Allow one to also use run.get_node and run.get_pk as a shortcut, without having to import the functions themselves
 run.get_node = run_get_node
 run.get_pk = run_get_pk
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Lightweight metrics that instrument the engine, for example to find what stalls the event loop of a daemon worker.
+
+The metrics of an interpreter are kept in a single registry, see `get_registry`. Daemon workers publish a snapshot of
+their registry in their status file, from where `verdi daemon metrics` collects them, also in the text format of
+Prometheus, see `format_prometheus`.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import contextlib
+import threading
+import time
+
+# Upper bounds in seconds of the buckets of histograms, chosen to span from fast database operations to slow transfers
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1., 5., 10., 30., 60., 300.)
+
+METRIC_TYPE_GAUGE = 'gauge'
+METRIC_TYPE_HISTOGRAM = 'histogram'
+
+_REGISTRY = None
+
+
+class Metric(object):
+    """Base class of a metric, which has a value for each combination of the values of its labels."""
+
+    metric_type = None
+
+    def __init__(self, name, description):
+        """Construct a new instance.
+
+        :param name: the name of the metric
+        :param description: a description of what the metric measures
+        """
+        self.name = name
+        self.description = description
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """Return a JSON serializable snapshot of the current values of the metric.
+
+        :return: dictionary with the type and description of the metric and a list of its series, each a dictionary
+            with the labels and the value
+        """
+        with self._lock:
+            series = [{'labels': dict(key), 'value': self._copy_value(value)} for key, value in self._values.items()]
+
+        return {'type': self.metric_type, 'description': self.description, 'series': series}
+
+    def reset(self):
+        """Remove all values."""
+        with self._lock:
+            self._values.clear()
+
+    @staticmethod
+    def _copy_value(value):
+        """Return a copy of a value that is safe to serialize outside of the lock."""
+        return value
+
+
+class Gauge(Metric):
+    """A metric whose value can go up and down, for example the number of active processes."""
+
+    metric_type = METRIC_TYPE_GAUGE
+
+    def set(self, value, **labels):
+        """Set the value of the gauge for the given labels."""
+        with self._lock:
+            self._values[_get_series_key(labels)] = value
+
+
+class Histogram(Metric):
+    """A metric that counts observations, typically durations in seconds, in buckets of increasing upper bounds.
+
+    Besides the cumulative counts per bucket, the histogram keeps the number, sum and maximum of the observations.
+    """
+
+    metric_type = METRIC_TYPE_HISTOGRAM
+
+    def __init__(self, name, description, buckets=DEFAULT_BUCKETS):
+        super(Histogram, self).__init__(name, description)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        """Record an observation for the given labels."""
+        with self._lock:
+            key = _get_series_key(labels)
+
+            try:
+                entry = self._values[key]
+            except KeyError:
+                entry = {'buckets': [0] * len(self.buckets), 'count': 0, 'sum': 0., 'max': 0.}
+                self._values[key] = entry
+
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry['buckets'][index] += 1
+
+            entry['count'] += 1
+            entry['sum'] += value
+            entry['max'] = max(entry['max'], value)
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        """Return a context manager that observes the time in seconds that is spent within it, also if it raises."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.observe(time.time() - start, **labels)
+
+    def snapshot(self):
+        """Return a JSON serializable snapshot of the current values of the histogram, including its buckets."""
+        snapshot = super(Histogram, self).snapshot()
+        snapshot['buckets'] = list(self.buckets)
+        return snapshot
+
+    @staticmethod
+    def _copy_value(value):
+        return dict(value, buckets=list(value['buckets']))
+
+
+class MetricsRegistry(object):
+    """Registry of the metrics of an interpreter."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def gauge(self, name, description):
+        """Return the gauge with the given name, creating it if it does not exist yet."""
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(self, name, description, buckets=DEFAULT_BUCKETS):
+        """Return the histogram with the given name, creating it if it does not exist yet."""
+        return self._get_or_create(Histogram, name, description, buckets=buckets)
+
+    def snapshot(self):
+        """Return a JSON serializable snapshot of all metrics, as a dictionary of metric names onto their snapshots."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def reset(self):
+        """Remove the values of all metrics."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        for metric in metrics:
+            metric.reset()
+
+    def _get_or_create(self, cls, name, description, **kwargs):
+        """Return the metric with the given name, creating it as an instance of `cls` if it does not exist yet.
+
+        :raises ValueError: if a metric with the same name but of another type exists
+        """
+        with self._lock:
+            metric = self._metrics.get(name, None)
+
+            if metric is None:
+                metric = cls(name, description, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError('a metric named `{}` of type {} already exists'.format(name, metric.metric_type))
+
+        return metric
+
+
+def get_registry():
+    """Return the registry of the metrics of this interpreter.
+
+    :return: the metrics registry
+    :rtype: :class:`aiida.engine.metrics.MetricsRegistry`
+    """
+    global _REGISTRY  # pylint: disable=global-statement
+
+    if _REGISTRY is None:
+        _REGISTRY = MetricsRegistry()
+
+    return _REGISTRY
+
+
+def merge_snapshots(snapshots):
+    """Merge the snapshots of the registries of several interpreters, for example of all workers of the daemon.
+
+    The values of gauges with the same labels are summed, as are the counts and sums of histograms, of which the
+    maximum is the maximum over all snapshots.
+
+    :param snapshots: an iterable of snapshots as returned by `MetricsRegistry.snapshot`
+    :return: the merged snapshot
+    """
+    merged = {}
+
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, dict(metric, series=[]))
+            series = {_get_series_key(entry['labels']): entry for entry in target['series']}
+
+            for entry in metric['series']:
+                key = _get_series_key(entry['labels'])
+                existing = series.get(key, None)
+
+                if existing is None:
+                    value = entry['value']
+                    if metric['type'] == METRIC_TYPE_HISTOGRAM:
+                        value = dict(value, buckets=list(value['buckets']))
+                    entry = {'labels': entry['labels'], 'value': value}
+                    target['series'].append(entry)
+                    series[key] = entry
+                elif metric['type'] == METRIC_TYPE_HISTOGRAM:
+                    value = existing['value']
+                    value['buckets'] = [one + two for one, two in zip(value['buckets'], entry['value']['buckets'])]
+                    value['count'] += entry['value']['count']
+                    value['sum'] += entry['value']['sum']
+                    value['max'] = max(value['max'], entry['value']['max'])
+                else:
+                    existing['value'] += entry['value']
+
+    return merged
+
+
+def format_prometheus(snapshots, prefix='aiida_'):
+    """Format snapshots of metrics in the text exposition format of Prometheus.
+
+    :param snapshots: a list of tuples of a dictionary of labels, which are added to all series, and a snapshot as
+        returned by `MetricsRegistry.snapshot`, for example with the pid of each daemon worker as a label
+    :param prefix: the prefix to add to the names of the metrics
+    :return: the metrics as a string
+    """
+    lines = []
+    metrics = {}
+
+    for extra_labels, snapshot in snapshots:
+        for name, metric in snapshot.items():
+            metrics.setdefault(name, (metric, []))[1].extend(
+                (dict(entry['labels'], **extra_labels), entry['value']) for entry in metric['series'])
+
+    for name in sorted(metrics):
+        metric, series = metrics[name]
+        name = prefix + name
+
+        lines.append('# HELP {} {}'.format(name, metric['description']))
+        lines.append('# TYPE {} {}'.format(name, metric['type']))
+
+        for labels, value in series:
+            if metric['type'] == METRIC_TYPE_HISTOGRAM:
+                for bound, count in zip(metric['buckets'], value['buckets']):
+                    bucket_labels = dict(labels, le=repr(float(bound)))
+                    lines.append('{}_bucket{} {}'.format(name, _format_labels(bucket_labels), count))
+                lines.append('{}_bucket{} {}'.format(name, _format_labels(dict(labels, le='+Inf')), value['count']))
+                lines.append('{}_sum{} {}'.format(name, _format_labels(labels), repr(float(value['sum']))))
+                lines.append('{}_count{} {}'.format(name, _format_labels(labels), value['count']))
+            else:
+                lines.append('{}{} {}'.format(name, _format_labels(labels), value))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _get_series_key(labels):
+    """Return the key of the series of a metric with the given labels."""
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels):
+    """Format a dictionary of labels as the label set of a Prometheus series."""
+    if not labels:
+        return ''
+
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    return '{' + ','.join('{}="{}"'.format(key, escape(value)) for key, value in sorted(labels.items())) + '}'
@@ -23,7 +23,7 @@ from aiida.common.links import LinkType
 
 from ..process import Process, ProcessState
 from ..process_spec import CalcJobProcessSpec
-from .tasks import Waiting, UPLOAD_COMMAND
+from .tasks import Waiting, UPLOAD_COMMAND, PARSE_COMMAND, TASK_BUSY_SECONDS
 
 __all__ = ('CalcJob',)
 
@@ -272,16 +272,25 @@ class CalcJob(Process):
         """Prepare files for submission of calculation."""
         raise NotImplementedError
 
-    def parse(self, retrieved_temporary_folder=None):
+    def parse(self, retrieved_temporary_folder=None, exit_code=None):
         """Parse a retrieved job calculation.
 
         This is called once it's finished waiting for the calculation to be finished and the data has been retrieved.
+        If the computer offloads the parsing, the parser already ran in a thread of the executor of the runner, which
+        validated and stored its outputs and passes its exit code. The outputs then only have to be attached.
+
+        :param retrieved_temporary_folder: the absolute path to the directory with the retrieved temporary files
+        :param exit_code: the exit code of the parser, if it already ran
         """
         import shutil
         from aiida.engine.daemon import execmanager
 
+        offloaded = exit_code is not None
+
         try:
-            exit_code = execmanager.parse_results(self, retrieved_temporary_folder)
+            if not offloaded:
+                with TASK_BUSY_SECONDS.time(task=PARSE_COMMAND):
+                    exit_code = execmanager.parse_results(self, retrieved_temporary_folder)
         finally:
             # Delete the temporary folder
             try:
@@ -292,7 +301,14 @@ class CalcJob(Process):
 
         # Finally link up the outputs and we're done
         for entry in self.node.get_outgoing():
-            self.out(entry.link_label, entry.node)
+            try:
+                self.out(entry.link_label, entry.node)
+            except ValueError as exception:
+                if not offloaded:
+                    raise
+                self.logger.error('invalid value {} specified with label {}: {}'.format(
+                    entry.node, entry.link_label, exception))
+                exit_code = self.exit_codes.ERROR_INVALID_OUTPUT
 
         return exit_code
 
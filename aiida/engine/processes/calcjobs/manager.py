@@ -21,9 +21,13 @@ from tornado import concurrent, gen
 
 from aiida import schedulers
 from aiida.common import exceptions, lang
+from aiida.engine import metrics
 
 __all__ = ('JobsList', 'JobManager')
 
+_SCHEDULER_POLL_SECONDS = metrics.get_registry().histogram(
+    'scheduler_poll_seconds', 'Time to retrieve the state of the jobs from the scheduler, by computer')
+
 
 class JobsList(object):
     """Manager of calculation jobs submitted with a specific ``AuthInfo``, i.e. computer configured for a specific user.
@@ -100,7 +104,8 @@ class JobsList(object):
             self.logger.info('waiting for transport')
             transport = yield request
 
-            scheduler = self._authinfo.computer.get_scheduler()
+            computer = self._authinfo.computer
+            scheduler = computer.get_scheduler()
             scheduler.set_transport(transport)
 
             kwargs = {'as_dict': True}
@@ -109,24 +114,25 @@ class JobsList(object):
             else:
                 kwargs['jobs'] = self._get_jobs_with_scheduler()
 
-            scheduler_response = scheduler.get_jobs(**kwargs)
-
-            # Update the last update time and clear the jobs cache
-            self._last_updated = time.time()
-            jobs_cache = {}
-            self.logger.info('AuthInfo<{}>: successfully retrieved status of active jobs'.format(self._authinfo.pk))
-
-            for job_id, job_info in iteritems(scheduler_response):
-                # If the job is done then get detailed job information
-                detailed_job_info = None
-                if job_info.job_state == schedulers.JobState.DONE:
-                    try:
-                        detailed_job_info = scheduler.get_detailed_jobinfo(job_id)
-                    except exceptions.FeatureNotAvailable:
-                        detailed_job_info = 'This scheduler does not implement get_detailed_jobinfo'
-
-                job_info.detailedJobinfo = detailed_job_info
-                jobs_cache[job_id] = job_info
+            with _SCHEDULER_POLL_SECONDS.time(computer=computer.name):
+                scheduler_response = scheduler.get_jobs(**kwargs)
+
+                # Update the last update time and clear the jobs cache
+                self._last_updated = time.time()
+                jobs_cache = {}
+                self.logger.info('AuthInfo<{}>: successfully retrieved status of active jobs'.format(self._authinfo.pk))
+
+                for job_id, job_info in iteritems(scheduler_response):
+                    # If the job is done then get detailed job information
+                    detailed_job_info = None
+                    if job_info.job_state == schedulers.JobState.DONE:
+                        try:
+                            detailed_job_info = scheduler.get_detailed_jobinfo(job_id)
+                        except exceptions.FeatureNotAvailable:
+                            detailed_job_info = 'This scheduler does not implement get_detailed_jobinfo'
+
+                    job_info.detailedJobinfo = detailed_job_info
+                    jobs_cache[job_id] = job_info
 
             raise gen.Return(jobs_cache)
 
@@ -23,6 +23,7 @@ import plumpy
 
 from aiida.common.datastructures import CalcJobState
 from aiida.common.exceptions import TransportTaskException
+from aiida.engine import metrics
 from aiida.engine.daemon import execmanager
 from aiida.engine.utils import exponential_backoff_retry, interruptable_task
 from aiida.schedulers.datastructures import JobState
@@ -33,6 +34,7 @@ UPLOAD_COMMAND = 'upload'
 SUBMIT_COMMAND = 'submit'
 UPDATE_COMMAND = 'update'
 RETRIEVE_COMMAND = 'retrieve'
+PARSE_COMMAND = 'parse'
 KILL_COMMAND = 'kill'
 
 TRANSPORT_TASK_RETRY_INITIAL_INTERVAL = 20
@@ -40,9 +42,19 @@ TRANSPORT_TASK_MAXIMUM_ATTEMTPS = 5
 
 logger = logging.getLogger(__name__)
 
+# The wall time of a task includes the time spent waiting for the throttle, for a transport and, for the update task,
+# for the job to finish on the scheduler, during which other processes run on the event loop.
+TASK_WALL_SECONDS = metrics.get_registry().histogram(
+    'calcjob_task_wall_seconds',
+    'Wall time of a task of a calculation job from its launch until it finishes, including all waits, by task')
+
+# The busy time of a task only includes its synchronous calls, which block the event loop of the runner
+TASK_BUSY_SECONDS = metrics.get_registry().histogram(
+    'calcjob_task_busy_seconds', 'Time that a task of a calculation job blocks the event loop, by task')
+
 
 @coroutine
-def task_upload_job(node, transport_queue, calc_info, script_filename, cancellable):
+def task_upload_job(node, transport_queue, throttle, calc_info, script_filename, cancellable):
     """
     Transport task that will attempt to upload the files of a job calculation to the remote
 
@@ -53,6 +65,8 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
 
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
+    :param throttle: the throttle that enforces the limits of the computer on the transport tasks
+    :type throttle: :class:`aiida.engine.processes.calcjobs.throttle.ComputerThrottle`
     :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
@@ -71,9 +85,13 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
 
     @coroutine
     def do_upload():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.upload_calculation(node, transport, calc_info, script_filename))
+        with throttle.request_transfer(node) as slot:
+            yield cancellable.with_interrupt(slot)
+            with transport_queue.request_transport(authinfo) as request:
+                transport = yield cancellable.with_interrupt(request)
+                with TASK_BUSY_SECONDS.time(task=UPLOAD_COMMAND):
+                    result = execmanager.upload_calculation(node, transport, calc_info, script_filename)
+                raise Return(result)
 
     try:
         logger.info('scheduled request to upload CalcJob<{}>'.format(node.pk))
@@ -91,7 +109,7 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
 
 
 @coroutine
-def task_submit_job(node, transport_queue, calc_info, script_filename, cancellable):
+def task_submit_job(node, transport_queue, throttle, calc_info, script_filename, cancellable):
     """
     Transport task that will attempt to submit a job calculation
 
@@ -102,6 +120,8 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
 
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
+    :param throttle: the throttle that enforces the limits of the computer on the transport tasks
+    :type throttle: :class:`aiida.engine.processes.calcjobs.throttle.ComputerThrottle`
     :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
@@ -123,21 +143,26 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
     def do_submit():
         with transport_queue.request_transport(authinfo) as request:
             transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.submit_calculation(node, transport, calc_info, script_filename))
+            with TASK_BUSY_SECONDS.time(task=SUBMIT_COMMAND):
+                result = execmanager.submit_calculation(node, transport, calc_info, script_filename)
+            raise Return(result)
 
-    try:
-        logger.info('scheduled request to submit CalcJob<{}>'.format(node.pk))
-        result = yield exponential_backoff_retry(
-            do_submit, initial_interval, max_attempts, logger=node.logger, ignore_exceptions=plumpy.Interruption)
-    except plumpy.Interruption:
-        pass
-    except Exception:
-        logger.warning('submitting CalcJob<{}> failed'.format(node.pk))
-        raise TransportTaskException('submit_calculation failed {} times consecutively'.format(max_attempts))
-    else:
-        logger.info('submitting CalcJob<{}> successful'.format(node.pk))
-        node.set_state(CalcJobState.WITHSCHEDULER)
-        raise Return(result)
+    # The job counts towards the queued jobs of the computer from its admission until it is marked as with the scheduler
+    with throttle.request_submission(node) as admission:
+        try:
+            logger.info('scheduled request to submit CalcJob<{}>'.format(node.pk))
+            yield cancellable.with_interrupt(admission)
+            result = yield exponential_backoff_retry(
+                do_submit, initial_interval, max_attempts, logger=node.logger, ignore_exceptions=plumpy.Interruption)
+        except plumpy.Interruption:
+            pass
+        except Exception:
+            logger.warning('submitting CalcJob<{}> failed'.format(node.pk))
+            raise TransportTaskException('submit_calculation failed {} times consecutively'.format(max_attempts))
+        else:
+            logger.info('submitting CalcJob<{}> successful'.format(node.pk))
+            node.set_state(CalcJobState.WITHSCHEDULER)
+            raise Return(result)
 
 
 @coroutine
@@ -203,7 +228,7 @@ def task_update_job(node, job_manager, cancellable):
 
 
 @coroutine
-def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancellable):
+def task_retrieve_job(node, transport_queue, throttle, retrieved_temporary_folder, cancellable, executor=None):
     """
     Transport task that will attempt to retrieve all files of a completed job calculation
 
@@ -212,10 +237,20 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
     retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
     If all retries fail, the task will raise a TransportTaskException
 
+    If an executor is given, the files are instead retrieved in one of its threads, through a transport that is opened
+    for this task alone, because the transports of the queue are shared with the other tasks on the event loop. If the
+    process was paused while waiting for a previous retrieval of the node, the outcome of that one is awaited instead
+    of retrieving the files a second time.
+
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
+    :param throttle: the throttle that enforces the limits of the computer on the transport tasks
+    :type throttle: :class:`aiida.engine.processes.calcjobs.throttle.ComputerThrottle`
+    :param retrieved_temporary_folder: the absolute path to the directory in which to retrieve the temporary files
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
     :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
+    :param executor: the executor to which to offload the retrieval, see `Computer.get_maximum_offloaded_tasks`
+    :type executor: :class:`aiida.engine.executors.ThreadExecutor`
     :raises: Return if the tasks was successfully completed
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
     """
@@ -230,9 +265,23 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
 
     @coroutine
     def do_retrieve():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder))
+        with throttle.request_transfer(node) as slot:
+            yield cancellable.with_interrupt(slot)
+
+            if executor is not None:
+                computer = node.computer
+                task_key = (RETRIEVE_COMMAND, node.uuid)
+                offloaded = executor.submit_once(task_key, computer.uuid, computer.get_maximum_offloaded_tasks(),
+                                                 _retrieve_offloaded, node.pk, retrieved_temporary_folder)
+                result = yield cancellable.with_interrupt(offloaded)
+                executor.release(task_key)
+                raise Return(result)
+
+            with transport_queue.request_transport(authinfo) as request:
+                transport = yield cancellable.with_interrupt(request)
+                with TASK_BUSY_SECONDS.time(task=RETRIEVE_COMMAND):
+                    result = execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder)
+                raise Return(result)
 
     try:
         logger.info('scheduled request to retrieve CalcJob<{}>'.format(node.pk))
@@ -249,6 +298,67 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
         raise Return(result)
 
 
+@coroutine
+def task_parse_job(node, executor, retrieved_temporary_folder, cancellable):
+    """
+    Task that will parse the retrieved files of a job calculation in a thread of the executor and store the outputs
+
+    Unlike the transport tasks, the parsing is not retried if it fails, since the failure of a parser is not transient.
+    If the process was paused while waiting for a previous parsing of the node, the outcome of that one is awaited
+    instead of parsing and storing the outputs a second time.
+
+    :param node: the node that represents the job calculation
+    :param executor: the executor in one of whose threads to parse, see `Computer.get_maximum_offloaded_tasks`
+    :type executor: :class:`aiida.engine.executors.ThreadExecutor`
+    :param retrieved_temporary_folder: the absolute path to the directory with the retrieved temporary files
+    :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
+    :raises: Return containing the exit code returned by the parser
+    """
+    limit = node.computer.get_maximum_offloaded_tasks()
+
+    logger.info('scheduled request to parse CalcJob<{}>'.format(node.pk))
+    task_key = (PARSE_COMMAND, node.uuid)
+    offloaded = executor.submit_once(task_key, node.computer.uuid, limit, _parse_offloaded, node.pk,
+                                     retrieved_temporary_folder)
+    exit_code = yield cancellable.with_interrupt(offloaded)
+    executor.release(task_key)
+    logger.info('parsing CalcJob<{}> successful'.format(node.pk))
+
+    raise Return(exit_code)
+
+
+def _retrieve_offloaded(pk, retrieved_temporary_folder, cancelled):
+    """Retrieve the files of a job calculation in a thread of an executor, through a transport of its own.
+
+    :param pk: the pk of the node of the job calculation, which is loaded anew in the database session of the thread
+    :param retrieved_temporary_folder: the absolute path to the directory in which to retrieve the temporary files
+    :param cancelled: the event that is set if the process was killed before the retrieval started
+    """
+    from aiida.orm import load_node
+
+    if cancelled.is_set():
+        return None
+
+    node = load_node(pk)
+    transport = node.computer.get_authinfo(node.user).get_transport()
+
+    return execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder)
+
+
+def _parse_offloaded(pk, retrieved_temporary_folder, cancelled):
+    """Parse the retrieved files of a job calculation and store the outputs in a thread of an executor.
+
+    :param pk: the pk of the node of the job calculation, which is loaded anew in the database session of the thread
+    :param retrieved_temporary_folder: the absolute path to the directory with the retrieved temporary files
+    :param cancelled: the event that is set if the process was killed, after which the outputs are no longer stored
+    :return: the exit code returned by the parser
+    """
+    from aiida.orm import load_node
+
+    return execmanager.parse_and_store_results(load_node(pk), retrieved_temporary_folder, cancelled)
+
+
 @coroutine
 def task_kill_job(node, transport_queue, cancellable):
     """
@@ -279,7 +389,9 @@ def task_kill_job(node, transport_queue, cancellable):
     def do_kill():
         with transport_queue.request_transport(authinfo) as request:
             transport = yield cancellable.with_interrupt(request)
-            raise Return(execmanager.kill_calculation(node, transport))
+            with TASK_BUSY_SECONDS.time(task=KILL_COMMAND):
+                result = execmanager.kill_calculation(node, transport)
+            raise Return(result)
 
     try:
         logger.info('scheduled request to kill CalcJob<{}>'.format(node.pk))
@@ -295,6 +407,16 @@ def task_kill_job(node, transport_queue, cancellable):
         raise Return(result)
 
 
+_TASK_COMMANDS = {
+    task_upload_job: UPLOAD_COMMAND,
+    task_submit_job: SUBMIT_COMMAND,
+    task_update_job: UPDATE_COMMAND,
+    task_retrieve_job: RETRIEVE_COMMAND,
+    task_parse_job: PARSE_COMMAND,
+    task_kill_job: KILL_COMMAND,
+}
+
+
 class Waiting(plumpy.Waiting):
     """The waiting state for the `CalcJob` process."""
 
@@ -302,17 +424,20 @@ class Waiting(plumpy.Waiting):
         super(Waiting, self).__init__(process, done_callback, msg, data)
         self._task = None
         self._killing = None
+        self._retrieved_temporary_folder = None
 
     def load_instance_state(self, saved_state, load_context):
         super(Waiting, self).load_instance_state(saved_state, load_context)
         self._task = None
         self._killing = None
+        self._retrieved_temporary_folder = None
 
     @coroutine
     def execute(self):
 
         node = self.process.node
         transport_queue = self.process.runner.transport
+        throttle = self.process.runner.throttle
 
         if isinstance(self.data, tuple):
             command = self.data[0]
@@ -326,12 +451,13 @@ class Waiting(plumpy.Waiting):
 
             if command == UPLOAD_COMMAND:
                 node.set_process_status(process_status)
-                calc_info, script_filename = yield self._launch_task(task_upload_job, node, transport_queue, *args)
+                calc_info, script_filename = yield self._launch_task(
+                    task_upload_job, node, transport_queue, throttle, *args)
                 raise Return(self.submit(calc_info, script_filename))
 
             elif command == SUBMIT_COMMAND:
                 node.set_process_status(process_status)
-                yield self._launch_task(task_submit_job, node, transport_queue, *args)
+                yield self._launch_task(task_submit_job, node, transport_queue, throttle, *args)
                 raise Return(self.update())
 
             elif self.data == UPDATE_COMMAND:
@@ -348,9 +474,22 @@ class Waiting(plumpy.Waiting):
 
             elif self.data == RETRIEVE_COMMAND:
                 node.set_process_status(process_status)
-                # Create a temporary folder that has to be deleted by JobProcess.retrieved after successful parsing
-                temp_folder = tempfile.mkdtemp()
-                yield self._launch_task(task_retrieve_job, node, transport_queue, temp_folder)
+                # Create a temporary folder that has to be deleted by JobProcess.retrieved after successful parsing. It
+                # is kept when the process is paused, since an offloaded retrieval that is in flight still writes to it
+                if self._retrieved_temporary_folder is None:
+                    self._retrieved_temporary_folder = tempfile.mkdtemp()
+                temp_folder = self._retrieved_temporary_folder
+
+                # Computers can have the retrieval and parsing run in the threads of the executor of the runner
+                if node.computer.get_maximum_offloaded_tasks() > 0:
+                    executor = self.process.runner.executor
+                    yield self._launch_task(
+                        task_retrieve_job, node, transport_queue, throttle, temp_folder, executor=executor)
+                    node.set_process_status('Waiting for task: {}'.format(PARSE_COMMAND))
+                    exit_code = yield self._launch_task(task_parse_job, node, executor, temp_folder)
+                    raise Return(self.parse(temp_folder, exit_code))
+
+                yield self._launch_task(task_retrieve_job, node, transport_queue, throttle, temp_folder)
                 raise Return(self.parse(temp_folder))
 
             else:
@@ -360,6 +499,7 @@ class Waiting(plumpy.Waiting):
             raise plumpy.PauseInterruption('Pausing after failed transport task: {}'.format(exception))
         except plumpy.KillInterruption:
             exc_info = sys.exc_info()
+            yield self._cancel_offloaded_tasks(node)
             yield self._launch_task(task_kill_job, node, transport_queue)
             self._killing.set_result(True)
             six.reraise(*exc_info)
@@ -379,11 +519,28 @@ class Waiting(plumpy.Waiting):
         task_fn = functools.partial(coro, *args, **kwargs)
         try:
             self._task = interruptable_task(task_fn)
-            result = yield self._task
+            with TASK_WALL_SECONDS.time(task=_TASK_COMMANDS.get(coro, coro.__name__)):
+                result = yield self._task
             raise Return(result)
         finally:
             self._task = None
 
+    @coroutine
+    def _cancel_offloaded_tasks(self, node):
+        """Cancel the tasks of the node that were offloaded to the executor and wait for those that are in flight.
+
+        Since threads cannot be interrupted, this ensures that nothing is stored for the node after it was killed.
+        """
+        executor = self.process.runner.executor
+
+        for command in (RETRIEVE_COMMAND, PARSE_COMMAND):
+            future = executor.cancel((command, node.uuid))
+            if future is not None:
+                try:
+                    yield future
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning('offloaded {} of CalcJob<{}> failed after it was killed'.format(command, node.pk))
+
     def upload(self, calc_info, script_filename):
         """Return the `Waiting` state that will `upload` the `CalcJob`."""
         return self.create_state(
@@ -409,12 +566,13 @@ class Waiting(plumpy.Waiting):
         """Return the `Waiting` state that will `retrieve` the `CalcJob`."""
         return self.create_state(ProcessState.WAITING, None, msg='Waiting to retrieve', data=RETRIEVE_COMMAND)
 
-    def parse(self, retrieved_temporary_folder):
+    def parse(self, retrieved_temporary_folder, exit_code=None):
         """Return the `Running` state that will `parse` the `CalcJob`.
 
         :param retrieved_temporary_folder: temporary folder used in retrieving that can be used during parsing.
+        :param exit_code: the exit code of the parser, if it already ran in a thread of the executor of the runner.
         """
-        return self.create_state(ProcessState.RUNNING, self.process.parse, retrieved_temporary_folder)
+        return self.create_state(ProcessState.RUNNING, self.process.parse, retrieved_temporary_folder, exit_code)
 
     def interrupt(self, reason):
         """Interrupt the `Waiting` state by calling interrupt on the transport task `InterruptableFuture`."""
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Enforcement of the limits that computers put on the transport tasks of the calculation jobs that run on them."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import time
+
+from tornado import concurrent, gen
+
+__all__ = ('ComputerThrottle',)
+
+
+class FairQueue(object):
+    """
+    A limited number of slots, which are granted to the waiters in round robin order over their groups.
+
+    Waiters of the same group are served in the order in which they asked for a slot, but each group in turn gets a
+    slot, such that a group with many waiters, for example the calculation jobs launched by a single workflow, does not
+    starve the others. A limit of 0 means that the number of slots is unlimited.
+    """
+
+    def __init__(self, limit=0):
+        self.limit = limit
+        self._active = 0
+        self._waiters = collections.OrderedDict()
+
+    @property
+    def active(self):
+        """Return the number of slots that are currently held."""
+        return self._active
+
+    @property
+    def waiting(self):
+        """Return the number of waiters that did not get a slot yet."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    @contextlib.contextmanager
+    def request_slot(self, group=None):
+        """
+        Request a slot, which is released when the context is exited, also if the slot was not granted yet::
+
+            @tornado.gen.coroutine
+            def transfer_task(queue, group):
+                with queue.request_slot(group) as request:
+                    yield request
+                    # Do the work that requires a slot
+
+        :param group: the group of the waiter, for example the pk of the workflow that launched the calculation job
+        :return: a future that resolves once the slot is granted
+        """
+        future = concurrent.Future()
+
+        if not self._waiters and self._has_free_slot():
+            self._active += 1
+            future.set_result(True)
+        else:
+            self._waiters.setdefault(group, collections.deque()).append(future)
+
+        try:
+            yield future
+        finally:
+            if future.done():
+                self._active -= 1
+                self._grant()
+            else:
+                self._discard(group, future)
+
+    def _has_free_slot(self):
+        """Return whether a slot can be granted."""
+        return not self.limit or self._active < self.limit
+
+    def _grant(self):
+        """Grant the free slots to the first waiters of the groups in turn."""
+        while self._waiters and self._has_free_slot():
+            group, waiters = next(iter(self._waiters.items()))
+            future = waiters.popleft()
+
+            # Move the group to the back of the line, if it has more waiters
+            del self._waiters[group]
+            if waiters:
+                self._waiters[group] = waiters
+
+            self._active += 1
+            future.set_result(True)
+
+    def _discard(self, group, future):
+        """Remove a waiter that gave up before being granted a slot."""
+        waiters = self._waiters.get(group, None)
+
+        if waiters is not None and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._waiters[group]
+
+
+class RateLimiter(object):
+    """Spaces out events evenly, such that no more than a given number of them happen per minute."""
+
+    def __init__(self, rate=0):
+        """
+        :param rate: the maximum number of events per minute, 0 meaning unlimited
+        """
+        self.rate = rate
+        self._next = 0.
+
+    def reserve(self, now=None):
+        """
+        Reserve the next moment at which an event may happen.
+
+        :param now: the current time, by default `time.time()`
+        :return: the time in seconds to wait until the event may happen
+        """
+        if not self.rate:
+            return 0.
+
+        now = time.time() if now is None else now
+        moment = max(self._next, now)
+        self._next = moment + 60. / self.rate
+
+        return moment - now
+
+
+class ComputerThrottle(object):
+    """
+    Enforce the limits that computers put on the transport tasks of calculation jobs, see the `Computer` methods
+    `set_maximum_concurrent_transfers`, `set_maximum_queued_jobs` and `set_maximum_submission_rate`.
+
+    Calculation jobs that exceed a limit wait in a `FairQueue` of their computer, until it is their turn, instead of
+    failing and being retried. The limits on transfers and the submission rate apply to each runner, and so to each
+    daemon worker, separately. The limit on the number of queued jobs is checked against the database, such that it
+    applies to all runners together, up to the submissions that other runners are making at the same time.
+    """
+
+    def __init__(self):
+        self._transfers = {}
+        self._gates = {}
+        self._rates = {}
+        self._submitting = collections.Counter()
+
+    @contextlib.contextmanager
+    def request_transfer(self, node):
+        """
+        Request a slot for a transfer of files of a calculation job, for example an upload or a retrieval::
+
+            @tornado.gen.coroutine
+            def upload_task(throttle, node):
+                with throttle.request_transfer(node) as request:
+                    yield request
+                    # Upload the files
+
+        :param node: the node of the calculation job
+        :return: a future that resolves once the transfer may start
+        """
+        computer = node.computer
+        queue = self._get_queue(self._transfers, computer.uuid, computer.get_maximum_concurrent_transfers())
+
+        with queue.request_slot(get_group(node)) as request:
+            yield request
+
+    @contextlib.contextmanager
+    def request_submission(self, node):
+        """
+        Request the submission of a calculation job to the scheduler of its computer::
+
+            @tornado.gen.coroutine
+            def submit_task(throttle, node):
+                with throttle.request_submission(node) as request:
+                    yield request
+                    # Submit the job and mark it as being with the scheduler
+
+        The submission is admitted once there is room for another job in the queue of the scheduler and the submission
+        rate allows it. The job counts towards the queued jobs of the computer until the context is exited, by which
+        time its state should reflect that it is with the scheduler.
+
+        :param node: the node of the calculation job
+        :return: a future that resolves once the job may be submitted
+        """
+        uuid = node.computer.uuid
+        state = {'abandoned': False, 'admitted': False}
+        admission = self._admit(node.computer, get_group(node), state)
+
+        try:
+            yield admission
+        finally:
+            state['abandoned'] = True
+            if state['admitted']:
+                self._submitting[uuid] -= 1
+
+    @gen.coroutine
+    def _admit(self, computer, group, state):
+        """
+        Wait until a job may be submitted to the computer.
+
+        Jobs pass a gate of a single slot one at a time, in the fair order of its queue, and wait there for room in the
+        scheduler queue and for their moment according to the submission rate, such that the jobs behind them wait
+        without polling the database themselves.
+
+        :param computer: the computer of the job
+        :param group: the group of the job in the fair queue
+        :param state: dictionary that tells whether the requester `abandoned` the submission, and in which is recorded
+            whether the job was `admitted`
+        """
+        uuid = computer.uuid
+        gate = self._get_queue(self._gates, uuid, 1)
+
+        with gate.request_slot(group) as request:
+            yield request
+
+            while not state['abandoned'] and not self._has_room_in_queue(computer):
+                yield gen.sleep(computer.get_minimum_job_poll_interval())
+
+            if not state['abandoned']:
+                rate = self._rates.setdefault(uuid, RateLimiter())
+                rate.rate = computer.get_maximum_submission_rate()
+                delay = rate.reserve()
+                if delay > 0:
+                    yield gen.sleep(delay)
+
+            if not state['abandoned']:
+                state['admitted'] = True
+                self._submitting[uuid] += 1
+
+    def _has_room_in_queue(self, computer):
+        """Return whether the computer allows another job to be submitted to its scheduler."""
+        limit = computer.get_maximum_queued_jobs()
+
+        if not limit:
+            return True
+
+        return count_queued_jobs(computer) + self._submitting[computer.uuid] < limit
+
+    @staticmethod
+    def _get_queue(queues, key, limit):
+        """Return the queue for the given key, updated with the current limit."""
+        queue = queues.setdefault(key, FairQueue())
+        queue.limit = limit
+        return queue
+
+
+def get_group(node):
+    """Return the group of a calculation job in the fair queues, which is the pk of its caller, if it has one."""
+    caller = node.caller
+    return caller.pk if caller is not None else node.pk
+
+
+def count_queued_jobs(computer):
+    """Return the number of active calculation jobs on the computer that were submitted to its scheduler.
+
+    :param computer: the computer
+    :return: the number of jobs
+    """
+    from aiida.common.datastructures import CalcJobState
+    from aiida.engine.processes import ProcessState
+    from aiida.orm import CalcJobNode, Computer, QueryBuilder
+
+    active = [ProcessState.CREATED.value, ProcessState.WAITING.value, ProcessState.RUNNING.value]
+    filters = {
+        'attributes.{}'.format(CalcJobNode.CALC_JOB_STATE_KEY): CalcJobState.WITHSCHEDULER.value,
+        'attributes.{}'.format(CalcJobNode.PROCESS_STATE_KEY): {
+            'in': active
+        },
+    }
+
+    builder = QueryBuilder()
+    builder.append(Computer, filters={'id': computer.pk}, tag='computer')
+    builder.append(CalcJobNode, with_computer='computer', filters=filters)
+
+    return builder.count()
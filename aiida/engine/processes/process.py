@@ -26,6 +26,7 @@ from pika.exceptions import ConnectionClosed
 import plumpy
 from plumpy import ProcessState
 from kiwipy.communications import UnroutableError
+from tornado import gen
 
 from aiida import orm
 from aiida.common import exceptions
@@ -33,6 +34,7 @@ from aiida.common.extendeddicts import AttributeDict
 from aiida.common.lang import classproperty, override, protected
 from aiida.common.links import LinkType
 from aiida.common.log import LOG_LEVEL_REPORT
+from aiida.engine import metrics
 
 from .exit_code import ExitCode
 from .builder import ProcessBuilder
@@ -41,6 +43,11 @@ from .process_spec import ProcessSpec
 
 __all__ = ('Process', 'ProcessState')
 
+# The wall time of a step includes the time that the step waits for other coroutines, such as the transport tasks of a
+# calculation job in its waiting state, during which other processes run on the event loop
+_STEP_WALL_SECONDS = metrics.get_registry().histogram(
+    'process_step_wall_seconds', 'Wall time of a step of a process, including all waits, by process class and state')
+
 
 @plumpy.auto_persist('_parent_pid', '_enable_persistence')
 @six.add_metaclass(abc.ABCMeta)
@@ -333,6 +340,13 @@ class Process(plumpy.Process):
                 self._parent_pid = current.pid
         self._pid = self._create_and_setup_db_record()
 
+    @override
+    @gen.coroutine
+    def step(self):
+        """Run the current state of the process and transition to the next, recording the wall time that this takes."""
+        with _STEP_WALL_SECONDS.time(process=self.__class__.__name__, state=self._state.LABEL.value):
+            yield super(Process, self).step()
+
     @override
     def on_entering(self, state):
         super(Process, self).on_entering(state)
@@ -593,17 +607,32 @@ class Process(plumpy.Process):
         outputs_stored = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
         outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
 
+        if isinstance(self.node, orm.CalculationNode):
+            link_type = LinkType.CREATE
+        elif isinstance(self.node, orm.WorkflowNode):
+            link_type = LinkType.RETURN
+        else:
+            link_type = None
+
+        # The new outputs and their links are collected and stored together, instead of committing each one separately
+        nodes = []
+        links = []
+
         for link_label, output in outputs_flat.items():
 
             if link_label not in outputs_new:
                 continue
 
-            if isinstance(self.node, orm.CalculationNode):
-                output.add_incoming(self.node, LinkType.CREATE, link_label)
-            elif isinstance(self.node, orm.WorkflowNode):
-                output.add_incoming(self.node, LinkType.RETURN, link_label)
+            if link_type is None:
+                nodes.append(output)
+            elif output.is_stored:
+                links.append((self.node, output, link_type, link_label))
+            else:
+                output.add_incoming(self.node, link_type, link_label)
+                nodes.append(output)
 
-            output.store()
+        if nodes or links:
+            orm.Node.objects(self.node.backend).store_many(nodes, links=links)
 
     def _setup_db_record(self):
         """
@@ -25,7 +25,8 @@ from aiida.orm import load_node
 from aiida.plugins.utils import PluginVersionProvider
 
 from .processes import futures
-from .processes.calcjobs import manager
+from .processes.calcjobs import manager, throttle
+from . import executors
 from . import transports
 from . import utils
 
@@ -43,9 +44,18 @@ class Runner(object):  # pylint: disable=too-many-public-methods
     _persister = None
     _communicator = None
     _controller = None
+    _task_receiver = None
     _closed = False
 
-    def __init__(self, poll_interval=0, loop=None, communicator=None, rmq_submit=False, persister=None):
+    def __init__(
+        self,
+        poll_interval=0,
+        loop=None,
+        communicator=None,
+        rmq_submit=False,
+        persister=None,
+        executor_max_workers=executors.DEFAULT_MAX_WORKERS
+    ):
         """
         Construct a new runner
 
@@ -57,7 +67,9 @@ class Runner(object):  # pylint: disable=too-many-public-methods
         :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
         :type persister: :class:`plumpy.Persister`
+        :param executor_max_workers: the number of threads of the executor to which tasks are offloaded from the loop
         """
+        # pylint: disable=too-many-arguments
         assert not (rmq_submit and persister is None), \
             'Must supply a persister if you want to submit using communicator'
 
@@ -66,6 +78,8 @@ class Runner(object):  # pylint: disable=too-many-public-methods
         self._rmq_submit = rmq_submit
         self._transport = transports.TransportQueue(self._loop)
         self._job_manager = manager.JobManager(self._transport)
+        self._throttle = throttle.ComputerThrottle()
+        self._executor = executors.ThreadExecutor(executor_max_workers, self._loop)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
 
@@ -118,10 +132,47 @@ class Runner(object):  # pylint: disable=too-many-public-methods
     def job_manager(self):
         return self._job_manager
 
+    @property
+    def throttle(self):
+        """
+        Get the throttle that enforces the limits of computers on the transport tasks of calculation jobs
+
+        :return: the throttle
+        :rtype: :class:`aiida.engine.processes.calcjobs.throttle.ComputerThrottle`
+        """
+        return self._throttle
+
+    @property
+    def executor(self):
+        """
+        Get the executor to which blocking tasks are offloaded from the event loop of this runner
+
+        :return: the executor
+        :rtype: :class:`aiida.engine.executors.ThreadExecutor`
+        """
+        return self._executor
+
     @property
     def controller(self):
         return self._controller
 
+    @property
+    def task_receiver(self):
+        """Return the receiver of the process tasks of this runner, if it is a daemon runner that listens for them.
+
+        :return: the task receiver or None
+        :rtype: :class:`aiida.manage.external.rmq.ProcessLauncher`
+        """
+        return self._task_receiver
+
+    def set_task_receiver(self, task_receiver):
+        """Set the receiver of the process tasks that are continued by this runner.
+
+        :param task_receiver: the task receiver
+        :type task_receiver: :class:`aiida.manage.external.rmq.ProcessLauncher`
+        """
+        self._task_receiver = task_receiver
+
     @property
     def is_daemon_runner(self):
         """Return whether the runner is a daemon runner, which means it submits processes over RabbitMQ.
@@ -148,9 +199,10 @@ class Runner(object):  # pylint: disable=too-many-public-methods
             return self._loop.run_sync(lambda: future)
 
     def close(self):
-        """Close the runner by stopping the loop."""
+        """Close the runner by stopping the loop and the executor."""
         assert not self._closed
         self.stop()
+        self._executor.close()
         self._closed = True
 
     def instantiate_process(self, process, *args, **inputs):
@@ -14,11 +14,17 @@ from __future__ import absolute_import
 from collections import namedtuple
 import contextlib
 import logging
+import time
 import traceback
 from tornado import concurrent, gen, ioloop
 
+from aiida.engine import metrics
+
 _LOGGER = logging.getLogger(__name__)
 
+_TRANSPORT_WAIT_SECONDS = metrics.get_registry().histogram(
+    'transport_wait_seconds', 'Time that a task waits for a transport, by computer')
+
 
 class TransportRequest(object):
     """ Information kept about request for a transport object """
@@ -101,6 +107,14 @@ class TransportQueue(object):
             # Save the handle so that we can cancel the callback if the user no longer wants it
             open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
 
+        requested = time.time()
+        computer = authinfo.computer.name
+
+        def record_wait(_):
+            _TRANSPORT_WAIT_SECONDS.observe(time.time() - requested, computer=computer)
+
+        transport_request.future.add_done_callback(record_wait)
+
         try:
             transport_request.count += 1
             yield transport_request.future
@@ -14,9 +14,13 @@ from __future__ import division
 
 import io
 import datetime
+import hashlib
 import shutil
 import os
 import logging
+import sqlite3
+import threading
+import time
 
 from abc import abstractmethod, ABCMeta
 import six
@@ -25,6 +29,7 @@ from pytz import timezone as ptimezone
 
 from aiida.common import json
 from aiida.common import timezone as dtimezone
+from aiida.common.utils import grouper
 
 
 @six.add_metaclass(ABCMeta)  # pylint: disable=useless-object-inheritance
@@ -45,6 +50,17 @@ class AbstractBackup(object):
     END_DATE_OF_BACKUP_KEY = 'end_date_of_backup'
     PERIODICITY_KEY = 'periodicity'
     BACKUP_LENGTH_THRESHOLD_KEY = 'backup_length_threshold'
+    BACKUP_WORKERS_KEY = 'backup_workers'
+    BANDWIDTH_LIMIT_KEY = 'bandwidth_limit'
+
+    # Name of the file in the backup directory with the digests of the files that have been backed up
+    MANIFEST_FILENAME = '.backup_manifest.sqlite'
+
+    # Number of directories after which the manifest is committed to disk, such that an interrupted run can resume
+    MANIFEST_SAVE_INTERVAL = 1000
+
+    # Number of parallel copy workers if not specified in the backup information
+    DEFAULT_BACKUP_WORKERS = 4
 
     # Backup parameters that will be populated by the JSON file
 
@@ -72,6 +88,12 @@ class AbstractBackup(object):
 
     _additional_back_time_mins = None
 
+    # Number of directories that are copied in parallel
+    _backup_workers = None
+
+    # Maximum total copy rate in MB per second, unlimited if not set
+    _bandwidth_limit = None
+
     _ignore_backup_dir_existence_check = False  # pylint: disable=invalid-name
 
     def __init__(self, backup_info_filepath, additional_back_time_mins):
@@ -209,6 +231,16 @@ class AbstractBackup(object):
             self._logger.error('The backup length threshold should be an integer')
             raise
 
+        # Parse the optional number of copy workers and bandwidth limit
+        try:
+            if backup_variables.get(self.BACKUP_WORKERS_KEY) is not None:
+                self._backup_workers = int(backup_variables.get(self.BACKUP_WORKERS_KEY))
+            if backup_variables.get(self.BANDWIDTH_LIMIT_KEY) is not None:
+                self._bandwidth_limit = float(backup_variables.get(self.BANDWIDTH_LIMIT_KEY))
+        except ValueError:
+            self._logger.error('The number of backup workers should be an integer and the bandwidth limit a number')
+            raise
+
     def _dictionarize_backup_info(self):
         """
         This dictionarises the backup information and returns the dictionary.
@@ -222,6 +254,12 @@ class AbstractBackup(object):
             self.BACKUP_LENGTH_THRESHOLD_KEY: int(self._backup_length_threshold.total_seconds() // 3600)
         }
 
+        if self._backup_workers is not None:
+            backup_variables[self.BACKUP_WORKERS_KEY] = self._backup_workers
+
+        if self._bandwidth_limit is not None:
+            backup_variables[self.BANDWIDTH_LIMIT_KEY] = self._bandwidth_limit
+
         return backup_variables
 
     def _store_backup_info(self, backup_info_file_name):
@@ -285,12 +323,22 @@ class AbstractBackup(object):
         return get_profile().repository_path
 
     def _backup_needed_files(self, query_sets):
-        """Perform backup of a minimum-set of files"""
+        """Perform backup of a minimum-set of files.
+
+        The repository folders of the nodes in the query sets are copied in parallel. Only the files whose content
+        changed with respect to the manifest of the previous backups are copied, such that a round that was
+        interrupted, and is therefore repeated by the next run, resumes where it stopped.
+        """
+        from multiprocessing.pool import ThreadPool
 
         repository_path = os.path.normpath(self._get_repository_path())
 
+        manifest = BackupManifest(os.path.join(self._backup_dir, self.MANIFEST_FILENAME))
+        limiter = BandwidthLimiter(None if self._bandwidth_limit is None else self._bandwidth_limit * 1024**2)
+
         parent_dir_set = set()
         copy_counter = 0
+        file_counter = 0
 
         dir_no_to_copy = 0
 
@@ -302,51 +350,53 @@ class AbstractBackup(object):
         last_progress_print = datetime.datetime.now()
         percent_progress = 0
 
-        for query_set in query_sets:
-            for item in self._get_query_set_iterator(query_set):
-                source_dir = self._get_source_directory(item)
-
-                # Get the relative directory without the / which
-                # separates the repository_path from the relative_dir.
-                relative_dir = source_dir[(len(repository_path) + 1):]
-                destination_dir = os.path.join(self._backup_dir, relative_dir)
-
-                # Remove the destination directory if it already exists
-                if os.path.exists(destination_dir):
-                    shutil.rmtree(destination_dir)
-
-                # Copy the needed directory
-                try:
-                    shutil.copytree(source_dir, destination_dir, True, None)
-                except EnvironmentError as why:
-                    self._logger.warning(
-                        'Problem copying directory %s to %s. More information: %s (Error no: %s)', source_dir,
-                        destination_dir, why.strerror, why.errno
-                    )
-                    # Raise envEr
-
-                # Extract the needed parent directories
-                AbstractBackup._extract_parent_dirs(relative_dir, parent_dir_set)
-                copy_counter += 1
-                log_msg = 'Copied %.0f directories [%s] (%3.0f/100)'
-
-                if (
-                    self._logger.getEffectiveLevel() <= logging.INFO and
-                    (datetime.datetime.now() - last_progress_print).seconds > 60
-                ):
-                    last_progress_print = datetime.datetime.now()
-                    percent_progress = copy_counter * 100 / dir_no_to_copy
-                    self._logger.info(log_msg, copy_counter, item.__class__.__name__, percent_progress)
-
-                if (
-                    self._logger.getEffectiveLevel() <= logging.INFO and percent_progress <
-                    (copy_counter * 100 / dir_no_to_copy)
-                ):
-                    percent_progress = (copy_counter * 100 / dir_no_to_copy)
-                    last_progress_print = datetime.datetime.now()
-                    self._logger.info(log_msg, copy_counter, item.__class__.__name__, percent_progress)
-
-        self._logger.info('%.0f directories copied', copy_counter)
+        def get_relative_dirs():
+            for query_set in query_sets:
+                for item in self._get_query_set_iterator(query_set):
+                    # Get the relative directory without the / which separates the repository_path from the relative_dir
+                    yield self._get_source_directory(item)[(len(repository_path) + 1):]
+
+        def backup_directory(relative_dir):
+            return relative_dir, self._backup_directory(repository_path, relative_dir, manifest, limiter)
+
+        pool = ThreadPool(self._backup_workers or self.DEFAULT_BACKUP_WORKERS)
+
+        try:
+            # The query sets are iterated in this thread, and the directories are copied by the workers in batches
+            for batch in grouper(self.MANIFEST_SAVE_INTERVAL, get_relative_dirs()):
+                for relative_dir, copied in pool.imap_unordered(backup_directory, batch):
+
+                    # Extract the needed parent directories
+                    AbstractBackup._extract_parent_dirs(relative_dir, parent_dir_set)
+                    copy_counter += 1
+                    file_counter += copied
+                    log_msg = 'Backed up %.0f directories (%3.0f/100)'
+
+                    if (
+                        self._logger.getEffectiveLevel() <= logging.INFO and
+                        (datetime.datetime.now() - last_progress_print).seconds > 60
+                    ):
+                        last_progress_print = datetime.datetime.now()
+                        percent_progress = copy_counter * 100 / dir_no_to_copy
+                        self._logger.info(log_msg, copy_counter, percent_progress)
+
+                    if (
+                        self._logger.getEffectiveLevel() <= logging.INFO and percent_progress <
+                        (copy_counter * 100 / dir_no_to_copy)
+                    ):
+                        percent_progress = (copy_counter * 100 / dir_no_to_copy)
+                        last_progress_print = datetime.datetime.now()
+                        self._logger.info(log_msg, copy_counter, percent_progress)
+
+                # Record the progress, such that an interrupted run does not copy these directories again
+                manifest.save()
+
+            file_counter += self._backup_object_store(repository_path, manifest, limiter, parent_dir_set)
+        finally:
+            pool.terminate()
+            manifest.close()
+
+        self._logger.info('%.0f directories backed up, %.0f changed files copied', copy_counter, file_counter)
 
         self._logger.info('Start setting permissions')
         perm_counter = 0
@@ -368,6 +418,108 @@ class AbstractBackup(object):
         self._logger.info('End of backup.')
         self._logger.info('Backed up objects with modification timestamp less or equal to %s.', self._oldest_object_bk)
 
+    def _backup_object_store(self, repository_path, manifest, limiter, parent_dir_set):
+        """Back up the index and pack files of the object store of the repository, if it is used.
+
+        The index is copied first, since the pack files only grow while the store is in use, such that the copied packs
+        contain all the objects referenced by the copied index.
+
+        :return: the number of copied files
+        """
+        from aiida.manage.repository.object_store import get_object_store, INDEX_FILENAME
+
+        object_store = get_object_store()
+
+        if object_store is None:
+            return 0
+
+        relative_dir = object_store.dirpath[(len(repository_path) + 1):]
+        destination_dir = os.path.join(self._backup_dir, relative_dir)
+
+        if not os.path.isdir(destination_dir):
+            os.makedirs(destination_dir)
+
+        object_store.copy_index(os.path.join(destination_dir, INDEX_FILENAME))
+        AbstractBackup._extract_parent_dirs(relative_dir, parent_dir_set)
+
+        return self._backup_directory(repository_path, relative_dir, manifest, limiter, append_only=True) + 1
+
+    def _backup_directory(self, repository_path, relative_dir, manifest, limiter, append_only=False):
+        """Copy the files of a directory of the repository that changed since they were last backed up.
+
+        A file is considered unchanged if its size and modification time correspond to the manifest. Otherwise, its
+        digest is compared to the one in the manifest, and the file is only copied if its content changed. Files in the
+        destination directory that no longer exist in the source directory are removed.
+
+        :param repository_path: absolute path of the repository
+        :param relative_dir: path of the directory relative to the repository
+        :param manifest: the `BackupManifest` of the backup
+        :param limiter: the `BandwidthLimiter` of the backup
+        :param append_only: boolean, if True, the files are only ever appended to, such that for a file that grew only
+            the new content is copied. The digests of these files are not computed.
+        :return: the number of copied files
+        """
+        source_dir = os.path.join(repository_path, relative_dir)
+        destination_dir = os.path.join(self._backup_dir, relative_dir)
+        entries = manifest.get(relative_dir)
+        new_entries = {}
+        copied = 0
+
+        if not os.path.isdir(source_dir):
+            self._logger.debug('Repository directory %s does not exist, skipping it', source_dir)
+            return copied
+
+        try:
+            for root, _, filenames in os.walk(source_dir):
+                for filename in filenames:
+                    source = os.path.join(root, filename)
+                    relpath = os.path.relpath(source, source_dir)
+                    destination = os.path.join(destination_dir, relpath)
+
+                    # Files written by the backup of the object store itself are not listed in the manifest
+                    if append_only and filename.endswith('.sqlite'):
+                        continue
+
+                    status = os.stat(source)
+                    entry = entries.get(relpath)
+                    digest = None
+                    offset = 0
+
+                    if entry is not None and os.path.isfile(destination):
+                        size, mtime, digest = entry
+
+                        if size == status.st_size and mtime == status.st_mtime:
+                            new_entries[relpath] = entry
+                            continue
+
+                        if append_only and size < status.st_size and os.path.getsize(destination) == size:
+                            offset = size
+                        elif size == status.st_size and digest is not None and digest == _get_file_digest(source):
+                            new_entries[relpath] = [status.st_size, status.st_mtime, digest]
+                            continue
+
+                    if not os.path.isdir(os.path.dirname(destination)):
+                        os.makedirs(os.path.dirname(destination))
+
+                    digest = _copy_file(source, destination, limiter, offset=offset, digest=not append_only)
+                    new_entries[relpath] = [status.st_size, status.st_mtime, digest]
+                    copied += 1
+
+            # Remove the files that were deleted from the source directory since the last backup
+            for relpath in set(entries) - set(new_entries):
+                destination = os.path.join(destination_dir, relpath)
+                if os.path.isfile(destination):
+                    os.remove(destination)
+        except EnvironmentError as why:
+            self._logger.warning(
+                'Problem copying directory %s to %s. More information: %s (Error no: %s)', source_dir, destination_dir,
+                why.strerror, why.errno
+            )
+
+        manifest.set(relative_dir, new_entries)
+
+        return copied
+
     @staticmethod
     def _extract_parent_dirs(given_rel_dir, parent_dir_set):
         """
@@ -420,6 +572,124 @@ class AbstractBackup(object):
         """
 
 
+def _get_file_digest(filepath):
+    """Return the SHA-256 digest of the content of the file."""
+    hasher = hashlib.sha256()
+
+    with io.open(filepath, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(BandwidthLimiter.CHUNK_SIZE), b''):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def _copy_file(source, destination, limiter, offset=0, digest=True):
+    """Copy the file, or its content from the given offset onwards, and its permission bits and times.
+
+    :param limiter: the `BandwidthLimiter` that throttles the copy
+    :param offset: position in the source file from which to append to the destination, which should have this size
+    :param digest: boolean, if True, compute the SHA-256 digest of the content while copying
+    :return: the digest of the content, or None if `digest` is False
+    """
+    hasher = hashlib.sha256() if digest else None
+
+    with io.open(source, 'rb') as handle_source, io.open(destination, 'r+b' if offset else 'wb') as handle_target:
+        handle_source.seek(offset)
+        handle_target.seek(offset)
+        handle_target.truncate()
+
+        for chunk in iter(lambda: handle_source.read(BandwidthLimiter.CHUNK_SIZE), b''):
+            limiter.consume(len(chunk))
+            handle_target.write(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+
+    shutil.copystat(source, destination)
+
+    return None if hasher is None else hasher.hexdigest()
+
+
+class BackupManifest(object):
+    """Record of the size, modification time and digest of the files that have been backed up.
+
+    The manifest maps the path of each backed up directory, relative to the repository, onto a dictionary with, for
+    each file in that directory, a list of its size, modification time and SHA-256 digest. It is an SQLite database
+    with a row per directory, such that saving it only writes the directories that changed since it was last saved,
+    and only the directories that are being backed up are loaded in memory.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._lock = threading.Lock()
+
+        # The connection is shared by the copy workers, which is why every use of it holds the lock
+        self._connection = sqlite3.connect(filepath, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS manifest (relative_dir TEXT PRIMARY KEY, entries TEXT NOT NULL)'
+        )
+        self._connection.commit()
+
+    def get(self, relative_dir):
+        """Return the entries of the files of the given directory that have been backed up."""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT entries FROM manifest WHERE relative_dir = ?', (relative_dir,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row is not None else {}
+
+    def set(self, relative_dir, entries):
+        """Replace the entries of the files of the given directory."""
+        with self._lock:
+            if entries:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO manifest (relative_dir, entries) VALUES (?, ?)',
+                    (relative_dir, json.dumps(entries))
+                )
+            else:
+                self._connection.execute('DELETE FROM manifest WHERE relative_dir = ?', (relative_dir,))
+
+    def save(self):
+        """Write the changes since the manifest was last saved to disk."""
+        with self._lock:
+            self._connection.commit()
+
+    def close(self):
+        """Save the manifest and close the connection to its database."""
+        self.save()
+
+        with self._lock:
+            self._connection.close()
+
+
+class BandwidthLimiter(object):
+    """Throttle shared by the copy workers that limits the total number of bytes copied per second."""
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, rate=None):
+        """Construct a new instance.
+
+        :param rate: maximum number of bytes per second, or None for no limit
+        """
+        self._rate = rate
+        self._lock = threading.Lock()
+        self._start = time.time()
+        self._consumed = 0
+
+    def consume(self, nbytes):
+        """Account for the given number of bytes, sleeping as long as needed to respect the rate."""
+        if not self._rate:
+            return
+
+        with self._lock:
+            self._consumed += nbytes
+            delay = self._start + self._consumed / self._rate - time.time()
+
+        if delay > 0:
+            time.sleep(delay)
+
+
 class BackupError(Exception):
     """General backup error"""
 
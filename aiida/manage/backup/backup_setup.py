@@ -160,6 +160,13 @@ class BackupSetup(object):
 
  * ``backup_dir``: The destination directory of the backup. e.g.
    ``"backup_dir": "/scratch/aiida_user/backup_script_dest"``
+
+ * ``backup_workers`` (optional): The number of repository folders that are
+   copied in parallel, by default 4. e.g. ``"backup_workers": 8``
+
+ * ``bandwidth_limit`` (optional, in MB/s): The maximum total rate at which
+   files are copied. If not set or ``null``, the rate is not limited.
+   e.g. ``"bandwidth_limit": 50``
 """
         sys.stdout.write(info_str)
 
@@ -14,7 +14,7 @@ from __future__ import absolute_import
 
 import io
 import os
-import copy
+import time
 import warnings
 from enum import Enum
 from contextlib import contextmanager
@@ -43,6 +43,12 @@ DEFAULT_CONFIG = {
     ConfigKeys.DISABLED.value: [],
 }
 
+# Suffix of the identifiers in the configuration that apply to all entry points whose name starts with the same prefix
+WILDCARD = '*'
+
+# Minimum number of seconds between two checks whether the watched configuration file was modified
+CHECK_INTERVAL = 1
+
 
 def _get_config(config_file):
     """Return the caching configuration.
@@ -51,7 +57,7 @@ def _get_config(config_file):
     :return: the configuration dictionary
     """
     from aiida.manage.configuration import get_profile
-    from aiida.plugins.entry_point import is_valid_entry_point_string, load_entry_point_from_string
+    from aiida.plugins.entry_point import is_valid_entry_point_string, get_entry_point_from_string
 
     profile = get_profile()
 
@@ -88,8 +94,18 @@ def _get_config(config_file):
                     "entry point '{}' in 'cache_config.yml' is not a valid entry point string.".format(identifier)
                 )
 
+            if WILDCARD in identifier:
+                if identifier.index(WILDCARD) != len(identifier) - 1:
+                    raise exceptions.ConfigurationError(
+                        "entry point '{}' in 'cache_config.yml' can only contain a wildcard at the end.".format(
+                            identifier
+                        )
+                    )
+                continue
+
+            # Only look up the entry point, importing the plugin is not necessary to know that it exists
             try:
-                load_entry_point_from_string(identifier)
+                get_entry_point_from_string(identifier)
             except exceptions.EntryPointError as exception:
                 raise exceptions.ConfigurationError(
                     "entry point '{}' in 'cache_config.yml' can not be loaded: {}.".format(identifier, exception)
@@ -98,27 +114,130 @@ def _get_config(config_file):
     return config
 
 
-_CONFIG = {}
+def _get_mtime(config_file):
+    """Return the modification time of the caching configuration file, or `None` if it does not exist."""
+    try:
+        return os.stat(config_file).st_mtime
+    except (OSError, IOError):
+        return None
+
+
+class _CachingPolicy(object):
+    """
+    The caching configuration of a profile, compiled for the lookups of `get_use_cache`.
+
+    Explicit identifiers are kept in sets and identifiers that end in a wildcard, for example
+    `aiida.calculations:quantumespresso.*`, in a mapping of their prefix. The outcome of the lookup of an identifier is
+    cached, such that the wildcards only have to be matched once per identifier. If the policy was read from the
+    configuration file of the current configuration directory, that file is watched and the policy is recompiled when
+    the file is modified. The file is checked at most once every `CHECK_INTERVAL` seconds, since the policy is looked up
+    for every process that is launched and every node that is stored.
+    """
+
+    def __init__(self, config, config_file=None, mtime=None):
+        """
+        :param config: the configuration dictionary, as returned by `_get_config`
+        :param config_file: the configuration file to watch for modifications, if any
+        :param mtime: the modification time of the watched configuration file at the time it was read
+        """
+        self.default = config[ConfigKeys.DEFAULT.value]
+        self.config_file = config_file
+        self.mtime = mtime
+        self._checked = time.time()
+        self._explicit = {}
+        self._prefixes = {}
+        self._lookups = {}
+
+        for key, value in [(ConfigKeys.ENABLED.value, True), (ConfigKeys.DISABLED.value, False)]:
+            for identifier in config[key]:
+                if identifier.endswith(WILDCARD):
+                    self._prefixes.setdefault(identifier[:-len(WILDCARD)], set()).add(value)
+                else:
+                    self._explicit.setdefault(identifier, set()).add(value)
+
+    def is_outdated(self, now=None):
+        """Return whether the watched configuration file was modified since the policy was compiled.
+
+        :param now: the current time, by default `time.time()`
+        :return: True if the file was modified, False if not or if it was checked less than `CHECK_INTERVAL` ago
+        """
+        if self.config_file is None:
+            return False
+
+        now = time.time() if now is None else now
+
+        if now - self._checked < CHECK_INTERVAL:
+            return False
+
+        self._checked = now
+        return _get_mtime(self.config_file) != self.mtime
+
+    def lookup(self, identifier):
+        """Return whether caching is explicitly enabled or disabled for the identifier.
+
+        An explicit identifier takes precedence over a wildcard, and a longer wildcard over a shorter one.
+
+        :param identifier: the full entry point string of the process
+        :return: True if enabled, False if disabled and None if the configuration does not specify the identifier
+        :raises ValueError: if the configuration defines the identifier both enabled and disabled
+        """
+        try:
+            return self._lookups[identifier]
+        except KeyError:
+            pass
+
+        values = self._explicit.get(identifier, None)
+
+        if values is None:
+            for length in range(len(identifier), -1, -1):
+                values = self._prefixes.get(identifier[:length], None)
+                if values is not None:
+                    break
+
+        if values is not None and len(values) > 1:
+            raise ValueError('Invalid configuration: caching for {} is both enabled and disabled.'.format(identifier))
+
+        result = next(iter(values)) if values is not None else None
+
+        self._lookups[identifier] = result
+        return result
+
+
+# The compiled caching configuration and the overrides of `enable_caching` and `disable_caching`, the latest last, as
+# tuples of the identifier, or `None` for the default, and whether caching is enabled
+_POLICY = None
+_OVERRIDES = []
 
 
 def configure(config_file=None):
-    """Reads the caching configuration file and sets the _CONFIG variable."""
+    """Read the caching configuration file and compile the caching policy.
+
+    Without an explicit configuration file, the file of the current configuration directory is read, which is then
+    watched such that modifications are picked up automatically.
+
+    :param config_file: the absolute path to the caching configuration file
+    """
     # pylint: disable=global-statement
+    global _POLICY
+
+    watch = config_file is None
+
     if config_file is None:
         from aiida.manage.configuration import get_config
 
         config = get_config()
         config_file = os.path.join(config.dirpath, 'cache_config.yml')
 
-    global _CONFIG
-    _CONFIG.clear()
-    _CONFIG.update(_get_config(config_file=config_file))
+    mtime = _get_mtime(config_file)
+    config = _get_config(config_file=config_file)
+
+    _POLICY = _CachingPolicy(config, config_file if watch else None, mtime)
 
 
 @decorator
 def _with_config(wrapped, _, args, kwargs):
     """Function decorator to load the caching configuration for the scope of the wrapped function."""
-    if not _CONFIG:
+    if _POLICY is None or _POLICY.is_outdated():
         configure()
     return wrapped(*args, **kwargs)
 
@@ -127,6 +246,9 @@ def _with_config(wrapped, _, args, kwargs):
 def get_use_cache(node_class=None, identifier=None):
     """Return whether the caching mechanism should be used for the given entry point according to the configuration.
 
+    The overrides of `enable_caching` and `disable_caching` for the identifier take precedence over the configuration
+    of the identifier, which in turn takes precedence over the overrides of the default and the default itself.
+
     :param node_class: the Node class or sub class to check if enabled for caching
     :param identifier: the full entry point string of the process, e.g. `aiida.calculations:arithmetic.add`
     :return: boolean, True if caching is enabled, False otherwise
@@ -143,29 +265,35 @@ def get_use_cache(node_class=None, identifier=None):
     if identifier is not None:
         type_check(identifier, six.string_types)
 
-        enabled = identifier in _CONFIG[ConfigKeys.ENABLED.value]
-        disabled = identifier in _CONFIG[ConfigKeys.DISABLED.value]
+        for override, enabled in reversed(_OVERRIDES):
+            if override == identifier:
+                return enabled
 
-        if enabled and disabled:
-            raise ValueError('Invalid configuration: caching for {} is both enabled and disabled.'.format(identifier))
-        elif enabled:
-            return True
-        elif disabled:
-            return False
+        enabled = _POLICY.lookup(identifier)
+
+        if enabled is not None:
+            return enabled
 
-    return _CONFIG[ConfigKeys.DEFAULT.value]
+    for override, enabled in reversed(_OVERRIDES):
+        if override is None:
+            return enabled
+
+    return _POLICY.default
 
 
 @contextmanager
-@_with_config
-def _reset_config():
-    """Reset the configuration by clearing the contents of the global config variable."""
-    # pylint: disable=global-statement
-    global _CONFIG
-    config_copy = copy.deepcopy(_CONFIG)
-    yield
-    _CONFIG.clear()
-    _CONFIG.update(config_copy)
+def _override(identifier, enabled):
+    """Override the caching configuration for the identifier, or the default if it is `None`, within the context."""
+    override = (identifier, enabled)
+    _OVERRIDES.append(override)
+    try:
+        yield
+    finally:
+        # Remove this very override, which is not necessarily the first one that is equal to it when contexts are nested
+        for index in range(len(_OVERRIDES) - 1, -1, -1):
+            if _OVERRIDES[index] is override:
+                del _OVERRIDES[index]
+                break
 
 
 @contextmanager
@@ -183,15 +311,7 @@ def enable_caching(node_class=None, identifier=None):
             'Use the `identifier` argument instead', AiidaDeprecationWarning
         )
 
-    with _reset_config():
-        if identifier is None:
-            _CONFIG[ConfigKeys.DEFAULT.value] = True
-        else:
-            _CONFIG[ConfigKeys.ENABLED.value].append(identifier)
-            try:
-                _CONFIG[ConfigKeys.DISABLED.value].remove(identifier)
-            except ValueError:
-                pass
+    with _override(identifier, True):
         yield
 
 
@@ -210,13 +330,5 @@ def disable_caching(node_class=None, identifier=None):
             'Use the `identifier` argument instead', AiidaDeprecationWarning
         )
 
-    with _reset_config():
-        if identifier is None:
-            _CONFIG[ConfigKeys.DEFAULT.value] = False
-        else:
-            _CONFIG[ConfigKeys.DISABLED.value].append(identifier)
-            try:
-                _CONFIG[ConfigKeys.ENABLED.value].remove(identifier)
-            except ValueError:
-                pass
+    with _override(identifier, False):
         yield
@@ -98,6 +98,15 @@ CONFIG_OPTIONS = {
         'description': 'The polling interval in seconds to be used by process runners',
         'global_only': False,
     },
+    'runner.executor.max_workers': {
+        'key': 'runner_executor_max_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 4,
+        'description': 'The number of threads in which process runners run the calculation job tasks that computers '
+                       'offload from the event loop',
+        'global_only': False,
+    },
     'daemon.timeout': {
         'key': 'daemon_timeout',
         'valid_type': 'int',
@@ -106,6 +115,54 @@ CONFIG_OPTIONS = {
         'description': 'The timeout in seconds for calls to the circus client',
         'global_only': False,
     },
+    'daemon.autoscale': {
+        'key': 'daemon_autoscale',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether the daemon should scale the number of workers automatically with the load',
+        'global_only': False,
+    },
+    'daemon.autoscale_min_workers': {
+        'key': 'daemon_autoscale_min_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1,
+        'description': 'The minimum number of daemon workers when the daemon scales automatically',
+        'global_only': False,
+    },
+    'daemon.autoscale_max_workers': {
+        'key': 'daemon_autoscale_max_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 4,
+        'description': 'The maximum number of daemon workers when the daemon scales automatically',
+        'global_only': False,
+    },
+    'daemon.autoscale_interval': {
+        'key': 'daemon_autoscale_interval',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 30,
+        'description': 'The interval in seconds at which the daemon decides whether to scale the number of workers',
+        'global_only': False,
+    },
+    'daemon.autoscale_cooldown': {
+        'key': 'daemon_autoscale_cooldown',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 120,
+        'description': 'The minimum time in seconds between two changes of the number of workers by the daemon',
+        'global_only': False,
+    },
+    'daemon.autoscale_max_loop_lag': {
+        'key': 'daemon_autoscale_max_loop_lag',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 500,
+        'description': 'The event loop lag in milliseconds of a daemon worker above which it is considered overloaded',
+        'global_only': False,
+    },
     'verdi.shell.auto_import': {
         'key': 'verdi_shell_auto_import',
         'valid_type': 'string',
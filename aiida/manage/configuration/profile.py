@@ -30,6 +30,8 @@ CIRCUS_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'circus-{}.log')
 DAEMON_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'aiida-{}.log')
 CIRCUS_PORT_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'circus-{}.port')
 CIRCUS_SOCKET_FILE_TEMPATE = os.path.join(DAEMON_DIR, 'circus-{}.sockets')
+DAEMON_WORKERS_DIR_TEMPLATE = os.path.join(DAEMON_DIR, 'workers-{}')
+DAEMON_AUTOSCALER_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'autoscaler-{}.json')
 CIRCUS_CONTROLLER_SOCKET_TEMPLATE = 'circus.c.sock'
 CIRCUS_PUBSUB_SOCKET_TEMPLATE = 'circus.p.sock'
 CIRCUS_STATS_SOCKET_TEMPLATE = 'circus.s.sock'
@@ -308,5 +310,7 @@ class Profile(object):  # pylint: disable=too-many-public-methods
             'daemon': {
                 'log': DAEMON_LOG_FILE_TEMPLATE.format(self.name),
                 'pid': DAEMON_PID_FILE_TEMPLATE.format(self.name),
+                'workers': DAEMON_WORKERS_DIR_TEMPLATE.format(self.name),
+                'autoscaler': DAEMON_AUTOSCALER_FILE_TEMPLATE.format(self.name),
             }
         }
@@ -59,6 +59,7 @@ def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
     from aiida.common import exceptions
     from aiida.common.links import GraphTraversalRules
     from aiida.orm import Node, QueryBuilder, load_node
+    from aiida.orm.utils.loaders import get_identity_map
 
     starting_pks = []
     for pk in pks:
@@ -177,6 +178,10 @@ def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
         echo.echo('Starting node deletion...')
     delete_nodes_and_connections(pks_set_to_delete)
 
+    identity_map = get_identity_map()
+    for pk in pks_set_to_delete:
+        identity_map.remove(pk)
+
     if verbosity > 0:
         echo.echo('Nodes deleted from database, deleting files from the repository now...')
 
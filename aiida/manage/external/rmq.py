@@ -120,6 +120,19 @@ class ProcessLauncher(plumpy.ProcessLauncher):
     that if it is already marked as terminated, it is not continued but the future is reconstructed and returned
     """
 
+    def __init__(self, *args, **kwargs):
+        super(ProcessLauncher, self).__init__(*args, **kwargs)
+        self._num_active = 0
+
+    @property
+    def num_active(self):
+        """Return the number of continue tasks that are currently being handled, i.e. the number of active processes.
+
+        :return: the number of active processes
+        :rtype: int
+        """
+        return self._num_active
+
     @staticmethod
     def handle_continue_exception(node, exception, message):
         """Handle exception raised in `_continue` call.
@@ -186,6 +199,8 @@ class ProcessLauncher(plumpy.ProcessLauncher):
 
             raise gen.Return(future.result())
 
+        self._num_active += 1
+
         try:
             result = yield super(ProcessLauncher, self)._continue(communicator, pid, nowait, tag)
         except ImportError as exception:
@@ -196,6 +211,8 @@ class ProcessLauncher(plumpy.ProcessLauncher):
             message = 'failed to recreate the process instance in order to continue it.'
             self.handle_continue_exception(node, exception, message)
             raise
+        finally:
+            self._num_active -= 1
 
         # Ensure that the result is serialized such that communication thread won't have to do database operations
         try:
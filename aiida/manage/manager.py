@@ -286,7 +286,11 @@ class Manager(object):
         profile = self.get_profile()
         poll_interval = 0.0 if profile.is_test_profile else config.get_option('runner.poll.interval')
 
-        settings = {'rmq_submit': False, 'poll_interval': poll_interval}
+        settings = {
+            'rmq_submit': False,
+            'poll_interval': poll_interval,
+            'executor_max_workers': config.get_option('runner.executor.max_workers'),
+        }
         settings.update(kwargs)
 
         if 'communicator' not in settings:
@@ -325,6 +329,7 @@ class Manager(object):
             return plumpy.create_task(functools.partial(task_receiver, *args, **kwargs), loop=runner_loop)
 
         runner.communicator.add_task_subscriber(callback)
+        runner.set_task_receiver(task_receiver)
 
         return runner
 
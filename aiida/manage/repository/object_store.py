@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Content-addressed object store that keeps the files of node repositories in a small number of pack files.
+
+Each file is identified by the SHA-256 hash of its content, such that byte-identical files of different nodes are only
+stored once. The content of the files is appended to pack files of bounded size and an SQLite index maps each hash onto
+the pack, position and length of the content. The same index contains for each node the manifest of its repository: the
+relative path of each directory and file and, for the latter, the hash of its content.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import contextlib
+import fcntl
+import hashlib
+import io
+import os
+import shutil
+import sqlite3
+import threading
+
+from aiida.common import exceptions
+
+__all__ = ('PackedObjectStore', 'get_object_store', 'reset_object_store', 'migrate_folder_repository')
+
+OBJECT_TYPE_DIRECTORY = 0
+OBJECT_TYPE_FILE = 1
+
+# Name of the directory within the `repository` folder of a profile that contains the packs and the index
+OBJECT_STORE_DIRECTORY = 'packs'
+
+INDEX_FILENAME = 'index.sqlite'
+LOCK_FILENAME = 'packs.lock'
+PACK_EXTENSION = '.pack'
+
+# Size above which no more objects are appended to a pack file and a new one is started
+DEFAULT_PACK_SIZE = 4 * 1024**3
+
+# Seconds to wait for a lock on the index held by another process before raising
+INDEX_TIMEOUT = 60
+
+CHUNK_SIZE = 1024 * 1024
+
+_INDEX_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS objects ('
+    'hashkey TEXT PRIMARY KEY, pack_id INTEGER NOT NULL, position INTEGER NOT NULL, length INTEGER NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS entries ('
+    'uuid TEXT NOT NULL, key TEXT NOT NULL, type INTEGER NOT NULL, hashkey TEXT, PRIMARY KEY (uuid, key))',
+    'CREATE INDEX IF NOT EXISTS entries_hashkey ON entries (hashkey)',
+)
+
+_OBJECT_STORES = {}
+
+
+def get_object_store():
+    """Return the object store of the repository of the current profile, if the repository has been migrated to it.
+
+    :return: a `PackedObjectStore` instance or None if the repository of the profile uses the folder layout
+    """
+    from aiida.common.utils import get_repository_folder
+
+    dirpath = os.path.join(get_repository_folder('repository'), OBJECT_STORE_DIRECTORY)
+
+    try:
+        return _OBJECT_STORES[dirpath]
+    except KeyError:
+        store = PackedObjectStore(dirpath)
+
+    # Only an initialised store is remembered, such that a migration by another process is picked up
+    if not store.is_initialised:
+        return None
+
+    return _OBJECT_STORES.setdefault(dirpath, store)
+
+
+def reset_object_store():
+    """Reset the cached object stores, such that `get_object_store` checks the repository layout again."""
+    _OBJECT_STORES.clear()
+
+
+def migrate_folder_repository(store, repository_dirpath, remove=True, callback=None):
+    """Move the node repository folders of the folder layout into the object store.
+
+    :param store: the initialised `PackedObjectStore` to add the node repositories to
+    :param repository_dirpath: absolute path of the `repository` folder that contains the `node` section
+    :param remove: boolean, if True, delete each node repository folder once its contents have been added
+    :param callback: optional callable that is called with the UUID of each node that has been migrated
+    :return: the number of migrated node repositories
+    """
+    section_dirpath = os.path.join(repository_dirpath, 'node')
+    count = 0
+
+    if not os.path.isdir(section_dirpath):
+        return count
+
+    # The node repository folders are sharded as `node/<uuid[:2]>/<uuid[2:4]>/<uuid[4:]>`
+    for first in sorted(os.listdir(section_dirpath)):
+        first_dirpath = os.path.join(section_dirpath, first)
+        for second in sorted(os.listdir(first_dirpath)):
+            second_dirpath = os.path.join(first_dirpath, second)
+            for rest in sorted(os.listdir(second_dirpath)):
+                uuid = first + second + rest
+                dirpath = os.path.join(second_dirpath, rest)
+                store.add_node(uuid, dirpath)
+                if remove:
+                    shutil.rmtree(dirpath)
+                count += 1
+                if callback is not None:
+                    callback(uuid)
+
+    return count
+
+
+class PackedObjectReader(io.RawIOBase):
+    """Read-only file-like object that gives access to the content of a single object in a pack file."""
+
+    def __init__(self, filepath, position, length):
+        super(PackedObjectReader, self).__init__()
+        self._handle = io.open(filepath, 'rb')
+        self._start = position
+        self._length = length
+        self._position = 0
+        self._handle.seek(position)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError('invalid whence value {}'.format(whence))
+
+        if position < 0:
+            raise IOError('negative seek position {}'.format(position))
+
+        self._position = min(position, self._length)
+        self._handle.seek(self._start + self._position)
+        return self._position
+
+    def readinto(self, buffer):  # pylint: disable=arguments-differ
+        remaining = self._length - self._position
+
+        if remaining <= 0:
+            return 0
+
+        data = self._handle.read(min(len(buffer), remaining))
+        buffer[:len(data)] = data
+        self._position += len(data)
+
+        return len(data)
+
+    def close(self):
+        self._handle.close()
+        super(PackedObjectReader, self).close()
+
+
+class PackedObjectStore(object):
+    """Content-addressed store of the files of node repositories, with the content in pack files and an SQLite index.
+
+    Objects are only appended to the packs while the store is in use, which is safe for multiple threads and processes
+    through a file lock. Content that is no longer referenced by any node is only removed by `repack`, which rewrites
+    all pack files and should not be called while other processes are using the store.
+    """
+
+    def __init__(self, dirpath, pack_size=DEFAULT_PACK_SIZE):
+        """Construct a new instance.
+
+        :param dirpath: absolute path of the directory that contains the pack files and the index
+        :param pack_size: size in bytes above which a new pack file is started
+        """
+        self._dirpath = dirpath
+        self._pack_size = pack_size
+        self._local = threading.local()
+
+    @property
+    def dirpath(self):
+        """Return the absolute path of the directory of the store."""
+        return self._dirpath
+
+    @property
+    def index_path(self):
+        """Return the absolute path of the index file."""
+        return os.path.join(self._dirpath, INDEX_FILENAME)
+
+    @property
+    def is_initialised(self):
+        """Return whether the store has been initialised, which is to say that its index exists."""
+        return os.path.isfile(self.index_path)
+
+    def initialise(self):
+        """Create the directory and the index of the store, if they do not yet exist."""
+        if not os.path.isdir(self._dirpath):
+            os.makedirs(self._dirpath)
+
+        with self._transaction() as connection:
+            for statement in _INDEX_SCHEMA:
+                connection.execute(statement)
+
+    def _get_connection(self):
+        """Return the connection to the index for the current thread and process."""
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.index_path, timeout=INDEX_TIMEOUT)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Context manager that yields the connection to the index and commits on exit, or rolls back on exception."""
+        connection = self._get_connection()
+        with connection:
+            yield connection
+
+    @contextlib.contextmanager
+    def _lock(self):
+        """Context manager that holds the exclusive lock for writing to the pack files."""
+        with io.open(os.path.join(self._dirpath, LOCK_FILENAME), 'ab') as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _get_pack_path(self, pack_id):
+        return os.path.join(self._dirpath, '{}{}'.format(pack_id, PACK_EXTENSION))
+
+    def _get_pack_ids(self):
+        """Return the sorted list of identifiers of the pack files that exist."""
+        return sorted(
+            int(filename[:-len(PACK_EXTENSION)])
+            for filename in os.listdir(self._dirpath)
+            if filename.endswith(PACK_EXTENSION)
+        )
+
+    @staticmethod
+    def _get_file_hash(filepath):
+        """Return the hash of the content of the file, which is the key under which it is stored."""
+        hasher = hashlib.sha256()
+
+        with io.open(filepath, 'rb') as handle:
+            for chunk in iter(lambda: handle.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+
+        return hasher.hexdigest()
+
+    def _get_existing_hashkeys(self, hashkeys):
+        """Return the subset of the given hash keys for which an object exists in the store."""
+        connection = self._get_connection()
+        hashkeys = list(hashkeys)
+        existing = set()
+
+        # Keep the number of parameters per statement below the SQLite limit
+        for index in range(0, len(hashkeys), 500):
+            chunk = hashkeys[index:index + 500]
+            statement = 'SELECT hashkey FROM objects WHERE hashkey IN ({})'.format(', '.join(['?'] * len(chunk)))
+            existing.update(row[0] for row in connection.execute(statement, chunk))
+
+        return existing
+
+    def _write_objects(self, sources, pack_id=None):
+        """Append the content of the given sources to the pack files.
+
+        .. note:: the caller should be holding the lock of the store.
+
+        :param sources: list of tuples `(hashkey, length, handle_factory)` where `handle_factory` is a callable that
+            returns a binary file handle with the content of the object
+        :param pack_id: identifier of the first pack to write to, by default the last pack that exists
+        :return: list of tuples `(hashkey, pack_id, position, length)`
+        """
+        if pack_id is None:
+            pack_ids = self._get_pack_ids()
+            pack_id = pack_ids[-1] if pack_ids else 0
+
+        locations = []
+        pack = None
+
+        try:
+            for hashkey, length, handle_factory in sources:
+
+                if pack is None:
+                    pack = io.open(self._get_pack_path(pack_id), 'ab')
+                    pack.seek(0, os.SEEK_END)
+
+                position = pack.tell()
+
+                if position > 0 and position + length > self._pack_size:
+                    pack.flush()
+                    os.fsync(pack.fileno())
+                    pack.close()
+                    pack_id += 1
+                    pack = io.open(self._get_pack_path(pack_id), 'ab')
+                    position = 0
+
+                with handle_factory() as handle:
+                    shutil.copyfileobj(handle, pack, CHUNK_SIZE)
+
+                locations.append((hashkey, pack_id, position, length))
+        finally:
+            if pack is not None:
+                pack.flush()
+                os.fsync(pack.fileno())
+                pack.close()
+
+        return locations
+
+    def add_node(self, uuid, dirpath):
+        """Add the contents of a node repository folder, replacing any contents that were stored for the node before.
+
+        :param uuid: the UUID of the node
+        :param dirpath: absolute path of the folder with the contents of the repository of the node
+        """
+        entries = [('', OBJECT_TYPE_DIRECTORY, None)]
+        files = {}
+
+        for root, dirnames, filenames in os.walk(dirpath):
+            relpath = os.path.relpath(root, dirpath)
+            relpath = '' if relpath == os.curdir else relpath.replace(os.sep, '/') + '/'
+
+            for dirname in dirnames:
+                entries.append((relpath + dirname, OBJECT_TYPE_DIRECTORY, None))
+
+            for filename in filenames:
+                filepath = os.path.join(root, filename)
+                hashkey = self._get_file_hash(filepath)
+                entries.append((relpath + filename, OBJECT_TYPE_FILE, hashkey))
+                files.setdefault(hashkey, filepath)
+
+        with self._lock():
+            existing = self._get_existing_hashkeys(files.keys())
+            sources = [(hashkey, os.path.getsize(filepath), lambda filepath=filepath: io.open(filepath, 'rb'))
+                       for hashkey, filepath in files.items()
+                       if hashkey not in existing]
+            locations = self._write_objects(sources)
+
+            with self._transaction() as connection:
+                connection.executemany(
+                    'INSERT INTO objects (hashkey, pack_id, position, length) VALUES (?, ?, ?, ?)', locations
+                )
+                connection.execute('DELETE FROM entries WHERE uuid = ?', (uuid,))
+                connection.executemany(
+                    'INSERT INTO entries (uuid, key, type, hashkey) VALUES (?, ?, ?, ?)',
+                    [(uuid,) + entry for entry in entries]
+                )
+
+    def has_node(self, uuid):
+        """Return whether the store contains the repository of the node with the given UUID."""
+        statement = 'SELECT 1 FROM entries WHERE uuid = ? LIMIT 1'
+        return self._get_connection().execute(statement, (uuid,)).fetchone() is not None
+
+    def get_node_entries(self, uuid):
+        """Return the manifest of the repository of the node with the given UUID.
+
+        :param uuid: the UUID of the node
+        :return: a dictionary mapping the relative path of each directory and file onto a tuple of the object type and
+            the hash key of the content, which is None for directories. The root directory has the empty string as key.
+        :raises aiida.common.NotExistent: if the store does not contain the repository of the node
+        """
+        statement = 'SELECT key, type, hashkey FROM entries WHERE uuid = ?'
+        entries = {key: (object_type, hashkey) for key, object_type, hashkey in self._get_connection().execute(
+            statement, (uuid,))}
+
+        if not entries:
+            raise exceptions.NotExistent('the object store does not contain the repository of node {}'.format(uuid))
+
+        return entries
+
+    def delete_node(self, uuid):
+        """Delete the manifest of the repository of the node, leaving the content to be removed by `repack`."""
+        with self._transaction() as connection:
+            connection.execute('DELETE FROM entries WHERE uuid = ?', (uuid,))
+
+    def open_object(self, hashkey):
+        """Return a binary, read-only file handle to the content of the object with the given hash key.
+
+        :raises aiida.common.NotExistent: if the store does not contain an object with the given hash key
+        """
+        return io.BufferedReader(PackedObjectReader(*self.get_object_location(hashkey)))
+
+    def get_object_location(self, hashkey):
+        """Return the location of the content of the object with the given hash key within its pack file.
+
+        :return: tuple of the absolute path of the pack file, the position of the content in it and its length
+        :raises aiida.common.NotExistent: if the store does not contain an object with the given hash key
+        """
+        statement = 'SELECT pack_id, position, length FROM objects WHERE hashkey = ?'
+        row = self._get_connection().execute(statement, (hashkey,)).fetchone()
+
+        if row is None:
+            raise exceptions.NotExistent('the object store does not contain the object {}'.format(hashkey))
+
+        pack_id, position, length = row
+        return self._get_pack_path(pack_id), position, length
+
+    def materialize_node(self, uuid, dirpath):
+        """Write the contents of the repository of the node into the given folder.
+
+        :param uuid: the UUID of the node
+        :param dirpath: absolute path of an existing folder
+        :raises aiida.common.NotExistent: if the store does not contain the repository of the node
+        """
+        for key, (object_type, hashkey) in sorted(self.get_node_entries(uuid).items()):
+            path = os.path.join(dirpath, *key.split('/')) if key else dirpath
+
+            if object_type == OBJECT_TYPE_DIRECTORY:
+                if not os.path.isdir(path):
+                    os.makedirs(path)
+            else:
+                with self.open_object(hashkey) as source, io.open(path, 'wb') as target:
+                    shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+    def get_statistics(self):
+        """Return statistics of the store.
+
+        :return: a dictionary with the number of node repositories, the number and total size of the objects, the
+            number and size of the objects that are not referenced by any node, and the number and total size of the
+            pack files
+        """
+        connection = self._get_connection()
+        unreferenced = 'NOT EXISTS (SELECT 1 FROM entries WHERE entries.hashkey = objects.hashkey)'
+        pack_ids = self._get_pack_ids()
+
+        nodes = connection.execute('SELECT COUNT(DISTINCT uuid) FROM entries').fetchone()[0]
+        objects, size = connection.execute('SELECT COUNT(*), COALESCE(SUM(length), 0) FROM objects').fetchone()
+        garbage, garbage_size = connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(length), 0) FROM objects WHERE {}'.format(unreferenced)
+        ).fetchone()
+
+        return {
+            'nodes': nodes,
+            'objects': objects,
+            'objects_size': size,
+            'unreferenced_objects': garbage,
+            'unreferenced_size': garbage_size,
+            'packs': len(pack_ids),
+            'packs_size': sum(os.path.getsize(self._get_pack_path(pack_id)) for pack_id in pack_ids),
+        }
+
+    def copy_index(self, filepath):
+        """Write a consistent copy of the index to the given file.
+
+        Writers of the index are blocked while it is being copied, but readers are not.
+
+        :param filepath: absolute path of the file to write the copy to
+        """
+        connection = sqlite3.connect(self.index_path, timeout=INDEX_TIMEOUT, isolation_level=None)
+
+        try:
+            # Acquiring the reserved lock prevents other connections from committing while the file is copied
+            connection.execute('BEGIN IMMEDIATE')
+            shutil.copyfile(self.index_path, filepath)
+            connection.execute('ROLLBACK')
+        finally:
+            connection.close()
+
+    def repack(self):
+        """Rewrite the pack files with only the objects that are referenced by at least one node.
+
+        This garbage collects the content of deleted nodes and the space of partially written objects. All referenced
+        objects are copied into new pack files, after which the old ones are deleted, so this temporarily requires as
+        much free disk space as the size of the referenced objects.
+
+        .. warning:: no other process should be reading from or writing to the store while it is being repacked.
+
+        :return: a tuple of the number of removed objects and the number of bytes by which the packs shrunk
+        """
+        referenced = 'EXISTS (SELECT 1 FROM entries WHERE entries.hashkey = objects.hashkey)'
+
+        with self._lock():
+            connection = self._get_connection()
+            old_pack_ids = self._get_pack_ids()
+            old_size = sum(os.path.getsize(self._get_pack_path(pack_id)) for pack_id in old_pack_ids)
+            objects = connection.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+            rows = connection.execute(
+                'SELECT hashkey, pack_id, position, length FROM objects WHERE {} ORDER BY pack_id, position'.
+                format(referenced)
+            ).fetchall()
+
+            def get_factory(pack_id, position, length):
+                return lambda: PackedObjectReader(self._get_pack_path(pack_id), position, length)
+
+            sources = [(hashkey, length, get_factory(pack_id, position, length))
+                       for hashkey, pack_id, position, length in rows]
+            first_pack_id = old_pack_ids[-1] + 1 if old_pack_ids else 0
+            locations = self._write_objects(sources, pack_id=first_pack_id)
+
+            with self._transaction() as connection:
+                connection.execute('DELETE FROM objects')
+                connection.executemany(
+                    'INSERT INTO objects (hashkey, pack_id, position, length) VALUES (?, ?, ?, ?)', locations
+                )
+
+            for pack_id in old_pack_ids:
+                os.remove(self._get_pack_path(pack_id))
+
+            new_size = sum(os.path.getsize(self._get_pack_path(pack_id)) for pack_id in self._get_pack_ids())
+
+        return objects - len(locations), old_size - new_size
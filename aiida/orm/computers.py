@@ -47,6 +47,14 @@ class Computer(entities.Entity):
 
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL = 'minimum_scheduler_poll_interval'  # pylint: disable=invalid-name
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 10.  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_OFFLOADED_TASKS = 'maximum_offloaded_tasks'
+    PROPERTY_MAXIMUM_OFFLOADED_TASKS__DEFAULT = 0
+    PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS = 'maximum_concurrent_transfers'
+    PROPERTY_MAXIMUM_QUEUED_JOBS = 'maximum_queued_jobs'
+    PROPERTY_MAXIMUM_SUBMISSION_RATE = 'maximum_submission_rate'
+    PROPERTY_USE_REMOTE_OBJECT_CACHE = 'use_remote_object_cache'
+    PROPERTY_REMOTE_OBJECT_CACHE_MAX_AGE = 'remote_object_cache_max_age'
+    PROPERTY_REMOTE_OBJECT_CACHE_MAX_SIZE = 'remote_object_cache_max_size'
     PROPERTY_WORKDIR = 'workdir'
     PROPERTY_SHEBANG = 'shebang'
 
@@ -464,6 +472,179 @@ class Computer(entities.Entity):
         """
         self.set_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, interval)
 
+    def get_maximum_offloaded_tasks(self):
+        """
+        Get the maximum number of retrieve and parse tasks of calculation jobs on this computer that a runner runs at
+        once in the threads of its executor, instead of in its event loop.
+
+        :return: the maximum number of offloaded tasks, where 0 means that the tasks are not offloaded
+        :rtype: int
+        """
+        return self.get_property(
+            self.PROPERTY_MAXIMUM_OFFLOADED_TASKS, self.PROPERTY_MAXIMUM_OFFLOADED_TASKS__DEFAULT
+        )
+
+    def set_maximum_offloaded_tasks(self, maximum):
+        """
+        Set the maximum number of retrieve and parse tasks of calculation jobs on this computer that a runner runs at
+        once in the threads of its executor, instead of in its event loop.
+
+        Each offloaded retrieve task opens its own transport, so the maximum should respect the number of connections
+        that the computer accepts. Parsers of calculation jobs on this computer have to be thread-safe.
+
+        :param maximum: the maximum number of offloaded tasks, 0 not to offload the tasks
+        :type maximum: int
+        :raises ValueError: if the maximum is not a non-negative integer
+        """
+        if not isinstance(maximum, six.integer_types) or maximum < 0:
+            raise ValueError('the maximum number of offloaded tasks should be a non-negative integer')
+
+        self.set_property(self.PROPERTY_MAXIMUM_OFFLOADED_TASKS, maximum)
+
+    def get_maximum_concurrent_transfers(self):
+        """
+        Get the maximum number of uploads and retrievals of calculation jobs on this computer that a runner performs at
+        once.
+
+        :return: the maximum number of concurrent transfers, where 0 means unlimited
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS, 0)
+
+    def set_maximum_concurrent_transfers(self, maximum):
+        """
+        Set the maximum number of uploads and retrievals of calculation jobs on this computer that a runner performs at
+        once. Further transfers wait for their turn, such that the number of sessions over a connection to the computer
+        can be kept below the limit that it imposes, for example through `MaxSessions` of its SSH server.
+
+        :param maximum: the maximum number of concurrent transfers, 0 for unlimited
+        :type maximum: int
+        :raises ValueError: if the maximum is not a non-negative integer
+        """
+        if not isinstance(maximum, six.integer_types) or maximum < 0:
+            raise ValueError('the maximum number of concurrent transfers should be a non-negative integer')
+
+        self.set_property(self.PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS, maximum)
+
+    def get_maximum_queued_jobs(self):
+        """
+        Get the maximum number of calculation jobs that may be with the scheduler of this computer at once.
+
+        :return: the maximum number of queued jobs, where 0 means unlimited
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_QUEUED_JOBS, 0)
+
+    def set_maximum_queued_jobs(self, maximum):
+        """
+        Set the maximum number of calculation jobs that may be with the scheduler of this computer at once. Further
+        jobs wait to be submitted until jobs leave the queue of the scheduler.
+
+        :param maximum: the maximum number of queued jobs, 0 for unlimited
+        :type maximum: int
+        :raises ValueError: if the maximum is not a non-negative integer
+        """
+        if not isinstance(maximum, six.integer_types) or maximum < 0:
+            raise ValueError('the maximum number of queued jobs should be a non-negative integer')
+
+        self.set_property(self.PROPERTY_MAXIMUM_QUEUED_JOBS, maximum)
+
+    def get_maximum_submission_rate(self):
+        """
+        Get the maximum number of calculation jobs per minute that a runner submits to the scheduler of this computer.
+
+        :return: the maximum number of submissions per minute, where 0 means unlimited
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_SUBMISSION_RATE, 0)
+
+    def set_maximum_submission_rate(self, maximum):
+        """
+        Set the maximum number of calculation jobs per minute that a runner submits to the scheduler of this computer.
+        The submissions are spaced out evenly.
+
+        :param maximum: the maximum number of submissions per minute, 0 for unlimited
+        :type maximum: float
+        :raises ValueError: if the maximum is not a non-negative number
+        """
+        if isinstance(maximum, bool) or not isinstance(maximum, six.integer_types + (float,)) or maximum < 0:
+            raise ValueError('the maximum submission rate should be a non-negative number')
+
+        self.set_property(self.PROPERTY_MAXIMUM_SUBMISSION_RATE, maximum)
+
+    def get_use_remote_object_cache(self):
+        """
+        Get whether files that are uploaded for calculation jobs are cached on this computer, such that later uploads of
+        files with the same content are copied on the computer itself instead of being transferred.
+
+        :return: True if the remote object cache is used, False otherwise
+        :rtype: bool
+        """
+        return self.get_property(self.PROPERTY_USE_REMOTE_OBJECT_CACHE, False)
+
+    def set_use_remote_object_cache(self, use_cache):
+        """
+        Set whether files that are uploaded for calculation jobs are cached on this computer, such that later uploads of
+        files with the same content are copied on the computer itself instead of being transferred. The cache is kept
+        in a directory of the remote working directory, see `aiida.engine.daemon.remotecache`.
+
+        :param use_cache: True to use the remote object cache, False otherwise
+        :type use_cache: bool
+        :raises ValueError: if the value is not a boolean
+        """
+        if not isinstance(use_cache, bool):
+            raise ValueError('whether to use the remote object cache should be a boolean')
+
+        self.set_property(self.PROPERTY_USE_REMOTE_OBJECT_CACHE, use_cache)
+
+    def get_remote_object_cache_max_age(self):
+        """
+        Get the maximum number of days since an object in the remote object cache of this computer was last used, after
+        which it is evicted.
+
+        :return: the maximum age in days, where 0 means unlimited
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_REMOTE_OBJECT_CACHE_MAX_AGE, 0)
+
+    def set_remote_object_cache_max_age(self, maximum):
+        """
+        Set the maximum number of days since an object in the remote object cache of this computer was last used, after
+        which it is evicted.
+
+        :param maximum: the maximum age in days, 0 for unlimited
+        :type maximum: float
+        :raises ValueError: if the maximum is not a non-negative number
+        """
+        if isinstance(maximum, bool) or not isinstance(maximum, six.integer_types + (float,)) or maximum < 0:
+            raise ValueError('the maximum age of the remote object cache should be a non-negative number')
+
+        self.set_property(self.PROPERTY_REMOTE_OBJECT_CACHE_MAX_AGE, maximum)
+
+    def get_remote_object_cache_max_size(self):
+        """
+        Get the maximum total size of the objects in the remote object cache of this computer, beyond which the least
+        recently used objects are evicted.
+
+        :return: the maximum size in megabytes, where 0 means unlimited
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_REMOTE_OBJECT_CACHE_MAX_SIZE, 0)
+
+    def set_remote_object_cache_max_size(self, maximum):
+        """
+        Set the maximum total size of the objects in the remote object cache of this computer, beyond which the least
+        recently used objects are evicted.
+
+        :param maximum: the maximum size in megabytes, 0 for unlimited
+        :type maximum: float
+        :raises ValueError: if the maximum is not a non-negative number
+        """
+        if isinstance(maximum, bool) or not isinstance(maximum, six.integer_types + (float,)) or maximum < 0:
+            raise ValueError('the maximum size of the remote object cache should be a non-negative number')
+
+        self.set_property(self.PROPERTY_REMOTE_OBJECT_CACHE_MAX_SIZE, maximum)
+
     def get_transport(self, user=None):
         """
         Return a Transport class, configured with all correct parameters.
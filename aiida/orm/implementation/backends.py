@@ -120,6 +120,15 @@ class Backend(object):
         :return: a context manager to group database operations
         """
 
+    @abc.abstractmethod
+    def close_session(self):
+        """
+        Close the database session of the current thread, releasing its connection to the database.
+
+        Each thread has its own session. Threads other than the main one, for example those of the executor of a runner,
+        close their session once they are done, after which the entities that they loaded should no longer be used.
+        """
+
 
 @six.add_metaclass(abc.ABCMeta)
 class BackendEntity(object):
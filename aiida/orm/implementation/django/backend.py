@@ -92,6 +92,13 @@ class DjangoBackend(SqlBackend[models.Model]):
         """Open a transaction to be used as a context manager."""
         return transaction.atomic()
 
+    @staticmethod
+    def close_session():
+        """Close the database connection of the current thread."""
+        # pylint: disable=import-error,no-name-in-module
+        from django.db import connection
+        connection.close()
+
     # Below are abstract methods inherited from `aiida.orm.implementation.sql.backends.SqlBackend`
 
     def get_backend_entity(self, model):
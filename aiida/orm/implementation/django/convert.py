@@ -155,20 +155,14 @@ def _(dbmodel, backend):
     get_backend_entity for DummyModel DbNode.
     DummyModel instances are created when QueryBuilder queries the Django backend.
     """
-    djnode_instance = djmodels.DbNode(
-        id=dbmodel.id,
-        node_type=dbmodel.node_type,
-        process_type=dbmodel.process_type,
-        uuid=dbmodel.uuid,
-        ctime=dbmodel.ctime,
-        mtime=dbmodel.mtime,
-        label=dbmodel.label,
-        description=dbmodel.description,
-        dbcomputer_id=dbmodel.dbcomputer_id,
-        user_id=dbmodel.user_id,
-        attributes=dbmodel.attributes,
-        extras=dbmodel.extras
-    )
+    from sqlalchemy import inspect
+
+    # Columns that were deferred by the query are not accessed, which would trigger loading them, but marked as deferred
+    # on the Django model instance as well, such that they are only loaded when accessed through the Django model.
+    unloaded = inspect(dbmodel).unloaded
+    field_names = [field.attname for field in djmodels.DbNode._meta.concrete_fields if field.attname not in unloaded]  # pylint: disable=protected-access
+    values = [getattr(dbmodel, field_name) for field_name in field_names]
+    djnode_instance = djmodels.DbNode.from_db(None, field_names, values)
 
     from . import nodes
     return nodes.DjangoNode.from_dbmodel(djnode_instance, backend)
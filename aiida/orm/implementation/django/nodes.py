@@ -179,6 +179,8 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the attribute does not exist and no default is specified
         """
         try:
+            if self.is_stored:
+                return self._get_stored_json_values('attributes', [key])[0]
             return self._dbmodel.attributes[key]
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
@@ -199,7 +201,9 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if at least one attribute does not exist
         """
         try:
-            return [self.get_attribute(key) for key in keys]
+            if self.is_stored:
+                return self._get_stored_json_values('attributes', keys)
+            return [self._dbmodel.attributes[key] for key in keys]
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
 
@@ -324,6 +328,8 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the extra does not exist and no default is specified
         """
         try:
+            if self.is_stored:
+                return self._get_stored_json_values('extras', [key])[0]
             return self._dbmodel.extras[key]
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
@@ -344,7 +350,9 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if at least one extra does not exist
         """
         try:
-            return [self.get_extra(key) for key in keys]
+            if self.is_stored:
+                return self._get_stored_json_values('extras', keys)
+            return [self._dbmodel.extras[key] for key in keys]
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
 
@@ -438,6 +446,48 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key in self._dbmodel.extras:
             yield key
 
+    def _get_stored_json_values(self, column, keys):
+        """Return the values of top-level keys of a JSONB column of the stored node, fetching only those values.
+
+        The values are selected with the `->` operator in a single query, such that the rest of the column is not
+        transferred from the database.
+
+        :param column: the name of the JSONB column, `attributes` or `extras`
+        :param keys: a list of top-level keys
+        :return: a list of values
+        :raises KeyError: if at least one of the keys does not exist
+        """
+        from django.db import connection
+
+        if not keys:
+            return []
+
+        # Within a transaction the model is not refreshed, so a column that was loaded with the node is read from memory
+        in_transaction = self._dbmodel._in_transaction()  # pylint: disable=protected-access
+        if in_transaction and column not in self._dbmodel._model.get_deferred_fields():  # pylint: disable=protected-access
+            values = getattr(self._dbmodel, column)
+            return [values[key] for key in keys]
+
+        projections = ', '.join(['{column} ? %s, {column} -> %s'.format(column=column)] * len(keys))
+        statement = 'SELECT {} FROM {} WHERE id = %s'.format(projections, models.DbNode._meta.db_table)  # pylint: disable=protected-access
+        parameters = [key for key in keys for _ in range(2)] + [self.id]
+
+        with connection.cursor() as cursor:
+            cursor.execute(statement, parameters)
+            row = cursor.fetchone()
+
+        if row is None:
+            raise exceptions.NotExistent('Node<{}> does not exist'.format(self.id))
+
+        values = []
+
+        for key, exists, value in zip(keys, row[::2], row[1::2]):
+            if not exists:
+                raise KeyError(key)
+            values.append(value)
+
+        return values
+
     def _flush_if_stored(self, fields=None):
         if self._dbmodel.is_saved():
             self._dbmodel._flush(fields)  # pylint: disable=protected-access
@@ -535,3 +585,52 @@ class DjangoNodeCollection(BackendNodeCollection):
             models.DbNode.objects.filter(pk=pk).delete()  # pylint: disable=no-member
         except ObjectDoesNotExist:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def store_many(self, nodes, links=None, with_transaction=True, clean=True):
+        """Store multiple nodes, and optionally links between them, using multi-row inserts.
+
+        :param nodes: a list of unstored `BackendNode` instances, which can be empty to only store links
+        :param links: optional list of tuples `(source, target, link_type, link_label)`, where `source` and `target` are
+            either already stored or part of `nodes`, to be stored after the nodes themselves
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored
+        :raise aiida.common.UniquenessError: if any of the links violates a database constraint
+        """
+        from aiida.common.lang import EmptyContextManager
+
+        for node in nodes:
+            type_check(node, self.ENTITY_CLASS)
+            if node.is_stored:
+                raise exceptions.ModificationNotAllowed('Node<{}> is already stored'.format(node.pk))
+
+        if not nodes and not links:
+            return nodes
+
+        dbmodels = [node.dbmodel for node in nodes]
+
+        if clean:
+            for node in nodes:
+                node.clean_values()
+
+        try:
+            with transaction.atomic() if with_transaction else EmptyContextManager():
+                # On PostgreSQL `bulk_create` sets the primary keys on the model instances, which are needed for links
+                models.DbNode.objects.bulk_create(dbmodels, batch_size=self.BULK_INSERT_BATCH_SIZE)
+
+                if links:
+                    dblinks = [
+                        models.DbLink(input_id=source.id, output_id=target.id, label=link_label, type=link_type.value)
+                        for source, target, link_type, link_label in links
+                    ]
+                    try:
+                        with transaction.atomic():
+                            models.DbLink.objects.bulk_create(dblinks, batch_size=self.BULK_INSERT_BATCH_SIZE)
+                    except IntegrityError as exception:
+                        raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+        except Exception:
+            for dbmodel in dbmodels:
+                dbmodel.pk = None
+            raise
+
+        return nodes
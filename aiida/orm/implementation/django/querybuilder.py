@@ -85,6 +85,10 @@ class DjangoQueryBuilder(BackendQueryBuilder):
     def Link(self):
         return djmodels.DbLink.sa
 
+    @property
+    def NodeClosure(self):
+        return djmodels.DbNodeClosure.sa
+
     @property
     def Computer(self):
         return djmodels.DbComputer.sa
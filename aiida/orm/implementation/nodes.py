@@ -393,6 +393,9 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
     ENTITY_CLASS = BackendNode
 
+    # Maximum number of rows that are inserted with a single statement by `store_many`
+    BULK_INSERT_BATCH_SIZE = 1000
+
     @abc.abstractmethod
     def get(self, pk):
         """Return a Node entry from the collection with the given id
@@ -406,3 +409,16 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    @abc.abstractmethod
+    def store_many(self, nodes, links=None, with_transaction=True, clean=True):
+        """Store multiple nodes, and optionally links between them, using multi-row inserts.
+
+        :param nodes: a list of unstored `BackendNode` instances, which can be empty to only store links
+        :param links: optional list of tuples `(source, target, link_type, link_label)`, where `source` and `target` are
+            either already stored or part of `nodes`, to be stored after the nodes themselves
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored
+        :raise aiida.common.UniquenessError: if any of the links violates a database constraint
+        """
@@ -13,6 +13,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 import abc
 import six
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from aiida.common import exceptions
 from aiida.common.lang import abstractclassmethod, type_check
@@ -21,6 +23,19 @@ from aiida.common.exceptions import InputValidationError
 __all__ = ('BackendQueryBuilder',)
 
 
+class Explain(Executable, ClauseElement):
+    """SQL construct that asks PostgreSQL for the plan of a statement, formatted as JSON, without executing it."""
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, 'postgresql')
+def _compile_explain(element, compiler, **kwargs):
+    """Compile the `Explain` construct, such that the parameters of the statement are bound as usual."""
+    return 'EXPLAIN (FORMAT JSON) {}'.format(compiler.process(element.statement, **kwargs))
+
+
 @six.add_metaclass(abc.ABCMeta)
 class BackendQueryBuilder(object):
     """Backend query builder interface"""
@@ -54,6 +69,12 @@ class BackendQueryBuilder(object):
         A property, decorated with @property. Returns the implementation for the DbLink
         """
 
+    @abc.abstractmethod
+    def NodeClosure(self):
+        """
+        A property, decorated with @property. Returns the implementation for the DbNodeClosure
+        """
+
     @abc.abstractmethod
     def Computer(self):
         """
@@ -97,6 +118,12 @@ class BackendQueryBuilder(object):
         relationship between group and nodes.
         """
 
+    def is_node_closure_enabled(self):
+        """
+        Return whether the transitive closure table of the provenance graph can be used for recursive joins.
+        """
+        return self._backend.query_manager.is_node_closure_enabled()
+
     @property
     def AiidaNode(self):
         """
@@ -247,6 +274,25 @@ class BackendQueryBuilder(object):
         :returns: the number of results
         """
 
+    def estimate_count(self, query):
+        """
+        :returns: the number of results as estimated by the query planner, without executing the query
+        """
+        from aiida.common import json
+
+        session = self.get_session()
+
+        try:
+            plan = session.execute(Explain(query.statement)).scalar()
+        except Exception:
+            session.rollback()
+            raise
+
+        if isinstance(plan, six.string_types):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
     @abc.abstractmethod
     def first(self, query):
         """
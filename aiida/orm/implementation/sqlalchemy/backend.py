@@ -104,6 +104,11 @@ class SqlaBackend(SqlBackend[base.Base]):
                 # Make sure to commit the outermost session
                 session.commit()
 
+    @staticmethod
+    def close_session():
+        """Close the database session of the current thread, releasing its connection to the database."""
+        get_scoped_session().remove()
+
     # Below are abstract methods inherited from `aiida.orm.implementation.sql.backends.SqlBackend`
 
     def get_backend_entity(self, model):
@@ -14,6 +14,7 @@ from __future__ import absolute_import
 
 # pylint: disable=no-name-in-module,import-error
 from datetime import datetime
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -181,6 +182,8 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the attribute does not exist and no default is specified
         """
         try:
+            if self.is_stored:
+                return self._get_stored_json_values('attributes', [key])[0]
             return self._dbmodel.attributes[key]
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
@@ -201,7 +204,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if at least one attribute does not exist
         """
         try:
-            return [self.get_attribute(key) for key in keys]
+            if self.is_stored:
+                return self._get_stored_json_values('attributes', keys)
+            return [self._dbmodel.attributes[key] for key in keys]
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
 
@@ -329,6 +334,8 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if the extra does not exist and no default is specified
         """
         try:
+            if self.is_stored:
+                return self._get_stored_json_values('extras', [key])[0]
             return self._dbmodel.extras[key]
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
@@ -349,7 +356,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         :raises AttributeError: if at least one extra does not exist
         """
         try:
-            return [self.get_extra(key) for key in keys]
+            if self.is_stored:
+                return self._get_stored_json_values('extras', keys)
+            return [self._dbmodel.extras[key] for key in keys]
         except KeyError as exception:
             raise AttributeError('extra `{}` does not exist'.format(exception))
 
@@ -444,6 +453,43 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key in self._dbmodel.extras.keys():
             yield key
 
+    def _get_stored_json_values(self, column, keys):
+        """Return the values of top-level keys of a JSONB column of the stored node, fetching only those values.
+
+        The values are selected with the `->` operator in a single query, such that the rest of the column is not
+        transferred from the database.
+
+        :param column: the name of the JSONB column, `attributes` or `extras`
+        :param keys: a list of top-level keys
+        :return: a list of values
+        :raises KeyError: if at least one of the keys does not exist
+        """
+        if not keys:
+            return []
+
+        # Within a transaction the model is not refreshed, so a column that was loaded with the node is read from memory
+        in_transaction = self._dbmodel._in_transaction()  # pylint: disable=protected-access
+        if in_transaction and column not in sa_inspect(self._dbmodel._model).unloaded:  # pylint: disable=protected-access
+            values = getattr(self._dbmodel, column)
+            return [values[key] for key in keys]
+
+        session = get_scoped_session()
+        field = getattr(models.DbNode, column)
+        projections = []
+
+        for key in keys:
+            projections.extend([field.has_key(key), field[key]])
+
+        row = session.query(*projections).filter(models.DbNode.id == self.id).one()
+        values = []
+
+        for key, exists, value in zip(keys, row[::2], row[1::2]):
+            if not exists:
+                raise KeyError(key)
+            values.append(value)
+
+        return values
+
     def _flag_field(self, field):
         from aiida.backends.sqlalchemy.utils import flag_modified
         flag_modified(self._dbmodel, field)
@@ -553,3 +599,88 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def store_many(self, nodes, links=None, with_transaction=True, clean=True):
+        """Store multiple nodes, and optionally links between them, using multi-row inserts.
+
+        The primary keys for the new nodes are reserved from the sequence of the node table in a single query, after
+        which the nodes and the links are inserted with one multi-row `INSERT` statement per batch.
+
+        :param nodes: a list of unstored `BackendNode` instances, which can be empty to only store links
+        :param links: optional list of tuples `(source, target, link_type, link_label)`, where `source` and `target` are
+            either already stored or part of `nodes`, to be stored after the nodes themselves
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :raise aiida.common.ModificationNotAllowed: if any of the nodes is already stored
+        :raise aiida.common.UniquenessError: if any of the links violates a database constraint
+        """
+        from sqlalchemy import text
+        from sqlalchemy.exc import IntegrityError
+        from sqlalchemy.orm import make_transient_to_detached
+        from aiida.backends.sqlalchemy.models.node import DbLink
+        from aiida.common import timezone
+        from aiida.common.utils import grouper
+
+        session = get_scoped_session()
+
+        for node in nodes:
+            type_check(node, self.ENTITY_CLASS)
+            if node.is_stored:
+                raise exceptions.ModificationNotAllowed('Node<{}> is already stored'.format(node.pk))
+
+        if not nodes and not links:
+            return nodes
+
+        dbmodels = [node.dbmodel for node in nodes]
+        node_table = models.DbNode.__table__
+        link_table = DbLink.__table__
+
+        try:
+            statement = text("SELECT nextval('db_dbnode_id_seq') FROM generate_series(1, :count)")
+            pks = [row[0] for row in session.execute(statement, {'count': len(nodes)})]
+            now = timezone.now()
+
+            for pk, node, dbmodel in zip(pks, nodes, dbmodels):
+                if clean:
+                    node.clean_values()
+                dbmodel.id = pk
+                dbmodel.user_id = dbmodel.user.id
+                dbmodel.dbcomputer_id = dbmodel.dbcomputer.id if dbmodel.dbcomputer is not None else None
+                if dbmodel.mtime is None:
+                    dbmodel.mtime = now
+
+            for batch in grouper(self.BULK_INSERT_BATCH_SIZE, dbmodels):
+                rows = [{column.key: getattr(dbmodel, column.key)
+                         for column in node_table.columns}
+                        for dbmodel in batch]
+                session.execute(node_table.insert().values(rows))
+
+            if links:
+                try:
+                    with session.begin_nested():
+                        for batch in grouper(self.BULK_INSERT_BATCH_SIZE, links):
+                            rows = [{
+                                'input_id': source.id,
+                                'output_id': target.id,
+                                'label': link_label,
+                                'type': link_type.value
+                            } for source, target, link_type, link_label in batch]
+                            session.execute(link_table.insert().values(rows))
+                except IntegrityError as exception:
+                    raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+
+            if with_transaction:
+                session.commit()
+        except Exception:
+            if with_transaction:
+                session.rollback()
+            for dbmodel in dbmodels:
+                dbmodel.id = None
+            raise
+
+        # The rows have been inserted directly, so the model instances are attached to the session as persistent
+        for dbmodel in dbmodels:
+            make_transient_to_detached(dbmodel)
+            session.add(dbmodel)
+
+        return nodes
@@ -14,6 +14,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import collections
+
 from ..data import Data
 
 
@@ -30,15 +32,20 @@ class ArrayData(Data):
       If instead the ArrayData node has already been stored,
       the array is cached in memory after the first read, and the cached array
       is used thereafter.
+      The cache holds at most ``array_cache_max_bytes`` bytes: the least
+      recently used arrays are evicted first and larger arrays are not cached.
       If too much RAM memory is used, you can clear the
       cache with the :py:meth:`.clear_internal_cache` method.
+      Large arrays can also be accessed without reading them in memory with
+      ``get_array(name, mmap=True)``.
     """
     array_prefix = 'array|'
+    array_cache_max_bytes = 256 * 1024**2
     _cached_arrays = None
 
     def initialize(self):
         super(ArrayData, self).initialize()
-        self._cached_arrays = {}
+        self._cached_arrays = collections.OrderedDict()
 
     def delete_array(self, name):
         """
@@ -101,33 +108,86 @@ class ArrayData(Data):
         for name in self.get_arraynames():
             yield (name, self.get_array(name))
 
-    def get_array(self, name):
+    def get_array(self, name, mmap=False):
         """
         Return an array stored in the node
 
         :param name: The name of the array to return.
+        :param mmap: if True, return a read-only ``numpy.memmap`` backed by the file in the repository, such that
+            only the parts of the array that are accessed are read from disk. Memory mapped arrays are not cached.
         """
         import numpy
 
-        def get_array_from_file(self, name):
-            """Return the array stored in a .npy file"""
-            filename = '{}.npy'.format(name)
+        # Return with proper caching if the node is stored, otherwise always re-read from disk
+        if not mmap and self.is_stored and name in self._cached_arrays:
+            array = self._cached_arrays.pop(name)
+            self._cached_arrays[name] = array  # Mark as the most recently used array
+            return array
 
-            if filename not in self.list_object_names():
-                raise KeyError('Array with name `{}` not found in ArrayData<{}>'.format(name, self.pk))
+        filename = '{}.npy'.format(name)
 
-            # Open a handle in binary read mode as the arrays are written as binary files as well
-            with self.open(filename, mode='rb') as handle:
-                return numpy.load(handle, allow_pickle=False)
+        if filename not in self.list_object_names():
+            raise KeyError('Array with name `{}` not found in ArrayData<{}>'.format(name, self.pk))
 
-        # Return with proper caching if the node is stored, otherwise always re-read from disk
-        if not self.is_stored:
-            return get_array_from_file(self, name)
+        if mmap:
+            return self._get_array_memmap(filename)
+
+        # Open a handle in binary read mode as the arrays are written as binary files as well
+        with self.open(filename, mode='rb') as handle:
+            array = numpy.load(handle, allow_pickle=False)
+
+        if self.is_stored:
+            self._cache_array(name, array)
+
+        return array
+
+    def _get_array_memmap(self, filename):
+        """
+        Return a read-only memory map of the array stored in the given .npy file of the repository.
+
+        :param filename: the name of the .npy file in the repository
+        """
+        import io
+        import numpy
+
+        filepath, position = self._repository.get_object_location(filename)  # pylint: disable=protected-access
+
+        with io.open(filepath, 'rb') as handle:
+            handle.seek(position)
+            version = numpy.lib.format.read_magic(handle)
+            if version == (1, 0):
+                shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(handle)
+            else:
+                shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(handle)
+            offset = handle.tell()
+
+        # Empty files cannot be memory mapped
+        if not numpy.prod(shape, dtype=int):
+            return numpy.empty(shape, dtype=dtype, order='F' if fortran_order else 'C')
+
+        return numpy.memmap(
+            filepath, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran_order else 'C'
+        )
+
+    def _cache_array(self, name, array):
+        """
+        Add an array to the internal memory cache, evicting the least recently used arrays to keep the total size of
+        the cached arrays below ``array_cache_max_bytes``. Arrays that are larger than that are not cached.
+
+        :param name: The name of the array.
+        :param array: The numpy array to cache.
+        """
+        if array.nbytes > self.array_cache_max_bytes:
+            return
+
+        self._cached_arrays.pop(name, None)
 
-        if name not in self._cached_arrays:
-            self._cached_arrays[name] = get_array_from_file(self, name)
+        cache_size = sum(cached.nbytes for cached in self._cached_arrays.values())
+        while self._cached_arrays and cache_size + array.nbytes > self.array_cache_max_bytes:
+            _, evicted = self._cached_arrays.popitem(last=False)
+            cache_size -= evicted.nbytes
 
-        return self._cached_arrays[name]
+        self._cached_arrays[name] = array
 
     def clear_internal_cache(self):
         """
@@ -137,7 +197,7 @@ class ArrayData(Data):
         This function is useful if you want to keep the node in memory, but you
         do not want to waste memory to cache the arrays in RAM.
         """
-        self._cached_arrays = {}
+        self._cached_arrays = collections.OrderedDict()
 
     def set_array(self, name, array):
         """
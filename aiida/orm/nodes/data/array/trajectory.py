@@ -343,6 +343,9 @@ class TrajectoryData(ArrayData):
            0 to ``self.numsteps - 1``.
         :raises IndexError: if you require an index beyond the limits.
         :raises KeyError: if you did not store the trajectory yet.
+
+        .. note:: the arrays are memory mapped, such that only the data of the
+           requested step is read from disk.
         """
         if index >= self.numsteps:
             raise IndexError(
@@ -350,16 +353,24 @@ class TrajectoryData(ArrayData):
                 ' (index={})'.format(self.numsteps, index)
             )
 
-        vel = self.get_velocities()
-        if vel is not None:
-            vel = vel[index, :, :]
-        time = self.get_times()
-        if time is not None:
-            time = time[index]
-        cells = self.get_cells()
-        if cells is not None:
-            cell = cells[index, :, :]
-        return (self.get_stepids()[index], time, cell, self.symbols, self.get_positions()[index, :, :], vel)
+        def get_step(name, optional=False):
+            """Return a copy of the data of the step in the given array, or None if an optional array was not set."""
+            import numpy
+
+            try:
+                value = self.get_array(name, mmap=True)[index]
+            except KeyError:
+                if optional:
+                    return None
+                raise
+
+            # Copy array slices, such that they are no longer backed by the file
+            return numpy.array(value) if isinstance(value, numpy.ndarray) else value
+
+        return (
+            get_step('steps'), get_step('times', optional=True), get_step('cells', optional=True), self.symbols,
+            get_step('positions'), get_step('velocities', optional=True)
+        )
 
     def get_step_structure(self, index, custom_kinds=None):
         """
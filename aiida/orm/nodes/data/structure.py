@@ -22,6 +22,11 @@ from functools import reduce
 import six
 from six.moves import range, zip
 
+try:
+    from collections.abc import Sequence  # only works on python 3.3+
+except ImportError:
+    from collections import Sequence
+
 from .data import Data
 from aiida.common.constants import elements
 from aiida.common.exceptions import UnsupportedSpeciesError
@@ -569,6 +574,31 @@ def get_symbols_string(symbols, weights):
         return '{{{}}}'.format(''.join(sorted(pieces)))
 
 
+def get_site_symbols_from_attributes(kinds, sites=None, kind_site_counts=None):
+    """
+    Return the symbols string of the kind of each site, from the attributes of a stored StructureData.
+
+    This allows to compute the formula of structures that are listed with a query, without loading the nodes. The sites
+    of a structure in compact form are not in its attributes, in which case its ``kind_site_counts`` attribute is used,
+    such that the symbols of the sites are grouped by kind.
+
+    :param kinds: the ``kinds`` attribute
+    :param sites: the ``sites`` attribute, None if the sites are stored in compact form
+    :param kind_site_counts: the ``kind_site_counts`` attribute, the number of sites of each kind in compact form
+    :return: a list of strings
+    :raise KeyError: if a site has a kind that is not defined, or if neither the sites nor their counts are defined
+    """
+    symbols = {kind['name']: get_symbols_string(kind['symbols'], kind['weights']) for kind in kinds}
+
+    if sites is not None:
+        return [symbols[site['kind_name']] for site in sites]
+
+    if kind_site_counts is not None:
+        return [symbols[kind['name']] for kind, count in zip(kinds, kind_site_counts) for _ in range(count)]
+
+    raise KeyError('sites')
+
+
 def has_vacancies(weights):
     """
     Returns True if the sum of the weights is less than one.
@@ -707,12 +737,72 @@ def atom_kinds_to_html(atom_kind):
     return html_formula
 
 
+def _get_ase_tags(kinds):
+    """
+    Return the list of the ASE tags of the given kinds, None for the kinds that need no tag.
+
+    A kind gets a tag if its name differs from its chemical symbol: the digit following the symbol in the name if
+    there is one, otherwise a new integer that is not yet used for that symbol.
+
+    :param kinds: the list of kinds from the StructureData object.
+    """
+    from collections import defaultdict
+
+    # I create the list of tags
+    tag_list = []
+    used_tags = defaultdict(list)
+    for k in kinds:
+        # Skip alloys and vacancies
+        if k.is_alloy or k.has_vacancies:
+            tag_list.append(None)
+        # If the kind name is equal to the specie name,
+        # then no tag should be set
+        elif six.text_type(k.name) == six.text_type(k.symbols[0]):
+            tag_list.append(None)
+        else:
+            # Name is not the specie name
+            if k.name.startswith(k.symbols[0]):
+                try:
+                    new_tag = int(k.name[len(k.symbols[0])])
+                    tag_list.append(new_tag)
+                    used_tags[k.symbols[0]].append(new_tag)
+                    continue
+                except ValueError:
+                    pass
+            tag_list.append(k.symbols[0])  # I use a string as a placeholder
+
+    for i in range(len(tag_list)):
+        # If it is a string, it is the name of the element,
+        # and I have to generate a new integer for this element
+        # and replace tag_list[i] with this new integer
+        if isinstance(tag_list[i], six.string_types):
+            # I get a list of used tags for this element
+            existing_tags = used_tags[tag_list[i]]
+            if existing_tags:
+                new_tag = max(existing_tags) + 1
+            else:  # empty list
+                new_tag = 1
+            # I store it also as a used tag!
+            used_tags[tag_list[i]].append(new_tag)
+            # I update the tag
+            tag_list[i] = new_tag
+
+    return tag_list
+
+
 class StructureData(Data):
     """
     This class contains the information about a given structure, i.e. a
     collection of sites together with a cell, the
     boundary conditions (whether they are periodic or not) and other
     related useful information.
+
+    By default the sites are stored as a list of dictionaries in the attributes. For large structures, the sites can
+    instead be stored in a compact form, see :py:meth:`.set_compact_sites`: the positions as an array of shape (N, 3)
+    and the indices of the kinds of the sites as an array of shape (N,), both written as .npy files in the repository
+    as for :py:class:`~aiida.orm.nodes.data.array.array.ArrayData`. The ``sites`` property then is a read-only view
+    that creates the ``Site`` objects on access, while :py:meth:`.get_positions` and :py:meth:`.get_kind_indices`
+    return the arrays directly.
     """
     _set_incompatibilities = [('ase', 'cell'), ('ase', 'pbc'), ('ase', 'pymatgen'), ('ase', 'pymatgen_molecule'),
                               ('ase', 'pymatgen_structure'), ('cell', 'pymatgen'), ('cell', 'pymatgen_molecule'),
@@ -722,7 +812,12 @@ class StructureData(Data):
 
     _dimensionality_label = {0: '', 1: 'length', 2: 'surface', 3: 'volume'}
 
-    def __init__(self, cell=None, pbc=None, ase=None, pymatgen=None, pymatgen_structure=None, pymatgen_molecule=None, **kwargs):
+    array_prefix = 'array|'
+    _site_array_names = ('positions', 'kind_indices')
+    _site_arrays = None
+
+    def __init__(self, cell=None, pbc=None, ase=None, pymatgen=None, pymatgen_structure=None, pymatgen_molecule=None,
+                 compact_sites=False, **kwargs):
 
         args = {
             'cell': cell,
@@ -739,6 +834,9 @@ class StructureData(Data):
 
         super(StructureData, self).__init__(**kwargs)
 
+        if compact_sites:
+            self.set_compact_sites()
+
         if any([ext is not None for ext in [ase, pymatgen, pymatgen_structure, pymatgen_molecule]]):
 
             if ase is not None:
@@ -947,18 +1045,34 @@ class StructureData(Data):
                 raise ValidationError("Kind with name '{}' appears {} times "
                                       'instead of only one'.format(c, counts[c]))
 
-        try:
-            # This will try to create the sites objects
-            sites = self.sites
-        except ValueError as exc:
-            raise ValidationError('Unable to validate the sites: {}'.format(exc))
+        kind_names = set(k.name for k in kinds)
 
-        for site in sites:
-            if site.kind_name not in [k.name for k in kinds]:
+        if self.is_compact:
+            # The sites are kept in memory while the node is unstored, so they are written to the repository here
+            self._write_site_arrays()
+
+            kind_indices = self.get_kind_indices()
+            if len(kind_indices) != len(self.get_positions()):
+                raise ValidationError('The number of kind indices and positions of the sites differ')
+            if len(kind_indices) and (kind_indices.min() < 0 or kind_indices.max() >= len(kinds)):
+                raise ValidationError('A site has a kind index that does not refer to any of the {} kinds'
+                                      ''.format(len(kinds)))
+
+            site_kind_names = set(self.get_site_kindnames())
+        else:
+            try:
+                # This will try to create the sites objects
+                sites = self.sites
+            except ValueError as exc:
+                raise ValidationError('Unable to validate the sites: {}'.format(exc))
+
+            site_kind_names = set(s.kind_name for s in sites)
+
+            for kind_name in site_kind_names - kind_names:
                 raise ValidationError('A site has kind {}, but no specie with that name exists'
-                                      ''.format(site.kind_name))
+                                      ''.format(kind_name))
 
-        kinds_without_sites = (set(k.name for k in kinds) - set(s.kind_name for s in sites))
+        kinds_without_sites = kind_names - site_kind_names
         if kinds_without_sites:
             raise ValidationError('The following kinds are defined, but there '
                                   'are no sites with that kind: {}'.format(list(kinds_without_sites)))
@@ -1007,7 +1121,8 @@ class StructureData(Data):
 
         # Get cell vectors and atomic position
         lattice_vectors = np.array(self.get_attribute('cell'))
-        base_sites = self.get_attribute('sites')
+        base_positions = self.get_positions().tolist()
+        base_kind_names = self.get_site_kindnames()
 
         start1 = -int(supercell_factors[0] / 2)
         start2 = -int(supercell_factors[1] / 2)
@@ -1027,18 +1142,17 @@ class StructureData(Data):
         center = (lattice_vectors[0] + lattice_vectors[1] + lattice_vectors[2]) / 2.
 
         for ix, iy, iz in product(grid1, grid2, grid3):
-            for base_site in base_sites:
+            for position, kind_name in zip(base_positions, base_kind_names):
                 shift = (ix * lattice_vectors[0] + iy * lattice_vectors[1] + \
                          iz * lattice_vectors[2] - center).tolist()
 
-                kind_name = base_site['kind_name']
                 kind_string = self.get_kind(kind_name).get_symbols_string()
 
                 atoms_json.append({
                     'l': kind_string,
-                    'x': base_site['position'][0] + shift[0],
-                    'y': base_site['position'][1] + shift[1],
-                    'z': base_site['position'][2] + shift[2],
+                    'x': position[0] + shift[0],
+                    'y': position[1] + shift[1],
+                    'z': position[2] + shift[2],
                     # 'atomic_elements_html': kind_string
                     'atomic_elements_html': atom_kinds_to_html(kind_string)
                 })
@@ -1124,14 +1238,13 @@ class StructureData(Data):
         self.set_pbc(pbc)
 
         # Calculating the minimal cell:
-        positions = np.array([site.position for site in self.sites])
+        positions = self.get_positions()
         position_min, position_max = get_extremas_from_positions(positions)
 
         # Translate the structure to the origin, such that the minimal values in each dimension
         # amount to (0,0,0)
         positions -= position_min
-        for index, site in enumerate(self.get_attribute('sites')):
-            site['position'] = list(positions[index])
+        self.reset_sites_positions(positions)
 
         # The orthorhombic cell that (just) accomodates the whole structure is now given by the
         # extremas of position in each dimension:
@@ -1211,7 +1324,7 @@ class StructureData(Data):
             used to group and/or order the symbols in the formula
         """
 
-        symbol_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
+        symbol_list = self._get_site_symbols()
 
         return get_formula(symbol_list, mode=mode, separator=separator)
 
@@ -1226,7 +1339,21 @@ class StructureData(Data):
 
         :return: a list of strings
         """
-        return [this_site.kind_name for this_site in self.sites]
+        if self.is_compact:
+            kind_names = self.get_kind_names()
+            return [kind_names[index] for index in self.get_kind_indices().tolist()]
+
+        return [raw_site['kind_name'] for raw_site in self.get_attribute('sites', [])]
+
+    def _get_site_symbols(self):
+        """
+        Return a list with the symbols string of the kind of each site, see :py:meth:`Kind.get_symbols_string`.
+        """
+        symbols = {kind.name: kind.get_symbols_string() for kind in self.kinds}
+        try:
+            return [symbols[kind_name] for kind_name in self.get_site_kindnames()]
+        except KeyError as exception:
+            raise ValueError("Kind name '{}' unknown".format(exception.args[0]))
 
     def get_composition(self):
         """
@@ -1238,7 +1365,7 @@ class StructureData(Data):
 
         :returns: a dictionary with the composition
         """
-        symbols_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
+        symbols_list = self._get_site_symbols()
         composition = {symbol: symbols_list.count(symbol) for symbol in set(symbols_list)}
         return composition
 
@@ -1326,7 +1453,7 @@ class StructureData(Data):
 
         new_kind = Kind(kind=kind)  # So we make a copy
 
-        if kind.name in [k.name for k in self.kinds]:
+        if kind.name in self.get_kind_names():
             raise ValueError('A kind with the same name ({}) already exists.'.format(kind.name))
 
         # If here, no exceptions have been raised, so I add the site.
@@ -1351,13 +1478,19 @@ class StructureData(Data):
             raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
 
         new_site = Site(site=site)  # So we make a copy
+        kind_names = self.get_kind_names()
 
-        if site.kind_name not in [k.name for k in self.kinds]:
+        if site.kind_name not in kind_names:
             raise ValueError("No kind with name '{}', available kinds are: "
-                             '{}'.format(site.kind_name, [k.name for k in self.kinds]))
+                             '{}'.format(site.kind_name, kind_names))
 
         # If here, no exceptions have been raised, so I add the site.
-        self.attributes.setdefault('sites', []).append(new_site.get_raw())
+        if self.is_compact:
+            site_arrays = self._get_site_arrays()
+            site_arrays['positions'].append(list(new_site.position))
+            site_arrays['kind_indices'].append(kind_names.index(new_site.kind_name))
+        else:
+            self.attributes.setdefault('sites', []).append(new_site.get_raw())
 
     def append_atom(self, **kwargs):
         """
@@ -1483,19 +1616,190 @@ class StructureData(Data):
         if self.is_stored:
             raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
 
-        self.set_attribute('sites', [])
+        if self.is_compact:
+            self._site_arrays = {name: [] for name in self._site_array_names}
+        else:
+            self.set_attribute('sites', [])
 
     @property
     def sites(self):
         """
         Returns a list of sites.
+
+        .. note:: if the sites are stored in compact form, this is a read-only sequence that creates the ``Site``
+            objects only when they are accessed.
         """
+        if self.is_compact:
+            site_arrays = self._get_site_arrays()
+            return _CompactSites(site_arrays['positions'], site_arrays['kind_indices'], self.get_kind_names())
+
         try:
             raw_sites = self.get_attribute('sites')
         except AttributeError:
             raw_sites = []
         return [Site(raw=i) for i in raw_sites]
 
+    @property
+    def is_compact(self):
+        """
+        Return whether the sites are stored in compact form, as arrays in the repository, see
+        :py:meth:`.set_compact_sites`.
+        """
+        return self.get_attribute('{}positions'.format(self.array_prefix), None) is not None
+
+    def set_compact_sites(self, compact=True):
+        """
+        Choose whether the sites are stored in compact form or as a list of dictionaries in the attributes.
+
+        In compact form, the positions of the sites are stored as an array of shape (N, 3) and the indices of their
+        kinds in ``self.kinds`` as an integer array of shape (N,). The arrays are written to the repository as .npy
+        files when the node is stored, and their shapes are stored in the ``array|positions`` and
+        ``array|kind_indices`` attributes, as for ``ArrayData``. The sites that are already defined are converted.
+
+        :param compact: if True store the sites in compact form, otherwise in the attributes.
+        :raises aiida.common.ModificationNotAllowed: if object is stored already
+        """
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
+
+        if compact == self.is_compact:
+            return
+
+        kind_names = self.get_kind_names()
+
+        if compact:
+            raw_sites = self.get_attribute('sites', [])
+            indices = {kind_name: index for index, kind_name in enumerate(kind_names)}
+            self._site_arrays = {
+                'positions': [list(raw_site['position']) for raw_site in raw_sites],
+                'kind_indices': [indices[raw_site['kind_name']] for raw_site in raw_sites],
+            }
+            if 'sites' in self.attributes:
+                self.delete_attribute('sites')
+            # The shapes are updated when the arrays are written to the repository, before storing
+            self.set_attribute('{}positions'.format(self.array_prefix), [len(raw_sites), 3])
+            self.set_attribute('{}kind_indices'.format(self.array_prefix), [len(raw_sites)])
+        else:
+            site_arrays = self._get_site_arrays()
+            raw_sites = [{
+                'position': list(position),
+                'kind_name': kind_names[index]
+            } for position, index in zip(site_arrays['positions'], site_arrays['kind_indices'])]
+
+            for name in self._site_array_names:
+                filename = '{}.npy'.format(name)
+                if filename in self.list_object_names():
+                    self.delete_object(filename)
+                self.delete_attribute('{}{}'.format(self.array_prefix, name))
+
+            if 'kind_site_counts' in self.attributes:
+                self.delete_attribute('kind_site_counts')
+
+            self._site_arrays = None
+            self.set_attribute('sites', raw_sites)
+
+    def get_positions(self):
+        """
+        Return the positions of the sites, in angstrom.
+
+        :return: a float array of shape (N, 3), with N the number of sites
+        """
+        import numpy
+
+        if self.is_compact:
+            positions = self._get_site_arrays()['positions']
+        else:
+            positions = [raw_site['position'] for raw_site in self.get_attribute('sites', [])]
+
+        return numpy.array(positions, dtype=float).reshape(-1, 3)
+
+    def get_kind_indices(self):
+        """
+        Return the index in ``self.kinds`` of the kind of each site.
+
+        :return: an integer array of shape (N,), with N the number of sites
+        :raise: ValueError if the kind of a site is not present.
+        """
+        import numpy
+
+        if self.is_compact:
+            return numpy.array(self._get_site_arrays()['kind_indices'], dtype=int)
+
+        indices = {kind_name: index for index, kind_name in enumerate(self.get_kind_names())}
+
+        try:
+            return numpy.array([indices[kind_name] for kind_name in self.get_site_kindnames()], dtype=int)
+        except KeyError as exception:
+            raise ValueError("Kind name '{}' unknown".format(exception.args[0]))
+
+    def _get_site_arrays(self):
+        """
+        Return a dictionary with the ``positions`` and ``kind_indices`` of the sites stored in compact form.
+
+        While the node is unstored, the values are lists that can be extended and that are only written to the
+        repository upon validation. Once the node is stored, they are the arrays read from the repository, which are
+        cached in memory after the first read.
+        """
+        import numpy
+
+        if self._site_arrays is None:
+            site_arrays = {}
+            for name in self._site_array_names:
+                # Open a handle in binary read mode as the arrays are written as binary files as well
+                with self.open('{}.npy'.format(name), mode='rb') as handle:
+                    site_arrays[name] = numpy.load(handle, allow_pickle=False)
+
+            if not self.is_stored:
+                site_arrays = {name: array.tolist() for name, array in site_arrays.items()}
+
+            self._site_arrays = site_arrays
+
+        return self._site_arrays
+
+    def _write_site_arrays(self):
+        """
+        Write the sites stored in compact form to the repository, together with the shapes of their arrays.
+        """
+        import tempfile
+        import numpy
+
+        site_arrays = self._get_site_arrays()
+        arrays = {
+            'positions': numpy.array(site_arrays['positions'], dtype=float).reshape(-1, 3),
+            'kind_indices': numpy.array(site_arrays['kind_indices'], dtype=int),
+        }
+
+        for name, array in arrays.items():
+            # Write the array to a temporary file, and then add it to the repository of the node
+            with tempfile.NamedTemporaryFile() as handle:
+                numpy.save(handle, array, allow_pickle=False)
+
+                # Flush and rewind the handle, otherwise the command to store it in the repo will write an empty file
+                handle.flush()
+                handle.seek(0)
+
+                self.put_object_from_filelike(handle, '{}.npy'.format(name), mode='wb', encoding=None)
+
+            self.set_attribute('{}{}'.format(self.array_prefix, name), list(array.shape))
+
+        # The number of sites of each kind allows to compute the formula from the attributes only, as done by the
+        # queries that list structures, see `get_site_symbols_from_attributes`
+        counts = numpy.bincount(arrays['kind_indices'], minlength=len(self.get_kind_names()))
+        self.set_attribute('kind_site_counts', counts.tolist())
+
+    def clone(self):
+        """
+        Create a clone of the StructureData node.
+
+        :returns: an unstored clone of this StructureData node
+        """
+        if self.is_compact and not self.is_stored:
+            self._write_site_arrays()
+
+        return super(StructureData, self).clone()
+
     @property
     def kinds(self):
         """
@@ -1600,6 +1904,7 @@ class StructureData(Data):
             given in the same order of the one it's substituting, i.e. the
             kind of the site will not be checked.
         """
+        import numpy
         from aiida.common.exceptions import ModificationNotAllowed
 
         if self.is_stored:
@@ -1611,29 +1916,24 @@ class StructureData(Data):
         else:
 
             # test consistency of th enew input
-            n_sites = len(self.sites)
+            n_sites = len(self.get_site_kindnames())
             if n_sites != len(new_positions) and conserve_particle:
                 raise ValueError('the new positions should be as many as the previous structure.')
 
-            new_sites = []
-            for i in range(n_sites):
-                try:
-                    this_pos = [float(j) for j in new_positions[i]]
-                except ValueError:
-                    raise ValueError('Expecting a list of floats. Found instead {}'.format(new_positions[i]))
-
-                if len(this_pos) != 3:
-                    raise ValueError('Expecting a list of lists of length 3. found instead {}'.format(len(this_pos)))
+            try:
+                positions = numpy.array(new_positions, dtype=float)
+            except (ValueError, TypeError):
+                raise ValueError('Expecting a list of lists of floats. Found instead {}'.format(new_positions))
 
-                # now append this Site to the new_site list.
-                new_site = Site(site=self.sites[i])  # So we make a copy
-                new_site.position = copy.deepcopy(this_pos)
-                new_sites.append(new_site)
+            if n_sites and (positions.ndim != 2 or positions.shape[1] != 3):
+                raise ValueError('Expecting a list of lists of length 3. found instead {}'.format(positions.shape))
 
-            # now clear the old sites, and substitute with the new ones
-            self.clear_sites()
-            for this_new_site in new_sites:
-                self.append_site(this_new_site)
+            # now substitute the positions of the old sites with the new ones
+            if self.is_compact:
+                self._get_site_arrays()['positions'] = positions.tolist()
+            else:
+                for raw_site, position in zip(self.get_attribute('sites', []), positions.tolist()):
+                    raw_site['position'] = position
 
     @property
     def pbc(self):
@@ -1762,10 +2062,10 @@ class StructureData(Data):
         """
         from phonopy.structure.atoms import Atoms as PhonopyAtoms
 
-        atoms = PhonopyAtoms(symbols=[_.kind_name for _ in self.sites])
+        atoms = PhonopyAtoms(symbols=self.get_site_kindnames())
         # Phonopy internally uses scaled positions, so you must store cell first!
         atoms.set_cell(self.cell)
-        atoms.set_positions([_.position for _ in self.sites])
+        atoms.set_positions(self.get_positions())
 
         return atoms
 
@@ -1778,13 +2078,27 @@ class StructureData(Data):
         :return: an ase.Atoms object
         """
         import ase
+        import numpy
 
-        asecell = ase.Atoms(cell=self.cell, pbc=self.pbc)
-        _kinds = self.kinds
+        kinds = self.kinds
+        tags = _get_ase_tags(kinds)
+        kind_indices = self.get_kind_indices()
+
+        for index in set(kind_indices.tolist()):
+            if kinds[index].is_alloy or kinds[index].has_vacancies:
+                raise ValueError('Cannot convert to ASE if the kind represents an alloy or it has vacancies.')
 
-        for site in self.sites:
-            asecell.append(site.get_ase(kinds=_kinds))
-        return asecell
+        symbols = [str(kinds[index].symbols[0]) for index in kind_indices.tolist()]
+        masses = numpy.array([kind.mass for kind in kinds], dtype=float)[kind_indices]
+        tags = numpy.array([tag or 0 for tag in tags], dtype=int)[kind_indices]
+
+        return ase.Atoms(
+            symbols=symbols,
+            positions=self.get_positions(),
+            masses=masses,
+            tags=tags,
+            cell=self.cell,
+            pbc=self.pbc)
 
     def _get_object_pymatgen(self, **kwargs):
         """
@@ -1865,7 +2179,7 @@ class StructureData(Data):
         if kwargs:
             raise ValueError('Unrecognized parameters passed to pymatgen converter: {}'.format(kwargs.keys()))
 
-        positions = [list(x.position) for x in self.sites]
+        positions = self.get_positions().tolist()
         return Structure(self.cell, species, positions, coords_are_cartesian=True, **additional_kwargs)
 
     def _get_object_pymatgen_molecule(self, **kwargs):
@@ -1891,7 +2205,7 @@ class StructureData(Data):
             k = self.get_kind(s.kind_name)
             species.append({s: w for s, w in zip(k.symbols, k.weights)})
 
-        positions = [list(x.position) for x in self.sites]
+        positions = self.get_positions().tolist()
         return Molecule(species, positions)
 
 
@@ -2340,47 +2654,9 @@ class Site(object):
         .. note:: If any site is an alloy or has vacancies, a ValueError
             is raised (from the site.get_ase() routine).
         """
-        from collections import defaultdict
         import ase
 
-        # I create the list of tags
-        tag_list = []
-        used_tags = defaultdict(list)
-        for k in kinds:
-            # Skip alloys and vacancies
-            if k.is_alloy or k.has_vacancies:
-                tag_list.append(None)
-            # If the kind name is equal to the specie name,
-            # then no tag should be set
-            elif six.text_type(k.name) == six.text_type(k.symbols[0]):
-                tag_list.append(None)
-            else:
-                # Name is not the specie name
-                if k.name.startswith(k.symbols[0]):
-                    try:
-                        new_tag = int(k.name[len(k.symbols[0])])
-                        tag_list.append(new_tag)
-                        used_tags[k.symbols[0]].append(new_tag)
-                        continue
-                    except ValueError:
-                        pass
-                tag_list.append(k.symbols[0])  # I use a string as a placeholder
-
-        for i in range(len(tag_list)):
-            # If it is a string, it is the name of the element,
-            # and I have to generate a new integer for this element
-            # and replace tag_list[i] with this new integer
-            if isinstance(tag_list[i], six.string_types):
-                # I get a list of used tags for this element
-                existing_tags = used_tags[tag_list[i]]
-                if existing_tags:
-                    new_tag = max(existing_tags) + 1
-                else:  # empty list
-                    new_tag = 1
-                # I store it also as a used tag!
-                used_tags[tag_list[i]].append(new_tag)
-                # I update the tag
-                tag_list[i] = new_tag
+        tag_list = _get_ase_tags(kinds)
 
         found = False
         for k, t in zip(kinds, tag_list):
@@ -2446,5 +2722,34 @@ class Site(object):
         return "kind name '{}' @ {},{},{}".format(self.kind_name, self.position[0], self.position[1], self.position[2])
 
 
+class _CompactSites(Sequence):
+    """
+    Read-only sequence of the sites of a StructureData that stores its sites in compact form, which creates the
+    ``Site`` objects only when they are accessed.
+    """
+
+    def __init__(self, positions, kind_indices, kind_names):
+        """
+        :param positions: the positions of the sites, a list or array of shape (N, 3)
+        :param kind_indices: the indices of the kinds of the sites in ``kind_names``
+        :param kind_names: the list of the names of the kinds of the structure
+        """
+        self._positions = positions
+        self._kind_indices = kind_indices
+        self._kind_names = kind_names
+
+    def __len__(self):
+        return len(self._kind_indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return Site(kind_name=self._kind_names[self._kind_indices[index]], position=self._positions[index])
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 # get_structuredata_from_qeinput has been moved to:
 # aiida.tools.codespecific.quantumespresso.qeinputparser
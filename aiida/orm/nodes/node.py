@@ -25,7 +25,7 @@ from aiida.common.lang import classproperty, type_check
 from aiida.common.links import LinkType
 from aiida.common.warnings import AiidaDeprecationWarning
 from aiida.manage.manager import get_manager
-from aiida.orm.utils.links import LinkManager, LinkTriple
+from aiida.orm.utils.links import LinkManager, LinkTriple, validate_links_together
 from aiida.orm.utils.repository import Repository
 from aiida.orm.utils.node import AbstractNodeMeta, validate_attribute_extra_key
 
@@ -40,6 +40,9 @@ __all__ = ('Node',)
 
 _NO_DEFAULT = tuple()
 
+# Maximum number of threads used to move the sandbox folders into the repository when storing nodes in bulk
+REPOSITORY_STORE_WORKERS = 8
+
 
 @six.add_metaclass(AbstractNodeMeta)
 class Node(Entity):
@@ -76,10 +79,231 @@ class Node(Entity):
             if node.get_outgoing().all():
                 raise exceptions.InvalidOperation('cannot delete Node<{}> because it has output links'.format(node.pk))
 
+            from aiida.orm.utils.loaders import get_identity_map
+
             repository = node._repository  # pylint: disable=protected-access
             self._backend.nodes.delete(node_id)
+            get_identity_map(self._backend).remove(node.pk)
             repository.erase(force=True)
 
+        def store_many(self, nodes, links=None, with_transaction=True):
+            """Store multiple nodes, together with the links between them, with a minimal number of queries.
+
+            All unstored nodes are inserted with multi-row inserts in a single transaction, followed by the links from
+            their incoming link caches. The source nodes of those links have to be either stored already or be part of
+            `nodes`. The repository folders of the nodes are moved into the repository in parallel beforehand.
+
+            Additional links, for example between nodes that are both already stored, can be passed through `links`,
+            such that they are validated up front and inserted in the same transaction as the nodes.
+
+            .. note:: nodes for which caching is enabled need to be compared against the existing nodes one by one and
+                some node classes customize `store`, so if caching is enabled for any of the nodes, or any of them
+                overrides `store`, they are all stored individually through `Node.store` instead.
+
+            :param nodes: an iterable of nodes, nodes that are already stored are ignored
+            :param links: optional iterable of tuples `(source, target, link_type, link_label)` of links to add, where
+                `source` and `target` are either already stored or part of `nodes`
+            :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+            :return: the list of nodes
+            :raise aiida.common.StoringNotAllowed: if any of the nodes is not storable
+            :raise aiida.common.ModificationNotAllowed: if a source node of a cached link is not stored or in `nodes`
+            :raise ValueError: if any of the `links` is invalid or if the links violate a uniqueness constraint together
+            """
+            from aiida.manage.caching import get_use_cache
+
+            nodes = list(nodes)
+            unstored = []
+            batch = set()
+
+            for node in nodes:
+                if not node.is_stored and id(node) not in batch:
+                    unstored.append(node)
+                    batch.add(id(node))
+
+            for node in unstored:
+                if not node._storable:  # pylint: disable=protected-access
+                    raise exceptions.StoringNotAllowed(node._unstorable_message)  # pylint: disable=protected-access
+
+                node._validate()  # pylint: disable=protected-access
+
+                for link_triple in node._incoming_cache:  # pylint: disable=protected-access
+                    if not link_triple.node.is_stored and id(link_triple.node) not in batch:
+                        raise exceptions.ModificationNotAllowed(
+                            'Cannot store because source node of link triple {} is not stored'.format(link_triple)
+                        )
+
+            links = list(links or [])
+
+            for source, target, link_type, link_label in links:
+                for node in (source, target):
+                    if not node.is_stored and id(node) not in batch:
+                        raise exceptions.ModificationNotAllowed(
+                            'Cannot add link from {} to {} because Node<{}> is not stored'.format(source, target, node)
+                        )
+                target.validate_incoming(source, link_type, link_label)
+                source.validate_outgoing(target, link_type, link_label)
+
+            cached_links = [(link_triple.node, node, link_triple.link_type, link_triple.link_label)
+                            for node in unstored
+                            for link_triple in node._incoming_cache]  # pylint: disable=protected-access
+
+            # The links are only validated against existing links above, so also validate them against each other
+            validate_links_together(cached_links + links)
+
+            if any(self._overrides_store(node) or get_use_cache(identifier=node.process_type) for node in unstored):
+                self._store_individually(unstored, with_transaction=with_transaction)
+                self._store_links(links, with_transaction=with_transaction)
+                return nodes
+
+            # The values of all nodes are cleaned first, because the hash of a node can depend on its incoming nodes
+            for node in unstored:
+                node.backend_entity.clean_values()
+
+            # The hash of a node that cannot be computed before its incoming nodes are stored is set after storing
+            deferred = []
+
+            for node in unstored:
+                try:
+                    node_hash = make_hash(node._get_objects_to_hash())  # pylint: disable=protected-access
+                except exceptions.InvalidOperation:
+                    deferred.append(node)
+                    continue
+                except Exception:  # pylint: disable=broad-except
+                    node_hash = None
+                node.backend_entity.set_extra(_HASH_EXTRA_KEY, node_hash)
+
+            repositories = [node._repository for node in unstored]  # pylint: disable=protected-access
+            self._store_repositories(repositories)
+
+            try:
+                self._backend.nodes.store_many([node.backend_entity for node in unstored],
+                                               cached_links + links,
+                                               with_transaction=with_transaction,
+                                               clean=False)
+            except Exception:
+                # Put back the files in the sandbox folders since the transaction did not succeed
+                for repository in repositories:
+                    repository.restore()
+                raise
+
+            for node in unstored:
+                for link_triple in node._incoming_cache:  # pylint: disable=protected-access
+                    link_triple.node._prefetched_links.pop('outgoing', None)  # pylint: disable=protected-access
+                node._incoming_cache = list()  # pylint: disable=protected-access
+
+            self._clear_prefetched_links(links)
+
+            for node in deferred:
+                node.backend_entity.set_extra(_HASH_EXTRA_KEY, node.get_hash())
+
+            self._add_to_autogroup(unstored)
+
+            return nodes
+
+        def _store_links(self, links, with_transaction=True):
+            """Insert the given links, whose source and target nodes are all stored, with multi-row inserts.
+
+            :param links: a list of validated tuples `(source, target, link_type, link_label)`
+            """
+            if links:
+                self._backend.nodes.store_many([], links, with_transaction=with_transaction)
+                self._clear_prefetched_links(links)
+
+        @staticmethod
+        def _clear_prefetched_links(links):
+            """Clear the prefetched links of the source and target nodes of the given links, which are now outdated."""
+            for source, target, _, _ in links:
+                source._prefetched_links.pop('outgoing', None)  # pylint: disable=protected-access
+                target._prefetched_links.pop('incoming', None)  # pylint: disable=protected-access
+
+        @staticmethod
+        def _overrides_store(node):
+            """Return whether the class of the node, or one of its bases, overrides the `store` method of `Node`."""
+            for cls in type(node).__mro__:
+                if cls is Node:
+                    return False
+                if 'store' in vars(cls):
+                    return True
+            return False
+
+        @staticmethod
+        def _store_individually(nodes, with_transaction=True):
+            """Store the nodes one by one, making sure that the source nodes of cached links are stored first.
+
+            :param nodes: a list of unstored nodes whose unstored source nodes are all part of the list
+            """
+            pending = list(nodes)
+
+            while pending:
+                remaining = []
+                for node in pending:
+                    if all(link_triple.node.is_stored for link_triple in node._incoming_cache):  # pylint: disable=protected-access
+                        node.store(with_transaction=with_transaction)
+                    else:
+                        remaining.append(node)
+
+                if len(remaining) == len(pending):
+                    raise exceptions.ModificationNotAllowed('the cached links of the nodes contain a cycle')
+
+                pending = remaining
+
+        @staticmethod
+        def _store_repositories(repositories):
+            """Move the sandbox folders of the given repositories into the repository in parallel.
+
+            If any of the moves fails, the repositories that were already stored are restored before reraising.
+
+            :param repositories: a list of unstored `Repository` instances
+            """
+            from multiprocessing.pool import ThreadPool
+
+            def store(repository):
+                try:
+                    repository.store()
+                except Exception as exception:  # pylint: disable=broad-except
+                    return exception
+                return None
+
+            if not repositories:
+                return
+
+            pool = ThreadPool(min(len(repositories), REPOSITORY_STORE_WORKERS))
+            try:
+                errors = pool.map(store, repositories)
+            finally:
+                pool.close()
+                pool.join()
+
+            failures = [error for error in errors if error is not None]
+
+            if failures:
+                for repository, error in zip(repositories, errors):
+                    if error is None:
+                        repository.restore()
+                raise failures[0]
+
+        @staticmethod
+        def _add_to_autogroup(nodes):
+            """Add the nodes that are to be grouped to the current autogroup, if any, with a single call.
+
+            :param nodes: a list of stored nodes
+            """
+            from aiida.orm.autogroup import current_autogroup, Autogroup, VERDIAUTOGROUP_TYPE
+            from aiida.orm import Group
+
+            if current_autogroup is None:
+                return
+
+            if not isinstance(current_autogroup, Autogroup):
+                raise exceptions.ValidationError('`current_autogroup` is not of type `Autogroup`')
+
+            grouped = [node for node in nodes if current_autogroup.is_to_be_grouped(node)]
+            group_label = current_autogroup.get_group_name()
+
+            if grouped and group_label is not None:
+                group = Group.objects.get_or_create(label=group_label, type_string=VERDIAUTOGROUP_TYPE)[0]
+                group.add_nodes(grouped)
+
     # This will be set by the metaclass call
     _logger = None
 
@@ -102,6 +326,7 @@ class Node(Entity):
 
     # These are to be initialized in the `initialization` method
     _incoming_cache = None
+    _prefetched_links = None
     _repository = None
 
     @classmethod
@@ -154,6 +379,9 @@ class Node(Entity):
         # A cache of incoming links represented as a list of LinkTriples instances
         self._incoming_cache = list()
 
+        # Stored link triples per link direction, as filled by `aiida.orm.utils.prefetch`
+        self._prefetched_links = dict()
+
         # Calls the initialisation from the RepositoryMixin
         self._repository = Repository(uuid=self.uuid, is_stored=self.is_stored, base_path=self._repository_base_path)
 
@@ -782,6 +1010,8 @@ class Node(Entity):
 
         if self.is_stored and source.is_stored:
             self.backend_entity.add_incoming(source.backend_entity, link_type, link_label)
+            self._prefetched_links.pop('incoming', None)
+            source._prefetched_links.pop('outgoing', None)  # pylint: disable=protected-access
         else:
             self._add_incoming_cache(source, link_type, link_label)
 
@@ -866,6 +1096,11 @@ class Node(Entity):
         if link_type and not all([isinstance(t, LinkType) for t in link_type]):
             raise TypeError('link_type should be a LinkType or tuple of LinkType: got {}'.format(link_type))
 
+        if link_direction in self._prefetched_links:
+            return self._filter_prefetched_links(
+                link_direction, node_class, link_type, link_label_filter, only_uuid=only_uuid
+            )
+
         node_class = node_class or Node
         node_filters = {'id': {'==': self.id}}
         edge_filters = {}
@@ -899,6 +1134,35 @@ class Node(Entity):
 
         return [LinkTriple(entry[0], LinkType(entry[1]), entry[2]) for entry in builder.all()]
 
+    def _filter_prefetched_links(self, link_direction, node_class, link_type, link_label_filter, only_uuid=False):
+        """Return the prefetched link triples of the given direction that match the filters.
+
+        The filters have the same meaning as for `get_stored_link_triples` but are applied in Python on the link triples
+        that were loaded through `aiida.orm.utils.prefetch`.
+
+        :return: list of `LinkTriple` instances
+        """
+        node_class = node_class or Node
+        link_triples = []
+
+        for link_triple in self._prefetched_links[link_direction]:
+
+            if not isinstance(link_triple.node, node_class):
+                continue
+
+            if link_type and link_triple.link_type not in link_type:
+                continue
+
+            if link_label_filter and not sql_string_match(string=link_triple.link_label, pattern=link_label_filter):
+                continue
+
+            if only_uuid:
+                link_triple = LinkTriple(link_triple.node.uuid, link_triple.link_type, link_triple.link_label)
+
+            link_triples.append(link_triple)
+
+        return link_triples
+
     def get_incoming(self, node_class=None, link_type=(), link_label_filter=None, only_uuid=False):
         """Return a list of link triples that are (directly) incoming into this node.
 
@@ -964,10 +1228,13 @@ class Node(Entity):
     def store_all(self, with_transaction=True, use_cache=None):
         """Store the node, together with all input links.
 
-        Unstored nodes from cached incoming linkswill also be stored.
+        Unstored nodes from cached incoming linkswill also be stored. The nodes and the links are inserted together
+        with multi-row inserts through `Node.objects.store_many`.
 
         :parameter with_transaction: if False, do not use a transaction because the caller will already have opened one.
         """
+        from aiida.manage.caching import get_use_cache
+
         if use_cache is not None:
             warnings.warn(  # pylint: disable=no-member
                 'the `use_cache` argument is deprecated and will be removed in `v2.0.0`', AiidaDeprecationWarning
@@ -980,11 +1247,62 @@ class Node(Entity):
         for link_triple in self._incoming_cache:
             link_triple.node.verify_are_parents_stored()
 
-        for link_triple in self._incoming_cache:
-            if not link_triple.node.is_stored:
-                link_triple.node.store(with_transaction=with_transaction)
+        nodes = [link_triple.node for link_triple in self._incoming_cache if not link_triple.node.is_stored]
+
+        # Look for a node to cache from before anything is written, such that a cache hit costs a single transaction.
+        # On a miss this node is stored directly, because `store_many` would look for a node to cache from once more.
+        # Nodes whose class overrides `store`, like `UpfData`, can change their values there, so they are left to
+        # `store_many`, which calls their `store` method.
+        objects = Node.objects(self.backend)
+        overridden = [objects._overrides_store(node) for node in nodes + [self]]  # pylint: disable=protected-access
+
+        if self._cachable and self._storable and not any(overridden) and get_use_cache(identifier=self.process_type):
+            same_node = self._get_prospective_same_node(nodes)
+            self._store_all_from_cache(nodes, same_node, with_transaction=with_transaction)
+            return self
 
-        return self.store(with_transaction)
+        objects.store_many(nodes + [self], with_transaction=with_transaction)
+
+        return self
+
+    def _get_prospective_same_node(self, nodes):
+        """Return a stored node from which this node can be cached once it is stored together with the given nodes.
+
+        The hash of this node is computed as it will be once stored, for which this node and its unstored incoming
+        nodes are validated and their values cleaned, as storing them would. Validating can set attributes and write
+        to the repository, for example for a `StructureData` with compact sites.
+
+        :param nodes: the unstored source nodes of the cached incoming links of this node
+        :return: a stored `Node` instance with the same hash as this node or None
+        """
+        for node in nodes + [self]:
+            node._validate()  # pylint: disable=protected-access
+            node.backend_entity.clean_values()
+
+        return self._get_same_node()
+
+    def _store_all_from_cache(self, nodes, cache_node, with_transaction=True):
+        """Store the unstored incoming nodes and this node from an existing cache node, together with its outputs.
+
+        Without a cache node, this node is stored normally, its values having been cleaned by the lookup of the cache.
+
+        :param nodes: the unstored source nodes of the cached incoming links of this node
+        :param cache_node: the stored node to cache from, or None
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+        if with_transaction:
+            with self.backend.transaction():
+                self._store_all_from_cache(nodes, cache_node, with_transaction=False)
+            return
+
+        Node.objects(self.backend).store_many(nodes, with_transaction=False)
+
+        if cache_node is not None:
+            self._store_from_cache(cache_node, with_transaction=False)
+        else:
+            self._store(with_transaction=False, clean=False)
+
+        Node.objects(self.backend)._add_to_autogroup([self])  # pylint: disable=protected-access
 
     def store(self, with_transaction=True, use_cache=None):
         """Store the node in the database while saving its attributes and repository directory.
@@ -1065,6 +1383,9 @@ class Node(Entity):
             self._repository.restore()
             raise
 
+        for link_triple in self._incoming_cache:
+            link_triple.node._prefetched_links.pop('outgoing', None)  # pylint: disable=protected-access
+
         self._incoming_cache = list()
         self._backend_entity.set_extra(_HASH_EXTRA_KEY, self.get_hash())
 
@@ -1100,15 +1421,22 @@ class Node(Entity):
         self.put_object_from_tree(cache_node._repository._get_base_folder().abspath)  # pylint: disable=protected-access
 
         self._store(with_transaction=with_transaction, clean=False)
-        self._add_outputs_from_cache(cache_node)
+        self._add_outputs_from_cache(cache_node, with_transaction=with_transaction)
         self.set_extra('_aiida_cached_from', cache_node.uuid)
 
-    def _add_outputs_from_cache(self, cache_node):
-        """Replicate the output links and nodes from the cached node onto this node."""
+    def _add_outputs_from_cache(self, cache_node, with_transaction=True):
+        """Replicate the output links and nodes from the cached node onto this node.
+
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+        outputs = []
+
         for entry in cache_node.get_outgoing(link_type=LinkType.CREATE):
             new_node = entry.node.clone()
             new_node.add_incoming(self, link_type=LinkType.CREATE, link_label=entry.link_label)
-            new_node.store()
+            outputs.append(new_node)
+
+        Node.objects(self.backend).store_many(outputs, with_transaction=with_transaction)
 
     def get_hash(self, ignore_errors=True, **kwargs):
         """Return the hash for this node based on its attributes."""
@@ -1138,7 +1466,7 @@ class Node(Entity):
                 for key, val in self.attributes_items()
                 if key not in self._hash_ignored_attributes and key not in self._updatable_attributes  # pylint: disable=unsupported-membership-test
             },
-            self._repository._get_base_folder(),  # pylint: disable=protected-access
+            self._repository._get_folder_to_hash(),  # pylint: disable=protected-access
             self.computer.uuid if self.computer is not None else None
         ]
         return objects
@@ -122,7 +122,7 @@ class CalcJobNode(CalculationNode):
             },
             self.computer.uuid if self.computer is not None else None,  # pylint: disable=no-member
             {
-                entry.link_label: entry.node.get_hash()
+                entry.link_label: entry.node._get_hash()  # pylint: disable=protected-access
                 for entry in self.get_incoming(link_type=(LinkType.INPUT_CALC, LinkType.INPUT_WORK))
                 if entry.link_label not in self._hash_ignored_inputs
             }
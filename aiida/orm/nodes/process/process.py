@@ -491,7 +491,7 @@ class ProcessNode(Sealable, Node):
         """
         res = super(ProcessNode, self)._get_objects_to_hash()
         res.append({
-            entry.link_label: entry.node.get_hash()
+            entry.link_label: entry.node._get_hash()  # pylint: disable=protected-access
             for entry in self.get_incoming(link_type=(LinkType.INPUT_CALC, LinkType.INPUT_WORK))
             if entry.link_label not in self._hash_ignored_inputs
         })
@@ -28,9 +28,9 @@ import copy
 import logging
 import six
 from six.moves import range, zip
-from sqlalchemy import and_, or_, not_, func as sa_func, select, join
+from sqlalchemy import and_, or_, not_, func as sa_func, select, join, inspect as sa_inspect
 from sqlalchemy.types import Integer
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, Load
 from sqlalchemy.sql.expression import cast
 from sqlalchemy.dialects.postgresql import array
 
@@ -316,6 +316,10 @@ class QueryBuilder(object):
         :param order_by:
             How to order the results. As the 2 above, can be set also at later stage,
             check :func:`QueryBuilder.order_by` for more information.
+        :param bool defer_node_columns:
+            Whether the attributes and extras of nodes that are projected with '*' are only loaded from the database
+            when they are first accessed, which is the default. Pass False to load them with the rest of the row,
+            when most of the returned nodes will be accessed anyway.
 
         """
         backend = backend or get_manager().get_backend()
@@ -371,6 +375,9 @@ class QueryBuilder(object):
         # Check QueryBuilder.inject_query
         self._injected = False
 
+        # Whether the JSONB columns of nodes projected with '*' are deferred, see QueryBuilder._add_to_projections
+        self._defer_node_columns = kwargs.pop('defer_node_columns', True)
+
         # Setting debug levels:
         self.set_debug(kwargs.pop('debug', False))
 
@@ -421,7 +428,7 @@ class QueryBuilder(object):
         # I've gone through all the keywords, popping each item
         # If kwargs is not empty, there is a problem:
         if kwargs:
-            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by')
+            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by', 'defer_node_columns')
             raise InputValidationError('Received additional keywords: {}'
                                        '\nwhich I cannot process'
                                        '\nValid keywords are: {}'
@@ -1147,6 +1154,9 @@ class QueryBuilder(object):
                                            'will not work!\n'
                                            "I suggest you apply functions on a column, e.g. ('id')\n")
             self._query = self._query.add_entity(alias)
+            if self._defer_node_columns and sa_inspect(alias).mapper.class_ is self._impl.Node:
+                # The JSONB columns of nodes can be large, so they are only loaded when they are actually accessed
+                self._query = self._query.options(Load(alias).defer('attributes').defer('extras'))
         else:
             entity_to_project = self._get_projectable_entity(alias, column_name, attr_key, cast=cast)
             if func is None:
@@ -1375,6 +1385,29 @@ class QueryBuilder(object):
             entity_to_join, aliased_edge.input_id == entity_to_join.id, isouter=isouterjoin)
         return aliased_edge
 
+    def _join_node_closure(self, joined_entity, entity_to_join, isouterjoin, descendants=True):
+        """
+        Join ancestors or descendants through the materialized transitive closure table instead of a recursive query.
+
+        Contrary to the recursive query, which returns one row per path between two nodes, the closure table contains
+        a single entry for each pair of connected nodes, where the `depth` is that of the shortest path.
+
+        :param joined_entity: The (aliased) ORMclass that is the ancestor or descendant depending on `descendants`
+        :param entity_to_join: The (aliased) ORMClass that is to be joined
+        :param descendants: if True, **entity_to_join** is joined as a descendant of **joined_entity**, otherwise
+            as its ancestor
+        """
+        closure = aliased(self._impl.NodeClosure)
+
+        if descendants:
+            joined_column, to_join_column = closure.ancestor_id, closure.descendant_id
+        else:
+            joined_column, to_join_column = closure.descendant_id, closure.ancestor_id
+
+        self._query = self._query.join(closure, joined_column == joined_entity.id).join(
+            entity_to_join, to_join_column == entity_to_join.id, isouter=isouterjoin)
+        return closure
+
     def _join_descendants_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
         """
         joining descendants using the recursive functionality
@@ -1385,6 +1418,10 @@ class QueryBuilder(object):
         self._check_dbentities((joined_entity, self._impl.Node), (entity_to_join, self._impl.Node),
                                'with_ancestors')
 
+        # The closure table does not store the paths, so the recursive query is still needed to expand them
+        if not expand_path and self._impl.is_node_closure_enabled():
+            return self._join_node_closure(joined_entity, entity_to_join, isouterjoin, descendants=True)
+
         link1 = aliased(self._impl.Link)
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
@@ -1439,6 +1476,10 @@ class QueryBuilder(object):
         self._check_dbentities((joined_entity, self._impl.Node), (entity_to_join, self._impl.Node),
                                'with_ancestors')
 
+        # The closure table does not store the paths, so the recursive query is still needed to expand them
+        if not expand_path and self._impl.is_node_closure_enabled():
+            return self._join_node_closure(joined_entity, entity_to_join, isouterjoin, descendants=False)
+
         link1 = aliased(self._impl.Link)
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
@@ -2142,6 +2183,19 @@ class QueryBuilder(object):
         query = self.get_query()
         return self._impl.count(query)
 
+    def estimate_count(self):
+        """
+        Estimates the number of rows returned by the backend from the plan of the query planner.
+
+        The query is not executed, so the estimate is returned in constant time, whereas :meth:`.count` has to visit
+        every matching row. The estimate relies on the table statistics of the database and can be far off, especially
+        for filters on attributes and extras, so it should only be used where an approximate number suffices.
+
+        :returns: the estimated number of rows as an integer
+        """
+        query = self.get_query()
+        return self._impl.estimate_count(query)
+
     def iterall(self, batch_size=100):
         """
         Same as :meth:`.all`, but returns a generator.
@@ -14,7 +14,10 @@ from __future__ import absolute_import
 
 import six
 
-__all__ = ('load_code', 'load_computer', 'load_group', 'load_node')
+__all__ = ('load_code', 'load_computer', 'load_group', 'load_node', 'load_nodes', 'prefetch')
+
+# Maximum number of nodes whose links are loaded with a single query by `prefetch`
+PREFETCH_BATCH_SIZE = 1000
 
 
 def load_entity(
@@ -208,3 +211,75 @@ def load_node(identifier=None, pk=None, uuid=None, label=None, sub_classes=None,
         sub_classes=sub_classes,
         query_with_dashes=query_with_dashes
     )
+
+
+def load_nodes(identifiers, sub_classes=None, query_with_dashes=True):
+    """
+    Load multiple nodes by their identifiers: pks, uuids or the beginning of uuids, using a single query.
+
+    Identifiers that can only be interpreted as a label are loaded one by one. Nodes that were loaded before and are
+    still referenced are returned as the same instance.
+
+    :param identifiers: an iterable of pks (integer) or uuids (string)
+    :param sub_classes: an optional tuple of orm classes to narrow the queryset. Each class should be a strict sub class
+        of the ORM class of the given entity loader.
+    :param bool query_with_dashes: allow to query for a uuid with dashes
+    :returns: list of node instances, in the same order as the identifiers
+    :raise aiida.common.NotExistent: if no matching Node is found for one of the identifiers
+    :raise aiida.common.MultipleObjectsError: if more than one Node was found for one of the identifiers
+    """
+    from aiida.orm.utils.loaders import NodeEntityLoader
+    return NodeEntityLoader.load_entities(identifiers, sub_classes=sub_classes, query_with_dashes=query_with_dashes)
+
+
+def prefetch(nodes, incoming=True, outgoing=True):
+    """
+    Load the stored links of a collection of nodes with a few queries and cache them on each of the nodes.
+
+    Subsequent calls to `get_incoming` and `get_outgoing` of the nodes are answered from the cache, applying any filters
+    in Python, instead of running a query per node. The linked nodes are loaded with all their columns in the same query
+    and go through the identity map of `load_nodes`, such that a node that is linked to multiple nodes of the collection
+    is represented by a single instance. The cache of a node is invalidated when a link is added to or from it, but
+    links that are created or deleted through another node instance or by another process are not reflected.
+
+    :param nodes: an iterable of nodes, unstored nodes are ignored
+    :param incoming: boolean, if True, prefetch the incoming links
+    :param outgoing: boolean, if True, prefetch the outgoing links
+    :returns: the list of nodes
+    """
+    from aiida.common.links import LinkType
+    from aiida.common.utils import grouper
+    from aiida.orm import Node, QueryBuilder
+    from aiida.orm.utils.links import LinkTriple
+    from aiida.orm.utils.loaders import get_identity_map
+
+    nodes = list(nodes)
+    stored = [node for node in nodes if node.is_stored]
+    identity_map = get_identity_map()
+    pks = set(node.pk for node in stored)
+
+    directions = []
+
+    if incoming:
+        directions.append(('incoming', 'with_outgoing'))
+
+    if outgoing:
+        directions.append(('outgoing', 'with_incoming'))
+
+    for direction, relationship in directions:
+
+        link_triples = {pk: [] for pk in pks}
+
+        for chunk in grouper(PREFETCH_BATCH_SIZE, pks):
+            builder = QueryBuilder(defer_node_columns=False)
+            builder.append(Node, filters={'id': {'in': list(chunk)}}, project=['id'], tag='main')
+            builder.append(Node, project=['*'], edge_project=['type', 'label'], **{relationship: 'main'})
+
+            for pk, linked_node, link_type, link_label in builder.iterall():
+                link_triple = LinkTriple(identity_map.add(linked_node), LinkType(link_type), link_label)
+                link_triples[pk].append(link_triple)
+
+        for node in stored:
+            node._prefetched_links[direction] = list(link_triples[node.pk])  # pylint: disable=protected-access
+
+    return nodes
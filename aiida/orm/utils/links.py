@@ -16,12 +16,23 @@ from collections import namedtuple, OrderedDict, Mapping
 
 from aiida.common import exceptions
 from aiida.common.lang import type_check
+from aiida.common.links import LinkType
 
-__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link')
+__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link', 'validate_links_together')
 
 LinkPair = namedtuple('LinkPair', ['link_type', 'link_label'])
 LinkTriple = namedtuple('LinkTriple', ['node', 'link_type', 'link_label'])
 
+# The outdegree and indegree character of each link type, see `validate_link`
+LINK_DEGREES = {
+    LinkType.CALL_CALC: ('unique_triple', 'unique'),
+    LinkType.CALL_WORK: ('unique_triple', 'unique'),
+    LinkType.CREATE: ('unique_pair', 'unique'),
+    LinkType.INPUT_CALC: ('unique_triple', 'unique_pair'),
+    LinkType.INPUT_WORK: ('unique_triple', 'unique_pair'),
+    LinkType.RETURN: ('unique_pair', 'unique_triple'),
+}
+
 
 def link_triple_exists(source, target, link_type, link_label):
     """Return whether a link with the given type and label exists between the given source and target node.
@@ -115,7 +126,7 @@ def validate_link(source, target, link_type, link_label):
     :raise ValueError: if the proposed link is invalid
     """
     # yapf: disable
-    from aiida.common.links import LinkType, validate_link_label
+    from aiida.common.links import validate_link_label
     from aiida.orm import Node, Data, CalculationNode, WorkflowNode
 
     type_check(link_type, LinkType, 'link_type should be a LinkType enum but got: {}'.format(type(link_type)))
@@ -139,15 +150,16 @@ def validate_link(source, target, link_type, link_label):
     # type can be defined, as long as the link label is unique for the sub set of links of that type. Finally, for
     # `unique_triple` the triple of node, link type and link label has to be unique.
     link_mapping = {
-        LinkType.CALL_CALC: (WorkflowNode, CalculationNode, 'unique_triple', 'unique'),
-        LinkType.CALL_WORK: (WorkflowNode, WorkflowNode, 'unique_triple', 'unique'),
-        LinkType.CREATE: (CalculationNode, Data, 'unique_pair', 'unique'),
-        LinkType.INPUT_CALC: (Data, CalculationNode, 'unique_triple', 'unique_pair'),
-        LinkType.INPUT_WORK: (Data, WorkflowNode, 'unique_triple', 'unique_pair'),
-        LinkType.RETURN: (WorkflowNode, Data, 'unique_pair', 'unique_triple'),
+        LinkType.CALL_CALC: (WorkflowNode, CalculationNode),
+        LinkType.CALL_WORK: (WorkflowNode, WorkflowNode),
+        LinkType.CREATE: (CalculationNode, Data),
+        LinkType.INPUT_CALC: (Data, CalculationNode),
+        LinkType.INPUT_WORK: (Data, WorkflowNode),
+        LinkType.RETURN: (WorkflowNode, Data),
     }
 
-    type_source, type_target, outdegree, indegree = link_mapping[link_type]
+    type_source, type_target = link_mapping[link_type]
+    outdegree, indegree = LINK_DEGREES[link_type]
 
     if not isinstance(source, type_source) or not isinstance(target, type_target):
         raise ValueError('cannot add a {} link from {} to {}'.format(link_type, type(source), type(target)))
@@ -188,6 +200,44 @@ def validate_link(source, target, link_type, link_label):
             target.uuid, link_type, link_label, source.uuid))
 
 
+def validate_links_together(links):
+    """
+    Validate that a collection of new links, each of which is valid on its own, do not violate a uniqueness constraint
+    together.
+
+    `validate_link` only checks a link against the links that already exist, either stored or in the incoming link cache
+    of the target node. Two new links can therefore each be valid, while together they violate the indegree or outdegree
+    of their link type, for example two `CREATE` links into the same node or two `INPUT_CALC` links with the same label
+    into the same calculation.
+
+    :param links: iterable of tuples `(source, target, link_type, link_label)`
+    :raise ValueError: if two of the links violate the indegree or outdegree of their link type
+    """
+    keys = set()
+
+    for source, target, link_type, link_label in links:
+        outdegree, indegree = LINK_DEGREES[link_type]
+
+        for direction, node, other, degree in [('outgoing', source, target, outdegree),
+                                                ('incoming', target, source, indegree)]:
+            if degree == 'unique':
+                key = (direction, node.uuid, link_type)
+                message = 'node<{}> would have more than one {} {} link'.format(node.uuid, direction, link_type)
+            elif degree == 'unique_pair':
+                key = (direction, node.uuid, link_type, link_label)
+                message = 'node<{}> would have more than one {} {} link with label "{}"'.format(
+                    node.uuid, direction, link_type, link_label)
+            else:
+                key = (direction, node.uuid, link_type, link_label, other.uuid)
+                message = 'node<{}> would have more than one {} {} link with label "{}" and node<{}>'.format(
+                    node.uuid, direction, link_type, link_label, other.uuid)
+
+            if key in keys:
+                raise ValueError(message)
+
+            keys.add(key)
+
+
 class LinkManager(object):
     """
     Class to convert a list of LinkTriple tuples into an iterator.
@@ -12,6 +12,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import weakref
 from abc import ABCMeta
 from enum import Enum
 
@@ -22,8 +23,8 @@ from aiida.common.lang import abstractclassmethod, classproperty
 from aiida.orm.querybuilder import QueryBuilder
 
 __all__ = (
-    'get_loader', 'OrmEntityLoader', 'CalculationEntityLoader', 'CodeEntityLoader', 'ComputerEntityLoader',
-    'GroupEntityLoader', 'NodeEntityLoader'
+    'get_loader', 'get_identity_map', 'OrmEntityLoader', 'CalculationEntityLoader', 'CodeEntityLoader',
+    'ComputerEntityLoader', 'GroupEntityLoader', 'NodeEntityLoader'
 )
 
 
@@ -51,6 +52,69 @@ def get_loader(orm_class):
     raise ValueError('no OrmEntityLoader available for {}'.format(orm_class))
 
 
+class IdentityMap(object):
+    """
+    Map of loaded entities by their pk, which guarantees that an entity that is loaded multiple times is represented by
+    a single instance. Only weak references are kept, such that the map does not keep entities alive by itself.
+    """
+
+    def __init__(self):
+        self._entities = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, pk):
+        """
+        Return the entity with the given pk if it is in the map
+
+        :param pk: the pk of the entity
+        :returns: the entity or None if it is not in the map
+        """
+        return self._entities.get(pk)
+
+    def add(self, entity):
+        """
+        Add the entity to the map, unless the map already contains an instance for the same pk
+
+        :param entity: a stored entity
+        :returns: the instance that is in the map for the pk of the entity
+        """
+        return self._entities.setdefault(entity.pk, entity)
+
+    def remove(self, pk):
+        """
+        Remove the entity with the given pk from the map, for example because it was deleted
+
+        :param pk: the pk of the entity
+        """
+        self._entities.pop(pk, None)
+
+    def clear(self):
+        """Remove all entities from the map."""
+        self._entities.clear()
+
+
+_IDENTITY_MAPS = weakref.WeakKeyDictionary()
+
+
+def get_identity_map(backend=None):
+    """
+    Return the node identity map for the given backend, creating it if it does not yet exist.
+
+    :param backend: the backend, if not specified the backend of the currently loaded profile is used
+    :returns: the `IdentityMap` of the backend
+    """
+    from aiida.manage.manager import get_manager
+
+    backend = backend or get_manager().get_backend()
+
+    try:
+        return _IDENTITY_MAPS[backend]
+    except KeyError:
+        return _IDENTITY_MAPS.setdefault(backend, IdentityMap())
+
+
 class IdentifierType(Enum):
     """
     The enumeration that defines the three types of identifier that can be used to identify an orm entity.
@@ -123,6 +187,28 @@ class OrmEntityLoader(object):
         :param classes: a tuple of orm classes to which the identifier should be mapped
         :returns: the query builder instance
         """
+        uuid, is_complete = cls._normalize_uuid_identifier(identifier, query_with_dashes)
+
+        builder = QueryBuilder()
+        builder.append(cls=classes, tag='entity', project=['*'])
+
+        # If a UUID can be constructed from the identifier, it is a full UUID and the query can use an equality operator
+        if is_complete:
+            builder.add_filter('entity', {'uuid': uuid})
+        else:
+            builder.add_filter('entity', {'uuid': {'like': '{}%'.format(uuid)}})
+
+        return builder
+
+    @staticmethod
+    def _normalize_uuid_identifier(identifier, query_with_dashes):
+        """
+        Return the UUID identifier in the form in which it should be queried for and whether it is a complete UUID
+
+        :param identifier: the UUID identifier, which can be a partial UUID with or without dashes
+        :param query_with_dashes: whether to insert the dashes at the canonical positions of a UUID
+        :returns: tuple of the normalized UUID string and a boolean that is True if it represents a complete UUID
+        """
         from uuid import UUID
 
         uuid = identifier.replace('-', '')
@@ -132,18 +218,12 @@ class OrmEntityLoader(object):
                 if len(uuid) > dash_pos:
                     uuid = '{}-{}'.format(uuid[:dash_pos], uuid[dash_pos:])
 
-        builder = QueryBuilder()
-        builder.append(cls=classes, tag='entity', project=['*'])
-
-        # If a UUID can be constructed from the identifier, it is a full UUID and the query can use an equality operator
         try:
             UUID(uuid)
         except ValueError:
-            builder.add_filter('entity', {'uuid': {'like': '{}%'.format(uuid)}})
-        else:
-            builder.add_filter('entity', {'uuid': uuid})
+            return uuid, False
 
-        return builder
+        return uuid, True
 
     @classmethod
     def get_query_builder(
@@ -201,6 +281,8 @@ class OrmEntityLoader(object):
         """
         Load an entity that uniquely corresponds to the provided identifier of the identifier type.
 
+        Nodes are looked up in and registered in the identity map of the current backend, as by `load_entities`.
+
         :param identifier: the identifier
         :param identifier_type: the type of the identifier
         :param sub_classes: an optional tuple of orm classes, that should each be strict sub classes of the
@@ -209,9 +291,18 @@ class OrmEntityLoader(object):
         :raises aiida.common.MultipleObjectsError: if the identifier maps onto multiple entities
         :raises aiida.common.NotExistent: if the identifier maps onto not a single entity
         """
+        from aiida.orm import Node
+
         builder, query_parameters = cls.get_query_builder(identifier, identifier_type, sub_classes, query_with_dashes)
         builder.limit(2)
 
+        identity_map = get_identity_map() if issubclass(cls.orm_base_class, Node) else None
+
+        if identity_map is not None and query_parameters['identifier_type'] == IdentifierType.ID:
+            entity = identity_map.get(query_parameters['identifier'])
+            if entity is not None and isinstance(entity, query_parameters['classes']):
+                return entity
+
         classes = ' or '.join([sub_class.__name__ for sub_class in query_parameters['classes']])
         identifier = query_parameters['identifier']
         identifier_type = query_parameters['identifier_type'].value
@@ -225,8 +316,100 @@ class OrmEntityLoader(object):
             error = 'no {} found with {}<{}>: {}'.format(classes, identifier_type, identifier, exception)
             raise NotExistent(error)
 
+        if identity_map is not None:
+            entity = identity_map.add(entity)
+
         return entity
 
+    @classmethod
+    def load_entities(cls, identifiers, sub_classes=None, query_with_dashes=True):
+        """
+        Load the entities that uniquely correspond to each of the provided identifiers with a single query.
+
+        All identifiers that are inferred to be of type ID or UUID, where the latter can also be a partial UUID, are
+        resolved with one query. Identifiers that are inferred to be a LABEL are loaded one by one through
+        `load_entity`. Nodes are registered in the identity map of the current backend, such that a node that was
+        already loaded through this method is returned as the same instance, as long as it is still referenced.
+
+        :param identifiers: an iterable of identifiers
+        :param sub_classes: an optional tuple of orm classes, that should each be strict sub classes of the
+            base orm class of the loader, that will narrow the queryset
+        :returns: list of the loaded entities, in the same order as the identifiers
+        :raises aiida.common.MultipleObjectsError: if any of the identifiers maps onto multiple entities
+        :raises aiida.common.NotExistent: if any of the identifiers maps onto not a single entity
+        """
+        # pylint: disable=too-many-locals,too-many-branches
+        from aiida.orm import Node
+
+        classes = cls.get_query_classes(sub_classes)
+        identity_map = get_identity_map() if issubclass(cls.orm_base_class, Node) else None
+
+        entities = {}
+        parsed = []
+
+        for value in identifiers:
+            identifier, identifier_type = cls.infer_identifier_type(value)
+
+            if identifier_type == IdentifierType.UUID:
+                identifier, _ = cls._normalize_uuid_identifier(identifier, query_with_dashes)
+            elif identifier_type == IdentifierType.ID and identity_map is not None:
+                entity = identity_map.get(identifier)
+                if entity is not None and isinstance(entity, classes):
+                    entities[(identifier_type, identifier)] = [entity]
+
+            parsed.append((value, identifier, identifier_type))
+
+        filters = []
+
+        pks = set(identifier for _, identifier, identifier_type in parsed
+                  if identifier_type == IdentifierType.ID and (identifier_type, identifier) not in entities)
+        uuids = set(identifier for _, identifier, identifier_type in parsed if identifier_type == IdentifierType.UUID)
+
+        if pks:
+            filters.append({'id': {'in': list(pks)}})
+
+        for uuid in uuids:
+            uuid_filter = uuid if cls._normalize_uuid_identifier(uuid, False)[1] else {'like': '{}%'.format(uuid)}
+            filters.append({'uuid': uuid_filter})
+
+        if filters:
+            builder = QueryBuilder()
+            builder.append(cls=classes, tag='entity', project=['*'], filters={'or': filters})
+
+            for entity, in builder.iterall():
+                if identity_map is not None:
+                    entity = identity_map.add(entity)
+
+                if entity.pk in pks:
+                    entities.setdefault((IdentifierType.ID, entity.pk), []).append(entity)
+
+                for uuid in uuids:
+                    if entity.uuid.startswith(uuid):
+                        entities.setdefault((IdentifierType.UUID, uuid), []).append(entity)
+
+        class_names = ' or '.join([sub_class.__name__ for sub_class in classes])
+        results = []
+
+        for value, identifier, identifier_type in parsed:
+
+            if identifier_type == IdentifierType.LABEL:
+                results.append(cls.load_entity(value, sub_classes=sub_classes, query_with_dashes=query_with_dashes))
+                continue
+
+            matches = entities.get((identifier_type, identifier), [])
+
+            if not matches:
+                raise NotExistent('no {} found with {}<{}>'.format(class_names, identifier_type.value, identifier))
+
+            if len(matches) > 1:
+                raise MultipleObjectsError(
+                    'multiple {} entries found with {}<{}>'.format(class_names, identifier_type.value, identifier)
+                )
+
+            results.append(matches[0])
+
+        return results
+
     @classmethod
     def get_query_classes(cls, sub_classes=None):
         """
@@ -18,7 +18,7 @@ import io
 import os
 
 from aiida.common import exceptions
-from aiida.common.folders import RepositoryFolder, SandboxFolder
+from aiida.common.folders import Folder, RepositoryFolder, SandboxFolder
 
 
 class FileType(enum.Enum):
@@ -37,10 +37,14 @@ class Repository(object):
     _section_name = 'node'
 
     def __init__(self, uuid, is_stored, base_path=None):
+        self._uuid = uuid
         self._is_stored = is_stored
         self._base_path = base_path
         self._temp_folder = None
         self._repo_folder = RepositoryFolder(section=self._section_name, uuid=uuid)
+        self._is_materialized = False
+        self._is_packed_node = False
+        self._packed_entries = None
 
     def __del__(self):
         """Clean the sandboxfolder if it was instantiated."""
@@ -72,6 +76,9 @@ class Repository(object):
         :param key: fully qualified identifier for the object within the repository
         :return: a list of `File` named tuples representing the objects present in directory with the given key
         """
+        if self._is_packed():
+            return self._list_packed_objects(key)
+
         folder = self._get_base_folder()
 
         if key:
@@ -101,8 +108,41 @@ class Repository(object):
         :param key: fully qualified identifier for the object within the repository
         :param mode: the mode under which to open the handle
         """
+        if self._is_packed():
+            return self._open_packed_object(key, mode)
+
         return io.open(self._get_base_folder().get_abs_path(key), mode=mode)
 
+    def get_object_location(self, key):
+        """Return the location on disk of the content of the object identified by key.
+
+        The content is not necessarily a file of its own, for example if the repository is stored in a pack file of
+        the object store, so it is identified by a path and the position of the content within that file. This allows
+        to memory map the content without copying it.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: tuple of the absolute path of the file that contains the content and the position of the content
+        :raises IOError: if no file with the given key exists
+        """
+        if self._is_packed():
+            try:
+                object_type, hashkey = self._get_packed_entries()[self._get_packed_key(key)]
+            except KeyError:
+                raise IOError('object {} does not exist'.format(key))
+
+            if object_type != FileType.FILE.value:
+                raise IOError('object {} is a directory'.format(key))
+
+            filepath, position, _ = self._get_object_store().get_object_location(hashkey)
+            return filepath, position
+
+        filepath = self._get_base_folder().get_abs_path(key)
+
+        if not os.path.isfile(filepath):
+            raise IOError('object {} does not exist'.format(key))
+
+        return filepath, 0
+
     def get_object(self, key):
         """Return the object identified by key.
 
@@ -117,6 +157,13 @@ class Repository(object):
         except ValueError:
             directory, filename = None, key
 
+        if self._is_packed():
+            try:
+                object_type, _ = self._get_packed_entries()[self._get_packed_key(key)]
+            except KeyError:
+                raise IOError('object {} does not exist'.format(key))
+            return File(filename, FileType(object_type))
+
         folder = self._get_base_folder()
 
         if directory:
@@ -172,6 +219,8 @@ class Repository(object):
         else:
             folder.insert_path(path)
 
+        self._update_packed_node()
+
     def put_object_from_file(self, path, key, mode=None, encoding=None, force=False):
         """Store a new object under `key` with contents of the file located at `path` on this file system.
 
@@ -237,6 +286,8 @@ class Repository(object):
 
         folder.create_file_from_filelike(handle, key, mode=mode, encoding=encoding)
 
+        self._update_packed_node()
+
     def delete_object(self, key, force=False):
         """Delete the object from the repository.
 
@@ -254,6 +305,8 @@ class Repository(object):
 
         self._get_base_folder().remove_path(key)
 
+        self._update_packed_node()
+
     def erase(self, force=False):
         """Delete the repository folder.
 
@@ -266,6 +319,11 @@ class Repository(object):
         if not force:
             self.validate_mutability()
 
+        if self._is_packed():
+            self._get_object_store().delete_node(self._uuid)
+            self._is_packed_node = False
+            self._packed_entries = None
+
         self._repo_folder.erase()
 
     def store(self):
@@ -273,7 +331,16 @@ class Repository(object):
         if self._is_stored:
             raise exceptions.ModificationNotAllowed('repository is already stored')
 
-        self._repo_folder.replace_with_folder(self._get_temp_folder().abspath, move=True, overwrite=True)
+        object_store = self._get_object_store()
+
+        if object_store is not None:
+            # The sandbox folder is kept as the materialized copy of the stored contents
+            object_store.add_node(self._uuid, self._get_temp_folder().abspath)
+            self._is_materialized = True
+            self._is_packed_node = True
+        else:
+            self._repo_folder.replace_with_folder(self._get_temp_folder().abspath, move=True, overwrite=True)
+
         self._is_stored = True
 
     def restore(self):
@@ -281,7 +348,15 @@ class Repository(object):
         if not self._is_stored:
             raise exceptions.ModificationNotAllowed('repository is not yet stored')
 
-        self._temp_folder.replace_with_folder(self._repo_folder.abspath, move=True, overwrite=True)
+        if self._is_packed():
+            self._get_base_folder()
+            self._get_object_store().delete_node(self._uuid)
+            self._is_packed_node = False
+            self._packed_entries = None
+            self._is_materialized = False
+        else:
+            self._temp_folder.replace_with_folder(self._repo_folder.abspath, move=True, overwrite=True)
+
         self._is_stored = False
 
     def _get_base_folder(self):
@@ -289,7 +364,13 @@ class Repository(object):
 
         :return: a Folder object.
         """
-        if self._is_stored:
+        if self._is_packed():
+            # The contents of a packed repository are written to the sandbox folder the first time a folder is needed
+            folder = self._get_temp_folder()
+            if not self._is_materialized:
+                self._get_object_store().materialize_node(self._uuid, folder.abspath)
+                self._is_materialized = True
+        elif self._is_stored:
             folder = self._repo_folder
         else:
             folder = self._get_temp_folder()
@@ -309,3 +390,135 @@ class Repository(object):
             self._temp_folder = SandboxFolder()
 
         return self._temp_folder
+
+    def _get_object_store(self):
+        """Return the object store of the repository of the current profile.
+
+        :return: a `PackedObjectStore` or None if the repository of the profile uses the folder layout
+        """
+        from aiida.manage.repository.object_store import get_object_store
+        return get_object_store()
+
+    def _is_packed(self):
+        """Return whether the contents of this repository are stored in the object store.
+
+        The repository of a node that was stored before the repository of the profile was migrated, or that the
+        migration has not reached yet, is still in the folder layout. Only a positive answer is remembered, since the
+        contents of a stored node are never moved back out of the object store.
+        """
+        if not self._is_packed_node and self._is_stored:
+            object_store = self._get_object_store()
+            self._is_packed_node = object_store is not None and object_store.has_node(self._uuid)
+
+        return self._is_packed_node
+
+    def _get_folder_to_hash(self):
+        """Return the folder with the contents of this repository to compute the hash of its node from.
+
+        The contents of a packed repository are read directly from the object store, rather than being written to the
+        sandbox folder first.
+
+        :return: a `Folder` instance
+        """
+        if self._is_packed():
+            return PackedFolder(self)
+
+        return self._get_base_folder()
+
+    def _get_packed_key(self, key=None):
+        """Return the key in the manifest of the object store that corresponds to the given key in this repository."""
+        parts = [part for part in (self._base_path, key) if part]
+        return '/'.join(parts).replace(os.sep, '/').strip('/')
+
+    def _get_packed_entries(self):
+        """Return the manifest of this repository in the object store, which is fetched once since it is immutable."""
+        if self._packed_entries is None:
+            self._packed_entries = self._get_object_store().get_node_entries(self._uuid)
+
+        return self._packed_entries
+
+    def _list_packed_objects(self, key=None):
+        """Return the list of objects in the given sub directory of a packed repository."""
+        from aiida.manage.repository.object_store import OBJECT_TYPE_DIRECTORY
+
+        directory = self._get_packed_key(key)
+        entries = self._get_packed_entries()
+
+        if entries.get(directory, (None,))[0] != OBJECT_TYPE_DIRECTORY:
+            if self._base_path is not None and not key:
+                return []
+            raise OSError('directory {} does not exist'.format(key))
+
+        prefix = directory + '/' if directory else ''
+        objects = []
+
+        for entry_key, (object_type, _) in entries.items():
+            if entry_key and entry_key.startswith(prefix) and '/' not in entry_key[len(prefix):]:
+                objects.append(File(entry_key[len(prefix):], FileType(object_type)))
+
+        return sorted(objects, key=lambda x: x.name)
+
+    def _open_packed_object(self, key, mode='r'):
+        """Return a read-only handle to the content of an object in a packed repository."""
+        if any(char in mode for char in 'wax+'):
+            raise exceptions.ModificationNotAllowed('cannot modify the repository after the node has been stored')
+
+        try:
+            object_type, hashkey = self._get_packed_entries()[self._get_packed_key(key)]
+        except KeyError:
+            raise IOError('object {} does not exist'.format(key))
+
+        if object_type != FileType.FILE.value:
+            raise IOError('object {} is a directory'.format(key))
+
+        handle = self._get_object_store().open_object(hashkey)
+
+        if 'b' in mode:
+            return handle
+
+        return io.TextIOWrapper(handle, encoding='utf8')
+
+    def _update_packed_node(self):
+        """Replace the contents of a packed repository with those of its materialized copy after a forced change."""
+        if self._is_packed():
+            self._get_object_store().add_node(self._uuid, self._get_temp_folder().abspath)
+            self._packed_entries = None
+
+
+class PackedFolder(Folder):
+    """Read-only view of a directory of a packed repository, which provides what is needed to hash its contents.
+
+    Only `get_content_list`, `get_subfolder` and `open` for reading are supported, which read the manifest and the
+    content of the objects from the object store. The absolute path is that of the repository folder of the node in the
+    folder layout, which does not exist.
+    """
+
+    def __init__(self, repository, key=None):
+        """Construct a new instance.
+
+        :param repository: the `Repository` of a stored node whose contents are in the object store
+        :param key: fully qualified identifier of the directory within the repository, by default its root
+        """
+        abspath = repository._repo_folder.abspath  # pylint: disable=protected-access
+        super(PackedFolder, self).__init__(os.path.join(abspath, key) if key else abspath)
+        self._repository = repository
+        self._key = key
+
+    def _get_key(self, name):
+        return os.path.join(self._key, name) if self._key else name
+
+    def get_content_list(self, pattern='*', only_paths=True):
+        import fnmatch
+
+        objects = [entry for entry in self._repository.list_objects(self._key) if fnmatch.fnmatch(entry.name, pattern)]
+
+        if only_paths:
+            return [entry.name for entry in objects]
+
+        return [(entry.name, entry.type == FileType.FILE) for entry in objects]
+
+    def get_subfolder(self, subfolder, create=False, reset_limit=False):  # pylint: disable=unused-argument
+        return PackedFolder(self._repository, self._get_key(subfolder))
+
+    def open(self, name, mode='r', encoding='utf8', check_existence=False):  # pylint: disable=unused-argument
+        return self._repository.open(self._get_key(name), mode=mode)
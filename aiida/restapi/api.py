@@ -97,8 +97,13 @@ class AiidaApi(Api):
         from aiida.restapi.resources import Calculation, Computer, User, Code, Data, \
             Group, Node, StructureData, KpointsData, BandsData, UpfData, CifData, ServerInfo
 
+        from aiida.restapi.common.cache import get_cache_backend
+
         self.app = app
 
+        # The cache is shared by all resources and their translators
+        kwargs['cache'] = get_cache_backend(kwargs.pop('CACHE_CONFIG', None))
+
         super(AiidaApi, self).__init__(app=app, prefix=kwargs['PREFIX'], catch_all_404s=True)
 
         self.add_resource(
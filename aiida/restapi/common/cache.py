@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Cache for the responses of the REST API and the results of its translators."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import functools
+import hashlib
+import threading
+import time
+
+from six.moves.urllib.parse import parse_qsl, urlencode  # pylint: disable=import-error
+
+from aiida.common.exceptions import ConfigurationError
+
+# Name of the cache type of the in-process least recently used cache
+CACHE_TYPE_LRU = 'lru'
+
+# Name of the cache type that disables caching
+CACHE_TYPE_NULL = 'null'
+
+# Default maximum number of entries of the in-process cache
+DEFAULT_CACHE_THRESHOLD = 1000
+
+
+class LRUCache(object):
+    """In-process, thread-safe cache that evicts the least recently used entry once it is full.
+
+    The interface, `get(key)` and `set(key, value, timeout)`, is the one of the werkzeug cache classes, such that any of
+    those, for example `werkzeug.contrib.cache.MemcachedCache`, can be used as an external cache instead.
+    """
+
+    def __init__(self, threshold=DEFAULT_CACHE_THRESHOLD, default_timeout=300):
+        """Construct a new instance.
+
+        :param threshold: the maximum number of entries
+        :param default_timeout: the number of seconds after which an entry expires if no timeout is given
+        """
+        self._threshold = threshold
+        self._default_timeout = default_timeout
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the value stored under the given key, or None if there is none or it expired."""
+        with self._lock:
+            try:
+                expires, value = self._entries.pop(key)
+            except KeyError:
+                return None
+
+            if expires is not None and expires < time.time():
+                return None
+
+            self._entries[key] = (expires, value)
+
+        return value
+
+    def set(self, key, value, timeout=None):
+        """Store the value under the given key.
+
+        :param timeout: the number of seconds after which the entry expires, 0 meaning never
+        """
+        timeout = self._default_timeout if timeout is None else timeout
+        expires = time.time() + timeout if timeout else None
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (expires, value)
+
+            while len(self._entries) > self._threshold:
+                self._entries.popitem(last=False)
+
+        return True
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+        return True
+
+
+def get_cache_backend(cache_config=None):
+    """Return the cache configured by the `CACHE_CONFIG` dictionary of the REST API configuration.
+
+    The `CACHE_TYPE` is either `lru` for the in-process cache, `null` to disable caching, or the fully qualified name of
+    a class with the interface of the werkzeug cache classes, which is constructed with the `CACHE_OPTIONS` dictionary
+    as keyword arguments. The in-process cache keeps at most `CACHE_THRESHOLD` entries.
+
+    :param cache_config: the cache configuration dictionary, caching is disabled if it is None
+    :return: the cache instance or None if caching is disabled
+    :raises aiida.common.exceptions.ConfigurationError: if the cache type cannot be loaded
+    """
+    from aiida.common.utils import get_object_from_string
+
+    if not cache_config:
+        return None
+
+    cache_type = cache_config.get('CACHE_TYPE', CACHE_TYPE_LRU)
+
+    if cache_type == CACHE_TYPE_NULL:
+        return None
+
+    if cache_type == CACHE_TYPE_LRU:
+        return LRUCache(threshold=cache_config.get('CACHE_THRESHOLD', DEFAULT_CACHE_THRESHOLD))
+
+    try:
+        cache_class = get_object_from_string(cache_type)
+    except (ImportError, ValueError, AttributeError) as exception:
+        raise ConfigurationError('invalid CACHE_TYPE `{}`: {}'.format(cache_type, exception))
+
+    return cache_class(**cache_config.get('CACHE_OPTIONS', {}))
+
+
+def make_cache_key(namespace, *parts):
+    """Return a cache key for the given parts, scoped to the current profile.
+
+    The key is a digest, such that it only contains characters that are valid for every cache backend.
+
+    :param namespace: a string that identifies the kind of value that is cached
+    :param parts: strings that identify the value
+    """
+    from aiida.manage.configuration import get_profile
+
+    profile = get_profile()
+    hasher = hashlib.sha1()
+
+    for part in (profile.name if profile is not None else '',) + parts:
+        hasher.update(part.encode('utf-8'))
+        hasher.update(b'\0')
+
+    return 'aiida-rest:{}:{}'.format(namespace, hasher.hexdigest())
+
+
+def normalize_query_string(query_string):
+    """Return the query string with its parameters sorted, such that equivalent requests share their cache key.
+
+    :param query_string: the query string of the request, without the leading question mark
+    """
+    return urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+
+
+def cache_response(method):
+    """Decorator for the `get` method of a REST API resource that caches its JSON response, unless it is streamed.
+
+    The response of a request is cached if the translator of the resource defines a positive caching timeout for the
+    requested query type, see `BaseTranslator.get_caching_timeout`. The key is derived from the path, the normalized
+    query string and the mimetype negotiated from the `Accept` header of the request, since the latter determines
+    whether the response is streamed, see `Utils.get_streaming_mode`. All JSON responses carry an `ETag` with the
+    digest of their content, a `Last-Modified` header with the time at which the content was computed and `Vary:
+    Accept`, such that clients can revalidate them with conditional requests, which are answered with `304 Not
+    Modified` if the content did not change.
+    """
+    from flask import request, Response
+    from aiida.restapi.common.utils import MIMETYPE_NDJSON
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        """Return the response from the cache, or compute and cache it."""
+        cache = getattr(self, 'cache', None)
+        query_type = self.utils.parse_path(request.path, parse_pk_uuid=self.parse_pk_uuid)[3]
+        timeout = self.trans.get_caching_timeout(query_type) if cache is not None else 0
+
+        if timeout:
+            query_string = normalize_query_string(request.query_string.decode('utf-8'))
+            mimetype = request.accept_mimetypes.best_match(['application/json', MIMETYPE_NDJSON]) or ''
+            key = make_cache_key('response', request.path, query_string, mimetype)
+            cached = cache.get(key)
+
+            if cached is not None:
+                data, headers, last_modified = cached
+                response = Response(data, status=200, headers=headers)
+                return _make_conditional(response, last_modified)
+
+        response = method(self, *args, **kwargs)
+
+        if response.status_code != 200 or response.mimetype != 'application/json' or response.is_streamed:
+            return response
+
+        last_modified = time.time()
+
+        if timeout:
+            cache.set(key, (response.get_data(), list(response.headers.items()), last_modified), timeout)
+
+        return _make_conditional(response, last_modified)
+
+    return wrapper
+
+
+def _make_conditional(response, last_modified):
+    """Set the `ETag`, `Last-Modified` and `Vary` headers of the response and evaluate the conditional headers.
+
+    :param response: a Flask response with the full content
+    :param last_modified: the time at which the content was computed, as seconds since the epoch
+    :return: the response, turned into a `304 Not Modified` if the client already has the current content
+    """
+    from flask import request
+
+    response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+    response.last_modified = int(last_modified)
+    response.vary.add('Accept')
+
+    return response.make_conditional(request)
@@ -48,19 +48,68 @@ SERIALIZER_CONFIG = {'datetime_format': 'default'}
 """
 Caching configuration
 
-memcached: backend caching system
+CACHE_TYPE: 'lru' for an in-process cache of at most CACHE_THRESHOLD entries,
+'null' to disable caching, or the fully qualified name of a class with the
+interface of the werkzeug caches, e.g. 'werkzeug.contrib.cache.MemcachedCache',
+that is constructed with the CACHE_OPTIONS dictionary as keyword arguments.
+
+CACHING_TIMEOUTS: the number of seconds for which the responses and total counts
+of each resource are cached. Resources with mutable entities are not cached.
 """
-CACHE_CONFIG = {'CACHE_TYPE': 'memcached'}
+CACHE_CONFIG = {'CACHE_TYPE': 'lru', 'CACHE_THRESHOLD': 1000, 'CACHE_OPTIONS': {}}
 CACHING_TIMEOUTS = { #Caching TIMEOUTS (in seconds)
     'nodes': 10,
-    'users': 10,
     'calculations': 10,
-    'computers': 10,
-    'datas': 10,
-    'groups': 10,
+    'data': 10,
     'codes': 10,
+    'structures': 10,
+    'kpoints': 10,
+    'bands': 10,
+    'cifs': 10,
+    'upfs': 10,
+    'users': 0,
+    'computers': 0,
+    'groups': 0,
 }
 
+"""
+Total counts
+
+COUNT_MODE: how the total number of results of a query is determined, unless
+the request sets the `count` key of the query string: 'exact' counts all the
+matching rows, 'estimated' uses the estimate of the query planner if it exceeds
+ESTIMATED_COUNT_THRESHOLD rows and counts exactly otherwise, 'none' does not
+count the results at all. Estimated counts are flagged by the
+X-Total-Count-Approximate header of the response.
+"""
+COUNT_MODE = 'exact'
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+"""
+Streaming
+
+STREAMING_THRESHOLD: listings for which the client explicitly requested more
+results than this, through limit or perpage, are serialized row by row while
+the rows are fetched from the database, in batches of STREAMING_BATCH_SIZE,
+instead of being built in memory first. Listings with the default limit are
+not streamed. Streamed responses are not cached. Clients can request newline
+delimited JSON, with one result per line, through the header
+`Accept: application/x-ndjson`, in which case the response is always streamed.
+"""
+STREAMING_THRESHOLD = 100
+STREAMING_BATCH_SIZE = 100
+
+"""
+File downloads
+
+Files of the repositories of nodes are streamed in chunks of DOWNLOAD_CHUNK_SIZE
+bytes, with support for HTTP range requests. If DOWNLOAD_GZIP is True, they are
+compressed on the fly for clients that accept the gzip content encoding, unless
+a range is requested.
+"""
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_GZIP = True
+
 # IO tree
 MAX_TREE_DEPTH = 5
 """
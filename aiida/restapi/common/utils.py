@@ -14,7 +14,8 @@ from __future__ import absolute_import
 from __future__ import division
 from datetime import datetime, timedelta
 
-from flask import jsonify
+import six
+from flask import jsonify, current_app, stream_with_context, Response
 from flask.json import JSONEncoder
 
 from aiida.common.exceptions import InputValidationError, ValidationError
@@ -26,6 +27,20 @@ PK_DBSYNONYM = 'id'
 # Example uuid (version 4)
 UUID_REF = 'd55082b6-76dc-426b-af89-0e08b59524d2'
 
+# Ways of determining the total number of results of a query, selected by the `count` key of the query string
+COUNT_MODE_EXACT = 'exact'
+COUNT_MODE_ESTIMATED = 'estimated'
+COUNT_MODE_NONE = 'none'
+COUNT_MODES = (COUNT_MODE_EXACT, COUNT_MODE_ESTIMATED, COUNT_MODE_NONE)
+
+# Media type of newline delimited JSON, in which every result is serialized on its own line
+MIMETYPE_NDJSON = 'application/x-ndjson'
+
+if six.PY2:
+    from collections import Iterator  # pylint: disable=ungrouped-imports
+else:
+    from collections.abc import Iterator  # pylint: disable=no-name-in-module, import-error
+
 
 ########################## Classes #####################
 class CustomJSONEncoder(JSONEncoder):
@@ -274,7 +289,7 @@ class Utils(object):
         if query_type in ('schema') and is_querystring_defined:
             raise RestInputValidationError('schema requests do not allow specifying a query string')
 
-    def paginate(self, page, perpage, total_count):
+    def paginate(self, page, perpage, total_count, is_exact=True):
         """
         Calculates limit and offset for the reults of a query,
         given the page and the number of restuls per page.
@@ -282,9 +297,14 @@ class Utils(object):
         if the
         required page exceeds that limit.
         If number of rows==0, only page 1 exists
+        If the total count is not exact, the last page is only indicative and
+        is not enforced, and the next page is always given: it is up to the
+        caller to remove it if there are no further results.
         :param page: integer number of the page that has to be viewed
         :param perpage: integer defining how many results a page contains
-        :param total_count: the total number of rows retrieved by the query
+        :param total_count: the total number of rows retrieved by the query,
+            None if it was not counted
+        :param is_exact: whether the total count is exact or an estimate
         :return: integers: limit, offset, rel_pages
         """
         from math import ceil
@@ -295,10 +315,11 @@ class Utils(object):
             page = int(page)
         except ValueError:
             raise InputValidationError('page number must be an integer')
-        try:
-            total_count = int(total_count)
-        except ValueError:
-            raise InputValidationError('total_count must be an integer')
+        if total_count is not None:
+            try:
+                total_count = int(total_count)
+            except ValueError:
+                raise InputValidationError('total_count must be an integer')
         # Non-mandatory params
         if perpage is not None:
             try:
@@ -312,7 +333,9 @@ class Utils(object):
         first_page = 1
 
         ## Calculate last page
-        if total_count == 0:
+        if total_count is None:
+            last_page = None
+        elif total_count == 0:
             last_page = 1
         else:
             last_page = int(ceil(total_count / perpage))
@@ -320,7 +343,7 @@ class Utils(object):
         ## Check validity of required page and calculate limit, offset,
         # previous,
         #  and next page
-        if page > last_page or page < 1:
+        if page < 1 or (is_exact and page > last_page):
             raise RestInputValidationError(
                 'Non existent page requested. The '
                 'page range is [{} : {}]'.format(first_page, last_page)
@@ -333,28 +356,32 @@ class Utils(object):
             prev_page = page - 1
 
         next_page = None
-        if page < last_page:
+        if not is_exact or page < last_page:
             next_page = page + 1
 
         rel_pages = dict(prev=prev_page, next=next_page, first=first_page, last=last_page)
 
         return (limit, offset, rel_pages)
 
-    def build_headers(self, rel_pages=None, url=None, total_count=None):
+    def build_headers(self, rel_pages=None, url=None, total_count=None, is_exact=True):
         """
         Construct the header dictionary for an HTTP response. It includes related
         pages, total count of results (before pagination).
 
         :param rel_pages: a dictionary defining related pages (first, prev, next, last)
         :param url: (string) the full url, i.e. the url that the client uses to get Rest resources
+        :param total_count: the total count of results, None if it was not counted
+        :param is_exact: whether the total count is exact, otherwise the
+            X-Total-Count-Approximate header is set
         """
 
         ## Type validation
         # mandatory parameters
-        try:
-            total_count = int(total_count)
-        except ValueError:
-            raise InputValidationError('total_count must be a long integer')
+        if total_count is not None:
+            try:
+                total_count = int(total_count)
+            except ValueError:
+                raise InputValidationError('total_count must be a long integer')
 
         # non mandatory parameters
         if rel_pages is not None and not isinstance(rel_pages, dict):
@@ -374,9 +401,14 @@ class Utils(object):
         headers = {}
 
         ## Setting mandatory headers
-        # set X-Total-Count
-        headers['X-Total-Count'] = total_count
-        expose_header = ['X-Total-Count']
+        # set X-Total-Count, flagged as approximate if it is an estimate
+        expose_header = []
+        if total_count is not None:
+            headers['X-Total-Count'] = total_count
+            expose_header.append('X-Total-Count')
+            if not is_exact:
+                headers['X-Total-Count-Approximate'] = 'true'
+                expose_header.append('X-Total-Count-Approximate')
 
         ## Two auxiliary functions
         def split_url(url):
@@ -454,6 +486,123 @@ class Utils(object):
 
         return response
 
+    def get_streaming_mode(self, limit=None):
+        """
+        Determine whether the results of a listing are streamed, see `build_streamed_response`.
+
+        They are streamed if the client accepts newline delimited JSON rather
+        than JSON, or if it explicitly asked for more than `STREAMING_THRESHOLD`
+        results. Listings with the default limit are not streamed, such that
+        they keep being cached and carry an `ETag`.
+
+        :param limit: the maximum number of results that was requested, None if the default limit applies
+        :return: tuple of booleans, whether the response is streamed and whether as newline delimited JSON
+        """
+        from flask import request
+        from aiida.restapi.common.config import STREAMING_THRESHOLD
+
+        ndjson = request.accept_mimetypes.best_match(['application/json', MIMETYPE_NDJSON]) == MIMETYPE_NDJSON
+
+        if limit is None:
+            return ndjson, ndjson
+
+        return ndjson or int(limit) > STREAMING_THRESHOLD, ndjson
+
+    @staticmethod
+    def build_streamed_response(status=200, headers=None, data=None, ndjson=False):
+        """
+        Build a response whose content is serialized while it is sent
+
+        The data has the same structure as for `build_response`, except that
+        the results can be iterators, whose items are serialized one at a time
+        as they are consumed, such that they never have to be all in memory.
+
+        :param status: status of the response, e.g. 200=OK, 400=bad request
+        :param headers: dictionary for additional header k,v pairs,
+            e.g. X-total-count=<number of rows resulting from query>
+        :param data: a dictionary with the data returned by the Resource
+        :param ndjson: if True, only the results are sent, as newline
+            delimited JSON with one result per line
+
+        :return: a streamed Flask response object
+        """
+        if not isinstance(data, dict):
+            raise InputValidationError('data must be a dictionary')
+
+        if headers is not None and not isinstance(headers, dict):
+            raise InputValidationError('header must be a dictionary')
+
+        encoder = current_app.json_encoder()
+
+        if ndjson:
+            chunks = iter_ndjson(data, encoder)
+            mimetype = MIMETYPE_NDJSON
+        else:
+            chunks = iter_json(data, encoder)
+            mimetype = 'application/json'
+
+        response = Response(stream_with_context(chunks), status=status, mimetype=mimetype)
+
+        if headers is not None:
+            for key, val in headers.items():
+                response.headers[key] = val
+
+        return response
+
+    @staticmethod
+    def build_file_response(node, key, filename):
+        """
+        Build a response that streams a file of the repository of a node in chunks
+
+        The response supports HTTP range requests of a single range. Unless a
+        range is requested, the file is compressed on the fly if the client
+        accepts the gzip content encoding and `DOWNLOAD_GZIP` is enabled.
+
+        :param node: the node whose repository contains the file
+        :param key: the key of the file in the repository of the node
+        :param filename: the name of the file proposed to the client
+        :return: a streamed Flask response object
+        """
+        from flask import request
+        from aiida.restapi.common.config import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_GZIP
+
+        with node.open(key, 'rb') as handle:
+            handle.seek(0, 2)
+            size = handle.tell()
+
+        headers = {
+            'Content-Disposition': 'attachment; filename="{}"'.format(filename),
+            'Accept-Ranges': 'bytes',
+        }
+
+        start, stop = 0, size
+        status = 200
+        gzip = False
+
+        if request.range is not None:
+            byte_range = request.range.range_for_length(size)
+            if byte_range is None:
+                headers['Content-Range'] = 'bytes */{}'.format(size)
+                return Response(status=416, headers=headers)
+            start, stop = byte_range
+            status = 206
+            headers['Content-Range'] = 'bytes {}-{}/{}'.format(start, stop - 1, size)
+        elif DOWNLOAD_GZIP and 'gzip' in request.accept_encodings:
+            gzip = True
+            headers['Content-Encoding'] = 'gzip'
+            headers['Vary'] = 'Accept-Encoding'
+
+        chunks = iter_file_chunks(node, key, start, stop, DOWNLOAD_CHUNK_SIZE)
+
+        if gzip:
+            chunks = iter_gzip_chunks(chunks)
+        else:
+            headers['Content-Length'] = str(stop - start)
+
+        return Response(
+            chunks, status=status, headers=headers, mimetype='application/octet-stream', direct_passthrough=True
+        )
+
     @staticmethod
     def build_datetime_filter(dtobj):
         """
@@ -523,6 +672,9 @@ class Utils(object):
         tree_in_limit = None
         tree_out_limit = None
 
+        # how to determine the total count of the results
+        count_mode = None
+
         ## Count how many time a key has been used for the filters and check if
         # reserved keyword
         # have been used twice,
@@ -572,6 +724,8 @@ class Utils(object):
             raise RestInputValidationError('You cannot specify in_limit more than once')
         if 'out_limit' in field_counts.keys() and field_counts['out_limit'] > 1:
             raise RestInputValidationError('You cannot specify out_limit more than once')
+        if 'count' in field_counts.keys() and field_counts['count'] > 1:
+            raise RestInputValidationError('You cannot specify count more than once')
 
         ## Extract results
         for field in field_list:
@@ -660,6 +814,14 @@ class Utils(object):
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'out_limit'")
 
+            elif field[0] == 'count':
+                if field[1] == '=':
+                    count_mode = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'count'")
+                if count_mode not in COUNT_MODES:
+                    raise RestInputValidationError('count must be one of: {}'.format(', '.join(COUNT_MODES)))
+
             else:
 
                 ## Construct the filter entry.
@@ -688,7 +850,7 @@ class Utils(object):
 
         return (
             limit, offset, perpage, orderby, filters, alist, nalist, elist, nelist, downloadformat, visformat, filename,
-            rtype, tree_in_limit, tree_out_limit
+            rtype, tree_in_limit, tree_out_limit, count_mode
         )
 
     def parse_query_string(self, query_string):
@@ -840,6 +1002,89 @@ class Utils(object):
         return self.build_translator_parameters(field_list)
 
 
+def iter_json(data, encoder):
+    """
+    Serialize the data to JSON in chunks, serializing the items of iterators one by one as they are consumed.
+
+    :param data: the data to serialize, where iterators are serialized as lists
+    :param encoder: the JSON encoder for all other values
+    :return: a generator of strings
+    """
+    if isinstance(data, dict):
+        yield '{'
+        for index, (key, value) in enumerate(data.items()):
+            yield '{}{}:'.format(',' if index else '', encoder.encode(six.text_type(key)))
+            for chunk in iter_json(value, encoder):
+                yield chunk
+        yield '}'
+    elif isinstance(data, Iterator):
+        yield '['
+        for index, item in enumerate(data):
+            yield '{}{}'.format(',' if index else '', encoder.encode(item))
+        yield ']'
+    else:
+        yield encoder.encode(data)
+
+
+def iter_ndjson(data, encoder):
+    """
+    Serialize the items of the iterators contained in the data as newline delimited JSON.
+
+    :param data: dictionary, possibly nested, whose iterators contain the results
+    :param encoder: the JSON encoder for the items
+    :return: a generator of strings, one per item
+    """
+    for value in data.values():
+        if isinstance(value, dict):
+            for line in iter_ndjson(value, encoder):
+                yield line
+        elif isinstance(value, Iterator):
+            for item in value:
+                yield encoder.encode(item) + '\n'
+
+
+def iter_file_chunks(node, key, start, stop, chunk_size):
+    """
+    Read a file of the repository of a node in chunks.
+
+    :param node: the node whose repository contains the file
+    :param key: the key of the file in the repository of the node
+    :param start: the offset of the first byte to read
+    :param stop: the offset after the last byte to read
+    :param chunk_size: the maximum number of bytes per chunk
+    :return: a generator of bytes
+    """
+    with node.open(key, 'rb') as handle:
+        handle.seek(start)
+        remaining = stop - start
+
+        while remaining > 0:
+            chunk = handle.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def iter_gzip_chunks(chunks):
+    """
+    Compress chunks of bytes on the fly in the gzip format.
+
+    :param chunks: an iterable of bytes
+    :return: a generator of the compressed bytes
+    """
+    import zlib
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
 def list_routes():
     """List available routes"""
     from six.moves import urllib
@@ -17,6 +17,7 @@ from six.moves.urllib.parse import unquote  # pylint: disable=import-error
 from flask import request, make_response
 from flask_restful import Resource
 
+from aiida.restapi.common.cache import cache_response
 from aiida.restapi.common.utils import Utils
 
 
@@ -92,11 +93,10 @@ class BaseResource(Resource):
     This is the only difference in the classes.
     """
 
-    ## TODO add the caching support. I cache total count, results, and possibly
-
     def __init__(self, **kwargs):
 
         self.trans = None
+        self.cache = kwargs.get('cache', None)
 
         # Flag to tell the path parser whether to expect a pk or a uuid pattern
         self.parse_pk_uuid = None
@@ -107,6 +107,7 @@ class BaseResource(Resource):
         self.utils = Utils(**self.utils_confs)
         self.method_decorators = {'get': kwargs.get('get_decorators', [])}
 
+    @cache_response
     def get(self, id=None, page=None):  # pylint: disable=redefined-builtin,invalid-name,unused-argument
         # pylint: disable=too-many-locals
         """
@@ -128,7 +129,7 @@ class BaseResource(Resource):
         # pylint: disable=unused-variable
         (
             limit, offset, perpage, orderby, filters, _alist, _nalist, _elist, _nelist, _downloadformat, _visformat,
-            _filename, _rtype, tree_in_limit, tree_out_limit
+            _filename, _rtype, tree_in_limit, tree_out_limit, count_mode
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -141,6 +142,8 @@ class BaseResource(Resource):
             is_querystring_defined=(bool(query_string))
         )
 
+        stream = ndjson = False
+
         ## Treat the schema case which does not imply access to the DataBase
         if query_type == 'schema':
 
@@ -152,21 +155,29 @@ class BaseResource(Resource):
         else:
             ## Set the query, and initialize qb object
             self.trans.set_query(filters=filters, orders=orderby, node_id=node_id)
+            self.trans.set_count_mode(count_mode)
 
             ## Count results
             total_count = self.trans.get_total_count()
+            is_exact = self.trans.is_total_count_exact()
 
             ## Pagination (if required)
             if page is not None:
-                (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
+                (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count, is_exact)
+                if not is_exact and not self.trans.has_results_after(offset + limit):
+                    rel_pages['next'] = None
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
+                headers = self.utils.build_headers(
+                    rel_pages=rel_pages, url=request.url, total_count=total_count, is_exact=is_exact
+                )
             else:
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, is_exact=is_exact)
 
-            ## Retrieve results
-            results = self.trans.get_results()
+            ## Retrieve results, streamed if a listing can return many
+            if node_id is None:
+                stream, ndjson = self.utils.get_streaming_mode(limit)
+            results = self.trans.get_results(stream=stream)
 
         ## Build response and return it
         data = dict(
@@ -180,6 +191,9 @@ class BaseResource(Resource):
             data=results
         )
 
+        if stream:
+            return self.utils.build_streamed_response(status=200, headers=headers, data=data, ndjson=ndjson)
+
         return self.utils.build_response(status=200, headers=headers, data=data)
 
 
@@ -198,6 +212,8 @@ class Node(Resource):
         from aiida.orm import Node as tNode
         self.tclass = tNode
 
+        self.cache = kwargs.get('cache', None)
+
         # Parse a uuid pattern in the URL path (not a pk)
         self.parse_pk_uuid = 'uuid'
 
@@ -207,6 +223,17 @@ class Node(Resource):
         self.utils = Utils(**self.utils_confs)
         self.method_decorators = {'get': kwargs.get('get_decorators', [])}
 
+    @staticmethod
+    def _is_listing(query_type, node_id):
+        """
+        Return whether the request is for a list of nodes, rather than for a single node or its content.
+
+        :param query_type: the query type of the request
+        :param node_id: the identifier of the node in the path of the request, None if there is none
+        """
+        return query_type in ('inputs', 'outputs') or (query_type == 'default' and node_id is None)
+
+    @cache_response
     def get(self, id=None, page=None):  # pylint: disable=redefined-builtin,invalid-name,unused-argument
         # pylint: disable=too-many-locals,too-many-statements,too-many-branches,fixme
         """
@@ -228,7 +255,7 @@ class Node(Resource):
 
         (
             limit, offset, perpage, orderby, filters, alist, nalist, elist, nelist, downloadformat, visformat, filename,
-            rtype, tree_in_limit, tree_out_limit
+            rtype, tree_in_limit, tree_out_limit, count_mode
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -241,6 +268,8 @@ class Node(Resource):
             is_querystring_defined=(bool(query_string))
         )
 
+        stream = ndjson = False
+
         ## Treat the schema case which does not imply access to the DataBase
         if query_type == 'schema':
 
@@ -254,7 +283,7 @@ class Node(Resource):
         elif query_type == 'statistics':
             (
                 limit, offset, perpage, orderby, filters, alist, nalist, elist, nelist, downloadformat, visformat,
-                filename, rtype, tree_in_limit, tree_out_limit
+                filename, rtype, tree_in_limit, tree_out_limit, count_mode
             ) = self.utils.parse_query_string(query_string)
             headers = self.utils.build_headers(url=request.url, total_count=0)
             if filters:
@@ -288,24 +317,34 @@ class Node(Resource):
                 filename=filename,
                 rtype=rtype
             )
+            self.trans.set_count_mode(count_mode)
 
             ## Count results
             total_count = self.trans.get_total_count()
+            is_exact = self.trans.is_total_count_exact()
 
             ## Pagination (if required)
             if page is not None:
-                (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
+                (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count, is_exact)
+                if not is_exact and not self.trans.has_results_after(offset + limit):
+                    rel_pages['next'] = None
                 self.trans.set_limit_offset(limit=limit, offset=offset)
 
-                ## Retrieve results
-                results = self.trans.get_results()
+                ## Retrieve results, streamed if a listing can return many
+                if self._is_listing(query_type, node_id):
+                    stream, ndjson = self.utils.get_streaming_mode(limit)
+                results = self.trans.get_results(stream=stream)
 
-                headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
+                headers = self.utils.build_headers(
+                    rel_pages=rel_pages, url=request.url, total_count=total_count, is_exact=is_exact
+                )
             else:
 
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                ## Retrieve results
-                results = self.trans.get_results()
+                ## Retrieve results, streamed if a listing can return many
+                if self._is_listing(query_type, node_id):
+                    stream, ndjson = self.utils.get_streaming_mode(limit)
+                results = self.trans.get_results(stream=stream)
 
                 if query_type == 'download' and results:
                     if results['download']['status'] == 200:
@@ -327,6 +366,11 @@ class Node(Resource):
                     except TypeError:
                         status = ''
 
+                    if status == 200 and 'node' in results[query_type]:
+                        return self.utils.build_file_response(
+                            results[query_type]['node'], results[query_type]['key'], results[query_type]['filename']
+                        )
+
                     if status == 200:
                         data = results[query_type]['data']
                         response = make_response(data)
@@ -336,7 +380,7 @@ class Node(Resource):
                         )
                         return response
 
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, is_exact=is_exact)
 
         ## Build response
         data = dict(
@@ -350,6 +394,9 @@ class Node(Resource):
             data=results
         )
 
+        if stream:
+            return self.utils.build_streamed_response(status=200, headers=headers, data=data, ndjson=ndjson)
+
         return self.utils.build_response(status=200, headers=headers, data=data)
 
 
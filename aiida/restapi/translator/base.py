@@ -21,7 +21,7 @@ from aiida.common.utils import get_object_from_string
 from aiida.orm.querybuilder import QueryBuilder
 from aiida.restapi.common.exceptions import RestValidationError, \
     RestInputValidationError
-from aiida.restapi.common.utils import PK_DBSYNONYM
+from aiida.restapi.common.utils import PK_DBSYNONYM, COUNT_MODES, COUNT_MODE_ESTIMATED, COUNT_MODE_NONE
 
 
 class BaseTranslator(object):
@@ -51,6 +51,10 @@ class BaseTranslator(object):
     _is_qb_initialized = False
     _is_id_query = None
     _total_count = None
+    _is_total_count_exact = True
+
+    # Query types whose results can change for a stored entity and should therefore never be cached
+    _mutable_query_types = ('extras',)
 
     def __init__(self, Class=None, **kwargs):
         """
@@ -103,6 +107,13 @@ class BaseTranslator(object):
         self.limit_default = kwargs['LIMIT_DEFAULT']
         self.schema = None
 
+        # Cache for the total counts, configured through the `CACHE_CONFIG` of the REST API, None if disabled
+        self.cache = kwargs.get('cache', None)
+
+        # How the total count of the results is determined, see `set_count_mode`
+        self._count_mode = None
+        self.set_count_mode()
+
     def __repr__(self):
         """
         This function is required for the caching system to be able to compare
@@ -180,27 +191,91 @@ class BaseTranslator(object):
         self.qbobj.__init__(**self._query_help)
         self._is_qb_initialized = True
 
+    def set_count_mode(self, count_mode=None):
+        """
+        Set how the total count of the results of the query is determined.
+
+        In the 'exact' mode all the matching rows are counted. In the 'estimated' mode the estimate of the query
+        planner is used instead, unless it is below `ESTIMATED_COUNT_THRESHOLD`, in which case counting is cheap enough
+        to be exact. In the 'none' mode the results are not counted at all and the total count is None.
+
+        :param count_mode: one of the `COUNT_MODES`, the `COUNT_MODE` of the REST API configuration if None
+        """
+        from aiida.restapi.common.config import COUNT_MODE
+
+        if count_mode is None:
+            count_mode = COUNT_MODE
+
+        if count_mode not in COUNT_MODES:
+            raise InputValidationError('count mode must be one of: {}'.format(', '.join(COUNT_MODES)))
+
+        self._count_mode = count_mode
+
     def count(self):
         """
         Count the number of rows returned by the query and set total_count
+
+        Depending on the count mode, see `set_count_mode`, the count is exact, an estimate or None. If caching is
+        enabled, the count is memoized under a key derived from the query help, such that for example subsequent pages
+        of the same query do not count the rows again.
         """
-        if self._is_qb_initialized:
-            self._total_count = self.qbobj.count()
-        else:
+        if not self._is_qb_initialized:
             raise InvalidOperation('query builder object has not been initialized.')
 
-            # def caching_method(self):
-            #     """
-            #     class method for caching. It is a wrapper of the
-            # flask_cache memoize
-            #     method. To be used as a decorator
-            #     :return: the flask_cache memoize method with the timeout kwarg
-            #     corrispondent to the class
-            #     """
-            #     return cache.memoize()
-            #
+        if self._count_mode == COUNT_MODE_NONE:
+            self._total_count = None
+            self._is_total_count_exact = False
+            return
+
+        timeout = self.get_caching_timeout() if self.cache is not None else 0
+
+        if timeout:
+            from aiida.common import json
+            from aiida.restapi.common.cache import make_cache_key
+
+            key = make_cache_key('count', self._count_mode, json.dumps(self._query_help, sort_keys=True, default=str))
+            cached = self.cache.get(key)
+
+            if cached is None:
+                cached = self._count_rows()
+                self.cache.set(key, cached, timeout)
+
+            self._total_count, self._is_total_count_exact = cached
+        else:
+            self._total_count, self._is_total_count_exact = self._count_rows()
+
+    def _count_rows(self):
+        """
+        Count the rows of the query according to the count mode.
+
+        :return: tuple of the count and a boolean that is False if the count is an estimate
+        """
+        from aiida.restapi.common.config import ESTIMATED_COUNT_THRESHOLD
+
+        if self._count_mode == COUNT_MODE_ESTIMATED:
+            estimate = self.qbobj.estimate_count()
+            if estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate, False
+
+        return self.qbobj.count(), True
 
-            #    @cache.memoize(timeout=CACHING_TIMEOUTS[self.__label__])
+    def get_caching_timeout(self, query_type=None):
+        """
+        Return the number of seconds for which results of this translator can be cached.
+
+        The timeouts per translator label are defined by `CACHING_TIMEOUTS` in the REST API configuration, where a
+        timeout of zero disables caching for entities that are mutable.
+
+        :param query_type: the query type of the request, e.g. 'extras', the results of mutable query types are never
+            cached
+        :return: the timeout in seconds, zero if the results should not be cached
+        """
+        from aiida.restapi.common.config import CACHING_TIMEOUTS
+
+        if query_type in self._mutable_query_types:
+            return 0
+
+        return CACHING_TIMEOUTS.get(self.__label__, 0)
 
     def get_total_count(self):
         """
@@ -214,6 +289,31 @@ class BaseTranslator(object):
 
         return self._total_count
 
+    def is_total_count_exact(self):
+        """
+        Returns whether the total count is exact, rather than estimated or not counted at all.
+
+        :return: boolean
+        """
+        return self._is_total_count_exact
+
+    def has_results_after(self, offset):
+        """
+        Returns whether the query has rows beyond the given offset, to paginate results whose total count is not exact.
+
+        The limit and offset of the query builder object are changed, so they have to be set afterwards.
+
+        :param offset: the number of rows to skip
+        :return: boolean
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        self.qbobj.offset(offset)
+        self.qbobj.limit(1)
+
+        return self.qbobj.first() is not None
+
     def set_filters(self, filters=None):
         """
         Add filters in query_help.
@@ -459,26 +559,28 @@ class BaseTranslator(object):
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
-    def get_formatted_result(self, label):
+    def get_formatted_result(self, label, stream=False):
         """
         Runs the query and retrieves results tagged as "label".
 
         :param label: the tag of the results to be extracted out of
           the query rows.
         :type label: str
+        :param stream: if True, the results are a generator that formats the
+          rows while the query builder yields them, rather than a list
         :return: a list of the query results
         """
 
         if not self._is_qb_initialized:
             raise InvalidOperation('query builder object has not been initialized.')
 
-        results = []
-        if self._total_count > 0:
-            for res in self.qbobj.dict():
-                tmp = res[label]
-                if self._default_user_projections:
-                    tmp['user_email'] = res['user']['email']
-                results.append(tmp)
+        if self._total_count is None or self._total_count > 0:
+            results = self._iter_formatted_rows(label)
+        else:
+            results = iter(())
+
+        if not stream:
+            results = list(results)
 
         # TODO think how to make it less hardcoded
         if self._result_type == 'with_outgoing':
@@ -490,10 +592,25 @@ class BaseTranslator(object):
 
         return result
 
-    def get_results(self):
+    def _iter_formatted_rows(self, label):
+        """
+        Yield the results tagged as "label", fetching the rows from the database in batches.
+
+        :param label: the tag of the results to be extracted out of the query rows.
+        """
+        from aiida.restapi.common.config import STREAMING_BATCH_SIZE
+
+        for res in self.qbobj.iterdict(batch_size=STREAMING_BATCH_SIZE):
+            tmp = res[label]
+            if self._default_user_projections:
+                tmp['user_email'] = res['user']['email']
+            yield tmp
+
+    def get_results(self, stream=False):
         """
         Returns either list of nodes or details of single node from database.
 
+        :param stream: if True, the list of results is replaced by a generator, see `get_formatted_result`
         :return: either list of nodes or details of single node from database
         """
 
@@ -507,7 +624,7 @@ class BaseTranslator(object):
             self.count()
 
         ## Retrieve data
-        data = self.get_formatted_result(self._result_type)
+        data = self.get_formatted_result(self._result_type, stream=stream)
         return data
 
     def _check_id_validity(self, node_id):
@@ -120,6 +120,25 @@ class CalculationTranslator(NodeTranslator):
                 CalculationTranslator.get_files_list(node_obj, fname, files, prefix + [fname])
         return files
 
+    @staticmethod
+    def validate_file(node, filename):
+        """
+        Check that the repository of the node contains a file with the given name, such that it can be downloaded.
+
+        The content is not read here, it is streamed in chunks by the resource, see `Utils.build_file_response`.
+
+        :param node: aiida node
+        :param filename: the key of the file in the repository of the node
+        :raises RestInputValidationError: if there is no such file
+        """
+        try:
+            is_file = node.get_object(filename).type == FileType.FILE
+        except (IOError, ValueError):
+            is_file = False
+
+        if not is_file:
+            raise RestInputValidationError('Error in getting {} content'.format(filename))
+
     @staticmethod
     def get_retrieved_inputs(node, filename=None, rtype=None):
         """
@@ -136,14 +155,11 @@ class CalculationTranslator(NodeTranslator):
                     rtype = 'download'
 
                 if rtype == 'download':
-                    try:
-                        content = node.get_object_content(filename)
-                    except IOError:
-                        error = 'Error in getting {} content'.format(filename)
-                        raise RestInputValidationError(error)
+                    CalculationTranslator.validate_file(node, filename)
 
                     response['status'] = 200
-                    response['data'] = content
+                    response['node'] = node
+                    response['key'] = filename
                     response['filename'] = filename.replace('/', '_')
 
                 else:
@@ -180,14 +196,11 @@ class CalculationTranslator(NodeTranslator):
                     rtype = 'download'
 
                 if rtype == 'download':
-                    try:
-                        content = retrieved_folder_node.get_object_content(filename)
-                    except IOError:
-                        error = 'Error in getting {} content'.format(filename)
-                        raise RestInputValidationError(error)
+                    CalculationTranslator.validate_file(retrieved_folder_node, filename)
 
                     response['status'] = 200
-                    response['data'] = content
+                    response['node'] = retrieved_folder_node
+                    response['key'] = filename
                     response['filename'] = filename.replace('/', '_')
 
                 else:
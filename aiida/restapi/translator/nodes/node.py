@@ -278,7 +278,13 @@ class NodeTranslator(BaseTranslator):
             return {}
 
         # otherwise ...
-        node = self.qbobj.first()[1]
+        result = self.qbobj.first()
+
+        # The count is None if it was skipped
+        if result is None:
+            return {}
+
+        node = result[1]
 
         # content/attributes
         if self._content_type == 'attributes':
@@ -531,17 +537,19 @@ class NodeTranslator(BaseTranslator):
         with node.open(file_name) as fobj:
             return fobj.read()
 
-    def get_results(self):
+    def get_results(self, stream=False):
         """
         Returns either a list of nodes or details of single node from database
 
+        :param stream: if True, a list of nodes is replaced by a generator, the content of a single node is never
+            streamed
         :return: either a list of nodes or the details of single node
             from the database
         """
         if self._content_type is not None:
             return self._get_content()
 
-        return super(NodeTranslator, self).get_results()
+        return super(NodeTranslator, self).get_results(stream=stream)
 
     def get_statistics(self, user_pk=None):
         """Return statistics for a given node"""
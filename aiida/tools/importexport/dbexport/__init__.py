@@ -20,6 +20,7 @@ import time
 from aiida import get_version, orm
 from aiida.common import json
 from aiida.common.folders import RepositoryFolder
+from aiida.manage.repository.object_store import get_object_store
 from aiida.orm.utils.repository import Repository
 
 from aiida.tools.importexport.common import exceptions
@@ -443,6 +444,7 @@ def export_tree(
         # Large speed increase by not getting the node itself and looping in memory in python, but just getting the uuid
         uuid_query = orm.QueryBuilder()
         uuid_query.append(orm.Node, filters={'id': {'in': all_nodes_pk}}, project=['uuid'])
+        object_store = get_object_store()
         for res in uuid_query.all():
             uuid = str(res[0])
             sharded_uuid = export_shard_uuid(uuid)
@@ -451,7 +453,12 @@ def export_tree(
             thisnodefolder = nodesubfolder.get_subfolder(sharded_uuid, create=False, reset_limit=True)
 
             # Make sure the node's repository folder was not deleted
-            src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
+            if object_store is not None and object_store.has_node(uuid):
+                # Packed repositories are written to a sandbox folder, which is kept alive by the `Repository`
+                repository = Repository(uuid=uuid, is_stored=True)
+                src = repository._get_base_folder()  # pylint: disable=protected-access
+            else:
+                src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
             if not src.exists():
                 raise exceptions.ArchiveExportError(
                     'Unable to find the repository folder for Node with UUID={} in the local repository'.format(uuid)
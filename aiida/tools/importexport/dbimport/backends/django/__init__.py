@@ -25,6 +25,7 @@ from aiida.common import timezone, json
 from aiida.common.folders import SandboxFolder, RepositoryFolder
 from aiida.common.links import LinkType, validate_link_label
 from aiida.common.utils import grouper, get_object_from_string
+from aiida.manage.repository.object_store import get_object_store
 from aiida.orm.utils.repository import Repository
 from aiida.orm import QueryBuilder, Node, Group
 from aiida.tools.importexport.common import exceptions
@@ -111,6 +112,9 @@ def import_data_dj(
     # The returned dictionary with new and existing nodes and links
     ret_dict = {}
 
+    # The repository contents of new nodes go into the object store, if the profile repository has been migrated to it
+    object_store = get_object_store()
+
     # Initial check(s)
     if group:
         if not isinstance(group, Group):
@@ -394,10 +398,13 @@ def import_data_dj(
                                 'Unable to find the repository folder for Node with UUID={} in the exported '
                                 'file'.format(import_entry_uuid)
                             )
-                        destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
-                        # Replace the folder, possibly destroying existing previous folders, and move the files
-                        # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
-                        destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
+                        if object_store is not None:
+                            object_store.add_node(import_entry_uuid, subfolder.abspath)
+                        else:
+                            destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
+                            # Replace the folder, possibly destroying existing previous folders, and move the files
+                            # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
+                            destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
 
                         # For DbNodes, we also have to store its attributes
                         if not silent:
@@ -485,6 +485,73 @@ class Graph(object):
         link_types = tuple([getattr(LinkType, l.upper()) if isinstance(l, six.string_types) else l for l in link_types])
         return link_types
 
+    def _add_links(self, nodes, outgoing, link_types=(), annotate_links=None, max_nodes=None):
+        """add nodes and edges for the incoming or outgoing links of a set of nodes, fetched with a single query
+
+        :param nodes: nodes, which must already have been added to the graph
+        :type nodes: list[aiida.orm.nodes.node.Node]
+        :param outgoing: whether to follow outgoing, rather than incoming, links
+        :type outgoing: bool
+        :param link_types: filter by link types (Default value = ())
+        :type link_types: str or tuple[str] or aiida.common.links.LinkType or tuple[aiida.common.links.LinkType]
+        :param annotate_links: label edges with the link 'label', 'type' or 'both' (Default value = None)
+        :type annotate_links: bool or str
+        :param max_nodes: if not None, linked nodes that are not yet in the graph are only added
+            as long as the graph contains less nodes than this (Default value = None)
+        :type max_nodes: None or int
+        :returns: dictionary mapping the pk of each of the nodes onto the list of its linked nodes in the graph
+        :rtype: dict
+
+        """
+        from aiida.orm import Node
+
+        if annotate_links not in [None, False, 'label', 'type', 'both']:
+            raise AssertionError('annotate_links must be one of False, "label", "type" or "both"')
+
+        origins = {node.pk: node for node in nodes}
+        linked_nodes = {pk: [] for pk in origins}
+
+        if not origins:
+            return linked_nodes
+
+        link_types = self._convert_link_types(link_types)
+        edge_filters = {'type': {'in': [link_type.value for link_type in link_types]}} if link_types else {}
+        relationship = {'with_incoming': 'origin'} if outgoing else {'with_outgoing': 'origin'}
+
+        query = QueryBuilder()
+        query.append(Node, filters={'id': {'in': list(origins)}}, project=['id'], tag='origin')
+        query.append(
+            Node,
+            project=['*'],
+            edge_filters=edge_filters,
+            edge_project=['type', 'label'],
+            edge_tag='link',
+            tag='linked',
+            **relationship
+        )
+        query.order_by({'linked': 'id'})
+
+        for result in query.iterdict():
+            origin = origins[result['origin']['id']]
+            linked_node = result['linked']['*']
+
+            if linked_node.pk not in self._nodes:
+                if max_nodes is not None and len(self._nodes) >= max_nodes:
+                    continue
+                self.add_node(linked_node)
+
+            link_pair = LinkPair(LinkType(result['link']['type']), result['link']['label'])
+            style = self._link_styles(
+                link_pair, add_label=annotate_links in ['label', 'both'], add_type=annotate_links in ['type', 'both']
+            )
+            if outgoing:
+                self.add_edge(origin, linked_node, link_pair, style=style)
+            else:
+                self.add_edge(linked_node, origin, link_pair, style=style)
+            linked_nodes[origin.pk].append(linked_node)
+
+        return linked_nodes
+
     def add_incoming(self, node, link_types=(), annotate_links=None, return_pks=True):
         """add nodes and edges for incoming links to a node
 
@@ -499,22 +566,10 @@ class Graph(object):
         :returns: list of nodes or node pks
 
         """
-        if annotate_links not in [None, False, 'label', 'type', 'both']:
-            raise AssertionError('annotate_links must be one of False, "label", "type" or "both"')
-
         node = self.add_node(node)
+        nodes = self._add_links([node], outgoing=False, link_types=link_types, annotate_links=annotate_links)[node.pk]
 
-        nodes = []
-        for link_triple in node.get_incoming(link_type=self._convert_link_types(link_types)).link_triples:
-            self.add_node(link_triple.node)
-            link_pair = LinkPair(link_triple.link_type, link_triple.link_label)
-            style = self._link_styles(
-                link_pair, add_label=annotate_links in ['label', 'both'], add_type=annotate_links in ['type', 'both']
-            )
-            self.add_edge(link_triple.node, node, link_pair, style=style)
-            nodes.append(link_triple.node.pk if return_pks else link_triple.node)
-
-        return nodes
+        return [linked_node.pk for linked_node in nodes] if return_pks else nodes
 
     def add_outgoing(self, node, link_types=(), annotate_links=None, return_pks=True):
         """add nodes and edges for outgoing links to a node
@@ -530,22 +585,68 @@ class Graph(object):
         :returns: list of nodes or node pks
 
         """
-        if annotate_links not in [None, False, 'label', 'type', 'both']:
-            raise AssertionError('annotate_links must be one of False, "label", "type" or "both"')
-
         node = self.add_node(node)
+        nodes = self._add_links([node], outgoing=True, link_types=link_types, annotate_links=annotate_links)[node.pk]
 
-        nodes = []
-        for link_triple in node.get_outgoing(link_type=self._convert_link_types(link_types)).link_triples:
-            self.add_node(link_triple.node)
-            link_pair = LinkPair(link_triple.link_type, link_triple.link_label)
-            style = self._link_styles(
-                link_pair, add_label=annotate_links in ['label', 'both'], add_type=annotate_links in ['type', 'both']
+        return [linked_node.pk for linked_node in nodes] if return_pks else nodes
+
+    def _recurse(
+        self, origin, outgoing, depth, link_types, annotate_links, origin_style, include_process_links, print_func,
+        max_nodes
+    ):
+        """add nodes and edges from an origin recursively, one depth level at a time
+
+        The links of all the nodes at a given depth, the frontier, are fetched with a single query.
+
+        :param outgoing: whether to follow outgoing, rather than incoming, links
+        :param include_process_links: whether to also add the links in the other direction of the process nodes
+        :param max_nodes: if not None, stop adding nodes once the graph contains this many nodes
+
+        """
+        # pylint: disable=too-many-arguments
+        origin_node = self._load_node(origin)
+
+        self.add_node(origin_node, style_override=dict(origin_style))
+
+        frontier = [origin_node]
+        traversed_pks = set([origin_node.pk])
+        cur_depth = 0
+        while frontier:
+            cur_depth += 1
+            # checking of maximum descendant depth is set and applies.
+            if depth is not None and cur_depth > depth:
+                break
+            if max_nodes is not None and len(self._nodes) >= max_nodes:
+                if print_func:
+                    print_func('- Stopping at depth {}: reached the maximum of {} nodes'.format(cur_depth, max_nodes))
+                break
+            if print_func:
+                print_func('- Depth: {}'.format(cur_depth))
+
+            linked_nodes = self._add_links(
+                frontier, outgoing=outgoing, link_types=link_types, annotate_links=annotate_links, max_nodes=max_nodes
             )
-            self.add_edge(node, link_triple.node, link_pair, style=style)
-            nodes.append(link_triple.node.pk if return_pks else link_triple.node)
 
-        return nodes
+            if include_process_links:
+                self._add_links(
+                    [node for node in frontier if isinstance(node, ProcessNode)],
+                    outgoing=not outgoing,
+                    link_types=link_types,
+                    annotate_links=annotate_links,
+                    max_nodes=max_nodes
+                )
+
+            # ensure the same path isn't traversed multiple times
+            new_frontier = []
+            for node in frontier:
+                if linked_nodes[node.pk] and print_func:
+                    print_func('  {} -> {}'.format(node.pk, [n.pk for n in linked_nodes[node.pk]]))
+                for new_node in linked_nodes[node.pk]:
+                    if new_node.pk in traversed_pks:
+                        continue
+                    new_frontier.append(new_node)
+                    traversed_pks.add(new_node.pk)
+            frontier = new_frontier
 
     def recurse_descendants(
         self,
@@ -555,7 +656,8 @@ class Graph(object):
         annotate_links=False,
         origin_style=(),
         include_process_inputs=False,
-        print_func=None
+        print_func=None,
+        max_nodes=None
     ):
         """add nodes and edges from an origin recursively,
         following outgoing links
@@ -573,42 +675,23 @@ class Graph(object):
         :param include_calculation_inputs: include incoming links for all processes (Default value = False)
         :type include_calculation_inputs: bool
         :param print_func: a function to stream information to, i.e. print_func(str)
+        :param max_nodes: if not None, stop adding nodes once the graph contains this many nodes,
+            such that only a sample of a huge graph is rendered (Default value = None)
+        :type max_nodes: None or int
 
         """
         # pylint: disable=too-many-arguments
-        origin_node = self._load_node(origin)
-
-        self.add_node(origin_node, style_override=dict(origin_style))
-
-        leaf_nodes = [origin_node]
-        traversed_pks = [origin_node.pk]
-        cur_depth = 0
-        while leaf_nodes:
-            cur_depth += 1
-            # checking of maximum descendant depth is set and applies.
-            if depth is not None and cur_depth > depth:
-                break
-            if print_func:
-                print_func('- Depth: {}'.format(cur_depth))
-            new_nodes = []
-            for node in leaf_nodes:
-                outgoing_nodes = self.add_outgoing(
-                    node, link_types=link_types, annotate_links=annotate_links, return_pks=False
-                )
-                if outgoing_nodes and print_func:
-                    print_func('  {} -> {}'.format(node.pk, [on.pk for on in outgoing_nodes]))
-                new_nodes.extend(outgoing_nodes)
-
-                if include_process_inputs and isinstance(node, ProcessNode):
-                    self.add_incoming(node, link_types=link_types, annotate_links=annotate_links)
-
-            # ensure the same path isn't traversed multiple times
-            leaf_nodes = []
-            for new_node in new_nodes:
-                if new_node.pk in traversed_pks:
-                    continue
-                leaf_nodes.append(new_node)
-                traversed_pks.append(new_node.pk)
+        self._recurse(
+            origin,
+            outgoing=True,
+            depth=depth,
+            link_types=link_types,
+            annotate_links=annotate_links,
+            origin_style=origin_style,
+            include_process_links=include_process_inputs,
+            print_func=print_func,
+            max_nodes=max_nodes
+        )
 
     def recurse_ancestors(
         self,
@@ -618,7 +701,8 @@ class Graph(object):
         annotate_links=False,
         origin_style=(),
         include_process_outputs=False,
-        print_func=None
+        print_func=None,
+        max_nodes=None
     ):
         """add nodes and edges from an origin recursively,
         following incoming links
@@ -636,42 +720,23 @@ class Graph(object):
         :param include_process_outputs:  include outgoing links for all processes (Default value = False)
         :type include_process_outputs: bool
         :param print_func: a function to stream information to, i.e. print_func(str)
+        :param max_nodes: if not None, stop adding nodes once the graph contains this many nodes,
+            such that only a sample of a huge graph is rendered (Default value = None)
+        :type max_nodes: None or int
 
         """
         # pylint: disable=too-many-arguments
-        origin_node = self._load_node(origin)
-
-        self.add_node(origin_node, style_override=dict(origin_style))
-
-        last_nodes = [origin_node]
-        traversed_pks = [origin_node.pk]
-        cur_depth = 0
-        while last_nodes:
-            cur_depth += 1
-            # checking of maximum descendant depth is set and applies.
-            if depth is not None and cur_depth > depth:
-                break
-            if print_func:
-                print_func('- Depth: {}'.format(cur_depth))
-            new_nodes = []
-            for node in last_nodes:
-                incoming_nodes = self.add_incoming(
-                    node, link_types=link_types, annotate_links=annotate_links, return_pks=False
-                )
-                if incoming_nodes and print_func:
-                    print_func('  {} -> {}'.format(node.pk, [n.pk for n in incoming_nodes]))
-                new_nodes.extend(incoming_nodes)
-
-                if include_process_outputs and isinstance(node, ProcessNode):
-                    self.add_outgoing(node, link_types=link_types, annotate_links=annotate_links)
-
-            # ensure the same path isn't traversed multiple times
-            last_nodes = []
-            for new_node in new_nodes:
-                if new_node.pk in traversed_pks:
-                    continue
-                last_nodes.append(new_node)
-                traversed_pks.append(new_node.pk)
+        self._recurse(
+            origin,
+            outgoing=False,
+            depth=depth,
+            link_types=link_types,
+            annotate_links=annotate_links,
+            origin_style=origin_style,
+            include_process_links=include_process_outputs,
+            print_func=print_func,
+            max_nodes=max_nodes
+        )
 
     def add_origin_to_targets(
         self,
@@ -148,6 +148,9 @@ def validate_verdi_documentation():
     from click import Context
     from aiida.cmdline.commands.cmd_verdi import verdi
 
+    # Import the modules of all subcommands, which are otherwise only loaded when they are invoked
+    verdi.load_commands()
+
     # Set the `verdi data` command to isolated mode such that external plugin commands are not discovered
     ctx = Context(verdi)
     command = verdi.get_command(ctx, 'data')